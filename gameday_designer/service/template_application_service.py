@@ -18,6 +18,8 @@ from django.contrib.auth.models import User
 from gamedays.models import Gameday, Team, Gameinfo, Gameresult
 from gameday_designer.models import ScheduleTemplate, TemplateSlot, TemplateApplication
 from gameday_designer.service.time_service import TimeService
+from gamedays.service.change_counter_service import ChangeCounterService
+from gamedays.service.placeholder_service import GamedayScheduleVersion
 
 
 class ApplicationError(Exception):
@@ -49,9 +51,10 @@ class TemplateApplicationService:
     Process (atomic transaction):
     1. Validate compatibility (team mapping complete, teams exist, gameday has enough fields)
     2. Clear existing gameday schedule
-    3. Create Gameinfo objects from template slots
-    4. Create Gameresult objects (home/away teams)
-    5. Create TemplateApplication audit record
+    3. Build Gameinfo objects from template slots
+    4. Build Gameresult objects (home/away teams)
+    5. Bulk create Gameinfo and Gameresult objects
+    6. Create TemplateApplication audit record
 
     Usage:
         service = TemplateApplicationService(template, gameday, team_mapping, applied_by=user)
@@ -91,12 +94,17 @@ class TemplateApplicationService:
         self.game_duration = game_duration
         self.break_duration = break_duration
         self.num_fields = num_fields
-        self._ordered_slots = None
+        self._slots = None
+        self._teams: Dict[int, Team] = {}
 
     def apply(self) -> ApplicationResult:
         """
         Apply template to gameday (atomic operation).
 
+        All games and results are built in memory and written with one
+        ``bulk_create`` each. ``bulk_create`` sends no ``post_save``, so the
+        ``update_game_schedule`` signal is not fired for the fresh drafts.
+
         Returns:
             ApplicationResult with success status and details
 
@@ -110,16 +118,21 @@ class TemplateApplicationService:
             # Step 2: Clear existing schedule
             self._clear_existing_schedule()
 
-            # Step 3: Create gameinfos from slots
-            gameinfos = self._create_gameinfos()
+            # Step 3: Build gameinfos from slots
+            scheduled_slots = self._create_gameinfos()
 
             # Step 4: Resolve ranking-based references
             self._resolve_ranking_references()
 
-            # Step 5: Create gameresults for each gameinfo
-            self._create_gameresults(gameinfos)
+            # Step 5: Build gameresults for each gameinfo
+            gameresults = self._create_gameresults(scheduled_slots)
+
+            # Step 6: Write games and results in bulk
+            gameinfos = self._save_schedule(
+                [gameinfo for _, gameinfo in scheduled_slots], gameresults
+            )
 
-            # Step 6: Store audit trail
+            # Step 7: Store audit trail
             application = self._create_audit_record()
 
             return ApplicationResult(
@@ -128,6 +141,18 @@ class TemplateApplicationService:
                 message=f'Successfully applied template "{self.template.name}" to gameday "{self.gameday.name}". Created {len(gameinfos)} games.',
             )
 
+    def _get_slots(self) -> list[TemplateSlot]:
+        """Template slots ordered by field and slot order, loaded once."""
+        if self._slots is None:
+            self._slots = list(self.template.slots.all().order_by("field", "slot_order"))
+        return self._slots
+
+    def _get_team(self, team_id) -> Optional[Team]:
+        try:
+            return self._teams.get(int(team_id))
+        except (TypeError, ValueError):
+            return None
+
     def _resolve_ranking_references(self):
         """
         Identify Ranking Stages and resolve their outcomes into the team mapping.
@@ -137,7 +162,7 @@ class TemplateApplicationService:
         """
         # 1. Group slots by stage
         stages_map = {}
-        for slot in self.template.slots.all():
+        for slot in self._get_slots():
             if slot.stage not in stages_map:
                 stages_map[slot.stage] = []
             stages_map[slot.stage].append(slot)
@@ -198,8 +223,8 @@ class TemplateApplicationService:
         """
         # Check gameday has enough fields
         # Note: We need to check the actual maximum field used in slots
-        slots = self.template.slots.all()
-        if not slots.exists():
+        slots = self._get_slots()
+        if not slots:
             raise ApplicationError("Template has no slots defined")
 
         max_field_used = max(slot.field for slot in slots)
@@ -231,8 +256,11 @@ class TemplateApplicationService:
             )
 
         # Check all mapped teams exist
+        self._teams = Team.objects.in_bulk(
+            {team_id for team_id in self.team_mapping.values() if team_id}
+        )
         for placeholder, team_id in self.team_mapping.items():
-            if not Team.objects.filter(pk=team_id).exists():
+            if self._get_team(team_id) is None:
                 raise ApplicationError(
                     f"Team with ID {team_id} (for placeholder {placeholder}) does not exist"
                 )
@@ -245,9 +273,8 @@ class TemplateApplicationService:
             Set of placeholder strings (e.g., {'0_0', '0_1', '1_0', ...})
         """
         placeholders = set()
-        slots = self.template.slots.all()
 
-        for slot in slots:
+        for slot in self._get_slots():
             # Add home team placeholder (if not a reference)
             if slot.home_group is not None and slot.home_team is not None:
                 placeholders.add(f"{slot.home_group}_{slot.home_team}")
@@ -271,105 +298,62 @@ class TemplateApplicationService:
         """
         Gameinfo.objects.filter(gameday=self.gameday).delete()
 
-    def _create_gameinfos(self) -> list:
+    def _create_gameinfos(self) -> list[Tuple[TemplateSlot, Gameinfo]]:
         """
-        Create Gameinfo objects from template slots.
+        Build unsaved Gameinfo objects from template slots.
 
-        When num_fields override is set, all template slots are fetched ordered by
-        (field, slot_order) and redistributed round-robin across effective_fields.
+        When num_fields override is set, all template slots ordered by
+        (field, slot_order) are redistributed round-robin across effective_fields.
         Otherwise the original per-field ordering is used.
 
         Returns:
-            List of created Gameinfo objects
+            List of (slot, gameinfo) pairs in field and time order
         """
-        gameinfos = []
-
         effective_start = self.start_time or self.gameday.start
         effective_duration = self.game_duration or self.template.game_duration
-        effective_fields = self.num_fields or self.template.num_fields
+        field_groups: Dict[int, list[TemplateSlot]] = defaultdict(list)
 
         if self.num_fields is not None:
             # Redistribution mode: assign slots round-robin across effective_fields
-            all_slots = list(
-                self.template.slots.all().order_by("field", "slot_order")
-            )
-
-            # Store ordered slots for _create_gameresults to reuse
-            self._ordered_slots = all_slots
-
-            # Assign effective field numbers round-robin
-            for i, slot in enumerate(all_slots):
-                slot._effective_field = (i % effective_fields) + 1
-
-            # Group by effective field for per-field time calculation
-            field_groups: dict = defaultdict(list)
-            for slot in all_slots:
-                field_groups[slot._effective_field].append(slot)
-
-            # Build a flat ordered list matching the final gameinfos order
-            # We process fields in order 1..effective_fields, matching slot assignment
-            for field_num in range(1, effective_fields + 1):
-                slots = field_groups.get(field_num, [])
-                if not slots:
-                    continue
-
-                slot_data = [
-                    {"break_after": s.break_after + (self.break_duration or 0)}
-                    for s in slots
-                ]
-                start_times = TimeService.calculate_game_times(
-                    effective_start, effective_duration, slot_data
-                )
-
-                for slot, scheduled in zip(slots, start_times):
-                    official_team = self._resolve_team_placeholder(
-                        slot.official_group, slot.official_team, slot.official_reference
-                    )
-                    gameinfo = Gameinfo.objects.create(
-                        gameday=self.gameday,
-                        scheduled=scheduled,
-                        field=slot._effective_field,
-                        stage=slot.stage,
-                        standing=slot.standing,
-                        officials=official_team,
-                        status="Geplant",
-                    )
-                    gameinfos.append(gameinfo)
+            num_fields = self.num_fields
+            for i, slot in enumerate(self._get_slots()):
+                field_groups[(i % num_fields) + 1].append(slot)
         else:
             # Standard mode: process each original field independently
-            self._ordered_slots = None  # Not needed; _create_gameresults uses default order
+            num_fields = self.template.num_fields
+            for slot in self._get_slots():
+                field_groups[slot.field].append(slot)
+
+        scheduled_slots = []
+        for field_num in range(1, num_fields + 1):
+            slots = field_groups.get(field_num, [])
+            if not slots:
+                continue
+
+            slot_data = [
+                {"break_after": s.break_after + (self.break_duration or 0)}
+                for s in slots
+            ]
+            start_times = TimeService.calculate_game_times(
+                effective_start, effective_duration, slot_data
+            )
 
-            for field_num in range(1, self.template.num_fields + 1):
-                slots = list(
-                    self.template.slots.filter(field=field_num).order_by("slot_order")
+            for slot, scheduled in zip(slots, start_times):
+                official_team = self._resolve_team_placeholder(
+                    slot.official_group, slot.official_team, slot.official_reference
                 )
-                if not slots:
-                    continue
-
-                slot_data = [
-                    {"break_after": s.break_after + (self.break_duration or 0)}
-                    for s in slots
-                ]
-                start_times = TimeService.calculate_game_times(
-                    effective_start, effective_duration, slot_data
+                gameinfo = Gameinfo(
+                    gameday=self.gameday,
+                    scheduled=scheduled,
+                    field=field_num,
+                    stage=slot.stage,
+                    standing=slot.standing,
+                    officials=official_team,
+                    status="Geplant",
                 )
+                scheduled_slots.append((slot, gameinfo))
 
-                for slot, scheduled in zip(slots, start_times):
-                    official_team = self._resolve_team_placeholder(
-                        slot.official_group, slot.official_team, slot.official_reference
-                    )
-                    gameinfo = Gameinfo.objects.create(
-                        gameday=self.gameday,
-                        scheduled=scheduled,
-                        field=slot.field,
-                        stage=slot.stage,
-                        standing=slot.standing,
-                        officials=official_team,
-                        status="Geplant",
-                    )
-                    gameinfos.append(gameinfo)
-
-        return gameinfos
+        return scheduled_slots
 
     def _resolve_team_placeholder(
         self, group: Optional[int], team: Optional[int], reference: Optional[str]
@@ -389,12 +373,12 @@ class TemplateApplicationService:
             # Check if this is a resolvable rank reference
             if reference in self.team_mapping:
                 team_id = self.team_mapping[reference]
-                try:
-                    return Team.objects.get(pk=team_id)
-                except Team.DoesNotExist:
+                resolved_team = self._get_team(team_id)
+                if resolved_team is None:
                     raise ApplicationError(
                         f"Team with ID {team_id} (referenced as {reference}) does not exist"
                     )
+                return resolved_team
 
             # This is a final round game (winner/loser), team will be determined later
             # For now, return None (would be handled by update rules in actual game flow)
@@ -405,37 +389,31 @@ class TemplateApplicationService:
             team_id = self.team_mapping.get(placeholder)
 
             if team_id:
-                try:
-                    return Team.objects.get(pk=team_id)
-                except Team.DoesNotExist:
+                resolved_team = self._get_team(team_id)
+                if resolved_team is None:
                     raise ApplicationError(
                         f"Team with ID {team_id} (placeholder {placeholder}) does not exist"
                     )
+                return resolved_team
 
         return None
 
-    def _create_gameresults(self, gameinfos: list):
+    def _create_gameresults(
+        self, scheduled_slots: list[Tuple[TemplateSlot, Gameinfo]]
+    ) -> list[Gameresult]:
         """
-        Create Gameresult objects for each Gameinfo.
+        Build unsaved Gameresult objects for each Gameinfo.
 
         Each gameinfo gets two Gameresult objects: home team and away team.
 
-        When num_fields redistribution was used in _create_gameinfos(), the gameinfos
-        are ordered by (effective_field, slot_in_that_field). We must pair them with
-        slots in the same order. _create_gameinfos() stores the redistributed slot list
-        grouped by effective field in self._ordered_slots; we rebuild that same ordering
-        here by re-grouping from self._ordered_slots.
-
         Args:
-            gameinfos: List of Gameinfo objects
+            scheduled_slots: (slot, gameinfo) pairs from _create_gameinfos()
+
+        Returns:
+            List of unsaved Gameresult objects
         """
-        if self.num_fields is not None and self._ordered_slots is not None:
-            effective_fields = self.num_fields
-            ordered_slots_for_zip = [s for fn in range(1, effective_fields + 1)
-                                     for s in self._ordered_slots if s._effective_field == fn]
-        else:
-            ordered_slots_for_zip = list(self.template.slots.all().order_by("field", "slot_order"))
-        for gameinfo, slot in zip(gameinfos, ordered_slots_for_zip):
+        gameresults = []
+        for slot, gameinfo in scheduled_slots:
             # Resolve home team
             home_team = self._resolve_team_placeholder(
                 slot.home_group, slot.home_team, slot.home_reference
@@ -446,25 +424,36 @@ class TemplateApplicationService:
                 slot.away_group, slot.away_team, slot.away_reference
             )
 
-            # Create home Gameresult
-            Gameresult.objects.create(
-                gameinfo=gameinfo,
-                team=home_team,
-                isHome=True,
-                fh=None,  # To be filled in during game
-                sh=None,
-                pa=None,
-            )
+            # fh, sh and pa are filled in during the game
+            gameresults.append(Gameresult(gameinfo=gameinfo, team=home_team, isHome=True))
+            gameresults.append(Gameresult(gameinfo=gameinfo, team=away_team, isHome=False))
+        return gameresults
 
-            # Create away Gameresult
-            Gameresult.objects.create(
-                gameinfo=gameinfo,
-                team=away_team,
-                isHome=False,
-                fh=None,  # To be filled in during game
-                sh=None,
-                pa=None,
-            )
+    def _save_schedule(
+        self, gameinfos: list[Gameinfo], gameresults: list[Gameresult]
+    ) -> list[Gameinfo]:
+        """
+        Bulk create the built gameinfos and their gameresults.
+
+        Backends that cannot return ids from a bulk insert leave the primary
+        keys unset; the schedule was cleared in this transaction, so the
+        gameday's gameinfos in id order are exactly the new ones. As
+        ``bulk_create`` sends no signals, the schedule version and the
+        gameday's change counter are bumped here.
+        """
+        Gameinfo.objects.bulk_create(gameinfos)
+        if any(gameinfo.pk is None for gameinfo in gameinfos):
+            created_ids = Gameinfo.objects.filter(gameday=self.gameday).order_by(
+                "pk"
+            ).values_list("pk", flat=True)
+            for gameinfo, pk in zip(gameinfos, created_ids):
+                gameinfo.pk = pk
+        Gameresult.objects.bulk_create(gameresults)
+        GamedayScheduleVersion.bump(self.gameday.pk)
+        ChangeCounterService.bump_after_bulk_write(
+            self.gameday.pk, created=(Gameinfo, Gameresult)
+        )
+        return gameinfos
 
     def _create_audit_record(self):
         """
@@ -15,7 +15,8 @@ Application Process:
 import datetime
 import pytest
 from django.contrib.auth.models import User
-from django.db import transaction
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 
 from gamedays.models import (
     Association,
@@ -946,3 +947,56 @@ class TestTemplateApplicationServiceOverrides:
             field_counts[gi.field] = field_counts.get(gi.field, 0) + 1
         assert field_counts.get(1, 0) == 2
         assert field_counts.get(2, 0) == 2
+
+
+@pytest.mark.django_db
+class TestTemplateApplicationServiceQueryCount:
+    """Query count of an application must not grow with the number of games."""
+
+    def _apply_template(self, num_slots: int, name: str) -> int:
+        template = ScheduleTemplate.objects.create(
+            name=name, num_teams=4, num_fields=2, num_groups=1
+        )
+        TemplateSlot.objects.bulk_create(
+            TemplateSlot(
+                template=template,
+                field=(i % 2) + 1,
+                slot_order=i // 2,
+                stage="Vorrunde",
+                standing="Round Robin",
+                home_group=0,
+                home_team=i % 4,
+                away_group=0,
+                away_team=(i + 1) % 4,
+                official_group=0,
+                official_team=(i + 2) % 4,
+            )
+            for i in range(num_slots)
+        )
+        gameday = Gameday.objects.create(
+            name=name,
+            season=Season.objects.get_or_create(name="2025")[0],
+            league=League.objects.get_or_create(name="Test League")[0],
+            date=datetime.date.today(),
+            start=datetime.time(10, 0),
+            format="4_2",
+            author=User.objects.get_or_create(username="test_user")[0],
+        )
+        teams = [
+            Team.objects.get_or_create(
+                name=f"Team {i}", defaults={"description": f"Desc {i}", "location": "City"}
+            )[0]
+            for i in range(4)
+        ]
+        team_mapping = {f"0_{i}": teams[i].pk for i in range(4)}
+        service = TemplateApplicationService(template, gameday, team_mapping)
+        with CaptureQueriesContext(connection) as queries:
+            service.apply()
+        assert Gameresult.objects.filter(gameinfo__gameday=gameday).count() == 2 * num_slots
+        return len(queries)
+
+    def test_apply_query_count_does_not_grow_with_games(self):
+        small = self._apply_template(4, "Small")
+        large = self._apply_template(40, "Large")
+        assert large == small
+        assert large <= 15
@@ -26,9 +26,7 @@ class GameLogAPIView(APIView):
         if request.query_params.get("other") is not None:
             try:
                 gamelog = GameService(game_id).get_gamelog()
-                return Response(
-                    json.loads(gamelog.as_json(), object_pairs_hook=OrderedDict)
-                )
+                return Response(gamelog.as_dict())
             except Gameinfo.DoesNotExist:
                 raise NotFound(detail=f"No game found for gameId {game_id}")
         gamelog = (
@@ -92,10 +90,7 @@ class GameLogAPIView(APIView):
                 data.get("team"), data.get("event"), request.user, data.get("half")
             )
             game_service.update_score(gamelog)
-            return Response(
-                json.loads(gamelog.as_json(), object_pairs_hook=OrderedDict),
-                status=HTTPStatus.CREATED,
-            )
+            return Response(gamelog.as_dict(), status=HTTPStatus.CREATED)
         except Gameinfo.DoesNotExist:
             raise NotFound(
                 detail=f'Could not create team logs ... gameId {request.data.get("gameId")} not found'
@@ -121,10 +116,7 @@ class GameLogAPIView(APIView):
         game_service = GameService(game_id)
         gamelog = game_service.delete_gamelog(sequence)
         game_service.update_score(gamelog)
-        return Response(
-            json.loads(gamelog.as_json(), object_pairs_hook=OrderedDict),
-            status=HTTPStatus.OK,
-        )
+        return Response(gamelog.as_dict(), status=HTTPStatus.OK)
 
     @staticmethod
     def _can_delete_log_entry(user, game: Gameinfo, sequence) -> bool:
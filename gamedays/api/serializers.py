@@ -2,7 +2,7 @@ import logging
 
 from django.db import transaction
 from rest_framework.fields import SerializerMethodField, IntegerField
-from rest_framework.serializers import ModelSerializer, Serializer
+from rest_framework.serializers import ListSerializer, ModelSerializer, Serializer
 
 from gamedays.models import (
     Gameday,
@@ -183,6 +183,21 @@ class GameinfoSerializer(ModelSerializer):
         }
 
 
+class ScoreSerializer(Serializer):
+    home = IntegerField(min_value=0)
+    away = IntegerField(min_value=0)
+
+
+class GameResultBatchEntrySerializer(Serializer):
+    gameinfo = IntegerField()
+    halftime_score = ScoreSerializer(required=False)
+    final_score = ScoreSerializer(required=False)
+
+
+class GameResultBatchSerializer(Serializer):
+    results = ListSerializer(child=GameResultBatchEntrySerializer(), allow_empty=False)
+
+
 class GameSetupSerializer(ModelSerializer):
     class Meta:
         model = GameSetup
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth.models import User
@@ -82,6 +84,124 @@ class DesignerAPITest(APITestCase):
         assert self.gameday.league_id == original_league_id
         assert self.gameday.season_id == original_season_id
 
+    def test_patch_designer_state_applies_patch_and_bumps_revision(self):
+        GamedayDesignerState.objects.create(
+            gameday=self.gameday,
+            state_data={"nodes": [{"id": "1"}], "edges": []},
+            revision=3,
+        )
+        url = f"/api/gamedays/{self.gameday.id}/designer-state/"
+        data = {
+            "base_revision": 3,
+            "patch": [
+                {"op": "add", "path": "/nodes/-", "value": {"id": "2"}},
+                {"op": "add", "path": "/metadata", "value": {"name": "Patched"}},
+            ],
+        }
+        response = self.client.patch(url, data, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"revision": 4}
+        state = GamedayDesignerState.objects.get(gameday=self.gameday)
+        assert state.state_data["nodes"] == [{"id": "1"}, {"id": "2"}]
+        assert state.revision == 4
+        self.gameday.refresh_from_db()
+        assert self.gameday.name == "Patched"
+        assert self.client.get(url).data["revision"] == 4
+
+    def test_patch_designer_state_with_stale_revision_is_rejected(self):
+        GamedayDesignerState.objects.create(
+            gameday=self.gameday, state_data={"nodes": []}, revision=5
+        )
+        url = f"/api/gamedays/{self.gameday.id}/designer-state/"
+        data = {
+            "base_revision": 4,
+            "patch": [{"op": "add", "path": "/nodes/-", "value": {"id": "1"}}],
+        }
+        response = self.client.patch(url, data, format="json")
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data["revision"] == 5
+        state = GamedayDesignerState.objects.get(gameday=self.gameday)
+        assert state.state_data == {"nodes": []}
+
+    def test_patch_designer_state_with_invalid_patch_leaves_state_untouched(self):
+        GamedayDesignerState.objects.create(
+            gameday=self.gameday, state_data={"nodes": []}, revision=1
+        )
+        url = f"/api/gamedays/{self.gameday.id}/designer-state/"
+        data = {
+            "base_revision": 1,
+            "patch": [
+                {"op": "add", "path": "/nodes/-", "value": {"id": "1"}},
+                {"op": "remove", "path": "/edges"},
+            ],
+        }
+        response = self.client.patch(url, data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        state = GamedayDesignerState.objects.get(gameday=self.gameday)
+        assert state.state_data == {"nodes": []}
+        assert state.revision == 1
+
+    def test_put_designer_state_bumps_revision(self):
+        url = f"/api/gamedays/{self.gameday.id}/designer-state/"
+        response = self.client.put(url, {"state_data": {"nodes": []}}, format="json")
+        assert response.data["revision"] == 1
+
+    def test_put_designer_state_with_stale_revision_is_rejected(self):
+        GamedayDesignerState.objects.create(
+            gameday=self.gameday, state_data={"nodes": []}, revision=2
+        )
+        url = f"/api/gamedays/{self.gameday.id}/designer-state/"
+        data = {"state_data": {"nodes": [{"id": "1"}]}, "base_revision": 1}
+        response = self.client.put(url, data, format="json")
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data["revision"] == 2
+        state = GamedayDesignerState.objects.get(gameday=self.gameday)
+        assert state.state_data == {"nodes": []}
+
+    def test_put_designer_state_does_not_overwrite_a_concurrent_patch(self):
+        state = GamedayDesignerState.objects.create(
+            gameday=self.gameday, state_data={"nodes": []}, revision=1
+        )
+        # a patch stored between the read and the write of the put
+        original_get_or_create = GamedayDesignerState.objects.get_or_create
+
+        def get_or_create_then_patch(**kwargs):
+            result = original_get_or_create(**kwargs)
+            GamedayDesignerState.objects.filter(pk=state.pk).update(revision=2)
+            return result
+
+        url = f"/api/gamedays/{self.gameday.id}/designer-state/"
+        with patch.object(
+            GamedayDesignerState.objects, "get_or_create", get_or_create_then_patch
+        ):
+            response = self.client.put(
+                url, {"state_data": {"nodes": [{"id": "1"}]}}, format="json"
+            )
+        assert response.status_code == status.HTTP_409_CONFLICT
+        state.refresh_from_db()
+        assert state.state_data == {"nodes": []}
+
+    def test_designer_state_must_stay_an_object_with_object_metadata(self):
+        GamedayDesignerState.objects.create(
+            gameday=self.gameday, state_data={"metadata": {"name": "x"}}, revision=1
+        )
+        url = f"/api/gamedays/{self.gameday.id}/designer-state/"
+        for operation in (
+            {"op": "replace", "path": "", "value": []},
+            {"op": "replace", "path": "/metadata", "value": "x"},
+        ):
+            response = self.client.patch(
+                url, {"base_revision": 1, "patch": [operation]}, format="json"
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+        response = self.client.put(
+            url, {"state_data": {"metadata": []}}, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        state = GamedayDesignerState.objects.get(gameday=self.gameday)
+        assert state.state_data == {"metadata": {"name": "x"}}
+        assert state.revision == 1
+
     def test_publish_gameday(self):
         # Publishing regenerates the schedule from the designer canvas, so it is
         # only allowed when no results have been entered yet. The g62 fixture ships
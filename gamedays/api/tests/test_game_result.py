@@ -1,8 +1,10 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django_webtest import WebTest
 from http import HTTPStatus
 from rest_framework.reverse import reverse
-from gamedays.models import Gameday, Gameinfo
+from gamedays.models import Gameday, Gameinfo, Gameresult
 from gamedays.tests.setup_factories.db_setup import DBSetup
 
 
@@ -66,3 +68,121 @@ class TestGameResult(WebTest):
 
         gameday.refresh_from_db()
         assert gameday.status == Gameday.STATUS_COMPLETED
+
+
+class TestGameResultBatch(WebTest):
+    def setUp(self):
+        self.gameday = DBSetup().g62_status_empty()
+        self.gameday.status = Gameday.STATUS_PUBLISHED
+        self.gameday.save()
+        self.games = list(Gameinfo.objects.filter(gameday=self.gameday).order_by("pk"))
+        self.url = reverse(
+            "api-gameday-games-results", kwargs={"gameday_pk": self.gameday.pk}
+        )
+
+    def _patch(self, results, **kwargs):
+        return self.app.patch_json(
+            self.url,
+            {"results": results},
+            headers=DBSetup().get_token_header(),
+            **kwargs,
+        )
+
+    def test_scores_of_many_games_are_entered_at_once(self):
+        first, second = self.games[:2]
+        response = self._patch(
+            [
+                {"gameinfo": first.pk, "halftime_score": {"home": 14, "away": 6}},
+                {
+                    "gameinfo": second.pk,
+                    "halftime_score": {"home": 7, "away": 0},
+                    "final_score": {"home": 21, "away": 6},
+                },
+            ]
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        games = {game["id"]: game for game in response.json}
+        assert games[first.pk]["status"] == Gameinfo.STATUS_IN_PROGRESS
+        assert games[first.pk]["halftime_score"] == {"home": 14, "away": 6}
+        assert games[second.pk]["status"] == Gameinfo.STATUS_COMPLETED
+        assert games[second.pk]["final_score"] == {"home": 21, "away": 6}
+        home = Gameresult.objects.get(gameinfo=second, isHome=True)
+        assert (home.fh, home.sh) == (7, 14)
+        self.gameday.refresh_from_db()
+        assert self.gameday.status == Gameday.STATUS_IN_PROGRESS
+
+    def test_gameday_completed_when_batch_finishes_all_games(self):
+        self._patch(
+            [
+                {"gameinfo": game.pk, "final_score": {"home": 0, "away": 0}}
+                for game in self.games
+            ]
+        )
+
+        self.gameday.refresh_from_db()
+        assert self.gameday.status == Gameday.STATUS_COMPLETED
+
+    def test_query_count_does_not_grow_with_number_of_games(self):
+        def count_queries(games):
+            with CaptureQueriesContext(connection) as queries:
+                self._patch(
+                    [
+                        {"gameinfo": game.pk, "halftime_score": {"home": 1, "away": 0}}
+                        for game in games
+                    ]
+                )
+            return len(queries)
+
+        count_queries(self.games[:1])
+        assert count_queries(self.games[1:3]) == count_queries(self.games[3:])
+
+    def test_game_of_another_gameday_is_rejected(self):
+        other_game = DBSetup().g62_status_empty().gameinfo_set.first()
+        response = self._patch(
+            [
+                {"gameinfo": self.games[0].pk, "final_score": {"home": 7, "away": 0}},
+                {"gameinfo": other_game.pk, "final_score": {"home": 7, "away": 0}},
+            ],
+            expect_errors=True,
+        )
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert not Gameinfo.objects.filter(
+            pk=self.games[0].pk, status=Gameinfo.STATUS_COMPLETED
+        ).exists()
+
+    def test_status_transitions_match_the_single_game_endpoint(self):
+        draft, scheduled, started = self.games[:3]
+        Gameinfo.objects.filter(pk=draft.pk).update(status=Gameinfo.STATUS_DRAFT)
+        Gameinfo.objects.filter(pk=started.pk).update(
+            status=Gameinfo.STATUS_IN_PROGRESS
+        )
+        halftime = {"halftime_score": {"home": 7, "away": 0}}
+        self._patch([{"gameinfo": game.pk, **halftime} for game in self.games[:3]])
+        batch_statuses = list(
+            Gameinfo.objects.filter(pk__in=[draft.pk, scheduled.pk, started.pk])
+            .order_by("pk")
+            .values_list("status", flat=True)
+        )
+
+        single_statuses = []
+        for status in (
+            Gameinfo.STATUS_DRAFT,
+            Gameinfo.STATUS_PUBLISHED,
+            Gameinfo.STATUS_IN_PROGRESS,
+        ):
+            game = self.games[3]
+            Gameinfo.objects.filter(pk=game.pk).update(status=status)
+            response = self.app.patch_json(
+                reverse("api-game-result", kwargs={"pk": game.pk}),
+                halftime,
+                headers=DBSetup().get_token_header(),
+            )
+            single_statuses.append(response.json["status"])
+
+        assert batch_statuses == single_statuses == [
+            Gameinfo.STATUS_DRAFT,
+            Gameinfo.STATUS_IN_PROGRESS,
+            Gameinfo.STATUS_IN_PROGRESS,
+        ]
@@ -1,9 +1,20 @@
+import time
+from unittest.mock import patch
+
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from gamedays.models import Gameday
+from gamedays.models import ChangeCounter, Gameday, Gameinfo, Gameresult
+from gamedays.service.change_counter_service import (
+    CHANGE_COUNTER_CACHE_TTL,
+    ChangeCounterService,
+)
+from gamedays.tests.setup_factories.db_setup import DBSetup
 from gamedays.tests.setup_factories.factories import GamedayFactory
+from league_manager.cache import clear_all_caches, live_cache
 
 
 class GamedayListEtagFreshnessTest(APITestCase):
@@ -14,6 +25,7 @@ class GamedayListEtagFreshnessTest(APITestCase):
     """
 
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_superuser(username="admin", password="pw")
         self.client.force_authenticate(user=self.user)
 
@@ -65,3 +77,81 @@ class GamedayListEtagFreshnessTest(APITestCase):
             g for g in revalidated.data["results"] if g["id"] == gameday.id
         )
         assert renamed["name"] == "Renamed via Designer"
+
+    def test_list_revalidation_is_answered_without_queries(self):
+        GamedayFactory()
+        etag = self.client.get("/api/gamedays/")["ETag"]
+
+        with self.assertNumQueries(0):
+            revalidated = self.client.get("/api/gamedays/", HTTP_IF_NONE_MATCH=etag)
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_etag_changes_when_league_is_renamed(self):
+        gameday = GamedayFactory()
+        etag_before = self.client.get("/api/gamedays/")["ETag"]
+
+        gameday.league.name = "Renamed League"
+        gameday.league.save()
+
+        revalidated = self.client.get("/api/gamedays/", HTTP_IF_NONE_MATCH=etag_before)
+        assert revalidated.status_code == status.HTTP_200_OK
+
+
+class GamedayGamesEtagFreshnessTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        DBSetup().g62_status_empty()
+        self.gameday = Gameday.objects.first()
+        self.url = f"/api/gamedays/{self.gameday.pk}/games/"
+
+    def test_games_etag_changes_when_a_score_is_entered(self):
+        etag_before = self.client.get(self.url)["ETag"]
+        with self.assertNumQueries(0):
+            revalidated = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag_before)
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+
+        gameresult = Gameresult.objects.filter(gameinfo__gameday=self.gameday).first()
+        gameresult.fh = 21
+        gameresult.save()
+
+        revalidated = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag_before)
+        assert revalidated.status_code == status.HTTP_200_OK
+
+    def test_games_etag_does_not_change_for_other_gamedays(self):
+        other = GamedayFactory()
+        etag_before = self.client.get(self.url)["ETag"]
+
+        Gameinfo.objects.create(
+            gameday=other,
+            scheduled="10:00",
+            field=1,
+            stage="Vorrunde",
+            standing="Gruppe 1",
+            officials=Gameinfo.objects.filter(gameday=self.gameday).first().officials,
+        )
+
+        revalidated = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag_before)
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+class ChangeCounterCacheTest(TestCase):
+    def setUp(self):
+        clear_all_caches()
+
+    def test_value_read_before_a_bump_expires_from_the_cache(self):
+        gameday = GamedayFactory()
+        key = ChangeCounterService.get_key(gameday.pk)
+        stale_value = ChangeCounter.objects.get(key=key).value
+        # a read selects the counter, then the bump commits and drops the
+        # cached value, then the read caches what it selected
+        with patch.object(live_cache, "set_many") as delayed_set_many:
+            assert ChangeCounterService.get(key) == [stale_value]
+        with self.captureOnCommitCallbacks(execute=True):
+            ChangeCounterService.bump(gameday.pk)
+        live_cache.set_many(*delayed_set_many.call_args.args)
+        assert ChangeCounterService.get(key) == [stale_value]
+
+        with patch(
+            "time.time", return_value=time.time() + CHANGE_COUNTER_CACHE_TTL + 1
+        ):
+            assert ChangeCounterService.get(key) == [stale_value + 1]
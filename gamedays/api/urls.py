@@ -19,6 +19,7 @@ from gamedays.api.views import (
     GameOfficialCreateOrUpdateView,
     GamedayPublishAPIView,
     GameResultUpdateAPIView,
+    GameResultBatchUpdateAPIView,
     GamedayViewSet,
     SeasonViewSet,
     LeagueViewSet,
@@ -73,6 +74,11 @@ urlpatterns = [
                     GameResultsListView.as_view(),
                     name="api-gameday-games",
                 ),
+                path(
+                    "<int:gameday_pk>/games/results/",
+                    GameResultBatchUpdateAPIView.as_view(),
+                    name="api-gameday-games-results",
+                ),
                 path(
                     "<int:gameday_pk>/games/<int:game_pk>/results/",
                     GameResultsUpdateView.as_view(),
@@ -5,9 +5,9 @@ from collections import OrderedDict
 from datetime import datetime
 
 from django.conf import settings
-from django.db.models import Count, Max
 from django.shortcuts import get_object_or_404
 from django.views.decorators.http import condition
+from django.utils import timezone
 from django.utils.decorators import method_decorator
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
@@ -26,6 +26,7 @@ from gamedays.api.serializers import (
     GamedayListSerializer,
     GameinfoSerializer,
     GameOfficialSerializer,
+    GameResultBatchSerializer,
     SeasonSerializer,
     LeagueSerializer,
 )
@@ -46,20 +47,21 @@ from gamedays.serializers.game_results import (
 from gamedays.service.auto_assign_officials_service import (
     AutoAssignOfficialsError,
     AutoAssignOfficialsService,
+    OfficialAssignmentPlanner,
+)
+from gamedays.service.change_counter_service import ChangeCounterService
+from gamedays.service.designer_state_service import DesignerStateService
+from gamedays.service.game_result_service import (
+    GameResultBatchError,
+    GameResultBatchService,
 )
 from gamedays.service.gameday_service import (
     GamedayService,
-    TABLE_HEADERS,
-    HtmlAndJsonRendering,
-)
-from gamedays.service.gameday_settings import (
-    TEAM_DESCRIPTION,
-    PF,
-    PA,
-    DIFF,
-    STANDING,
-    WIN_POINTS,
+    FINAL_TABLE_COLUMNS,
+    QUALIFY_TABLE_COLUMNS,
+    table_to_json,
 )
+from gamedays.service.json_patch import JsonPatchError, apply_json_patch
 
 logger = logging.getLogger(__name__)
 
@@ -78,36 +80,29 @@ def generate_gameday_list_etag(request):
     """Generate ETag for gameday list based on query parameters and gameday state.
 
     Must change whenever the list response would change: a new/deleted gameday
-    (count), or a field edit on an existing one -- name, status, league, season,
-    etc. (max updated_at). The pk of the newest row alone doesn't cover that last
-    case: publishing gameday N doesn't create a new row, so the pk-only ETag
-    stayed identical across the publish and clients kept serving their
-    pre-publish cached body via a stale 304.
+    or a field edit on an existing one -- name, status, league, season, etc.
+    Every such write bumps the global change counter (see
+    ChangeCounterService), so answering a revalidation takes one cache read.
+    The date is part of it because GamedayListAPIView lists today's gamedays.
     """
     # Include query parameters in ETag
     etag_data = request.GET.urlencode() or "all"
 
-    aggregate = Gameday.objects.aggregate(
-        count=Count("pk"), latest_update=Max("updated_at")
-    )
-    etag_data += f":{aggregate['count']}:{aggregate['latest_update']}"
+    (global_counter,) = ChangeCounterService.get(ChangeCounterService.get_key())
+    etag_data += f":{global_counter}:{datetime.today().date()}"
 
     return f'"{hashlib.md5(etag_data.encode()).hexdigest()}"'
 
 
 def generate_gameday_games_etag(request, gameday_pk=None):
-    """Generate ETag for gameday games list based on latest gameresult."""
-    try:
-        gameday = Gameday.objects.get(pk=gameday_pk)
-        # Include gameday pk and latest gameresult pk
-        latest_result = Gameresult.objects.filter(
-            gameinfo__gameday=gameday
-        ).values_list('pk', flat=True).order_by('-pk').first()
-
-        etag_data = f"{gameday_pk}:{latest_result or 'no-results'}"
-        return f'"{hashlib.md5(etag_data.encode()).hexdigest()}"'
-    except Gameday.DoesNotExist:
-        return '""'
+    """Generate ETag for gameday games list based on the gameday's change
+    counter, which every game and result write bumps, and the global one
+    for team names."""
+    global_counter, gameday_counter = ChangeCounterService.get(
+        ChangeCounterService.get_key(), ChangeCounterService.get_key(gameday_pk)
+    )
+    etag_data = f"{gameday_pk}:{global_counter}:{gameday_counter}"
+    return f'"{hashlib.md5(etag_data.encode()).hexdigest()}"'
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -242,7 +237,7 @@ class GamedayViewSet(viewsets.ModelViewSet):
 
         return Response(GamedaySerializer(gameday).data, status=status.HTTP_200_OK)
 
-    @action(detail=True, methods=["get", "put"], url_path="designer-state")
+    @action(detail=True, methods=["get", "put", "patch"], url_path="designer-state")
     def designer_state(self, request, pk=None):
         gameday = self.get_object()
         if request.method == "GET":
@@ -267,34 +262,128 @@ class GamedayViewSet(viewsets.ModelViewSet):
                     "status": gameday.status,
                     "has_results": has_results,
                 }
-            return Response({"state_data": state_data})
+            return Response({"state_data": state_data, "revision": state.revision})
+
+        if request.method == "PATCH":
+            return self._patch_designer_state(request, gameday)
 
         if request.method == "PUT":
-            state, created = GamedayDesignerState.objects.get_or_create(gameday=gameday)
-            state.state_data = request.data.get("state_data", {})
-            state.last_modified_by = request.user
-            state.save()
-
-            metadata = state.state_data.get("metadata", {})
-            update_fields = []
-            for field in ("name", "date", "start", "address"):
-                value = metadata.get(field)
-                if value is not None and value != "" and getattr(gameday, field) != value:
-                    setattr(gameday, field, value)
-                    update_fields.append(field)
-            # league/season are FKs: read/write the *_id attname directly so we
-            # compare and assign raw pks without loading the related objects.
-            # 0 is the designer's not-yet-loaded placeholder, not a real pk --
-            # skip it rather than pointing the gameday at a nonexistent row.
-            for field, attname in (("season", "season_id"), ("league", "league_id")):
-                value = metadata.get(field)
-                if value and getattr(gameday, attname) != value:
-                    setattr(gameday, attname, value)
-                    update_fields.append(attname)
-            if update_fields:
-                gameday.save(update_fields=update_fields)
-
-            return Response({"state_data": state.state_data})
+            return self._put_designer_state(request, gameday)
+
+    def _put_designer_state(self, request, gameday):
+        """Replaces the designer state. ``base_revision`` is optional; without
+        it the state read here is the base, so a concurrent patch still wins."""
+        state_data = request.data.get("state_data", {})
+        base_revision = request.data.get("base_revision")
+        if not self._is_valid_designer_state(state_data) or (
+            base_revision is not None
+            and (not isinstance(base_revision, int) or isinstance(base_revision, bool))
+        ):
+            return Response(
+                {"detail": "Expected state_data with an object as metadata."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        state, created = GamedayDesignerState.objects.get_or_create(gameday=gameday)
+        if base_revision is None:
+            base_revision = state.revision
+        conflict = self._save_designer_state(request, state, base_revision, state_data)
+        if conflict:
+            return conflict
+
+        self._sync_designer_metadata(gameday, state_data)
+
+        return Response({"state_data": state_data, "revision": base_revision + 1})
+
+    def _patch_designer_state(self, request, gameday):
+        """Applies an RFC 6902 patch to the designer state. ``base_revision``
+        must match the stored revision, otherwise the client has to reload."""
+        base_revision = request.data.get("base_revision")
+        operations = request.data.get("patch")
+        if (
+            not isinstance(base_revision, int)
+            or isinstance(base_revision, bool)
+            or not isinstance(operations, list)
+        ):
+            return Response(
+                {"detail": "Expected base_revision and a list of patch operations."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        state, created = GamedayDesignerState.objects.get_or_create(gameday=gameday)
+        if state.revision != base_revision:
+            return Response(
+                {"detail": "Designer state has changed.", "revision": state.revision},
+                status=status.HTTP_409_CONFLICT,
+            )
+        try:
+            state_data = apply_json_patch(state.state_data, operations)
+        except JsonPatchError as e:
+            logger.info("Rejected designer state patch for gameday %s: %s", gameday.pk, e)
+            return Response(
+                {"detail": "Patch could not be applied."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not self._is_valid_designer_state(state_data):
+            return Response(
+                {"detail": "Patched state must be an object with an object as metadata."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        conflict = self._save_designer_state(request, state, base_revision, state_data)
+        if conflict:
+            return conflict
+
+        if any(
+            str(operation.get("path", "")).startswith("/metadata")
+            or operation.get("path") == ""
+            for operation in operations
+        ):
+            self._sync_designer_metadata(gameday, state_data)
+
+        return Response({"revision": base_revision + 1})
+
+    @staticmethod
+    def _is_valid_designer_state(state_data) -> bool:
+        return isinstance(state_data, dict) and isinstance(
+            state_data.get("metadata", {}), dict
+        )
+
+    @staticmethod
+    def _save_designer_state(request, state, base_revision, state_data):
+        """Stores ``state_data`` if the state is still at ``base_revision``
+        and returns the 409 response otherwise."""
+        if DesignerStateService.save_if_unchanged(
+            state, base_revision, state_data, user=request.user
+        ):
+            return None
+        return Response(
+            {
+                "detail": "Designer state has changed.",
+                "revision": GamedayDesignerState.objects.values_list(
+                    "revision", flat=True
+                ).get(pk=state.pk),
+            },
+            status=status.HTTP_409_CONFLICT,
+        )
+
+    @staticmethod
+    def _sync_designer_metadata(gameday, state_data):
+        metadata = state_data.get("metadata", {})
+        update_fields = []
+        for field in ("name", "date", "start", "address"):
+            value = metadata.get(field)
+            if value is not None and value != "" and getattr(gameday, field) != value:
+                setattr(gameday, field, value)
+                update_fields.append(field)
+        # league/season are FKs: read/write the *_id attname directly so we
+        # compare and assign raw pks without loading the related objects.
+        # 0 is the designer's not-yet-loaded placeholder, not a real pk --
+        # skip it rather than pointing the gameday at a nonexistent row.
+        for field, attname in (("season", "season_id"), ("league", "league_id")):
+            value = metadata.get(field)
+            if value and getattr(gameday, attname) != value:
+                setattr(gameday, attname, value)
+                update_fields.append(attname)
+        if update_fields:
+            gameday.save(update_fields=update_fields)
 
 
 class GamedayListAPIView(ListAPIView):
@@ -372,17 +461,9 @@ class GamedayScheduleView(APIView):
         if get == "schedule":
             response = gs.get_schedule_data().to_json(orient=orient)
         elif get == "qualify":
-            qualify_table = gs.get_qualify_table()
-            if not isinstance(qualify_table, HtmlAndJsonRendering):
-                qualify_table = qualify_table[[STANDING, TEAM_DESCRIPTION, WIN_POINTS, PF, PA, DIFF]]
-                qualify_table = qualify_table.rename(columns=TABLE_HEADERS)
-            response = qualify_table.to_json(orient="split")
+            response = table_to_json(gs.get_qualify_table(), QUALIFY_TABLE_COLUMNS)
         elif get == "final":
-            final_table = gs.get_final_table()
-            if not isinstance(final_table, HtmlAndJsonRendering):
-                final_table = final_table[[TEAM_DESCRIPTION, WIN_POINTS, PF, PA, DIFF]]
-                final_table = final_table.rename(columns=TABLE_HEADERS)
-            response = final_table.to_json(orient="split")
+            response = table_to_json(gs.get_final_table(), FINAL_TABLE_COLUMNS)
         return Response(json.loads(response, object_pairs_hook=OrderedDict))
 
 
@@ -428,9 +509,10 @@ class GameResultUpdateAPIView(APIView):
         halftime_score = request.data.get("halftime_score")
         final_score = request.data.get("final_score")
 
+        game.status = GameResultBatchService.game_status_after_scores(
+            game.status, halftime_score is not None, final_score is not None
+        )
         if halftime_score is not None:
-            if game.status == Gameinfo.STATUS_PUBLISHED or game.status == "Geplant":
-                game.status = Gameinfo.STATUS_IN_PROGRESS
             # Sync to Gameresult records
             Gameresult.objects.filter(gameinfo=game, isHome=True).update(
                 fh=halftime_score.get("home")
@@ -440,7 +522,6 @@ class GameResultUpdateAPIView(APIView):
             )
 
         if final_score is not None:
-            game.status = Gameinfo.STATUS_COMPLETED
             # Sync to Gameresult records
             # Final score in JSON is total, in Gameresult it's sh (since fh is already set)
             home_res = Gameresult.objects.filter(gameinfo=game, isHome=True).first()
@@ -465,20 +546,36 @@ class GameResultUpdateAPIView(APIView):
             )
 
         game.save()
+        GameResultBatchService.update_gameday_status(game.gameday)
+
+        return Response(GameinfoSerializer(game).data, status=status.HTTP_200_OK)
 
-        # Update gameday status
-        gameday = game.gameday
-        if gameday.status == Gameday.STATUS_PUBLISHED:
-            gameday.status = Gameday.STATUS_IN_PROGRESS
-            gameday.save()
 
-        # Check if all games are completed
-        all_games = Gameinfo.objects.filter(gameday=gameday)
-        if all(g.status == Gameinfo.STATUS_COMPLETED for g in all_games):
-            gameday.status = Gameday.STATUS_COMPLETED
-            gameday.save()
+class GameResultBatchUpdateAPIView(APIView):
+    """Enter the scores of many games of a gameday at once"""
+    permission_classes = [IsAuthenticatedOrOwnerOrStaff]
 
-        return Response(GameinfoSerializer(game).data, status=status.HTTP_200_OK)
+    def patch(self, request, gameday_pk=None):
+        """PATCH /api/gamedays/{gameday_id}/games/results/"""
+        gameday = get_object_or_404(Gameday, pk=gameday_pk)
+
+        if not _check_gameday_mutation_permission(request, gameday):
+            return Response({"detail": "You do not have permission to perform this action."}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = GameResultBatchSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            gameinfo_ids = GameResultBatchService(gameday).apply(
+                serializer.validated_data["results"]
+            )
+        except GameResultBatchError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        games = Gameinfo.objects.filter(pk__in=gameinfo_ids).prefetch_related(
+            'gameresult_set__team'
+        )
+        return Response(GameInfoSerializer(games, many=True).data, status=status.HTTP_200_OK)
 
 
 class SeasonViewSet(viewsets.ReadOnlyModelViewSet):
@@ -528,7 +625,10 @@ class AutoAssignOfficialsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         try:
-            service = AutoAssignOfficialsService(pk)
+            service = AutoAssignOfficialsService(
+                pk,
+                mode=request.data.get("mode", OfficialAssignmentPlanner.MODE_GREEDY),
+            )
             assignments = service.assign()
             return Response(
                 {"assigned_count": len(assignments), "assignments": assignments}
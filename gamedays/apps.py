@@ -7,3 +7,6 @@ class GamedaysConfig(AppConfig):
     def ready(self):
         # noinspection PyUnresolvedReferences
         import gamedays.service.signals
+        from gamedays.management.schedule_registry import ScheduleFormatRegistry
+
+        ScheduleFormatRegistry.load()
@@ -0,0 +1,95 @@
+"""Compare the greedy and the optimal official auto-assignment.
+
+Plans synthetic tournaments (by default 4 fields, 60 games, one group per
+field) with both planner modes and prints runtime and fairness of the
+referee distribution. Nothing is read from or written to the database.
+
+Usage
+-----
+::
+
+    python manage.py benchmark_auto_assign_officials
+    python manage.py benchmark_auto_assign_officials --tournaments 50 --teams-per-group 5
+"""
+
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from gamedays.service.auto_assign_officials_service import (
+    OfficialAssignmentPlanner,
+    SlotGame,
+    TimeSlot,
+)
+
+
+def build_synthetic_tournament(
+    rng: random.Random, fields: int, games: int, teams_per_group: int
+) -> tuple[list[TimeSlot], dict[str, set[int]]]:
+    all_teams_in_standing = {
+        f"Gruppe {group + 1}": set(
+            range(group * teams_per_group, (group + 1) * teams_per_group)
+        )
+        for group in range(fields)
+    }
+    standings = list(all_teams_in_standing)
+    slots = []
+    for slot_index in range(games // fields):
+        slot_games = []
+        for field_index, standing in enumerate(standings):
+            home, away = rng.sample(sorted(all_teams_in_standing[standing]), 2)
+            slot_games.append(
+                SlotGame((slot_index, field_index), standing, {home, away})
+            )
+        slots.append(TimeSlot(slot_games, is_single_field=False))
+    return slots, all_teams_in_standing
+
+
+class Command(BaseCommand):
+    help = "Benchmark greedy against optimal official auto-assignment"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tournaments", type=int, default=20)
+        parser.add_argument("--fields", type=int, default=4)
+        parser.add_argument("--games", type=int, default=60)
+        parser.add_argument("--teams-per-group", type=int, default=6)
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        tournaments = [
+            build_synthetic_tournament(
+                rng, options["fields"], options["games"], options["teams_per_group"]
+            )
+            for _ in range(options["tournaments"])
+        ]
+        self.stdout.write(
+            f"{'mode':<8} {'ms/tournament':>14} {'spread':>7} {'stdev':>6} {'unassigned':>11}"
+        )
+        for mode in OfficialAssignmentPlanner.MODES:
+            runtimes, spreads, stdevs, unassigned = [], [], [], 0
+            for slots, all_teams_in_standing in tournaments:
+                planner = OfficialAssignmentPlanner(
+                    OfficialAssignmentPlanner.build_donor_pools(
+                        slots, all_teams_in_standing
+                    ),
+                    mode=mode,
+                )
+                start = time.perf_counter()
+                assignments = planner.plan(slots)
+                runtimes.append((time.perf_counter() - start) * 1000)
+                counts = [
+                    planner.referee_count[team]
+                    for teams in all_teams_in_standing.values()
+                    for team in teams
+                ]
+                spreads.append(max(counts) - min(counts))
+                stdevs.append(statistics.pstdev(counts))
+                unassigned += sum(len(slot.games) for slot in slots) - len(assignments)
+            self.stdout.write(
+                f"{mode:<8} {statistics.mean(runtimes):>14.2f} "
+                f"{statistics.mean(spreads):>7.2f} {statistics.mean(stdevs):>6.2f} "
+                f"{unassigned:>11}"
+            )
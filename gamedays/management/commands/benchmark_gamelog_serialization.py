@@ -0,0 +1,78 @@
+"""Measure the cost of rendering a game log response.
+
+Builds a synthetic game log (by default 40 entries per team and half) and
+renders it the way ``GameLogAPIView`` used to (encode, decode into ordered
+dicts, encode again through DRF) and the way it does now (one DRF encoding
+of ``GameLog.as_dict``). Nothing is read from or written to the database.
+
+Usage
+-----
+::
+
+    python manage.py benchmark_gamelog_serialization
+    python manage.py benchmark_gamelog_serialization --entries 80 --requests 5000
+"""
+
+import json
+import statistics
+import time
+from collections import OrderedDict
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from gamedays.service.gamelog import GameLogObject
+from gamedays.service.utils import AsJsonEncoder
+
+
+def build_synthetic_gamelog(entries: int) -> GameLogObject:
+    gamelog = GameLogObject(1, "Home", "Away", 1, 2)
+    for team in (gamelog.home, gamelog.away):
+        team.score = 0
+        for half in (team.firsthalf, team.secondhalf):
+            half.score = 0
+            half.entries = [
+                {"sequence": sequence, "td": sequence % 99, "pat1": None}
+                for sequence in range(entries, 0, -1)
+            ]
+    return gamelog
+
+
+def render_with_round_trip(gamelog: GameLogObject) -> bytes:
+    return JSONRenderer().render(
+        json.loads(
+            json.dumps(gamelog, cls=AsJsonEncoder), object_pairs_hook=OrderedDict
+        )
+    )
+
+
+def render_once(gamelog: GameLogObject) -> bytes:
+    return JSONRenderer().render(gamelog.as_json())
+
+
+class Command(BaseCommand):
+    help = "Benchmark the serialization of game log responses"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--entries", type=int, default=40)
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        gamelog = build_synthetic_gamelog(options["entries"])
+        if render_with_round_trip(gamelog) != render_once(gamelog):
+            raise AssertionError("both renderings must produce the same response")
+        self.stdout.write(f"{'rendering':<12} {'us/request':>11} {'bytes':>7}")
+        for name, render in (("round trip", render_with_round_trip), ("single", render_once)):
+            runtimes = []
+            for _ in range(options["repeat"]):
+                start = time.perf_counter()
+                for _ in range(options["requests"]):
+                    render(gamelog)
+                runtimes.append(
+                    (time.perf_counter() - start) * 1_000_000 / options["requests"]
+                )
+            self.stdout.write(
+                f"{name:<12} {statistics.median(runtimes):>11.1f} "
+                f"{len(render(gamelog)):>7}"
+            )
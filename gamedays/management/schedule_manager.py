@@ -1,10 +1,10 @@
 import datetime
 import json
-import pathlib
 import re
 from dataclasses import dataclass
 from typing import Union, List, Optional
 
+from gamedays.management.schedule_registry import ScheduleFormatRegistry
 from gamedays.models import Team, Gameday, Gameinfo, Gameresult
 from gamedays.service.stage_category import derive_legacy_stage_category
 from league_table.models import LeagueGroup
@@ -101,12 +101,10 @@ class Schedule:
     def _replace_group_name(self):
         mapping = self._init_mapping()
 
-        with open(
-            pathlib.Path(__file__).parent
-            / "schedules/schedule_{0}.json".format(self.format),
-            encoding="utf-8",
-        ) as f:
-            text = f.read()
+        schedule_format = ScheduleFormatRegistry.get(self.format)
+        if schedule_format is None:
+            raise FileNotFoundError(f"No schedule for format {self.format}")
+        text = schedule_format.schedule_text
 
         # Build regex that matches *any* key in mapping — longest first to handle overlaps
         pattern = re.compile(
@@ -0,0 +1,183 @@
+import json
+import pathlib
+from dataclasses import dataclass, fields
+from typing import Optional
+
+SCHEDULES_DIR = pathlib.Path(__file__).parent / "schedules"
+
+
+class ScheduleFormatError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class UpdateReference:
+    """Where the home, away or officials team of an update rule's game comes
+    from. Every key is optional; unset ones are None, like the JSON omits them."""
+
+    pre_finished: Optional[str] = None
+    team_name: Optional[str] = None
+    standing: Optional[str] = None
+    stage: Optional[str] = None
+    place: Optional[int] = None
+    points: Optional[int] = None
+    index: Optional[int] = None
+    aggregate_standings: Optional[tuple[str, ...]] = None
+    aggregate_place: Optional[int] = None
+    first_match: Optional[tuple["UpdateReference", ...]] = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UpdateReference":
+        _check_keys(data, {field.name for field in fields(cls)}, set())
+        values = dict(data)
+        if "aggregate_standings" in values:
+            values["aggregate_standings"] = tuple(values["aggregate_standings"])
+        if "first_match" in values:
+            values["first_match"] = tuple(
+                cls.from_dict(entry) for entry in values["first_match"]
+            )
+        return cls(**values)
+
+
+@dataclass(frozen=True, slots=True)
+class UpdateGame:
+    home: UpdateReference
+    away: UpdateReference
+    officials: UpdateReference
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UpdateGame":
+        _check_keys(data, {"home", "away", "officials"}, {"home", "away"})
+        return cls(
+            home=UpdateReference.from_dict(data["home"]),
+            away=UpdateReference.from_dict(data["away"]),
+            officials=UpdateReference.from_dict(data.get("officials", {})),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class UpdateRule:
+    """Assigns the teams of the games of standing ``name`` once the standing
+    or stage ``pre_finished`` is finished."""
+
+    name: str
+    pre_finished: str
+    games: tuple[UpdateGame, ...]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UpdateRule":
+        _check_keys(data, {"name", "pre_finished", "games"}, {"name", "pre_finished", "games"})
+        return cls(
+            name=data["name"],
+            pre_finished=data["pre_finished"],
+            games=tuple(UpdateGame.from_dict(game) for game in data["games"]),
+        )
+
+    def get_triggers(self) -> set[str]:
+        """Standings and stages whose completion can change the outcome of
+        this rule. Officials may wait for a later standing than the teams."""
+        return {self.pre_finished} | {
+            game.officials.pre_finished
+            for game in self.games
+            if game.officials.pre_finished is not None
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleFormat:
+    name: str
+    # kept as text, Schedule replaces the group names before parsing it
+    schedule_text: str
+    update_rules: tuple[UpdateRule, ...]
+    update_rules_by_trigger: dict[str, tuple[UpdateRule, ...]]
+
+    def get_update_rules(self, finished: Optional[set[str]] = None) -> tuple[UpdateRule, ...]:
+        """All update rules, or only the ones triggered by the ``finished``
+        standings and stages, in file order."""
+        if finished is None:
+            return self.update_rules
+        triggered = set()
+        for name in finished:
+            triggered.update(self.update_rules_by_trigger.get(name, ()))
+        return tuple(rule for rule in self.update_rules if rule in triggered)
+
+
+class ScheduleFormatRegistry:
+    """
+    All legacy ``schedule_<format>.json`` and ``update_<format>.json`` files,
+    read and validated once. Loaded by ``GamedaysConfig.ready()`` so a broken
+    file fails at startup instead of when a game is finished.
+    """
+
+    _formats: Optional[dict[str, ScheduleFormat]] = None
+
+    @classmethod
+    def load(cls, directory: pathlib.Path = SCHEDULES_DIR) -> None:
+        formats = {}
+        for schedule_file in sorted(directory.glob("schedule_*.json")):
+            name = schedule_file.stem[len("schedule_"):]
+            update_file = directory / f"update_{name}.json"
+            try:
+                schedule_text = schedule_file.read_text(encoding="utf-8")
+                _validate_schedule(json.loads(schedule_text))
+                update_rules = ()
+                if update_file.exists():
+                    update_data = json.loads(update_file.read_text(encoding="utf-8"))
+                    if not isinstance(update_data, list):
+                        raise ScheduleFormatError("update rules must be a list")
+                    update_rules = tuple(UpdateRule.from_dict(rule) for rule in update_data)
+            except (ValueError, TypeError, KeyError) as e:
+                raise ScheduleFormatError(f"Invalid schedule format {name}: {e}") from e
+            formats[name] = ScheduleFormat(
+                name=name,
+                schedule_text=schedule_text,
+                update_rules=update_rules,
+                update_rules_by_trigger=_index_by_trigger(update_rules),
+            )
+        cls._formats = formats
+
+    @classmethod
+    def get(cls, name: str) -> Optional[ScheduleFormat]:
+        if cls._formats is None:
+            cls.load()
+        return cls._formats.get(name)
+
+    @classmethod
+    def get_update_rules(
+        cls, name: str, finished: Optional[set[str]] = None
+    ) -> tuple[UpdateRule, ...]:
+        schedule_format = cls.get(name)
+        if schedule_format is None:
+            return ()
+        return schedule_format.get_update_rules(finished)
+
+
+def _index_by_trigger(update_rules: tuple[UpdateRule, ...]) -> dict[str, tuple[UpdateRule, ...]]:
+    index = {}
+    for rule in update_rules:
+        for trigger in rule.get_triggers():
+            index.setdefault(trigger, []).append(rule)
+    return {trigger: tuple(rules) for trigger, rules in index.items()}
+
+
+def _check_keys(data, allowed: set[str], required: set[str]) -> None:
+    if not isinstance(data, dict):
+        raise ScheduleFormatError(f"expected an object, got {data!r}")
+    unknown = data.keys() - allowed
+    if unknown:
+        raise ScheduleFormatError(f"unknown keys {sorted(unknown)}")
+    missing = required - data.keys()
+    if missing:
+        raise ScheduleFormatError(f"missing keys {sorted(missing)}")
+
+
+def _validate_schedule(data) -> None:
+    if not isinstance(data, list):
+        raise ScheduleFormatError("schedule must be a list of fields")
+    game_keys = {"stage", "standing", "home", "away", "official"}
+    for field_entry in data:
+        _check_keys(field_entry, {"field", "games"}, {"field", "games"})
+        for game in field_entry["games"]:
+            # an empty object is a free slot on the field
+            if game:
+                _check_keys(game, game_keys | {"break_after"}, game_keys)
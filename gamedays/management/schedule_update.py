@@ -1,66 +1,18 @@
-import json
-import pathlib
+from typing import Iterable, Optional
 
+from gamedays.management.schedule_registry import (
+    ScheduleFormatRegistry,
+    UpdateGame,
+    UpdateRule,
+)
 from gamedays.models import Team, Gameinfo, Gameresult
 from gamedays.service.model_wrapper import GamedayModelWrapper
 
 
-class UpdateGameEntry:
-    def __init__(self, in_dict: dict):
-        assert isinstance(in_dict, dict)
-        for key, val in in_dict.items():
-            if isinstance(val, (list, tuple)):
-                setattr(
-                    self,
-                    key,
-                    [UpdateGameEntry(x) if isinstance(x, dict) else x for x in val],
-                )
-            else:
-                setattr(
-                    self, key, UpdateGameEntry(val) if isinstance(val, dict) else val
-                )
-
-    def __getattr__(self, item):
-        try:
-            return self.__dict__[item]
-        except KeyError:
-            return None
-
-
-class UpdateEntry:
-    def __init__(self, entry):
-        self.entry = entry
-        self.current = -1
-
-    def get_name(self):
-        return self.entry["name"]
-
-    def _get_games(self):
-        return self.entry["games"]
-
-    def __iter__(self):
-        for game in self.entry["games"]:
-            yield UpdateGameEntry(game)
-
-    def __next__(self):
-        self.current = +1
-        if self.current < len(self._get_games()):
-            return self.current
-        raise StopIteration
-
-
 class ScheduleUpdate:
     def __init__(self, gameday_id, format):
         self.gameday_id = gameday_id
-        try:
-            with open(
-                pathlib.Path(__file__).parent
-                / "schedules/update_{0}.json".format(format),
-                "r",
-            ) as f:
-                self.data = json.loads(f.read())
-        except FileNotFoundError:
-            self.data = {}
+        self.format = format
 
     def _update_gameresult(self, gi, teamName, is_home):
         team = Team.objects.get(description=teamName)
@@ -70,19 +22,26 @@ class ScheduleUpdate:
         gameresult.gameinfo = gi
         gameresult.save()
 
-    def update(self):
+    def update(self, finished: Optional[Iterable[str]] = None):
+        """Applies the update rules of the format. With ``finished`` only the
+        rules triggered by those standings or stages are checked."""
+        update_rules = ScheduleFormatRegistry.get_update_rules(
+            self.format, None if finished is None else set(finished)
+        )
+        if not update_rules:
+            return
         gmw = GamedayModelWrapper(self.gameday_id)
-        for update_entry in self.data:
-            if gmw.is_finished(update_entry["pre_finished"]) and not gmw.is_finished(
-                update_entry["name"]
+        update_rule: UpdateRule
+        for update_rule in update_rules:
+            if gmw.is_finished(update_rule.pre_finished) and not gmw.is_finished(
+                update_rule.name
             ):
-                entry = UpdateEntry(update_entry)
                 qs = Gameinfo.objects.filter(
-                    gameday_id=self.gameday_id, standing=entry.get_name()
+                    gameday_id=self.gameday_id, standing=update_rule.name
                 )
-                game: UpdateGameEntry
+                game: UpdateGame
                 gi: Gameinfo
-                for gi, game in zip(qs, entry):
+                for gi, game in zip(qs, update_rule.games):
                     if game.home.stage:
                         home = gmw.get_team_by_qualify_for(
                             game.home.place, game.home.index
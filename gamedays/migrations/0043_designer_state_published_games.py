@@ -0,0 +1,18 @@
+# Generated by Django 6.0.8 on 2026-10-19 07:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedays', '0042_publish_legacy_draft_gamedays'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamedaydesignerstate',
+            name='published_games',
+            field=models.JSONField(blank=True, default=dict, help_text='Gameinfo id per game node id of the last publish'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.8 on 2026-10-19 07:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedays', '0043_designer_state_published_games'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamedaydesignerstate',
+            name='revision',
+            field=models.PositiveIntegerField(default=0, help_text='Incremented on every change of state_data'),
+        ),
+    ]
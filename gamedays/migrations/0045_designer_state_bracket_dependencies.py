@@ -0,0 +1,18 @@
+# Generated by Django 6.0.8 on 2026-10-19 07:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedays', '0044_designer_state_revision'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamedaydesignerstate',
+            name='bracket_dependencies',
+            field=models.JSONField(blank=True, help_text='Per standing, the published games whose teams are its winner or loser', null=True),
+        ),
+    ]
@@ -152,6 +152,19 @@ class GamedayDesignerState(models.Model):
     state_data = models.JSONField(
         default=dict, help_text="React Flow designer state (nodes, edges, teams)"
     )
+    published_games = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Gameinfo id per game node id of the last publish",
+    )
+    bracket_dependencies = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Per standing, the published games whose teams are its winner or loser",
+    )
+    revision = models.PositiveIntegerField(
+        default=0, help_text="Incremented on every change of state_data"
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -507,3 +520,16 @@ class TournamentColumnGame(models.Model):
 
     def __str__(self):
         return f"{self.column} -> Gameinfo #{self.gameinfo_id} (pos {self.order})"
+
+
+class ChangeCounter(models.Model):
+    """Monotonic change counters behind the API ETags, one global row and one
+    per gameday. See gamedays.service.change_counter_service."""
+
+    key = models.CharField(max_length=50, primary_key=True)
+    value = models.PositiveBigIntegerField(default=0)
+
+    objects: QuerySet["ChangeCounter"] = models.Manager()
+
+    def __str__(self):
+        return f"{self.key}: {self.value}"
@@ -1,15 +1,252 @@
-from collections import defaultdict
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+
+from django.db import transaction
 
 from gamedays.models import Gameday, GamedayDesignerState, Gameinfo
+from gamedays.service.change_counter_service import ChangeCounterService
+from gamedays.service.designer_state_service import DesignerStateService
+
+DESIGNER_STATE_ATTEMPTS = 3
 
 
 class AutoAssignOfficialsError(Exception):
     pass
 
 
+@dataclass
+class SlotGame:
+    key: object
+    standing: str
+    teams: set = field(default_factory=set)
+
+
+@dataclass
+class TimeSlot:
+    games: list[SlotGame]
+    # a single physical field hosts its games one after another, so a team
+    # playing in another game of the slot may still referee
+    is_single_field: bool
+
+
+def min_cost_assignment(cost: list[list[int]]) -> list[int]:
+    """Hungarian algorithm for a rectangular cost matrix with at least as
+    many columns as rows. Returns the chosen column for every row."""
+    rows, columns = len(cost), len(cost[0])
+    inf = float("inf")
+    u = [0] * (rows + 1)
+    v = [0] * (columns + 1)
+    matched_row = [0] * (columns + 1)
+    way = [0] * (columns + 1)
+    for row in range(1, rows + 1):
+        matched_row[0] = row
+        current_column = 0
+        min_values = [inf] * (columns + 1)
+        used = [False] * (columns + 1)
+        while True:
+            used[current_column] = True
+            current_row = matched_row[current_column]
+            delta = inf
+            next_column = 0
+            for column in range(1, columns + 1):
+                if used[column]:
+                    continue
+                reduced = cost[current_row - 1][column - 1] - u[current_row] - v[column]
+                if reduced < min_values[column]:
+                    min_values[column] = reduced
+                    way[column] = current_column
+                if min_values[column] < delta:
+                    delta = min_values[column]
+                    next_column = column
+            for column in range(columns + 1):
+                if used[column]:
+                    u[matched_row[column]] += delta
+                    v[column] -= delta
+                else:
+                    min_values[column] -= delta
+            current_column = next_column
+            if matched_row[current_column] == 0:
+                break
+        while current_column:
+            previous_column = way[current_column]
+            matched_row[current_column] = matched_row[previous_column]
+            current_column = previous_column
+    assignment = [0] * rows
+    for column in range(1, columns + 1):
+        if matched_row[column]:
+            assignment[matched_row[column] - 1] = column - 1
+    return assignment
+
+
+class OfficialAssignmentPlanner:
+    """Picks a refereeing team for every game, one time slot after another.
+
+    ``MODE_GREEDY`` hands each game the least used eligible team.
+    ``MODE_OPTIMAL`` solves a min-cost matching per time slot whose costs
+    balance the referee count across the whole day; if the time budget runs
+    out, the remaining slots are planned greedily."""
+
+    MODE_GREEDY = "greedy"
+    MODE_OPTIMAL = "optimal"
+    MODES = (MODE_GREEDY, MODE_OPTIMAL)
+    DEFAULT_TIME_BUDGET = 2.0
+
+    UNASSIGNED_COST = 10**9
+    INFEASIBLE_COST = 10**12
+
+    def __init__(
+        self,
+        donor_pools: dict[str, set],
+        mode: str = MODE_GREEDY,
+        time_budget: float = DEFAULT_TIME_BUDGET,
+    ):
+        self.donor_pools = donor_pools
+        self.mode = mode
+        self.time_budget = time_budget
+        self.referee_count: dict = defaultdict(int)
+
+    @staticmethod
+    def build_donor_pools(
+        slots: list[TimeSlot],
+        all_teams_in_standing: dict[str, set],
+        fallback_pool: set | None = None,
+    ) -> dict[str, set]:
+        """Referees are drawn from the teams of the other standings; if there
+        are none, from ``fallback_pool`` or else the standing's own teams."""
+        donor_pools = {}
+        for standing in {game.standing for slot in slots for game in slot.games}:
+            donor_pool = set()
+            for other_standing, teams in all_teams_in_standing.items():
+                if other_standing != standing:
+                    donor_pool |= teams
+            if not donor_pool:
+                donor_pool = set(
+                    all_teams_in_standing.get(standing, set())
+                    if fallback_pool is None
+                    else fallback_pool
+                )
+            donor_pools[standing] = donor_pool
+        return donor_pools
+
+    def plan(self, slots: list[TimeSlot]) -> dict:
+        assignments = {}
+        deadline = time.monotonic() + self.time_budget
+        remaining_availability = Counter()
+        slot_candidates = [self._get_slot_candidates(slot) for slot in slots]
+        for candidates in slot_candidates:
+            remaining_availability.update(candidates)
+        for slot, candidates in zip(slots, slot_candidates):
+            remaining_availability.subtract(candidates)
+            if self.mode == self.MODE_OPTIMAL and time.monotonic() < deadline:
+                slot_assignments = self._assign_slot_optimal(
+                    slot, remaining_availability, len(slots) + 1
+                )
+            else:
+                slot_assignments = self._assign_slot_greedy(slot)
+            assignments.update(slot_assignments)
+        return assignments
+
+    def _get_slot_candidates(self, slot: TimeSlot) -> set:
+        busy_teams = set().union(*(game.teams for game in slot.games))
+        candidates = set()
+        for game in slot.games:
+            donor_pool = self.donor_pools[game.standing]
+            candidates |= donor_pool - (game.teams if slot.is_single_field else busy_teams)
+        return candidates
+
+    def _choose(self, key, team) -> tuple:
+        self.referee_count[team] += 1
+        return key, team
+
+    def _assign_slot_greedy(self, slot: TimeSlot) -> dict:
+        assignments = {}
+        busy_teams = set().union(*(game.teams for game in slot.games))
+        groups: dict[str, list[SlotGame]] = defaultdict(list)
+        for game in slot.games:
+            groups[game.standing].append(game)
+
+        slot_assigned = set()
+        for standing, games in groups.items():
+            donor_pool = self.donor_pools[standing]
+            eligible = [
+                t for t in donor_pool if t not in busy_teams and t not in slot_assigned
+            ]
+            if not eligible:
+                if not slot.is_single_field:
+                    continue
+                for game in games:
+                    per_game_eligible = [t for t in donor_pool if t not in game.teams]
+                    if not per_game_eligible:
+                        continue
+                    per_game_eligible.sort(key=lambda t: self.referee_count[t])
+                    key, chosen = self._choose(game.key, per_game_eligible[0])
+                    assignments[key] = chosen
+                continue
+
+            for game in games:
+                if not eligible:
+                    break
+                eligible.sort(key=lambda t: self.referee_count[t])
+                key, chosen = self._choose(game.key, eligible.pop(0))
+                assignments[key] = chosen
+                slot_assigned.add(chosen)
+        return assignments
+
+    def _assign_slot_optimal(
+        self, slot: TimeSlot, remaining_availability: Counter, count_weight: int
+    ) -> dict:
+        def get_cost(team) -> int:
+            # fewer assignments first, then teams with fewer chances later on
+            return self.referee_count[team] * count_weight + remaining_availability[team]
+
+        assignments = {}
+        busy_teams = set().union(*(game.teams for game in slot.games))
+        candidates = {
+            game.key: self.donor_pools[game.standing] - busy_teams for game in slot.games
+        }
+        teams = sorted({t for eligible in candidates.values() for t in eligible}, key=str)
+        if teams:
+            games = slot.games
+            cost = [
+                [
+                    get_cost(t) if t in candidates[game.key] else self.INFEASIBLE_COST
+                    for t in teams
+                ]
+                + [self.UNASSIGNED_COST] * len(games)
+                for game in games
+            ]
+            for game, column in zip(games, min_cost_assignment(cost)):
+                if column < len(teams) and teams[column] in candidates[game.key]:
+                    key, chosen = self._choose(game.key, teams[column])
+                    assignments[key] = chosen
+        if slot.is_single_field:
+            for game in slot.games:
+                if game.key in assignments:
+                    continue
+                per_game_eligible = sorted(
+                    self.donor_pools[game.standing] - game.teams, key=str
+                )
+                if per_game_eligible:
+                    key, chosen = self._choose(
+                        game.key, min(per_game_eligible, key=get_cost)
+                    )
+                    assignments[key] = chosen
+        return {game.key: assignments[game.key] for game in slot.games if game.key in assignments}
+
+
 class AutoAssignOfficialsService:
-    def __init__(self, gameday_id: int):
+    def __init__(
+        self,
+        gameday_id: int,
+        mode: str = OfficialAssignmentPlanner.MODE_GREEDY,
+        time_budget: float = OfficialAssignmentPlanner.DEFAULT_TIME_BUDGET,
+    ):
+        if mode not in OfficialAssignmentPlanner.MODES:
+            raise AutoAssignOfficialsError(f"Unknown assignment mode: {mode}")
         self.gameday_id = gameday_id
+        self.mode = mode
+        self.time_budget = time_budget
 
     def assign(self) -> dict:
         gameday = Gameday.objects.get(pk=self.gameday_id)
@@ -30,94 +267,49 @@ class AutoAssignOfficialsService:
         # only materialized by CanvasPublishService at publish time.
         return self._assign_from_designer_state()
 
+    def _plan(self, slots: list[TimeSlot], donor_pools: dict[str, set]) -> dict:
+        return OfficialAssignmentPlanner(
+            donor_pools, mode=self.mode, time_budget=self.time_budget
+        ).plan(slots)
+
     def _assign_from_gameinfos(self, gameinfos: list[Gameinfo]) -> dict[int, int]:
         all_teams_in_standing: dict[str, set[int]] = defaultdict(set)
+        time_groups: dict[str, list[SlotGame]] = defaultdict(list)
+        fields_at_time: dict[str, set] = defaultdict(set)
         for gi in gameinfos:
-            for gr in gi.gameresult_set.all():
-                if gr.team_id:
-                    all_teams_in_standing[gi.standing].add(gr.team_id)
-
-        time_groups: dict[str, list[Gameinfo]] = defaultdict(list)
-        for gi in gameinfos:
-            time_groups[gi.scheduled.isoformat()].append(gi)
-
-        referee_count: dict[int, int] = defaultdict(int)
-        assignments: dict[int, int] = {}
-
-        scheduled_times = sorted(time_groups.keys())
-
-        for scheduled in scheduled_times:
-            games_at_time = time_groups[scheduled]
-
-            busy_teams: set[int] = set()
-            for gi in games_at_time:
-                for gr in gi.gameresult_set.all():
-                    if gr.team_id:
-                        busy_teams.add(gr.team_id)
-
-            # How many distinct *real* fields are in play at this exact
-            # timeslot. If it's just one, games sharing this timeslot can't
-            # truly be concurrent (a field only hosts one game at a time),
-            # so a team playing in another game here is safe to referee.
-            # Scoped per-timeslot (not gameday-wide) so an unrelated later
-            # game on a second field doesn't block an earlier single-field
-            # slot.
-            num_fields_at_time = len({gi.field for gi in games_at_time})
-
-            groups: dict[str, list[Gameinfo]] = defaultdict(list)
-            for gi in games_at_time:
-                groups[gi.standing].append(gi)
-
-            slot_assigned: set[int] = set()
-
-            for standing, gis in groups.items():
-                donor_pool: set[int] = set()
-                for other_standing, teams in all_teams_in_standing.items():
-                    if other_standing != standing:
-                        donor_pool |= teams
-
-                if not donor_pool:
-                    donor_pool = all_teams_in_standing[standing].copy()
-
-                eligible = [
-                    t
-                    for t in donor_pool
-                    if t not in busy_teams and t not in slot_assigned
-                ]
-
-                if not eligible:
-                    if num_fields_at_time > 1:
-                        continue
-                    for gi in gis:
-                        game_busy = {
-                            gr.team_id
-                            for gr in gi.gameresult_set.all()
-                            if gr.team_id
-                        }
-                        per_game_eligible = [
-                            t for t in donor_pool if t not in game_busy
-                        ]
-                        if not per_game_eligible:
-                            continue
-                        per_game_eligible.sort(key=lambda t: referee_count[t])
-                        chosen = per_game_eligible.pop(0)
-                        gi.officials_id = chosen
-                        gi.save(update_fields=["officials"])
-                        referee_count[chosen] += 1
-                        assignments[gi.pk] = chosen
-                    continue
-
-                for gi in gis:
-                    if not eligible:
-                        break
-                    eligible.sort(key=lambda t: referee_count[t])
-                    chosen = eligible.pop(0)
-                    gi.officials_id = chosen
-                    gi.save(update_fields=["officials"])
-                    referee_count[chosen] += 1
-                    assignments[gi.pk] = chosen
-                    slot_assigned.add(chosen)
+            teams = {gr.team_id for gr in gi.gameresult_set.all() if gr.team_id}
+            all_teams_in_standing[gi.standing] |= teams
+            scheduled = gi.scheduled.isoformat()
+            time_groups[scheduled].append(SlotGame(gi.pk, gi.standing, teams))
+            fields_at_time[scheduled].add(gi.field)
+
+        # How many distinct *real* fields are in play at this exact
+        # timeslot. If it's just one, games sharing this timeslot can't
+        # truly be concurrent (a field only hosts one game at a time),
+        # so a team playing in another game here is safe to referee.
+        # Scoped per-timeslot (not gameday-wide) so an unrelated later
+        # game on a second field doesn't block an earlier single-field
+        # slot.
+        slots = [
+            TimeSlot(time_groups[scheduled], len(fields_at_time[scheduled]) == 1)
+            for scheduled in sorted(time_groups.keys())
+        ]
+        assignments = self._plan(
+            slots,
+            OfficialAssignmentPlanner.build_donor_pools(slots, all_teams_in_standing),
+        )
 
+        gameinfos_by_pk = {gi.pk: gi for gi in gameinfos}
+        for gameinfo_pk, team_id in assignments.items():
+            gameinfos_by_pk[gameinfo_pk].officials_id = team_id
+        with transaction.atomic():
+            Gameinfo.objects.bulk_update(
+                [gameinfos_by_pk[gameinfo_pk] for gameinfo_pk in assignments],
+                ["officials"],
+            )
+            ChangeCounterService.bump_after_bulk_write(
+                self.gameday_id, updated={Gameinfo: ["officials"]}
+            )
         return assignments
 
     def _get_num_fields(self) -> int:
@@ -129,12 +321,28 @@ class AutoAssignOfficialsService:
             return 1
 
     def _assign_from_designer_state(self) -> dict[str, str]:
-        try:
-            state = GamedayDesignerState.objects.get(gameday_id=self.gameday_id)
-        except GamedayDesignerState.DoesNotExist:
-            return {}
+        # The designer may save while the planner runs; its save wins and
+        # the assignment is planned again on the state it stored.
+        for _ in range(DESIGNER_STATE_ATTEMPTS):
+            try:
+                state = GamedayDesignerState.objects.get(gameday_id=self.gameday_id)
+            except GamedayDesignerState.DoesNotExist:
+                return {}
+            state_data = state.state_data or {}
+            assignments = self._assign_in_state_data(state_data)
+            if not assignments:
+                return assignments
+            if DesignerStateService.save_if_unchanged(
+                state, state.revision, state_data
+            ):
+                return assignments
+        raise AutoAssignOfficialsError(
+            "Designer state kept changing during the assignment"
+        )
 
-        state_data = state.state_data or {}
+    def _assign_in_state_data(self, state_data: dict) -> dict[str, str]:
+        """Plans the officials of the game nodes and sets them in
+        ``state_data``."""
         nodes = state_data.get("nodes", [])
         game_nodes = [n for n in nodes if n.get("type") == "game"]
         if not game_nodes:
@@ -152,15 +360,6 @@ class AutoAssignOfficialsService:
         field_node_count = sum(1 for n in nodes if n.get("type") == "field")
         num_fields = field_node_count if field_node_count else self._get_num_fields()
 
-        all_teams_in_standing: dict[str, set[str]] = defaultdict(set)
-        for node in game_nodes:
-            data = node.get("data", {})
-            standing = data.get("standing", "")
-            for key in ("homeTeamId", "awayTeamId"):
-                team_id = data.get(key)
-                if team_id:
-                    all_teams_in_standing[standing].add(team_id)
-
         def time_key(node: dict) -> str:
             data = node.get("data", {})
             if data.get("manualTime") and data.get("startTime"):
@@ -172,81 +371,31 @@ class AutoAssignOfficialsService:
             # a referee who is also playing elsewhere at the same time.
             return f"stage:{node.get('parentId', '')}"
 
-        time_groups: dict[str, list[dict]] = defaultdict(list)
+        all_teams_in_standing: dict[str, set[str]] = defaultdict(set)
+        time_groups: dict[str, list[SlotGame]] = defaultdict(list)
+        nodes_by_id: dict[str, dict] = {}
         for node in game_nodes:
-            time_groups[time_key(node)].append(node)
-
-        referee_count: dict[str, int] = defaultdict(int)
-        assignments: dict[str, str] = {}
-
-        for key in sorted(time_groups.keys()):
-            games_at_time = time_groups[key]
-
-            busy_teams: set[str] = set()
-            for node in games_at_time:
-                data = node.get("data", {})
-                for tkey in ("homeTeamId", "awayTeamId"):
-                    if data.get(tkey):
-                        busy_teams.add(data[tkey])
-
-            groups: dict[str, list[dict]] = defaultdict(list)
-            for node in games_at_time:
-                groups[node.get("data", {}).get("standing", "")].append(node)
-
-            slot_assigned: set[str] = set()
-
-            for standing, group_nodes in groups.items():
-                donor_pool: set[str] = set()
-                for other_standing, teams in all_teams_in_standing.items():
-                    if other_standing != standing:
-                        donor_pool |= teams
-
-                if not donor_pool:
-                    # No other game to draw a referee from -- widen to the
-                    # full registered team pool, since a team that hasn't
-                    # been placed into any game slot yet is free to referee.
-                    donor_pool = all_team_ids.copy()
-
-                eligible = [
-                    t
-                    for t in donor_pool
-                    if t not in busy_teams and t not in slot_assigned
-                ]
-
-                if not eligible:
-                    if num_fields > 1:
-                        continue
-                    for node in group_nodes:
-                        data = node.get("data", {})
-                        game_busy: set[str] = set()
-                        for tkey in ("homeTeamId", "awayTeamId"):
-                            if data.get(tkey):
-                                game_busy.add(data[tkey])
-                        per_game_eligible = [
-                            t
-                            for t in donor_pool
-                            if t not in game_busy
-                        ]
-                        if not per_game_eligible:
-                            continue
-                        per_game_eligible.sort(key=lambda t: referee_count[t])
-                        chosen = per_game_eligible.pop(0)
-                        node["data"]["official"] = {"type": "static", "name": chosen}
-                        referee_count[chosen] += 1
-                        assignments[node["id"]] = chosen
-                    continue
-
-                for node in group_nodes:
-                    if not eligible:
-                        break
-                    eligible.sort(key=lambda t: referee_count[t])
-                    chosen = eligible.pop(0)
-                    node["data"]["official"] = {"type": "static", "name": chosen}
-                    referee_count[chosen] += 1
-                    assignments[node["id"]] = chosen
-                    slot_assigned.add(chosen)
-
-        state.state_data = state_data
-        state.save(update_fields=["state_data"])
+            data = node.get("data", {})
+            standing = data.get("standing", "")
+            teams = {data[key] for key in ("homeTeamId", "awayTeamId") if data.get(key)}
+            all_teams_in_standing[standing] |= teams
+            time_groups[time_key(node)].append(SlotGame(node["id"], standing, teams))
+            nodes_by_id[node["id"]] = node
+
+        slots = [
+            TimeSlot(time_groups[key], num_fields == 1)
+            for key in sorted(time_groups.keys())
+        ]
+        # No other game to draw a referee from -- widen to the full
+        # registered team pool, since a team that hasn't been placed into
+        # any game slot yet is free to referee.
+        assignments = self._plan(
+            slots,
+            OfficialAssignmentPlanner.build_donor_pools(
+                slots, all_teams_in_standing, fallback_pool=all_team_ids
+            ),
+        )
 
+        for node_id, chosen in assignments.items():
+            nodes_by_id[node_id]["data"]["official"] = {"type": "static", "name": chosen}
         return assignments
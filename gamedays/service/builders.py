@@ -1,8 +1,11 @@
-import pandas as pd
+from __future__ import annotations
 
 from gamedays.service.gameday_service import (
     HtmlAndJsonRendering,
 )
+from league_manager.utils.lazy_import import LazyModule
+
+pd = LazyModule("pandas")
 
 
 class TableContextBuilder:
@@ -1,33 +1,117 @@
 from gamedays.models import Gameinfo, Gameresult, GamedayDesignerState
+from gamedays.service.change_counter_service import ChangeCounterService
+
+RESULT_WINNER = "winner"
+RESULT_LOSER = "loser"
 
 
 class CanvasBracketProgressionService:
     """
     After a game completes, resolves any downstream playoff games that reference
     this game's winner/loser via homeTeamDynamic / awayTeamDynamic canvas refs.
+
+    The references are read from the bracket dependency graph stored with the
+    designer state on publish (see build_dependencies), so only the direct
+    dependents of the completed game are read and written.
     """
 
     def __init__(self, completed_game: Gameinfo):
         self.game = completed_game
 
+    @staticmethod
+    def build_dependencies(
+        game_nodes: list[dict], gameinfo_ids: dict[str, int]
+    ) -> dict[str, list[dict]]:
+        """
+        Maps every referenced match name (the standing of the game it refers
+        to) to the games taking its winner or loser, e.g.
+        ``{"HF1": [{"gameinfo": 12, "is_home": True, "result": "winner"}]}``.
+        ``gameinfo_ids`` is the Gameinfo id per game node id.
+        """
+        dependencies = {}
+        for node in game_nodes:
+            gameinfo_id = gameinfo_ids.get(node.get("id"))
+            data = node.get("data", {})
+            if gameinfo_id is None or not data.get("standing"):
+                continue
+            for is_home, ref in (
+                (True, data.get("homeTeamDynamic")),
+                (False, data.get("awayTeamDynamic")),
+            ):
+                if not ref or ref.get("type") not in (RESULT_WINNER, RESULT_LOSER):
+                    continue
+                dependencies.setdefault(ref.get("matchName"), []).append(
+                    {"gameinfo": gameinfo_id, "is_home": is_home, "result": ref["type"]}
+                )
+        return dependencies
+
     def apply(self) -> None:
-        try:
-            state = GamedayDesignerState.objects.get(gameday=self.game.gameday)
-        except GamedayDesignerState.DoesNotExist:
+        state = (
+            GamedayDesignerState.objects.filter(gameday_id=self.game.gameday_id)
+            .only("pk", "bracket_dependencies")
+            .first()
+        )
+        if state is None:
+            return
+        if state.bracket_dependencies is None:
+            state.bracket_dependencies = self._build_missing_dependencies(state)
+        dependents = state.bracket_dependencies.get(self.game.standing, [])
+        if not dependents:
             return
-
-        nodes = (state.state_data or {}).get("nodes", [])
-        game_nodes = [n for n in nodes if n.get("type") == "game"]
 
         winner_team, loser_team = self._resolve_winner_loser()
         if winner_team is None and loser_team is None:
             return
+        team_by_result = {RESULT_WINNER: winner_team, RESULT_LOSER: loser_team}
+        team_by_side = {
+            (dependent["gameinfo"], dependent["is_home"]): team_by_result[
+                dependent["result"]
+            ]
+            for dependent in dependents
+        }
 
-        for node in game_nodes:
-            data = node.get("data", {})
-            target_standing = data.get("standing")
-            self._try_update(data.get("homeTeamDynamic"), target_standing, True, winner_team, loser_team)
-            self._try_update(data.get("awayTeamDynamic"), target_standing, False, winner_team, loser_team)
+        gameresults_to_update = []
+        for gameresult in Gameresult.objects.filter(
+            gameinfo_id__in={gameinfo_id for gameinfo_id, _ in team_by_side}
+        ):
+            key = (gameresult.gameinfo_id, gameresult.isHome)
+            if key in team_by_side and gameresult.team_id != team_by_side[key].pk:
+                gameresult.team = team_by_side[key]
+                gameresults_to_update.append(gameresult)
+        if gameresults_to_update:
+            Gameresult.objects.bulk_update(gameresults_to_update, ["team"])
+            ChangeCounterService.bump_after_bulk_write(
+                self.game.gameday_id, updated={Gameresult: ["team"]}
+            )
+
+    def _build_missing_dependencies(self, state: GamedayDesignerState) -> dict:
+        """Builds and stores the graph of gamedays published before it was
+        kept, matching game nodes to the gameday's games by standing."""
+        state_data = (
+            GamedayDesignerState.objects.filter(pk=state.pk)
+            .values_list("state_data", flat=True)
+            .get()
+        ) or {}
+        game_nodes = [n for n in state_data.get("nodes", []) if n.get("type") == "game"]
+        gameinfo_id_by_standing = {}
+        for gameinfo_id, standing in Gameinfo.objects.filter(
+            gameday_id=self.game.gameday_id
+        ).values_list("pk", "standing"):
+            # ambiguous standings cannot be resolved
+            gameinfo_id_by_standing[standing] = (
+                None if standing in gameinfo_id_by_standing else gameinfo_id
+            )
+        dependencies = self.build_dependencies(
+            game_nodes,
+            {
+                node["id"]: gameinfo_id_by_standing.get(node.get("data", {}).get("standing"))
+                for node in game_nodes
+            },
+        )
+        GamedayDesignerState.objects.filter(pk=state.pk).update(
+            bracket_dependencies=dependencies
+        )
+        return dependencies
 
     def _resolve_winner_loser(self):
         results = list(Gameresult.objects.filter(gameinfo=self.game).select_related("team"))
@@ -42,21 +126,3 @@ class CanvasBracketProgressionService:
         if home_total >= away_total:
             return home.team, away.team
         return away.team, home.team
-
-    def _try_update(self, ref, target_standing, is_home, winner_team, loser_team):
-        if not ref or not target_standing:
-            return
-        if ref.get("matchName") != self.game.standing:
-            return
-        ref_type = ref.get("type")
-        if ref_type == "winner":
-            team = winner_team
-        elif ref_type == "loser":
-            team = loser_team
-        else:
-            return
-        try:
-            gi = Gameinfo.objects.get(gameday=self.game.gameday, standing=target_standing)
-        except Gameinfo.DoesNotExist:
-            return
-        Gameresult.objects.filter(gameinfo=gi, isHome=is_home).update(team=team)
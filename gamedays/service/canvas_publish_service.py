@@ -1,19 +1,41 @@
+from django.db import transaction
+
 from gamedays.models import Gameday, Gameinfo, Gameresult, GamedayDesignerState, Team
+from gamedays.service.canvas_progression_service import CanvasBracketProgressionService
+from gamedays.service.change_counter_service import ChangeCounterService
+from gamedays.service.placeholder_service import GamedayScheduleVersion
 from gamedays.service.stage_category import StageCategory
 
 
 OFFICIALS_PLACEHOLDER = "N/A"
 
+GAMEINFO_PUBLISHED_FIELDS = [
+    "scheduled",
+    "field",
+    "stage",
+    "stage_category",
+    "standing",
+    "officials",
+    "status",
+]
+
 
 class CanvasPublishService:
     """
     Translates a GamedayDesignerState canvas into Gameinfo + Gameresult DB rows.
-    Idempotent: clears any existing Gameinfo rows for the gameday before creating.
+    MODE_DIFF (default) matches game nodes to the rows published from them
+    before and only inserts, updates or deletes what changed; MODE_REPLACE
+    clears any existing Gameinfo rows for the gameday before creating.
     No-ops silently if no designer state exists.
     """
 
-    def __init__(self, gameday: Gameday):
+    MODE_DIFF = "diff"
+    MODE_REPLACE = "replace"
+
+    def __init__(self, gameday: Gameday, mode: str = MODE_DIFF):
         self.gameday = gameday
+        self.mode = mode
+        self._teams_by_name: dict[str, Team] = {}
 
     def apply(self) -> None:
         try:
@@ -30,81 +52,242 @@ class CanvasPublishService:
         node_by_id = {n["id"]: n for n in nodes}
         global_teams = {t["id"]: t for t in state_data.get("globalTeams", [])}
 
-        # officials is NOT NULL — use a placeholder when unresolved
-        placeholder, _ = Team.objects.get_or_create(
-            name=OFFICIALS_PLACEHOLDER,
-            defaults={"description": OFFICIALS_PLACEHOLDER, "location": ""},
-        )
+        with transaction.atomic():
+            self._load_teams(game_nodes, global_teams)
+            # officials is NOT NULL — use a placeholder when unresolved
+            placeholder = self._teams_by_name[OFFICIALS_PLACEHOLDER]
 
-        Gameinfo.objects.filter(gameday=self.gameday).delete()
+            published_games = []
+            for node in game_nodes:
+                data = node.get("data", {})
+                stage_node = node_by_id.get(node.get("parentId"), {})
+                field_node = node_by_id.get(stage_node.get("parentId", ""), {})
 
-        for node in game_nodes:
-            data = node.get("data", {})
-            stage_node = node_by_id.get(node.get("parentId"), {})
-            field_node = node_by_id.get(stage_node.get("parentId", ""), {})
+                gameinfo = Gameinfo(
+                    gameday=self.gameday,
+                    scheduled=data.get("startTime") or str(self.gameday.start),
+                    field=field_node.get("data", {}).get("order", 0) + 1,
+                    stage=stage_node.get("data", {}).get("name", ""),
+                    stage_category=stage_node.get("data", {}).get(
+                        "category", StageCategory.PRELIMINARY
+                    ),
+                    standing=data.get("standing", ""),
+                    officials=self._resolve_official(
+                        data.get("official"), global_teams, placeholder
+                    ),
+                    status=Gameinfo.STATUS_PUBLISHED,
+                )
+                home = self._resolve_team(
+                    data.get("homeTeamId"), global_teams
+                ) or self._resolve_dynamic_team(data.get("homeTeamDynamic"))
+                away = self._resolve_team(
+                    data.get("awayTeamId"), global_teams
+                ) or self._resolve_dynamic_team(data.get("awayTeamDynamic"))
+                published_games.append((node["id"], gameinfo, home, away))
 
-            field_num = field_node.get("data", {}).get("order", 0) + 1
-            stage_name = stage_node.get("data", {}).get("name", "")
-            stage_category = stage_node.get("data", {}).get(
-                "category", StageCategory.PRELIMINARY
+            previously_published = state.published_games or {}
+            published = self._write_games(published_games, previously_published)
+            bracket_dependencies = CanvasBracketProgressionService.build_dependencies(
+                game_nodes, published
             )
-            standing = data.get("standing", "")
-            start_time = data.get("startTime") or str(self.gameday.start)
+            update_fields = []
+            if published != previously_published:
+                state.published_games = published
+                update_fields.append("published_games")
+            if bracket_dependencies != state.bracket_dependencies:
+                state.bracket_dependencies = bracket_dependencies
+                update_fields.append("bracket_dependencies")
+            if update_fields:
+                state.save(update_fields=update_fields)
 
-            officials = self._resolve_official(
-                data.get("official"), global_teams, placeholder
-            )
+    def _write_games(
+        self, published_games: list[tuple], previously_published: dict[str, int]
+    ) -> dict[str, int]:
+        """Applies the insert/update/delete diff between the published games
+        and the rows stored for the gameday by the previous publish. Returns
+        the Gameinfo id per game node id."""
+        existing_gameinfos = Gameinfo.objects.filter(gameday=self.gameday)
+        if self.mode == self.MODE_REPLACE:
+            existing_gameinfos.delete()
+            existing_by_node_id = {}
+        else:
+            existing_by_pk = existing_gameinfos.filter(
+                pk__in=previously_published.values()
+            ).prefetch_related("gameresult_set").in_bulk()
+            existing_by_node_id = {
+                node_id: existing_by_pk[pk]
+                for node_id, pk in previously_published.items()
+                if pk in existing_by_pk
+            }
 
-            gi = Gameinfo.objects.create(
-                gameday=self.gameday,
-                scheduled=start_time,
-                field=field_num,
-                stage=stage_name,
-                stage_category=stage_category,
-                standing=standing,
-                officials=officials,
-                status=Gameinfo.STATUS_PUBLISHED,
+        gameinfos_to_create, gameinfos_to_update = [], []
+        gameresults_to_create, gameresults_to_update = [], []
+        kept_ids = []
+        gameinfo_by_node_id = {}
+        for node_id, gameinfo, home, away in published_games:
+            existing = existing_by_node_id.pop(node_id, None)
+            if existing is None:
+                gameinfo_by_node_id[node_id] = gameinfo
+                gameinfos_to_create.append(gameinfo)
+                gameresults_to_create += [
+                    Gameresult(gameinfo=gameinfo, team=home, isHome=True),
+                    Gameresult(gameinfo=gameinfo, team=away, isHome=False),
+                ]
+                continue
+            kept_ids.append(existing.pk)
+            gameinfo_by_node_id[node_id] = existing
+            if self._has_changed(existing, gameinfo):
+                for name in GAMEINFO_PUBLISHED_FIELDS:
+                    setattr(existing, name, getattr(gameinfo, name))
+                gameinfos_to_update.append(existing)
+            results_by_side = {
+                gameresult.isHome: gameresult
+                for gameresult in existing.gameresult_set.all()
+            }
+            for is_home, team in ((True, home), (False, away)):
+                gameresult = results_by_side.get(is_home)
+                team_id = team.pk if team else None
+                if gameresult is None:
+                    gameresults_to_create.append(
+                        Gameresult(gameinfo=existing, team=team, isHome=is_home)
+                    )
+                elif gameresult.team_id != team_id:
+                    gameresult.team = team
+                    gameresults_to_update.append(gameresult)
+
+        if self.mode == self.MODE_DIFF:
+            Gameinfo.objects.filter(gameday=self.gameday).exclude(
+                pk__in=kept_ids
+            ).delete()
+        if gameinfos_to_update:
+            Gameinfo.objects.bulk_update(gameinfos_to_update, GAMEINFO_PUBLISHED_FIELDS)
+        if gameresults_to_update:
+            Gameresult.objects.bulk_update(gameresults_to_update, ["team"])
+        if gameinfos_to_create:
+            Gameinfo.objects.bulk_create(gameinfos_to_create)
+            if any(gameinfo.pk is None for gameinfo in gameinfos_to_create):
+                # backends without RETURNING: every other row of the gameday
+                # is kept, so the remaining ids belong to the new rows
+                created_pks = (
+                    Gameinfo.objects.filter(gameday=self.gameday)
+                    .exclude(pk__in=kept_ids)
+                    .order_by("pk")
+                    .values_list("pk", flat=True)
+                )
+                for gameinfo, pk in zip(gameinfos_to_create, created_pks):
+                    gameinfo.pk = pk
+        if gameresults_to_create:
+            Gameresult.objects.bulk_create(gameresults_to_create)
+        if gameinfos_to_update or gameinfos_to_create:
+            # bulk writes send no signals
+            GamedayScheduleVersion.bump(self.gameday.pk)
+        updated = {}
+        if gameinfos_to_update:
+            updated[Gameinfo] = GAMEINFO_PUBLISHED_FIELDS
+        if gameresults_to_update:
+            updated[Gameresult] = ["team"]
+        created = tuple(
+            model
+            for model, rows in (
+                (Gameinfo, gameinfos_to_create),
+                (Gameresult, gameresults_to_create),
+            )
+            if rows
+        )
+        if updated or created:
+            ChangeCounterService.bump_after_bulk_write(
+                self.gameday.pk, updated=updated, created=created
             )
+        return {
+            node_id: gameinfo.pk for node_id, gameinfo in gameinfo_by_node_id.items()
+        }
 
-            Gameresult.objects.create(
-                gameinfo=gi,
-                team=self._resolve_team(data.get("homeTeamId"), global_teams)
-                    or self._resolve_dynamic_team(data.get("homeTeamDynamic")),
-                isHome=True,
+    @staticmethod
+    def _has_changed(existing: Gameinfo, published: Gameinfo) -> bool:
+        for name in GAMEINFO_PUBLISHED_FIELDS:
+            field = Gameinfo._meta.get_field(name)
+            # the canvas provides the start time as string
+            if field.to_python(getattr(existing, field.attname)) != field.to_python(
+                getattr(published, field.attname)
+            ):
+                return True
+        return False
+
+    def _load_teams(self, game_nodes: list[dict], global_teams: dict) -> None:
+        """Fetches every team the canvas refers to by name in one query and
+        creates the missing ones in bulk."""
+        names = {OFFICIALS_PLACEHOLDER}
+        for node in game_nodes:
+            data = node.get("data", {})
+            for team_id, dynamic_ref in (
+                (data.get("homeTeamId"), data.get("homeTeamDynamic")),
+                (data.get("awayTeamId"), data.get("awayTeamDynamic")),
+            ):
+                names.add(self._get_team_label(team_id, global_teams))
+                names.add(self._format_dynamic_ref(dynamic_ref))
+            names.add(self._get_official_name(data.get("official"), global_teams))
+        names.discard("")
+        self._teams_by_name = {
+            team.name: team for team in Team.objects.filter(name__in=names)
+        }
+        missing = names - self._teams_by_name.keys()
+        if missing:
+            Team.objects.bulk_create(
+                [
+                    Team(name=name, description=name, location="")
+                    for name in sorted(missing)
+                ],
+                ignore_conflicts=True,
             )
-            Gameresult.objects.create(
-                gameinfo=gi,
-                team=self._resolve_team(data.get("awayTeamId"), global_teams)
-                    or self._resolve_dynamic_team(data.get("awayTeamDynamic")),
-                isHome=False,
+            self._teams_by_name.update(
+                (team.name, team) for team in Team.objects.filter(name__in=missing)
             )
 
-    def _resolve_team(self, team_id, global_teams):
+    def _get_team_by_name(self, name: str) -> Team:
+        team = self._teams_by_name.get(name)
+        if team is None:
+            team, _ = Team.objects.get_or_create(
+                name=name,
+                defaults={"description": name, "location": ""},
+            )
+            self._teams_by_name[name] = team
+        return team
+
+    @staticmethod
+    def _get_team_label(team_id, global_teams) -> str:
         if not team_id:
-            return None
+            return ""
         entry = global_teams.get(team_id)
         if not entry:
-            return None
-        label = entry.get("label", "")
+            return ""
+        return entry.get("label", "")
+
+    @classmethod
+    def _get_official_name(cls, official_ref, global_teams) -> str:
+        if not official_ref:
+            return ""
+        if official_ref.get("type") == "static":
+            name = official_ref.get("name", "")
+            # Canvas stores canvas team-ID as name; resolve to label if possible
+            if name in global_teams:
+                name = global_teams[name].get("label", name)
+            return name
+        # Dynamic references (winner/loser/standing/rank/groupRank/groupTeam):
+        # format a readable label, e.g. {type: "winner", matchName: "VF 2"}
+        # -> "Gewinner VF 2", mirroring home/away dynamic resolution.
+        return cls._format_dynamic_ref(official_ref)
+
+    def _resolve_team(self, team_id, global_teams):
+        label = self._get_team_label(team_id, global_teams)
         if not label:
             return None
-        team, _ = Team.objects.get_or_create(
-            name=label,
-            defaults={"description": label, "location": ""},
-        )
-        return team
+        return self._get_team_by_name(label)
 
     def _resolve_dynamic_team(self, dynamic_ref):
-        if not dynamic_ref:
-            return None
         label = self._format_dynamic_ref(dynamic_ref)
         if not label:
             return None
-        team, _ = Team.objects.get_or_create(
-            name=label,
-            defaults={"description": label, "location": ""},
-        )
-        return team
+        return self._get_team_by_name(label)
 
     @staticmethod
     def _format_dynamic_ref(ref) -> str:
@@ -134,29 +317,7 @@ class CanvasPublishService:
         return ""
 
     def _resolve_official(self, official_ref, global_teams, fallback):
-        if not official_ref:
+        name = self._get_official_name(official_ref, global_teams)
+        if not name:
             return fallback
-        if official_ref.get("type") == "static":
-            name = official_ref.get("name", "")
-            # Canvas stores canvas team-ID as name; resolve to label if possible
-            if name in global_teams:
-                name = global_teams[name].get("label", name)
-            if name:
-                team, _ = Team.objects.get_or_create(
-                    name=name,
-                    defaults={"description": name, "location": ""},
-                )
-                return team
-            return fallback
-
-        # Dynamic references (winner/loser/standing/rank/groupRank/groupTeam):
-        # format a readable label, e.g. {type: "winner", matchName: "VF 2"}
-        # -> "Gewinner VF 2", mirroring home/away dynamic resolution.
-        name = self._format_dynamic_ref(official_ref)
-        if name:
-            team, _ = Team.objects.get_or_create(
-                name=name,
-                defaults={"description": name, "location": ""},
-            )
-            return team
-        return fallback
+        return self._get_team_by_name(name)
@@ -0,0 +1,116 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.dispatch import Signal
+
+from gamedays.models import ChangeCounter
+from league_manager.cache import live_cache
+from league_manager.db_router import reads_from_replica
+
+GLOBAL_COUNTER_KEY = "global"
+GAMEDAY_COUNTER_KEY = "gameday:{gameday_id}"
+CHANGE_COUNTER_CACHE_KEY = "change_counter:{key}"
+# a read racing a bump can cache the value from before the bump after the
+# bump dropped it; the timeout bounds how long it stays
+CHANGE_COUNTER_CACHE_TTL = 10
+
+# Sent by ChangeCounterService.bump_after_bulk_write once per written model,
+# so the caches of other apps can be invalidated like on post_save: the
+# sender is the model, ``created`` tells bulk_create from bulk_update and
+# ``update_fields`` holds the fields passed to bulk_update. Bulk writes that
+# belong to no gameday, like those of the Moodle sync, send it with
+# ``gameday_id=None``.
+post_bulk_write = Signal()
+
+
+class ChangeCounterService:
+    """
+    Change counters stored in the ChangeCounter table and mirrored in the
+    cache. The global counter covers everything listed across gamedays (the
+    gamedays themselves, leagues, seasons, teams); a gameday's counter covers
+    its games and results. ``gamedays.service.signals`` bumps them, callers
+    writing in bulk call ``bump_after_bulk_write``.
+
+    A bump drops the cached value right away and again on commit, the next
+    read fills it from the table. A read that selected the value before the
+    bump committed may still cache it afterwards, so cached values expire
+    after ``CHANGE_COUNTER_CACHE_TTL`` seconds.
+    Reads from a replica bypass the cache, see ``league_manager.db_router``.
+    """
+
+    @staticmethod
+    def get_key(gameday_id=None) -> str:
+        if gameday_id is None:
+            return GLOBAL_COUNTER_KEY
+        return GAMEDAY_COUNTER_KEY.format(gameday_id=gameday_id)
+
+    @classmethod
+    def get(cls, *keys: str) -> list[int]:
+        """Values of the counters ``keys`` with one cache read; counters that
+        are not cached are read with one query."""
+        if reads_from_replica():
+            # what is cached under these values is read from the same replica
+            stored = dict(
+                ChangeCounter.objects.filter(key__in=keys).values_list("key", "value")
+            )
+            return [stored.get(key, 0) for key in keys]
+        cache_keys = {key: CHANGE_COUNTER_CACHE_KEY.format(key=key) for key in keys}
+        cached = live_cache.get_many(cache_keys.values())
+        values = {
+            key: cached[cache_key]
+            for key, cache_key in cache_keys.items()
+            if cache_key in cached
+        }
+        missing = [key for key in keys if key not in values]
+        if missing:
+            stored = dict(
+                ChangeCounter.objects.filter(key__in=missing).values_list("key", "value")
+            )
+            for key in missing:
+                values[key] = stored.get(key, 0)
+            live_cache.set_many(
+                {cache_keys[key]: values[key] for key in missing},
+                CHANGE_COUNTER_CACHE_TTL,
+            )
+        return [values[key] for key in keys]
+
+    @classmethod
+    def bump(cls, gameday_id=None) -> None:
+        key = cls.get_key(gameday_id)
+        if not ChangeCounter.objects.filter(key=key).update(value=F("value") + 1):
+            try:
+                with transaction.atomic():
+                    ChangeCounter.objects.create(key=key, value=1)
+            except IntegrityError:
+                # created concurrently
+                ChangeCounter.objects.filter(key=key).update(value=F("value") + 1)
+        cache_key = CHANGE_COUNTER_CACHE_KEY.format(key=key)
+        live_cache.delete(cache_key)
+        transaction.on_commit(lambda: live_cache.delete(cache_key))
+
+    @classmethod
+    def bump_gameday(cls, gameday_id) -> None:
+        """Bumps the counter of a gameday whose listed fields changed as well
+        as the global one."""
+        cls.bump(gameday_id)
+        cls.bump()
+
+    @classmethod
+    def bump_after_bulk_write(
+        cls, gameday_id, updated: dict = None, created: tuple = ()
+    ) -> None:
+        """Bumps the counter of a gameday after games or results of it were
+        written in bulk and sends ``post_bulk_write``, as bulk writes send no
+        post_save. ``updated`` maps each model to the fields passed to
+        bulk_update, ``created`` lists the models rows were bulk created of."""
+        cls.bump(gameday_id)
+        for model, fields in (updated or {}).items():
+            post_bulk_write.send(
+                sender=model,
+                gameday_id=gameday_id,
+                created=False,
+                update_fields=frozenset(fields),
+            )
+        for model in created:
+            post_bulk_write.send(
+                sender=model, gameday_id=gameday_id, created=True, update_fields=None
+            )
@@ -0,0 +1,32 @@
+from django.db.models import F
+from django.utils import timezone
+
+from gamedays.models import GamedayDesignerState
+
+
+class DesignerStateService:
+    """
+    Writes of ``GamedayDesignerState.state_data``. Every write increments
+    ``revision``, which clients send back as ``base_revision`` to detect that
+    the state changed since they read it.
+    """
+
+    @staticmethod
+    def save_if_unchanged(
+        state: GamedayDesignerState, base_revision: int, state_data, user=None
+    ) -> bool:
+        """Stores ``state_data`` if the state is still at ``base_revision``
+        (compare-and-set: a concurrent save between read and write wins) and
+        returns whether it did. ``last_modified_by`` is kept without a user."""
+        changes = {
+            "state_data": state_data,
+            "revision": F("revision") + 1,
+            "updated_at": timezone.now(),
+        }
+        if user is not None:
+            changes["last_modified_by"] = user
+        return bool(
+            GamedayDesignerState.objects.filter(
+                pk=state.pk, revision=base_revision
+            ).update(**changes)
+        )
@@ -0,0 +1,126 @@
+import logging
+
+from django.db import transaction
+
+from gamedays.models import Gameday, Gameinfo, Gameresult
+from gamedays.service.change_counter_service import ChangeCounterService
+from gamedays.service.schedule_resolution_service import (
+    GamedayScheduleResolutionService,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class GameResultBatchError(Exception):
+    pass
+
+
+class GameResultBatchService:
+    """
+    Enters the halftime and final scores of many games of a gameday at once,
+    e.g. ``[{"gameinfo": 12, "halftime_score": {"home": 7, "away": 0},
+    "final_score": {"home": 14, "away": 6}}]``. Scores follow the single game
+    result endpoint: a halftime score starts the game, a final score completes
+    it and sets the second half to the difference to the first.
+
+    The games and their results are read with one query each and written in
+    bulk within one transaction, the dependent games are resolved once for all
+    completed games.
+    """
+
+    def __init__(self, gameday: Gameday):
+        self.gameday = gameday
+
+    def apply(self, entries: list[dict]) -> list[int]:
+        """Applies ``entries`` and returns the ids of the updated games."""
+        gameinfo_ids = [entry["gameinfo"] for entry in entries]
+        if len(set(gameinfo_ids)) != len(gameinfo_ids):
+            raise GameResultBatchError("Each game may only be listed once.")
+        gameinfos = Gameinfo.objects.filter(
+            gameday=self.gameday, pk__in=gameinfo_ids
+        ).in_bulk()
+        unknown = [pk for pk in gameinfo_ids if pk not in gameinfos]
+        if unknown:
+            raise GameResultBatchError(
+                f"Games {unknown} do not belong to gameday {self.gameday.pk}."
+            )
+        gameresults = {
+            (gameresult.gameinfo_id, gameresult.isHome): gameresult
+            for gameresult in Gameresult.objects.filter(gameinfo_id__in=gameinfo_ids)
+        }
+
+        gameinfos_to_update = []
+        gameresults_to_update = []
+        completed = []
+        for entry in entries:
+            gameinfo = gameinfos[entry["gameinfo"]]
+            halftime_score = entry.get("halftime_score")
+            final_score = entry.get("final_score")
+            for is_home, side in ((True, "home"), (False, "away")):
+                gameresult = gameresults.get((gameinfo.pk, is_home))
+                if gameresult is None:
+                    continue
+                if halftime_score is not None:
+                    gameresult.fh = halftime_score[side]
+                if final_score is not None:
+                    gameresult.sh = final_score[side] - (gameresult.fh or 0)
+                gameresults_to_update.append(gameresult)
+            status = self.game_status_after_scores(
+                gameinfo.status, halftime_score is not None, final_score is not None
+            )
+            if final_score is not None:
+                completed.append(gameinfo)
+            if status != gameinfo.status:
+                gameinfo.status = status
+                gameinfos_to_update.append(gameinfo)
+
+        with transaction.atomic():
+            if gameresults_to_update:
+                Gameresult.objects.bulk_update(gameresults_to_update, ["fh", "sh"])
+            if gameinfos_to_update:
+                Gameinfo.objects.bulk_update(gameinfos_to_update, ["status"])
+            ChangeCounterService.bump_after_bulk_write(
+                self.gameday.pk,
+                updated={Gameresult: ["fh", "sh"], Gameinfo: ["status"]},
+            )
+            if completed:
+                try:
+                    with transaction.atomic():
+                        GamedayScheduleResolutionService.resolve_completed_games(
+                            self.gameday, completed
+                        )
+                except Exception as e:
+                    logger.warning(
+                        f"Schedule resolution failed for gameday {self.gameday.pk}: {e}"
+                    )
+            self.update_gameday_status(self.gameday)
+        return gameinfo_ids
+
+    @staticmethod
+    def game_status_after_scores(
+        status: str, has_halftime_score: bool, has_final_score: bool
+    ) -> str:
+        """A halftime score starts a scheduled game, a final score completes
+        any game."""
+        if has_final_score:
+            return Gameinfo.STATUS_COMPLETED
+        if has_halftime_score and status == Gameinfo.STATUS_PUBLISHED:
+            return Gameinfo.STATUS_IN_PROGRESS
+        return status
+
+    @staticmethod
+    def update_gameday_status(gameday: Gameday) -> None:
+        """Starts a published gameday and completes it once no game of it is
+        left open, checked with a single EXISTS query."""
+        status = gameday.status
+        if status == Gameday.STATUS_PUBLISHED:
+            status = Gameday.STATUS_IN_PROGRESS
+        if (
+            not Gameinfo.objects.filter(gameday=gameday)
+            .exclude(status=Gameinfo.STATUS_COMPLETED)
+            .exists()
+        ):
+            status = Gameday.STATUS_COMPLETED
+        if status != gameday.status:
+            gameday.status = status
+            gameday.save()
@@ -1,11 +1,15 @@
+from __future__ import annotations
+
 import logging
 from abc import ABC, abstractmethod
 
-import pandas as pd
 from django.utils.html import format_html
 
 from gamedays.constants import LEAGUE_GAMEDAY_GAME_DETAIL
-from gamedays.service.placeholder_service import GamedayPlaceholderService
+from gamedays.service.placeholder_service import (
+    GamedayPlaceholderService,
+    PLACEHOLDER_FALLBACK,
+)
 from league_manager.utils.url_service import UrlService
 
 logger = logging.getLogger(__name__)
@@ -43,6 +47,9 @@ from gamedays.service.gameday_settings import (
     ID,
 )
 from gamedays.service.model_wrapper import GamedayModelWrapper
+from league_manager.utils.lazy_import import LazyModule
+
+pd = LazyModule("pandas")
 
 EMPTY_DATA = "[]"
 
@@ -56,6 +63,9 @@ TABLE_HEADERS = {
     DIFF: "+/-",
 }
 
+QUALIFY_TABLE_COLUMNS = [STANDING, TEAM_DESCRIPTION, WIN_POINTS, PF, PA, DIFF]
+FINAL_TABLE_COLUMNS = [TEAM_DESCRIPTION, WIN_POINTS, PF, PA, DIFF]
+
 SCHEDULE_TABLE_HEADERS = {
     SCHEDULED: "Start",
     FIELD: "Feld",
@@ -81,6 +91,14 @@ class HtmlAndJsonRendering(ABC):
         raise NotImplementedError
 
 
+def table_to_json(table, columns) -> str:
+    """Renders a qualify or final table with the German headers as split
+    JSON; empty tables render as ``[]``."""
+    if not isinstance(table, HtmlAndJsonRendering):
+        table = table[columns].rename(columns=TABLE_HEADERS)
+    return table.to_json(orient="split")
+
+
 class EmptySchedule(HtmlAndJsonRendering):
     def to_html(self, *args, **kwargs):
         return "None"
@@ -375,7 +393,9 @@ class GamedayGameService:
 
         if len(self.gameresult) > 0:
 
-            placeholder_service = GamedayPlaceholderService(self.game.gameday_id)
+            placeholders = GamedayPlaceholderService.get_placeholder_map(
+                self.game.gameday_id
+            )
 
             home_rows = self.gameresult[self.gameresult['isHome'] == True]
             away_rows = self.gameresult[self.gameresult['isHome'] == False]
@@ -385,18 +405,18 @@ class GamedayGameService:
                 self.home_team_id = home_row["team"]
                 self.home_team_name = home_row["team__description"]
                 if pd.isna(self.home_team_name) or self.home_team_name is None:
-                    self.home_team_name = placeholder_service.get_placeholder(pk, is_home=True)
+                    self.home_team_name = placeholders.get((self.game.pk, True), PLACEHOLDER_FALLBACK)
             else:
-                self.home_team_name = placeholder_service.get_placeholder(pk, is_home=True)
+                self.home_team_name = placeholders.get((self.game.pk, True), PLACEHOLDER_FALLBACK)
 
             if not away_rows.empty:
                 away_row = away_rows.iloc[0]
                 self.away_team_id = away_row["team"]
                 self.away_team_name = away_row["team__description"]
                 if pd.isna(self.away_team_name) or self.away_team_name is None:
-                    self.away_team_name = placeholder_service.get_placeholder(pk, is_home=False)
+                    self.away_team_name = placeholders.get((self.game.pk, False), PLACEHOLDER_FALLBACK)
             else:
-                self.away_team_name = placeholder_service.get_placeholder(pk, is_home=False)
+                self.away_team_name = placeholders.get((self.game.pk, False), PLACEHOLDER_FALLBACK)
 
         self._score_column_mapping = {
             # "created_time": "Zeit",
@@ -3,7 +3,7 @@ import json
 from django.db.models import QuerySet
 
 from gamedays.models import Gameresult, TeamLog
-from gamedays.service.utils import AsJsonEncoder
+from gamedays.service.change_counter_service import ChangeCounterService
 
 EXCLUDED_EVENTS = ["Strafe", "Spielzeit", "Auszeit", "First Down"]
 
@@ -97,7 +97,9 @@ class GameLog(object):
             away_team.pk,
         )
 
-    def as_json(self):
+    def as_dict(self) -> dict:
+        """The game log as plain dicts and lists, so a response encodes it
+        only once."""
         self.gamelog.is_first_half = self.is_firsthalf()
         self.gamelog.home.score = self.get_home_score()
         self.gamelog.away.score = self.get_away_score()
@@ -125,7 +127,10 @@ class GameLog(object):
         self.gamelog.away.secondhalf.entries = self.create_entries_for_half(
             self.get_entries_away_secondhalf()
         )
-        return json.dumps(self.gamelog, cls=(AsJsonEncoder))
+        return self.gamelog.as_json()
+
+    def as_json(self):
+        return json.dumps(self.as_dict())
 
     def get_home_team(self):
         return self.gamelog.home.name
@@ -234,6 +239,8 @@ class GameLog(object):
         TeamLog.objects.filter(gameinfo=self.gameinfo, sequence=sequence).update(
             isDeleted=True
         )
+        # update() sends no post_save
+        ChangeCounterService.bump(self.gameinfo.gameday_id)
 
 
 class Half(object):
@@ -258,8 +265,8 @@ class Team(object):
             id=self.id,
             name=self.name,
             score=self.score,
-            firsthalf=self.firsthalf,
-            secondhalf=self.secondhalf,
+            firsthalf=self.firsthalf.as_json(),
+            secondhalf=self.secondhalf.as_json(),
         )
 
 
@@ -274,6 +281,6 @@ class GameLogObject(object):
         return dict(
             gameId=self.gameId,
             isFirstHalf=self.is_first_half,
-            home=self.home,
-            away=self.away,
+            home=self.home.as_json(),
+            away=self.away.as_json(),
         )
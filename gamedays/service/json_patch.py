@@ -0,0 +1,130 @@
+import copy
+
+
+class JsonPatchError(Exception):
+    pass
+
+
+def apply_json_patch(document, operations: list):
+    """
+    Applies RFC 6902 ``operations`` to a copy of ``document`` and returns the
+    patched copy. Raises JsonPatchError on the first operation that cannot
+    be applied (including a failing ``test``), leaving ``document`` untouched.
+    """
+    if not isinstance(operations, list):
+        raise JsonPatchError("Patch must be a list of operations")
+    document = copy.deepcopy(document)
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise JsonPatchError("Patch operation must be an object")
+        op = operation.get("op")
+        path = _parse_pointer(operation.get("path"))
+        if op == "add":
+            document = _add(document, path, copy.deepcopy(_get_value(operation)))
+        elif op == "remove":
+            document = _remove(document, path)[0]
+        elif op == "replace":
+            value = copy.deepcopy(_get_value(operation))
+            if path:
+                document = _remove(document, path)[0]
+            document = _add(document, path, value)
+        elif op == "move":
+            from_path = _parse_pointer(operation.get("from"))
+            if path[: len(from_path)] == from_path and path != from_path:
+                raise JsonPatchError("Cannot move a value into one of its children")
+            document, value = _remove(document, from_path)
+            document = _add(document, path, value)
+        elif op == "copy":
+            from_path = _parse_pointer(operation.get("from"))
+            document = _add(document, path, copy.deepcopy(_get(document, from_path)))
+        elif op == "test":
+            if not _json_equal(_get(document, path), _get_value(operation)):
+                raise JsonPatchError(f"Test failed at {operation.get('path')}")
+        else:
+            raise JsonPatchError(f"Unknown patch operation: {op}")
+    return document
+
+
+def _get_value(operation: dict):
+    if "value" not in operation:
+        raise JsonPatchError(f"Operation {operation.get('op')} needs a value")
+    return operation["value"]
+
+
+def _json_equal(a, b) -> bool:
+    """Equality of RFC 6902 ``test``: unlike ``==`` in Python, booleans are
+    not numbers, so ``true`` does not equal ``1``."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[key], b[key]) for key in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(map(_json_equal, a, b))
+    if isinstance(a, (dict, list)) or isinstance(b, (dict, list)):
+        return False
+    return a == b
+
+
+def _parse_pointer(pointer) -> list[str]:
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise JsonPatchError(f"Invalid JSON pointer: {pointer!r}")
+    if not pointer:
+        return []
+    return [
+        token.replace("~1", "/").replace("~0", "~") for token in pointer.split("/")[1:]
+    ]
+
+
+def _get_index(container: list, token: str, allow_end: bool = False) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    # isdigit alone accepts other digits such as "²", which int() rejects
+    if (
+        not (token.isascii() and token.isdigit())
+        or (token != "0" and token.startswith("0"))
+    ):
+        raise JsonPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise JsonPatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _get(document, path: list[str]):
+    value = document
+    for token in path:
+        if isinstance(value, dict):
+            if token not in value:
+                raise JsonPatchError(f"Path member not found: {token!r}")
+            value = value[token]
+        elif isinstance(value, list):
+            value = value[_get_index(value, token)]
+        else:
+            raise JsonPatchError(f"Cannot traverse into a scalar at {token!r}")
+    return value
+
+
+def _add(document, path: list[str], value):
+    if not path:
+        return value
+    parent = _get(document, path[:-1])
+    if isinstance(parent, dict):
+        parent[path[-1]] = value
+    elif isinstance(parent, list):
+        parent.insert(_get_index(parent, path[-1], allow_end=True), value)
+    else:
+        raise JsonPatchError(f"Cannot add to a scalar at {path[-1]!r}")
+    return document
+
+
+def _remove(document, path: list[str]) -> tuple:
+    if not path:
+        raise JsonPatchError("Cannot remove the whole document")
+    parent = _get(document, path[:-1])
+    if isinstance(parent, dict):
+        if path[-1] not in parent:
+            raise JsonPatchError(f"Path member not found: {path[-1]!r}")
+        return document, parent.pop(path[-1])
+    if isinstance(parent, list):
+        return document, parent.pop(_get_index(parent, path[-1]))
+    raise JsonPatchError(f"Cannot remove from a scalar at {path[-1]!r}")
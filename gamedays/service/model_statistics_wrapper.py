@@ -1,11 +1,15 @@
-import pandas as pd
+from __future__ import annotations
+
 from django.core.exceptions import ObjectDoesNotExist
 
 from gamedays.models import Gameday, Gameinfo, TeamLog
+from league_manager.utils.lazy_import import LazyModule
 from league_table.models import LeagueSeasonConfig
 from league_table.service.leaguetable_settings import SHOW_PLAYER_NAMES, TOP_N_PLAYER
 from passcheck.models import PlayerlistGameday
 
+pd = LazyModule("pandas")
+
 INDIVIDUAL_STATISTIC_EVENTS = [
     "Touchdown",
     "Interception",
@@ -1,8 +1,7 @@
-import numpy as np
-import pandas as pd
+from __future__ import annotations
+
 from django.apps import apps
 from django.core.exceptions import ObjectDoesNotExist
-from pandas import DataFrame
 
 from gamedays.models import Gameinfo, Gameresult, TeamLog
 from gamedays.service.gameday_settings import (
@@ -36,7 +35,11 @@ from gamedays.service.gameday_settings import (
     TEAM_ID,
 )
 from gamedays.service.stage_category import StageCategory
-from gamedays.service.placeholder_service import GamedayPlaceholderService
+from gamedays.service.placeholder_service import (
+    GamedayPlaceholderService,
+    PLACEHOLDER_FALLBACK,
+)
+from league_manager.utils.lazy_import import LazyModule
 from league_table.models import LeagueSeasonConfig, LeagueRuleset
 from league_table.service.datatypes import LeagueConfigRuleset, LeagueConfig
 from league_table.service.leaguetable_settings import TOP_N_PLAYER, SHOW_PLAYER_NAMES
@@ -46,6 +49,9 @@ from league_table.service.ranking.engine import (
 )
 from passcheck.models import PasscheckVerification, PlayerlistGameday
 
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
 
 class DfflPoints(object):
 
@@ -76,7 +82,7 @@ class GamedayModelWrapper:
         if not gameinfo.exists():
             raise Gameinfo.DoesNotExist
         self.gameday = gameinfo.first().gameday
-        self._gameinfo: DataFrame = pd.DataFrame(gameinfo.values(
+        self._gameinfo: pd.DataFrame = pd.DataFrame(gameinfo.values(
                 # select the fields which should be in the dataframe
                 *(
                     [f.name for f in Gameinfo._meta.local_fields]
@@ -92,7 +98,7 @@ class GamedayModelWrapper:
             Gameresult.objects.filter(gameinfo_id__in=self._gameinfo['id']).order_by('-' + IS_HOME).values(
                 *([f.name for f in Gameresult._meta.local_fields] + [TEAM_DESCRIPTION, TEAM_ID])))
         if gameresult.empty:
-            self._games_with_result: DataFrame = pd.DataFrame()
+            self._games_with_result: pd.DataFrame = pd.DataFrame()
             return
         games_with_result = pd.merge(self._gameinfo, gameresult, left_on='id', right_on=GAMEINFO_ID)
         games_with_result[IN_POSSESSION] = games_with_result[IN_POSSESSION].astype(str)
@@ -109,7 +115,7 @@ class GamedayModelWrapper:
             0,
         )
         games_with_result[POINTS] = tmp[POINTS]
-        self._games_with_result: DataFrame = games_with_result
+        self._games_with_result: pd.DataFrame = games_with_result
         self._resolve_placeholders()
 
         self.league_season_config = None
@@ -134,19 +140,26 @@ class GamedayModelWrapper:
         ):
             return
 
-        # Only proceed if there are missing team names
-        if self._games_with_result[TEAM_DESCRIPTION].isna().any():
-
-            placeholder_service = GamedayPlaceholderService(self._gameinfo['gameday'].iloc[0])
+        missing = self._games_with_result[TEAM_DESCRIPTION].isna()
+        if not missing.any():
+            return
 
-            # Resolve each missing row
-            for index, row in self._games_with_result[
-                self._games_with_result[TEAM_DESCRIPTION].isna()
-            ].iterrows():
-                placeholder = placeholder_service.get_placeholder(
-                    row[GAMEINFO_ID], is_home=row[IS_HOME]
-                )
-                self._games_with_result.at[index, TEAM_DESCRIPTION] = placeholder
+        placeholders = GamedayPlaceholderService.get_placeholder_map(self.gameday.pk)
+        if not placeholders:
+            self._games_with_result.loc[missing, TEAM_DESCRIPTION] = PLACEHOLDER_FALLBACK
+            return
+        keys = pd.MultiIndex.from_arrays(
+            [
+                self._games_with_result.loc[missing, GAMEINFO_ID].astype(int),
+                self._games_with_result.loc[missing, IS_HOME].astype(bool),
+            ]
+        )
+        self._games_with_result.loc[missing, TEAM_DESCRIPTION] = (
+            pd.Series(placeholders)
+            .reindex(keys)
+            .fillna(PLACEHOLDER_FALLBACK)
+            .to_numpy()
+        )
 
     def get_staff_passcheck_details(self, gameday_id):
         column_mapping = {
@@ -1,9 +1,44 @@
 import logging
+from bisect import bisect_right
+
 from gamedays.models import Gameinfo, Gameday
 from gameday_designer.models import ScheduleTemplate, TemplateSlot, TemplateApplication
+from league_manager.cache import VersionStamp, live_cache
+from league_manager.db_router import reads_from_replica
 
 logger = logging.getLogger(__name__)
 
+SCHEDULE_GLOBAL_VERSION_KEY = "gameday_schedule_version"
+SCHEDULE_GAMEDAY_VERSION_KEY = "gameday_schedule_version:{gameday_id}"
+PLACEHOLDER_MAP_CACHE_KEY = "gameday_placeholders:{gameday_id}:{version}"
+PLACEHOLDER_MAP_CACHE_TTL = 60 * 60 * 24
+PLACEHOLDER_FALLBACK = "TBD"
+
+
+class GamedayScheduleVersion:
+    """Cache-held version stamps of a gameday's schedule layout.
+
+    ``gamedays.service.signals`` bumps the gameday's stamp when its games or
+    template application change and the global one when templates or their
+    slots change, as those can be shared by any number of gamedays.
+    """
+
+    @staticmethod
+    def get(gameday_id) -> str:
+        global_version = GamedayScheduleVersion._stamp(None).get()
+        gameday_version = GamedayScheduleVersion._stamp(gameday_id).get()
+        return f"{global_version}.{gameday_version}"
+
+    @staticmethod
+    def bump(gameday_id=None):
+        GamedayScheduleVersion._stamp(gameday_id).bump()
+
+    @staticmethod
+    def _stamp(gameday_id) -> VersionStamp:
+        if gameday_id is None:
+            return VersionStamp(SCHEDULE_GLOBAL_VERSION_KEY)
+        return VersionStamp(SCHEDULE_GAMEDAY_VERSION_KEY.format(gameday_id=gameday_id))
+
 
 class GamedayPlaceholderService:
     """
@@ -74,38 +109,68 @@ class GamedayPlaceholderService:
         try:
             gi = self._gameinfos.get(gameinfo_id)
             if not gi:
-                return "TBD"
+                return PLACEHOLDER_FALLBACK
 
             template = self.get_template()
             if not template:
-                return "TBD"
+                return PLACEHOLDER_FALLBACK
 
             slot = self._find_slot_for_game(gi)
             if not slot:
-                return "TBD"
+                return PLACEHOLDER_FALLBACK
 
             if is_official:
                 return slot.official_reference or (
                     f"G{slot.official_group+1}_T{slot.official_team+1}"
                     if slot.official_group is not None
-                    else "TBD"
-                )
-
-            if is_home:
-                return slot.home_reference or (
-                    f"G{slot.home_group+1}_T{slot.home_team+1}"
-                    if slot.home_group is not None
-                    else "TBD"
-                )
-            else:
-                return slot.away_reference or (
-                    f"G{slot.away_group+1}_T{slot.away_team+1}"
-                    if slot.away_group is not None
-                    else "TBD"
+                    else PLACEHOLDER_FALLBACK
                 )
+            return self._get_slot_label(slot, is_home)
         except (Gameinfo.DoesNotExist, IndexError, AttributeError) as e:
             logger.warning(f"Placeholder resolution failed for game {gameinfo_id}: {str(e)}")
-            return "TBD"
+            return PLACEHOLDER_FALLBACK
+
+    def build_placeholder_map(self) -> dict[tuple[int, bool], str]:
+        """
+        Resolves the home and away placeholder of every game of the gameday
+        at once. Games without a matching template slot are left out, callers
+        fall back to PLACEHOLDER_FALLBACK.
+        """
+        slots_by_field = self._get_slots_by_field()
+        if not slots_by_field:
+            return {}
+        scheduled_by_field = {}
+        for gi in self._gameinfos.values():
+            scheduled_by_field.setdefault(gi.field, []).append(gi.scheduled)
+        for scheduled in scheduled_by_field.values():
+            scheduled.sort()
+
+        placeholders = {}
+        for gi in self._gameinfos.values():
+            field_slots = slots_by_field.get(gi.field, [])
+            # same ordering as _find_slot_for_game: games on the field up to
+            # and including this one's start time
+            game_index = bisect_right(scheduled_by_field[gi.field], gi.scheduled)
+            if game_index < 1 or game_index > len(field_slots):
+                continue
+            slot = field_slots[game_index - 1]
+            for is_home in (True, False):
+                placeholders[(gi.pk, is_home)] = self._get_slot_label(slot, is_home)
+        return placeholders
+
+    @staticmethod
+    def _get_slot_label(slot: TemplateSlot, is_home: bool) -> str:
+        if is_home:
+            return slot.home_reference or (
+                f"G{slot.home_group+1}_T{slot.home_team+1}"
+                if slot.home_group is not None
+                else PLACEHOLDER_FALLBACK
+            )
+        return slot.away_reference or (
+            f"G{slot.away_group+1}_T{slot.away_team+1}"
+            if slot.away_group is not None
+            else PLACEHOLDER_FALLBACK
+        )
 
     def _find_slot_for_game(self, gi: Gameinfo) -> TemplateSlot:
         """Matches a Gameinfo to its TemplateSlot by counting previous games on the same field."""
@@ -125,12 +190,31 @@ class GamedayPlaceholderService:
 
         return field_slots[game_index - 1]
 
+    @classmethod
+    def get_placeholder_map(cls, gameday_id: int) -> dict[tuple[int, bool], str]:
+        """Placeholder per ``(gameinfo_id, is_home)`` of the gameday, cached
+        under its GamedayScheduleVersion."""
+        cache_key = PLACEHOLDER_MAP_CACHE_KEY.format(
+            gameday_id=gameday_id, version=GamedayScheduleVersion.get(gameday_id)
+        )
+        placeholders = live_cache.get(cache_key)
+        if placeholders is None:
+            placeholders = cls(gameday_id).build_placeholder_map()
+            # the version may be newer than what a lagging replica returned
+            if not reads_from_replica():
+                live_cache.set(cache_key, placeholders, PLACEHOLDER_MAP_CACHE_TTL)
+        return placeholders
+
     @classmethod
     def resolve_placeholder(cls, gameinfo_id: int, is_home: bool = True) -> str:
         """Utility class method for quick lookups."""
-        try:
-            gi = Gameinfo.objects.get(pk=gameinfo_id)
-            service = cls(gi.gameday_id)
-            return service.get_placeholder(gameinfo_id, is_home)
-        except Gameinfo.DoesNotExist:
-            return "TBD"
+        gameday_id = (
+            Gameinfo.objects.filter(pk=gameinfo_id)
+            .values_list("gameday_id", flat=True)
+            .first()
+        )
+        if gameday_id is None:
+            return PLACEHOLDER_FALLBACK
+        return cls.get_placeholder_map(gameday_id).get(
+            (gameinfo_id, is_home), PLACEHOLDER_FALLBACK
+        )
@@ -1,9 +1,15 @@
 import logging
 
+from django.db.models import Q
+
 from gameday_designer.models import (
+    TemplateApplication,
     TemplateUpdateRule,
 )
-from gamedays.models import Team, Gameinfo, Gameresult, Gameday
+from gamedays.management.schedule_update import ScheduleUpdate
+from gamedays.models import Team, Gameinfo, Gameresult, Gameday, GamedayDesignerState
+from gamedays.service.canvas_progression_service import CanvasBracketProgressionService
+from gamedays.service.change_counter_service import ChangeCounterService
 from gamedays.service.model_wrapper import GamedayModelWrapper
 from gamedays.service.placeholder_service import GamedayPlaceholderService
 
@@ -18,73 +24,153 @@ class GamedayScheduleResolutionService:
         self.template = self.placeholder_service.get_template()
         self.gmw = GamedayModelWrapper(gameday_id)
 
+    @classmethod
+    def resolve_completed_games(cls, gameday: Gameday, games: list[Gameinfo]) -> None:
+        """
+        Resolves the games depending on the completed ``games`` of ``gameday``
+        once, however many of them completed: by the applied template, the
+        published canvas or, failing both, the legacy JSON format.
+        """
+        finished = list(dict.fromkeys(name for gi in games for name in (gi.standing, gi.stage)))
+        # Check for Designer-based gameday (template slots)
+        if TemplateApplication.objects.filter(gameday=gameday).exists():
+            resolution_service = cls(gameday.pk)
+            for name in finished:
+                if resolution_service.gmw.is_finished(name):
+                    resolution_service.update_participants(name)
+        elif GamedayDesignerState.objects.filter(gameday=gameday).exists():
+            # Canvas-published gameday: resolve dynamic team refs in downstream games
+            for gameinfo in sorted(games, key=lambda gi: gi.scheduled):
+                CanvasBracketProgressionService(gameinfo).apply()
+        else:
+            # Fallback to legacy JSON-based logic
+            ScheduleUpdate(gameday.pk, gameday.format).update(finished=finished)
+
     def update_participants(self, finished_standing: str):
         """
         Updates dependent games based on a finished standing/stage.
+
+        The rules of the finished standing are the direct dependents in the
+        template; their target games, teams and results are each read with
+        one query and the changes written in bulk.
         """
         if not self.template:
             logger.warning(f"No template found for gameday {self.gameday_id}")
             return
 
         # Find rules that depend on the stage that just finished
-        rules = TemplateUpdateRule.objects.filter(
-            template=self.template, pre_finished=finished_standing
+        rules = list(
+            TemplateUpdateRule.objects.filter(
+                template=self.template, pre_finished=finished_standing
+            )
+            .select_related("slot")
+            .prefetch_related("team_rules")
         )
+        if not rules:
+            return
 
+        target_by_rule = self._get_target_gameinfos(rules)
+        assignments = []
         for rule in rules:
-            self._apply_rule(rule)
-
-    def _apply_rule(self, rule: TemplateUpdateRule):
-        # Find the Gameinfo object in this gameday that matches the slot
-        # We match by field, stage, and standing
-        target_gis = Gameinfo.objects.filter(
-            gameday=self.gameday,
-            field=rule.slot.field,
-            stage=rule.slot.stage,
-            standing=rule.slot.standing
-        )
-
-        if target_gis.count() == 0:
-            logger.warning(f"Could not find target Gameinfo for rule {rule.id}")
-            return
+            target_gi = target_by_rule.get(rule.pk)
+            if target_gi is None:
+                continue
+            for team_rule in rule.team_rules.all():
+                try:
+                    team_name = self.gmw.get_team_by(
+                        place=team_rule.place,
+                        standing=team_rule.standing,
+                        points=team_rule.points,
+                    )
+                except (IndexError, KeyError) as e:
+                    logger.warning(f"Error applying team rule {team_rule.id}: {str(e)}")
+                    continue
+                assignments.append((target_gi, team_rule, team_name))
+        if assignments:
+            self._apply_assignments(assignments)
 
-        if target_gis.count() > 1:
-            logger.warning(
-                f"Ambiguous match: found {target_gis.count()} Gameinfo objects for rule {rule.id} "
-                f"(field={rule.slot.field}, stage={rule.slot.stage}, standing={rule.slot.standing}). "
-                f"Skipping to avoid updating the wrong game."
+    def _get_target_gameinfos(self, rules: list[TemplateUpdateRule]) -> dict:
+        """Finds the Gameinfo of every rule's slot, matched by field, stage and
+        standing, with one query."""
+        slot_filter = Q()
+        for rule in rules:
+            slot_filter |= Q(
+                field=rule.slot.field, stage=rule.slot.stage, standing=rule.slot.standing
             )
-            return
+        gameinfos_by_slot = {}
+        for gi in Gameinfo.objects.filter(slot_filter, gameday=self.gameday):
+            gameinfos_by_slot.setdefault((gi.field, gi.stage, gi.standing), []).append(gi)
 
-        target_gi = target_gis.first()
-
-        for team_rule in rule.team_rules.all():
-            try:
-                team_name = self.gmw.get_team_by(
-                    place=team_rule.place,
-                    standing=team_rule.standing,
-                    points=team_rule.points,
+        target_by_rule = {}
+        for rule in rules:
+            target_gis = gameinfos_by_slot.get(
+                (rule.slot.field, rule.slot.stage, rule.slot.standing), []
+            )
+            if len(target_gis) == 0:
+                logger.warning(f"Could not find target Gameinfo for rule {rule.id}")
+            elif len(target_gis) > 1:
+                logger.warning(
+                    f"Ambiguous match: found {len(target_gis)} Gameinfo objects for rule {rule.id} "
+                    f"(field={rule.slot.field}, stage={rule.slot.stage}, standing={rule.slot.standing}). "
+                    f"Skipping to avoid updating the wrong game."
                 )
-                team = Team.objects.get(description=team_name)
+            else:
+                target_by_rule[rule.pk] = target_gis[0]
+        return target_by_rule
 
-                if team_rule.role == "home":
-                    self._update_gameresult(target_gi, team, True)
-                elif team_rule.role == "away":
-                    self._update_gameresult(target_gi, team, False)
-                elif team_rule.role == "official":
-                    if target_gi.officials != team:
-                        target_gi.officials = team
-                        target_gi.save()
-            except (IndexError, Team.DoesNotExist, KeyError) as e:
-                logger.warning(f"Error applying team rule {team_rule.id}: {str(e)}")
-
-    def _update_gameresult(self, gi: Gameinfo, team: Team, is_home: bool):
-        gameresult, created = Gameresult.objects.get_or_create(
-            gameinfo=gi, isHome=is_home
+    def _apply_assignments(self, assignments: list[tuple]):
+        teams = Team.objects.in_bulk(
+            {team_name for _, _, team_name in assignments}, field_name="description"
         )
-        if gameresult.team != team:
-            gameresult.team = team
-            gameresult.save()
+        gameresults = {
+            (gameresult.gameinfo_id, gameresult.isHome): gameresult
+            for gameresult in Gameresult.objects.filter(
+                gameinfo__in={gi for gi, _, _ in assignments}
+            )
+        }
+        gameresults_to_create, gameresults_to_update, gameinfos_to_update = {}, {}, {}
+        for gi, team_rule, team_name in assignments:
+            team = teams.get(team_name)
+            if team is None:
+                logger.warning(
+                    f"Error applying team rule {team_rule.id}: no team {team_name!r}"
+                )
+                continue
+            if team_rule.role == "official":
+                if gi.officials_id != team.pk:
+                    gi.officials = team
+                    gameinfos_to_update[gi.pk] = gi
+                continue
+            if team_rule.role not in ("home", "away"):
+                continue
+            is_home = team_rule.role == "home"
+            gameresult = gameresults.get((gi.pk, is_home))
+            if gameresult is None:
+                gameresult = Gameresult(gameinfo=gi, isHome=is_home, team=team)
+                gameresults[(gi.pk, is_home)] = gameresult
+                gameresults_to_create[(gi.pk, is_home)] = gameresult
+            elif gameresult.team_id != team.pk:
+                gameresult.team = team
+                if gameresult.pk is not None:
+                    gameresults_to_update[gameresult.pk] = gameresult
+
+        if gameresults_to_create:
+            Gameresult.objects.bulk_create(gameresults_to_create.values())
+        if gameresults_to_update:
+            Gameresult.objects.bulk_update(gameresults_to_update.values(), ["team"])
+        if gameinfos_to_update:
+            Gameinfo.objects.bulk_update(gameinfos_to_update.values(), ["officials"])
+        if gameresults_to_create or gameresults_to_update or gameinfos_to_update:
+            updated = {}
+            if gameresults_to_update:
+                updated[Gameresult] = ["team"]
+            if gameinfos_to_update:
+                updated[Gameinfo] = ["officials"]
+            ChangeCounterService.bump_after_bulk_write(
+                self.gameday_id,
+                updated=updated,
+                created=(Gameresult,) if gameresults_to_create else (),
+            )
 
     @classmethod
     def get_game_placeholder(cls, gameinfo_id: int, is_home: bool) -> str:
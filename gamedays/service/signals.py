@@ -1,11 +1,22 @@
 import logging
 
-from django.db.models.signals import post_save
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from gamedays.management.schedule_update import ScheduleUpdate
-from gamedays.models import Gameinfo, GamedayDesignerState
-from gameday_designer.models import TemplateApplication
+from gamedays.models import (
+    Gameday,
+    Gameinfo,
+    Gameresult,
+    GamedayDesignerState,
+    League,
+    Season,
+    Team,
+    TeamLog,
+)
+from gameday_designer.models import ScheduleTemplate, TemplateApplication, TemplateSlot
+from gamedays.service.change_counter_service import ChangeCounterService
+from gamedays.service.placeholder_service import GamedayScheduleVersion
 from gamedays.service.schedule_resolution_service import (
     GamedayScheduleResolutionService,
 )
@@ -17,24 +28,96 @@ logger = logging.getLogger(__name__)
 def update_game_schedule(sender, instance: Gameinfo, created, **kwargs):
     if instance.status == Gameinfo.STATUS_COMPLETED:
         try:
-            # Check for Designer-based gameday (template slots)
-            if TemplateApplication.objects.filter(gameday=instance.gameday).exists():
-                resolution_service = GamedayScheduleResolutionService(instance.gameday_id)
-                # Trigger updates for both standing (group) and stage
-                if resolution_service.gmw.is_finished(instance.standing):
-                    resolution_service.update_participants(instance.standing)
-                if resolution_service.gmw.is_finished(instance.stage):
-                    resolution_service.update_participants(instance.stage)
-            elif GamedayDesignerState.objects.filter(gameday=instance.gameday).exists():
-                # Canvas-published gameday: resolve dynamic team refs in downstream games
-                from gamedays.service.canvas_progression_service import CanvasBracketProgressionService
-                CanvasBracketProgressionService(instance).apply()
-            else:
-                # Fallback to legacy JSON-based logic
-                update_schedule = ScheduleUpdate(instance.gameday_id, instance.gameday.format)
-                update_schedule.update()
+            GamedayScheduleResolutionService.resolve_completed_games(
+                instance.gameday, [instance]
+            )
         except Exception as e:
             logger.warning(
                 f"Schedule resolution failed for gameinfo {instance.pk} "
                 f"(gameday {instance.gameday_id}): {e}"
             )
+
+
+@receiver(post_save, sender=Gameinfo)
+@receiver(post_delete, sender=Gameinfo)
+def invalidate_gameinfo_schedule(sender, instance: Gameinfo, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if update_fields is None or {"field", "scheduled", "gameday"} & set(update_fields):
+        GamedayScheduleVersion.bump(instance.gameday_id)
+
+
+@receiver(post_save, sender=Gameday)
+@receiver(post_delete, sender=Gameday)
+@receiver(post_save, sender=TemplateApplication)
+@receiver(post_delete, sender=TemplateApplication)
+def invalidate_gameday_schedule(sender, instance, **kwargs):
+    gameday_id = instance.pk if sender is Gameday else instance.gameday_id
+    GamedayScheduleVersion.bump(gameday_id)
+
+
+@receiver(post_save, sender=ScheduleTemplate)
+@receiver(post_delete, sender=ScheduleTemplate)
+@receiver(post_save, sender=TemplateSlot)
+@receiver(post_delete, sender=TemplateSlot)
+def invalidate_template_schedules(sender, instance, **kwargs):
+    GamedayScheduleVersion.bump()
+
+
+def _is_cascade(sender, origin) -> bool:
+    """True for rows deleted along with a parent, whose receiver bumps."""
+    if origin is None:
+        return False
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return model is not sender
+
+
+# Connected after update_game_schedule: the games it resolves in bulk on a
+# completion are written before the gameday's counter is bumped.
+@receiver(post_save, sender=Gameinfo)
+@receiver(post_delete, sender=Gameinfo)
+def bump_gameinfo_change_counter(sender, instance: Gameinfo, **kwargs):
+    if not _is_cascade(sender, kwargs.get("origin")):
+        ChangeCounterService.bump(instance.gameday_id)
+
+
+@receiver(post_save, sender=Gameresult)
+@receiver(post_delete, sender=Gameresult)
+@receiver(post_save, sender=TeamLog)
+@receiver(post_delete, sender=TeamLog)
+def bump_game_detail_change_counter(sender, instance, **kwargs):
+    if _is_cascade(sender, kwargs.get("origin")):
+        return
+    if sender.gameinfo.is_cached(instance):
+        gameday_id = instance.gameinfo.gameday_id
+    else:
+        gameday_id = (
+            Gameinfo.objects.filter(pk=instance.gameinfo_id)
+            .values_list("gameday_id", flat=True)
+            .first()
+        )
+    if gameday_id is not None:
+        ChangeCounterService.bump(gameday_id)
+
+
+@receiver(post_save, sender=Gameday)
+@receiver(post_delete, sender=Gameday)
+def bump_gameday_change_counter(sender, instance: Gameday, **kwargs):
+    ChangeCounterService.bump_gameday(instance.pk)
+
+
+@receiver(post_save, sender=GamedayDesignerState)
+@receiver(post_delete, sender=GamedayDesignerState)
+def bump_designer_state_change_counter(sender, instance, created=True, **kwargs):
+    # the list only shows whether a designer state exists
+    if created:
+        ChangeCounterService.bump()
+
+
+@receiver(post_save, sender=League)
+@receiver(post_delete, sender=League)
+@receiver(post_save, sender=Season)
+@receiver(post_delete, sender=Season)
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def bump_global_change_counter(sender, **kwargs):
+    ChangeCounterService.bump()
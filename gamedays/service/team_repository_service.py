@@ -1,6 +1,5 @@
-from django.core.cache import cache
-
 from gamedays.models import Team
+from league_manager.cache import pages_cache
 
 
 class TeamRepositoryService:
@@ -16,11 +15,11 @@ class TeamRepositoryService:
     @staticmethod
     def get_all_teams():
         cache_key = "all_teams"
-        cached_teams = cache.get(cache_key)
+        cached_teams = pages_cache.get(cache_key)
 
         if cached_teams is not None:
             return cached_teams
 
         teams = Team.objects.all().exclude(location="dummy").order_by("description")
-        cache.set(cache_key, teams, timeout=60 * 60 * 24)
+        pages_cache.set(cache_key, teams, timeout=60 * 60 * 24)
         return teams
@@ -1,4 +1,4 @@
-import pandas as pd
+from __future__ import annotations
 
 from gamedays.models import Gameinfo
 from gamedays.service.gameday_settings import (
@@ -11,6 +11,9 @@ from gamedays.service.gameday_settings import (
     STATUS,
     LEAGUE__NAME,
 )
+from league_manager.utils.lazy_import import LazyModule
+
+pd = LazyModule("pandas")
 
 TOURNAMENT_COLUMN_HEADERS = {
     SCHEDULED: "Zeit",
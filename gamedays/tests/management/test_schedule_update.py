@@ -1,4 +1,4 @@
-from collections.abc import Iterable
+import pytest
 from unittest.mock import patch, MagicMock
 
 from django.test import TransactionTestCase
@@ -8,11 +8,13 @@ from gamedays.management.schedule_manager import (
     Schedule,
     GroupSchedule,
 )
-from gamedays.management.schedule_update import (
-    ScheduleUpdate,
-    UpdateGameEntry,
-    UpdateEntry,
+from gamedays.management.schedule_registry import (
+    ScheduleFormatError,
+    ScheduleFormatRegistry,
+    UpdateGame,
+    UpdateRule,
 )
+from gamedays.management.schedule_update import ScheduleUpdate
 from gamedays.models import Gameday, Gameinfo, Gameresult
 from gamedays.service.model_wrapper import GamedayModelWrapper
 from gamedays.tests.setup_factories.dataframe_setup import DataFrameAssertion
@@ -321,10 +323,10 @@ class TestScheduleUpdate(TransactionTestCase):
         assert games.filter(officials__name__exact="teamName").count() == 1
 
 
-class TestUpdateGameEntry:
+class TestUpdateGame:
 
     def test_get_methods(self):
-        uge = UpdateGameEntry(
+        uge = UpdateGame.from_dict(
             {
                 "home": {"standing": "Gruppe 1", "place": 3},
                 "away": {"stage": "Vorrunde", "place": 0, "index": 1},
@@ -348,10 +350,33 @@ class TestUpdateGameEntry:
         assert uge.officials.points == 2
         assert uge.officials.pre_finished == "HF"
 
+    def test_unknown_key_is_rejected(self):
+        with pytest.raises(ScheduleFormatError):
+            UpdateGame.from_dict(
+                {"home": {"standing": "HF", "plce": 1}, "away": {"place": 1}}
+            )
 
-class TestUpdateEntry:
 
-    def test_update_entry_get_methods(self):
-        ue = UpdateEntry({"name": "P5", "games": []})
-        assert ue.get_name() == "P5"
-        assert isinstance(ue, Iterable)
+class TestUpdateRule:
+
+    def test_update_rule_get_methods(self):
+        ue = UpdateRule.from_dict({"name": "P5", "pre_finished": "Vorrunde", "games": []})
+        assert ue.name == "P5"
+        assert ue.games == ()
+
+
+class TestScheduleFormatRegistry:
+
+    def test_all_schedule_files_are_loaded(self):
+        ScheduleFormatRegistry.load()
+        assert ScheduleFormatRegistry.get("6_2").update_rules
+        assert ScheduleFormatRegistry.get("4_1").update_rules == ()
+        assert ScheduleFormatRegistry.get("unknown") is None
+
+    def test_update_rules_are_looked_up_by_finished_standing(self):
+        rules = ScheduleFormatRegistry.get_update_rules("6_2", {"Vorrunde"})
+        assert [rule.name for rule in rules] == ["HF", "P5"]
+        # P5 waits for the semifinals to know its officials
+        rules = ScheduleFormatRegistry.get_update_rules("6_2", {"HF"})
+        assert [rule.name for rule in rules] == ["P5", "P3", "P1"]
+        assert ScheduleFormatRegistry.get_update_rules("6_2", {"P1"}) == ()
@@ -1,4 +1,7 @@
+from unittest.mock import patch
+
 from django.contrib.auth.models import User
+from django.db.models import F
 from django.test import TestCase
 
 from gamedays.models import (
@@ -11,8 +14,13 @@ from gamedays.models import (
     Team,
 )
 from gamedays.service.auto_assign_officials_service import (
+    DESIGNER_STATE_ATTEMPTS,
     AutoAssignOfficialsError,
     AutoAssignOfficialsService,
+    OfficialAssignmentPlanner,
+    SlotGame,
+    TimeSlot,
+    min_cost_assignment,
 )
 from gamedays.tests.setup_factories.db_setup import DBSetup
 
@@ -359,6 +367,26 @@ class TestAutoAssignOfficialsService(TestCase):
         self._assert_no_self_referee(gameday)
 
 
+    def test_optimal_mode_balances_and_writes_in_one_update(self):
+        gameday = DBSetup().g62_status_empty()
+        service = AutoAssignOfficialsService(
+            gameday.pk, mode=OfficialAssignmentPlanner.MODE_OPTIMAL
+        )
+        # gameday, gameinfos, gameresults and one bulk update plus the change
+        # counter bump in a savepoint
+        with self.assertNumQueries(7):
+            assignments = service.assign()
+
+        assert len(assignments) == Gameinfo.objects.filter(gameday=gameday).count()
+        self._assert_no_self_referee(gameday)
+        self._assert_no_time_conflict(gameday)
+        self._assert_balanced_referee_counts(gameday)
+
+    def test_unknown_mode_rejected(self):
+        gameday = DBSetup().g62_status_empty()
+        with self.assertRaises(AutoAssignOfficialsError):
+            AutoAssignOfficialsService(gameday.pk, mode="random")
+
 class TestAutoAssignOfficialsServiceDesignerState(TestCase):
     """
     Covers gamedays that have never been published: games only exist as
@@ -448,6 +476,72 @@ class TestAutoAssignOfficialsServiceDesignerState(TestCase):
         node = state.state_data["nodes"][0]
         assert node["data"]["official"] == {"type": "static", "name": "team-c"}
 
+    def _create_three_team_state(self, gameday: Gameday) -> GamedayDesignerState:
+        return GamedayDesignerState.objects.create(
+            gameday=gameday,
+            state_data={
+                "nodes": [self._game_node("game-1", "Game 1", "team-a", "team-b")],
+                "globalTeams": [
+                    {"id": "team-a", "label": "A", "groupId": "group-1", "order": 0},
+                    {"id": "team-b", "label": "B", "groupId": "group-1", "order": 0},
+                    {"id": "team-c", "label": "C", "groupId": "group-1", "order": 0},
+                ],
+            },
+        )
+
+    def test_assignment_increments_the_revision(self):
+        gameday = self._create_draft_gameday()
+        self._create_three_team_state(gameday)
+
+        AutoAssignOfficialsService(gameday.pk).assign()
+
+        assert GamedayDesignerState.objects.get(gameday=gameday).revision == 1
+
+    def test_designer_save_during_assignment_is_kept(self):
+        gameday = self._create_draft_gameday()
+        self._create_three_team_state(gameday)
+        service = AutoAssignOfficialsService(gameday.pk)
+        assign_in_state_data = service._assign_in_state_data
+
+        def designer_saves_once(state_data):
+            if GamedayDesignerState.objects.get(gameday=gameday).revision == 0:
+                GamedayDesignerState.objects.filter(gameday=gameday).update(
+                    state_data={**state_data, "metadata": {"name": "Renamed"}},
+                    revision=1,
+                )
+            return assign_in_state_data(state_data)
+
+        with patch.object(service, "_assign_in_state_data", designer_saves_once):
+            assert service.assign() == {"game-1": "team-c"}
+
+        state = GamedayDesignerState.objects.get(gameday=gameday)
+        assert state.revision == 2
+        assert state.state_data["metadata"] == {"name": "Renamed"}
+        assert state.state_data["nodes"][0]["data"]["official"] == {
+            "type": "static",
+            "name": "team-c",
+        }
+
+    def test_designer_state_changing_on_every_attempt_fails(self):
+        gameday = self._create_draft_gameday()
+        self._create_three_team_state(gameday)
+        service = AutoAssignOfficialsService(gameday.pk)
+        assign_in_state_data = service._assign_in_state_data
+
+        def designer_always_saves(state_data):
+            GamedayDesignerState.objects.filter(gameday=gameday).update(
+                revision=F("revision") + 1
+            )
+            return assign_in_state_data(state_data)
+
+        with patch.object(service, "_assign_in_state_data", designer_always_saves):
+            with self.assertRaises(AutoAssignOfficialsError):
+                service.assign()
+
+        state = GamedayDesignerState.objects.get(gameday=gameday)
+        assert state.revision == DESIGNER_STATE_ATTEMPTS
+        assert state.state_data["nodes"][0]["data"]["official"] is None
+
     def test_no_eligible_team_skips_game(self):
         """Only the two playing teams are registered -- nobody is free to
         referee, so the game is left unassigned rather than crashing."""
@@ -674,3 +768,42 @@ class TestAutoAssignOfficialsServiceDesignerState(TestCase):
             f"Expected 0 assignments (2 real field nodes => can't assume "
             f"sequential), got {len(assignments)}: {assignments}"
         )
+
+
+class TestOfficialAssignmentPlanner(TestCase):
+    def test_min_cost_assignment_finds_optimum(self):
+        cost = [
+            [4, 1, 3],
+            [2, 0, 5],
+            [3, 2, 2],
+        ]
+        assert min_cost_assignment(cost) == [1, 0, 2]
+
+    def test_optimal_mode_spreads_load_where_greedy_does_not(self):
+        """Team 5 is only free in the first slot, so it has to referee
+        there -- greedy picks by count alone and leaves it idle all day."""
+        slots = [
+            TimeSlot([SlotGame("g1", "A", {1, 2})], is_single_field=False),
+            TimeSlot([SlotGame("g2", "A", {1, 5})], is_single_field=False),
+            TimeSlot([SlotGame("g3", "A", {2, 5})], is_single_field=False),
+        ]
+        donor_pools = {"A": {3, 4, 5}}
+        greedy = OfficialAssignmentPlanner(donor_pools)
+        greedy.plan(slots)
+        optimal = OfficialAssignmentPlanner(
+            donor_pools, mode=OfficialAssignmentPlanner.MODE_OPTIMAL
+        )
+        assert optimal.plan(slots)["g1"] == 5
+        assert max(optimal.referee_count.values()) == 1
+        assert greedy.referee_count[5] == 0
+        assert max(greedy.referee_count.values()) == 2
+
+    def test_exhausted_time_budget_falls_back_to_greedy(self):
+        slots = [
+            TimeSlot([SlotGame("g1", "A", {1, 2})], is_single_field=False),
+            TimeSlot([SlotGame("g2", "A", {1, 5})], is_single_field=False),
+        ]
+        planner = OfficialAssignmentPlanner(
+            {"A": {3, 4, 5}}, mode=OfficialAssignmentPlanner.MODE_OPTIMAL, time_budget=0
+        )
+        assert planner.plan(slots)["g1"] != 5
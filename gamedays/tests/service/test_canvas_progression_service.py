@@ -0,0 +1,116 @@
+from django.test import TestCase
+
+from gamedays.models import Gameinfo, GamedayDesignerState, Gameresult
+from gamedays.service.canvas_progression_service import CanvasBracketProgressionService
+from gamedays.service.canvas_publish_service import CanvasPublishService
+from gamedays.tests.setup_factories.db_setup import DBSetup
+
+
+def _game_node(node_id, standing, start_time, home=None, away=None):
+    return {
+        "id": node_id,
+        "type": "game",
+        "parentId": "stage-1",
+        "data": {
+            "type": "game",
+            "standing": standing,
+            "startTime": start_time,
+            "homeTeamId": home,
+            "awayTeamId": away,
+            "homeTeamDynamic": None,
+            "awayTeamDynamic": None,
+            "official": None,
+        },
+    }
+
+
+def _bracket_state_data():
+    final = _game_node("game-final", "Finale", "12:00")
+    final["data"]["homeTeamDynamic"] = {"type": "winner", "matchName": "HF1"}
+    final["data"]["awayTeamDynamic"] = {"type": "winner", "matchName": "HF2"}
+    third_place = _game_node("game-p3", "P3", "12:00")
+    third_place["data"]["homeTeamDynamic"] = {"type": "loser", "matchName": "HF1"}
+    third_place["data"]["awayTeamDynamic"] = {"type": "loser", "matchName": "HF2"}
+    return {
+        "nodes": [
+            {"id": "field-1", "type": "field", "data": {"type": "field", "order": 0}},
+            {
+                "id": "stage-1",
+                "type": "stage",
+                "parentId": "field-1",
+                "data": {"type": "stage", "name": "Playoffs", "category": "final"},
+            },
+            _game_node("game-hf1", "HF1", "10:00", "team-a", "team-b"),
+            _game_node("game-hf2", "HF2", "11:00", "team-c", "team-d"),
+            final,
+            third_place,
+        ],
+        "globalTeams": [
+            {"id": f"team-{name}", "label": f"Team {name.upper()}"} for name in "abcd"
+        ],
+    }
+
+
+class TestCanvasBracketProgressionService(TestCase):
+    def setUp(self):
+        self.gameday = DBSetup().create_empty_gameday()
+        self.state = GamedayDesignerState.objects.create(
+            gameday=self.gameday, state_data=_bracket_state_data()
+        )
+        CanvasPublishService(self.gameday).apply()
+        self.state.refresh_from_db()
+        self.games = {
+            node_id: Gameinfo.objects.get(pk=gameinfo_id)
+            for node_id, gameinfo_id in self.state.published_games.items()
+        }
+
+    def _finish(self, node_id, home_points, away_points):
+        game = self.games[node_id]
+        Gameresult.objects.filter(gameinfo=game, isHome=True).update(fh=home_points, sh=0)
+        Gameresult.objects.filter(gameinfo=game, isHome=False).update(fh=away_points, sh=0)
+        return game
+
+    def _team_names(self, node_id):
+        return [
+            result.team.description
+            for result in Gameresult.objects.filter(
+                gameinfo=self.games[node_id]
+            ).order_by("-isHome")
+        ]
+
+    def test_publish_stores_dependencies_of_each_standing(self):
+        final, third_place = self.games["game-final"].pk, self.games["game-p3"].pk
+        assert self.state.bracket_dependencies == {
+            "HF1": [
+                {"gameinfo": final, "is_home": True, "result": "winner"},
+                {"gameinfo": third_place, "is_home": True, "result": "loser"},
+            ],
+            "HF2": [
+                {"gameinfo": final, "is_home": False, "result": "winner"},
+                {"gameinfo": third_place, "is_home": False, "result": "loser"},
+            ],
+        }
+
+    def test_completed_game_updates_only_its_dependents_in_bulk(self):
+        semifinal = self._finish("game-hf1", 14, 7)
+        # dependencies, results of the finished game, dependent results, write
+        # and the change counter bump
+        with self.assertNumQueries(5):
+            CanvasBracketProgressionService(semifinal).apply()
+        assert self._team_names("game-final") == ["Team A", "Gewinner HF2"]
+        assert self._team_names("game-p3") == ["Team B", "Verlierer HF2"]
+
+    def test_game_without_dependents_writes_nothing(self):
+        final = self._finish("game-final", 7, 0)
+        with self.assertNumQueries(1):
+            CanvasBracketProgressionService(final).apply()
+
+    def test_dependencies_are_built_for_states_published_before(self):
+        GamedayDesignerState.objects.filter(pk=self.state.pk).update(
+            bracket_dependencies=None
+        )
+        semifinal = self._finish("game-hf2", 0, 21)
+        CanvasBracketProgressionService(semifinal).apply()
+        assert self._team_names("game-final") == ["Gewinner HF1", "Team D"]
+        self.state.refresh_from_db()
+        assert set(self.state.bracket_dependencies) == {"HF1", "HF2"}
@@ -1,6 +1,6 @@
 from django.test import TestCase
 
-from gamedays.models import Gameinfo, GamedayDesignerState
+from gamedays.models import Gameinfo, GamedayDesignerState, Gameresult
 from gamedays.service.canvas_publish_service import CanvasPublishService
 from gamedays.service.stage_category import StageCategory
 from gamedays.tests.setup_factories.db_setup import DBSetup
@@ -77,3 +77,84 @@ class TestCanvasPublishServiceStageCategory(TestCase):
 
         gi = Gameinfo.objects.get(gameday=gameday)
         assert gi.stage_category == StageCategory.PRELIMINARY
+
+
+def _state_data_with_games(num_games):
+    state_data = _state_data_with_one_game()
+    state_data["nodes"] = state_data["nodes"][:2]
+    state_data["globalTeams"] = [
+        {"id": f"team-{i}", "label": f"Canvas Team {i}"} for i in range(6)
+    ]
+    for i in range(num_games):
+        state_data["nodes"].append(
+            {
+                "id": f"game-{i}",
+                "type": "game",
+                "parentId": "stage-1",
+                "data": {
+                    "type": "game",
+                    "standing": "Tabelle",
+                    "startTime": f"{10 + i // 10}:{(i % 10) * 5:02d}",
+                    "homeTeamId": f"team-{i % 6}",
+                    "awayTeamId": f"team-{(i + 1) % 6}",
+                    "official": {"type": "static", "name": f"team-{(i + 2) % 6}"},
+                },
+            }
+        )
+    return state_data
+
+
+class TestCanvasPublishServiceDiff(TestCase):
+    def setUp(self):
+        self.gameday = DBSetup().create_empty_gameday()
+        self.state = GamedayDesignerState.objects.create(
+            gameday=self.gameday, state_data=_state_data_with_games(50)
+        )
+        CanvasPublishService(self.gameday).apply()
+        self.state.refresh_from_db()
+        self.gameinfo_ids = dict(self.state.published_games)
+
+    def _game_node(self, node_id):
+        return next(n for n in self.state.state_data["nodes"] if n["id"] == node_id)
+
+    def test_republish_of_unchanged_canvas_writes_nothing(self):
+        # designer state, teams, gameinfos, gameresults, stale rows + savepoints
+        with self.assertNumQueries(7):
+            CanvasPublishService(self.gameday).apply()
+
+    def test_republish_of_edited_canvas_touches_only_changed_rows(self):
+        self._game_node("game-3")["data"]["startTime"] = "18:00"
+        self._game_node("game-4")["data"]["awayTeamId"] = "team-0"
+        self.state.state_data["nodes"].remove(self._game_node("game-5"))
+        new_node = dict(self._game_node("game-6"), id="game-new")
+        self.state.state_data["nodes"].append(new_node)
+        self.state.save()
+
+        # lookups, one cascading delete, two bulk updates, two bulk inserts,
+        # the change counter bumps and the new game mapping
+        with self.assertNumQueries(24):
+            CanvasPublishService(self.gameday).apply()
+
+        self.state.refresh_from_db()
+        gameinfo_ids = self.state.published_games
+        assert Gameinfo.objects.filter(gameday=self.gameday).count() == 50
+        assert set(gameinfo_ids) == set(self.gameinfo_ids) - {"game-5"} | {"game-new"}
+        assert {
+            node_id: pk for node_id, pk in gameinfo_ids.items() if node_id != "game-new"
+        } == {
+            node_id: pk for node_id, pk in self.gameinfo_ids.items() if node_id != "game-5"
+        }
+        assert str(Gameinfo.objects.get(pk=gameinfo_ids["game-3"]).scheduled) == "18:00:00"
+        assert (
+            Gameresult.objects.get(gameinfo_id=gameinfo_ids["game-4"], isHome=False).team.name
+            == "Canvas Team 0"
+        )
+        assert Gameresult.objects.filter(gameinfo_id=gameinfo_ids["game-new"]).count() == 2
+
+    def test_replace_mode_recreates_all_games(self):
+        CanvasPublishService(self.gameday, mode=CanvasPublishService.MODE_REPLACE).apply()
+        gameinfo_ids = set(
+            Gameinfo.objects.filter(gameday=self.gameday).values_list("pk", flat=True)
+        )
+        assert len(gameinfo_ids) == 50
+        assert not gameinfo_ids & set(self.gameinfo_ids.values())
@@ -65,6 +65,15 @@ class TestGamelog(TestCase):
             }
         )
 
+    def test_dict_representation_needs_no_encoder(self):
+        first_game_entry = DBSetup().create_teamlog_home_and_away()
+        game_log = GameLog(first_game_entry)
+        gamelog = game_log.as_dict()
+        assert json.loads(json.dumps(gamelog)) == gamelog
+        # the output of the former encoder based serialization of the same log
+        assert gamelog == json.loads(json.dumps(game_log.gamelog, cls=AsJsonEncoder))
+        assert len(gamelog["home"]["firsthalf"]["entries"]) == 3
+
     def test_create_entries(self):
         first_game_entry = DBSetup().create_teamlog_home_and_away()
         first_team = Team.objects.first()
@@ -156,7 +165,8 @@ class TestGamelogCreator(TestCase):
         utc_now = datetime(2026, 8, 15, 9, 5, 0, tzinfo=UTC)
         created_time_field = TeamLog._meta.get_field("created_time")
         with mock.patch.object(created_time_field, "get_default", return_value=utc_now):
-            with self.assertNumQueries(1):
+            # the insert and the gameday's change counter bump
+            with self.assertNumQueries(2):
                 TeamLog.objects.create(
                     gameinfo=firstGame,
                     team=team,
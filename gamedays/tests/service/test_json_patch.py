@@ -0,0 +1,62 @@
+import pytest
+
+from gamedays.service.json_patch import JsonPatchError, apply_json_patch
+
+
+class TestJsonPatch:
+    def test_operations_are_applied_in_order(self):
+        document = {"nodes": [{"id": "a"}, {"id": "b"}], "a/b": {"x~y": 1}}
+        patched = apply_json_patch(
+            document,
+            [
+                {"op": "test", "path": "/nodes/0/id", "value": "a"},
+                {"op": "add", "path": "/nodes/1", "value": {"id": "c"}},
+                {"op": "remove", "path": "/nodes/0"},
+                {"op": "replace", "path": "/a~1b/x~0y", "value": 2},
+                {"op": "copy", "from": "/nodes/0", "path": "/first"},
+                {"op": "move", "from": "/nodes/1", "path": "/nodes/-"},
+            ],
+        )
+        assert patched == {
+            "nodes": [{"id": "c"}, {"id": "b"}],
+            "a/b": {"x~y": 2},
+            "first": {"id": "c"},
+        }
+        assert document == {"nodes": [{"id": "a"}, {"id": "b"}], "a/b": {"x~y": 1}}
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            {"op": "remove", "path": "/missing"},
+            {"op": "replace", "path": "/nodes/5", "value": 1},
+            {"op": "add", "path": "nodes", "value": 1},
+            {"op": "add", "path": "/nodes/01", "value": 1},
+            {"op": "add", "path": "/nodes/\u00b2", "value": 1},
+            {"op": "add", "path": "/nodes/0"},
+            {"op": "test", "path": "/nodes", "value": ["x"]},
+            {"op": "move", "from": "/nodes", "path": "/nodes/0"},
+            {"op": "unknown", "path": "/nodes"},
+        ],
+    )
+    def test_invalid_operation_raises(self, operation):
+        with pytest.raises(JsonPatchError):
+            apply_json_patch({"nodes": []}, [operation])
+
+    @pytest.mark.parametrize(
+        "value, expected, equal",
+        [
+            (1, 1.0, True),
+            ({"a": [1, {"b": None}]}, {"a": [1, {"b": None}]}, True),
+            (True, 1, False),
+            (0, False, False),
+            ([True], [1], False),
+            ({"a": 1}, {"a": True}, False),
+        ],
+    )
+    def test_test_operation_tells_booleans_from_numbers(self, value, expected, equal):
+        operation = {"op": "test", "path": "/value", "value": expected}
+        if equal:
+            apply_json_patch({"value": value}, [operation])
+        else:
+            with pytest.raises(JsonPatchError):
+                apply_json_patch({"value": value}, [operation])
@@ -1,13 +1,18 @@
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from gameday_designer.models import ScheduleTemplate, TemplateSlot, TemplateApplication
 from gamedays.models import Gameday, Gameinfo, Gameresult
 from gamedays.service.model_wrapper import GamedayModelWrapper
+from gamedays.service.placeholder_service import GamedayPlaceholderService
 from gamedays.tests.setup_factories.db_setup import DBSetup
 
 
 class TestPlaceholderResolution(TestCase):
     def setUp(self):
+        cache.clear()
         self.db_setup = DBSetup()
         self.db_setup.g62_status_empty()
         self.gameday = Gameday.objects.first()
@@ -103,3 +108,64 @@ class TestPlaceholderResolution(TestCase):
         )
         # For the 5th game, home_team was i-1 = 4
         assert home_placeholder == "G1_T5"
+
+    def _create_tbd_games(self, count):
+        Gameinfo.objects.filter(gameday=self.gameday).delete()
+        TemplateSlot.objects.filter(template=self.template).delete()
+        gameinfos = []
+        for i in range(count):
+            TemplateSlot.objects.create(
+                template=self.template,
+                field=1,
+                slot_order=i + 1,
+                stage="Finals",
+                standing=f"P{i + 1}",
+                home_reference=f"Winner Game {2 * i + 1}",
+                away_reference=f"Winner Game {2 * i + 2}",
+            )
+            gi = Gameinfo.objects.create(
+                gameday=self.gameday,
+                field=1,
+                scheduled=f"{10 + i}:00",
+                stage="Finals",
+                standing=f"P{i + 1}",
+                officials=self.team_a,
+            )
+            Gameresult.objects.create(gameinfo=gi, team=None, isHome=True)
+            Gameresult.objects.create(gameinfo=gi, team=None, isHome=False)
+            gameinfos.append(gi)
+        return gameinfos
+
+    def test_placeholder_map_is_cached_until_the_schedule_changes(self):
+        gameinfos = self._create_tbd_games(2)
+        placeholders = GamedayPlaceholderService.get_placeholder_map(self.gameday.pk)
+        assert placeholders == {
+            (gameinfos[0].pk, True): "Winner Game 1",
+            (gameinfos[0].pk, False): "Winner Game 2",
+            (gameinfos[1].pk, True): "Winner Game 3",
+            (gameinfos[1].pk, False): "Winner Game 4",
+        }
+        with self.assertNumQueries(0):
+            GamedayPlaceholderService.get_placeholder_map(self.gameday.pk)
+
+        slot = TemplateSlot.objects.get(template=self.template, slot_order=2)
+        slot.home_reference = "Sieger HF 1"
+        slot.save()
+        placeholders = GamedayPlaceholderService.get_placeholder_map(self.gameday.pk)
+        assert placeholders[(gameinfos[1].pk, True)] == "Sieger HF 1"
+
+    def test_resolving_placeholders_does_not_scale_with_tbd_games(self):
+        self._create_tbd_games(2)
+        GamedayModelWrapper(self.gameday.pk)
+        with CaptureQueriesContext(connection) as few_games:
+            GamedayModelWrapper(self.gameday.pk)
+
+        self._create_tbd_games(12)
+        GamedayModelWrapper(self.gameday.pk)
+        with CaptureQueriesContext(connection) as many_games:
+            gmw = GamedayModelWrapper(self.gameday.pk)
+
+        assert len(many_games) == len(few_games)
+        df = gmw._games_with_result
+        assert df["team__description"].isna().sum() == 0
+        assert (df["team__description"] == "Winner Game 24").sum() == 1
@@ -0,0 +1,69 @@
+from django.test import TestCase
+
+from gameday_designer.models import (
+    ScheduleTemplate,
+    TemplateApplication,
+    TemplateSlot,
+    TemplateUpdateRule,
+    TemplateUpdateRuleTeam,
+)
+from gamedays.models import Gameinfo, Gameresult
+from gamedays.service.schedule_resolution_service import (
+    GamedayScheduleResolutionService,
+)
+from gamedays.tests.setup_factories.db_setup import DBSetup
+
+
+class TestGamedayScheduleResolutionService(TestCase):
+    def setUp(self):
+        self.gameday = DBSetup().g62_qualify_finished()
+        self.template = ScheduleTemplate.objects.create(
+            name="Test Template", num_teams=6, num_fields=1
+        )
+        TemplateApplication.objects.create(
+            gameday=self.gameday, template=self.template, team_mapping={}
+        )
+        for standing, place in (("P5", 3), ("P3", 2)):
+            slot = TemplateSlot.objects.create(
+                template=self.template,
+                field=1,
+                slot_order=place,
+                stage="Finalrunde",
+                standing=standing,
+            )
+            rule = TemplateUpdateRule.objects.create(
+                template=self.template, slot=slot, pre_finished="Vorrunde"
+            )
+            for role, group, team_place in (
+                ("home", "Gruppe 1", place),
+                ("away", "Gruppe 2", place),
+                ("official", "Gruppe 1", 1),
+            ):
+                TemplateUpdateRuleTeam.objects.create(
+                    update_rule=rule, role=role, standing=group, place=team_place
+                )
+        Gameresult.objects.filter(
+            gameinfo__gameday=self.gameday, gameinfo__standing__in=["P5", "P3"]
+        ).update(team=None)
+
+    def test_update_participants_resolves_all_dependents_in_bulk(self):
+        service = GamedayScheduleResolutionService(self.gameday.pk)
+        expected = {
+            standing: [
+                service.gmw.get_team_by(place=place, standing=group, points=None)
+                for group in ("Gruppe 1", "Gruppe 2")
+            ]
+            for standing, place in (("P5", 3), ("P3", 2))
+        }
+        group_winner = service.gmw.get_team_by(place=1, standing="Gruppe 1", points=None)
+
+        # rules, team rules, target games, teams, results, one write each
+        # for results and officials and the change counter bump
+        with self.assertNumQueries(8):
+            service.update_participants("Vorrunde")
+
+        for standing, (home, away) in expected.items():
+            gameinfo = Gameinfo.objects.get(gameday=self.gameday, standing=standing)
+            results = Gameresult.objects.filter(gameinfo=gameinfo).order_by("-isHome")
+            assert [result.team.description for result in results] == [home, away]
+            assert gameinfo.officials.description == group_winner
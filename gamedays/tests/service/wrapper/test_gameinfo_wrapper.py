@@ -50,7 +50,8 @@ class TestGameinfoWrapper(TestCase):
         # wall-clock time; rendering to local time is the frontend's job.
         utc_now = datetime(2026, 8, 15, 9, 5, 0, tzinfo=UTC)
         first_game, gameinfo_wrapper = self._setup_first_game()
-        with self.assertNumQueries(1):
+        # the update and the gameday's change counter bump
+        with self.assertNumQueries(2):
             with mock.patch("django.utils.timezone.now", return_value=utc_now):
                 gameinfo_wrapper.set_gamestarted_to_now()
         first_game.refresh_from_db()
@@ -59,7 +60,8 @@ class TestGameinfoWrapper(TestCase):
     def test_halftime_time_is_stored_in_utc(self):
         utc_now = datetime(2026, 8, 15, 9, 5, 0, tzinfo=UTC)
         first_game, gameinfo_wrapper = self._setup_first_game()
-        with self.assertNumQueries(1):
+        # the update and the gameday's change counter bump
+        with self.assertNumQueries(2):
             with mock.patch("django.utils.timezone.now", return_value=utc_now):
                 gameinfo_wrapper.set_halftime_to_now()
         first_game.refresh_from_db()
@@ -46,6 +46,7 @@ from gamedays.tests.setup_factories.factories import (
     ResourceUrlFactory,
 )
 from gamedays.wizard import FIELD_GROUP_STEP, GAMEDAY_FORMAT_STEP, GAMEINFO_STEP
+from league_manager.utils.utils import MenuRegistry
 from league_table.tests.setup_factories.db_setup_leaguetable import LEAGUE_TABLE_TEST_RULESET
 from league_table.tests.setup_factories.factories_leaguetable import (
     LeagueGroupFactory,
@@ -115,8 +116,9 @@ class TestGamedayDetailView(TestCase):
         # 4. SeasonConfig - for statistics
         # 5. OfficialsSignups - List of External Referees
         # 6. SeasonConfig - for table tiebreaker
-        # 7. LeagueSlug
+        # 7. LeagueSlug - for the menu, cached per permission class
         ###
+        MenuRegistry.invalidate()
         with self.assertNumQueries(7):  # Exactly 1 query expected
             resp = self.client.get(
                 reverse(LEAGUE_GAMEDAY_DETAIL, kwargs={"pk": gameday.pk})
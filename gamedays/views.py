@@ -1,6 +1,5 @@
 from datetime import datetime
 
-import pandas as pd
 from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
@@ -20,6 +19,8 @@ from django.views.generic import (
 )
 from formtools.wizard.views import SessionWizardView
 
+from league_manager.db_router import ReplicaReadMixin
+from league_manager.utils.lazy_import import LazyModule
 from league_manager.utils.url_service import UrlService
 from league_table.constants import LEAGUE_TABLE_OVERALL_TABLE_BY_SLUG_AND_LEAGUE
 from league_table.models import LeagueSeasonConfig, OverrideOfficialGamedaySetting
@@ -62,8 +63,10 @@ from .wizard import (
     WIZARD_STEP_HANDLER_MAP,
 )
 
+pd = LazyModule("pandas")
 
-class GamedayListView(View):
+
+class GamedayListView(ReplicaReadMixin, View):
     model = Gameday
     template_name = "gamedays/gameday_list.html"
 
@@ -109,7 +112,7 @@ class GamedayListView(View):
         )
 
 
-class GamedayLeagueStatisticView(TemplateView):
+class GamedayLeagueStatisticView(ReplicaReadMixin, TemplateView):
     model = Gameday
     template_name = "gamedays/statistics/league_statistics.html"
 
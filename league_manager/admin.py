@@ -1,9 +1,9 @@
 from django.contrib import admin
 from django import forms
-from django.core.cache import cache
 from django.shortcuts import redirect
 from django.urls import path
 
+from league_manager.cache import config_cache
 from league_manager.constants import MAINTENANCE_CONFIG_CACHE_KEY
 from league_manager.models import SiteConfiguration
 
@@ -86,7 +86,7 @@ class SiteConfigurationAdmin(admin.ModelAdmin):
         )
         config.maintenance_scope = order[(current + 1) % len(order)]
         config.save()
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
         self.message_user(
             request,
             f"Maintenance scope changed to: {config.maintenance_scope}",
@@ -7,3 +7,6 @@ class LeagueManagerConfig(AppConfig):
     def ready(self):
         # noinspection PyUnresolvedReferences
         import league_manager.signals
+        from league_manager.utils.utils import MenuRegistry
+
+        MenuRegistry.load()
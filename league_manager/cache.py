@@ -0,0 +1,115 @@
+"""Cache namespaces.
+
+Every subsystem caches into its own namespace, a cache alias in
+``settings.CACHES`` with its own location, default timeout and size bound:
+
+* ``live``: version stamps, change counters and the data derived from them
+  (placeholder maps, gameday and passcheck bundles)
+* ``pages``: rendered pages and page data (``cache_page``, official lists,
+  team lists)
+* ``config``: site configuration and the database probe
+
+In production the namespaces are file based under ``CACHE_DIR``, shared by
+every process that sees that directory. Without ``CACHE_DIR`` it is the
+temporary directory, so each machine or container has caches of its own and
+does not see the invalidations of the others; the image points ``CACHE_DIR``
+to a volume the compose files mount into all backend containers. Each
+namespace counts its hits and misses per process, see ``get_cache_stats``.
+"""
+
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils.connection import ConnectionProxy
+
+from league_manager.constants import CACHE_CONFIG, CACHE_LIVE, CACHE_PAGES
+
+live_cache = ConnectionProxy(caches, CACHE_LIVE)
+pages_cache = ConnectionProxy(caches, CACHE_PAGES)
+config_cache = ConnectionProxy(caches, CACHE_CONFIG)
+
+
+class HitMissCountingMixin:
+    """Counts the hits and misses of ``get`` (and so ``get_many``) per
+    namespace, identified by its ``KEY_PREFIX``."""
+
+    _counters: dict[str, Counter] = defaultdict(Counter)
+    _counters_lock = threading.Lock()
+    _missing = object()
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, self._missing, version=version)
+        is_hit = value is not self._missing
+        with self._counters_lock:
+            self._counters[self.key_prefix]["hits" if is_hit else "misses"] += 1
+        return value if is_hit else default
+
+    def get_stats(self) -> dict:
+        with self._counters_lock:
+            counter = self._counters[self.key_prefix]
+            return {"hits": counter["hits"], "misses": counter["misses"]}
+
+
+class CountingFileBasedCache(HitMissCountingMixin, FileBasedCache):
+    """Checks the size of the namespace every ``cull_interval`` writes.
+
+    ``FileBasedCache`` lists the whole directory on every write to decide
+    whether to cull, and the ``live`` namespace is written on every scorecard
+    event. A namespace may now exceed ``MAX_ENTRIES`` by up to
+    ``cull_interval`` writes per thread."""
+
+    cull_interval = 100
+
+    def __init__(self, dir, params):
+        super().__init__(dir, params)
+        self._writes = 0
+
+    def _cull(self):
+        self._writes += 1
+        if self._writes % self.cull_interval == 0:
+            super()._cull()
+
+
+class CountingLocMemCache(HitMissCountingMixin, LocMemCache):
+    pass
+
+
+def get_cache_stats() -> dict[str, dict]:
+    """Hits and misses of every counting namespace in this process."""
+    return {
+        alias: caches[alias].get_stats()
+        for alias in settings.CACHES
+        if isinstance(caches[alias], HitMissCountingMixin)
+    }
+
+
+def clear_all_caches() -> None:
+    for alias in settings.CACHES:
+        caches[alias].clear()
+
+
+class VersionStamp:
+    """Version stamp held under ``key`` in the ``live`` namespace, part of the
+    keys of the data cached for it; a bump makes all of it unreachable.
+
+    Stamps are nanosecond timestamps rather than counters, so an evicted key
+    is initialized to a new value and can never resurrect old data.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def get(self) -> int:
+        version = live_cache.get(self.key)
+        if version is None:
+            live_cache.add(self.key, time.time_ns(), None)
+            version = live_cache.get(self.key)
+        return version
+
+    def bump(self) -> None:
+        live_cache.set(self.key, time.time_ns(), None)
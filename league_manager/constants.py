@@ -1,5 +1,9 @@
 ADMIN_ALL_URLS = "admin-all-urls"
 CLEAR_CACHE = "clear-cache"
+QUERY_STATS = "query-stats"
+CACHE_LIVE = "live"
+CACHE_PAGES = "pages"
+CACHE_CONFIG = "config"
 LEAGUE_MANAGER_MAINTENANCE = "maintenance"
 MAINTENANCE_CONFIG_CACHE_KEY = "site_maintenance_config"
 MAINTENANCE_CONFIG_CACHE_TTL = 30
@@ -3,9 +3,10 @@ from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
 
 from gamedays.models import Team
+from league_manager.constants import CACHE_PAGES
 
 
-@method_decorator(cache_page(60 * 60 * 24), name="dispatch")
+@method_decorator(cache_page(60 * 60 * 24, cache=CACHE_PAGES), name="dispatch")
 class TeamAutocompleteView(autocomplete.Select2QuerySetView):
     paginate_by = 500
 
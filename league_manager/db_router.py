@@ -0,0 +1,116 @@
+"""Read-replica routing for spectator traffic.
+
+Views opt in with ``ReplicaReadMixin``: the reads of a safe, anonymous
+request to such a view go to ``DATABASE_REPLICA_ALIAS``, everything else to
+``default``. Writes always go to ``default``.
+
+A replica lags behind the primary. A client that wrote something gets the
+``PRIMARY_PIN_COOKIE`` (see ``league_manager.middleware.replica_pin``) and
+reads the primary for ``REPLICA_PIN_SECONDS``, so it sees its own write; the
+writes of other clients do not affect where a spectator reads from.
+
+What spectators read is cached under the change counters
+(``gamedays.service.change_counter_service``). Within ``use_replica`` the
+counters are read from the replica as well and bypass their cache, so data
+read from a lagging replica is only ever cached under a version the replica
+had already applied. Caches versioned by a stamp in the cache itself are not
+filled from replica reads (see ``reads_from_replica``).
+
+Without ``DATABASE_REPLICA_ALIAS`` nothing is routed. Locally the test
+settings define a second SQLite database ``replica`` to try it against.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+PRIMARY_PIN_COOKIE = "primary_pin"
+
+_replica_reads = ContextVar("replica_reads", default=False)
+_wrote = ContextVar("wrote", default=False)
+
+
+@contextmanager
+def use_replica():
+    """Sends the reads of the block to the replica, unless there is none."""
+    if settings.DATABASE_REPLICA_ALIAS is None:
+        yield
+        return
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def reads_from_replica() -> bool:
+    return _replica_reads.get()
+
+
+@contextmanager
+def track_writes():
+    """Tracks whether the block writes to the database, see ``has_written``."""
+    token = _wrote.set(False)
+    try:
+        yield
+    finally:
+        _wrote.reset(token)
+
+
+def has_written() -> bool:
+    return _wrote.get()
+
+
+def is_primary_pinned(request) -> bool:
+    """True while the pin a client got with its last write is valid."""
+    try:
+        pinned_until = int(request.COOKIES.get(PRIMARY_PIN_COOKIE, 0))
+    except ValueError:
+        return False
+    return pinned_until > time.time()
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _replica_reads.get():
+            return settings.DATABASE_REPLICA_ALIAS
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        # a rolled back write pins as well, which only costs replica reads
+        _wrote.set(True)
+        # instances read from the replica are saved to the primary as well
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, settings.DATABASE_REPLICA_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+
+class ReplicaReadMixin:
+    """Reads safe requests of anonymous users from the replica.
+
+    Authenticated users (by session or token) are scorekeepers, officials and
+    staff, who expect to see their own writes, so they always read the
+    primary, as do clients pinned by a write of their own. Template responses
+    are rendered before leaving the replica, their querysets are evaluated
+    while rendering."""
+
+    def dispatch(self, request, *args, **kwargs):
+        if (
+            request.method not in ("GET", "HEAD", "OPTIONS")
+            or request.user.is_authenticated
+            or "HTTP_AUTHORIZATION" in request.META
+            or is_primary_pinned(request)
+        ):
+            return super().dispatch(request, *args, **kwargs)
+        with use_replica():
+            response = super().dispatch(request, *args, **kwargs)
+            if hasattr(response, "render") and not response.is_rendered:
+                response.render()
+        return response
@@ -0,0 +1,220 @@
+"""A scalable, reproducible dataset for benchmarks and load tests.
+
+One league with ``seasons`` seasons of ``gamedays`` gamedays each. On every
+gameday each of ``teams`` teams plays every other once, every game gets
+``events`` scoring events and every team has a roster of ``roster`` players
+who all played every gameday. The last gameday of a season is in progress.
+The same random generator seed always produces the same dataset.
+"""
+
+import random
+from datetime import date, time as time_of_day, timedelta
+from itertools import combinations
+
+from django.contrib.auth.models import User
+
+from gamedays.models import (
+    Gameday,
+    Gameinfo,
+    Gameresult,
+    League,
+    Person,
+    Season,
+    Team,
+    TeamLog,
+)
+from league_table.models import (
+    LeagueRuleset,
+    LeagueRulesetTieBreak,
+    LeagueSeasonConfig,
+    TieBreakStep,
+)
+from passcheck.models import EligibilityRule, Player, Playerlist, PlayerlistGameday
+
+BENCHMARK_LEAGUE = "Benchmark Liga"
+BENCHMARK_USERNAME = "benchmark"
+FIRST_SEASON = 2020
+# (event, points)
+SCORING_EVENTS = [
+    ("Touchdown", 6),
+    ("1-Extra-Punkt", 1),
+    ("2-Extra-Punkte", 2),
+    ("Interception", 0),
+    ("Safety", 2),
+]
+LIVE_STATUSES = ["1. Halbzeit", "2. Halbzeit"]
+TIE_BREAK_ORDER = [
+    "win_quotient",
+    "direct_wins",
+    "direct_point_diff",
+    "direct_points_scored",
+    "overall_point_diff",
+    "overall_points_scored",
+    "name_ascending",
+]
+
+
+class BenchmarkDataset:
+    """The seeded objects the endpoints are requested for."""
+
+    def __init__(self, rng: random.Random, options: dict):
+        self.rng = rng
+        self.options = options
+        self.seasons: list[Season] = []
+        self.gamedays: list[Gameday] = []
+        self.live_gamedays: list[Gameday] = []
+        self.games: list[Gameinfo] = []
+        self.home_teams: dict[int, Team] = {}
+
+    def seed(self) -> None:
+        self.user = User.objects.create_user(
+            username=BENCHMARK_USERNAME, password=BENCHMARK_USERNAME, is_staff=True
+        )
+        self.league = League.objects.create(name=BENCHMARK_LEAGUE)
+        ruleset = LeagueRuleset.objects.create(name="Benchmark")
+        steps = TieBreakStep.objects.in_bulk(TIE_BREAK_ORDER, field_name="key")
+        LeagueRulesetTieBreak.objects.bulk_create(
+            LeagueRulesetTieBreak(
+                ruleset=ruleset,
+                step=steps[key],
+                order=order,
+                sort_order="ascending" if key == "name_ascending" else "descending",
+            )
+            for order, key in enumerate(TIE_BREAK_ORDER)
+        )
+        eligibility_rule = EligibilityRule.objects.create(
+            league=self.league,
+            max_gamedays=self.options["gamedays"],
+            max_subs_in_other_leagues=0,
+            minimum_player_strength=5,
+            maximum_player_strength=self.options["roster"],
+        )
+        eligibility_rule.eligible_in.add(self.league)
+        self.teams = [
+            Team.objects.create(
+                name=f"BT{index}",
+                description=f"Benchmark Team {index}",
+                location="Benchmark",
+            )
+            for index in range(self.options["teams"])
+        ]
+        self._seed_rosters()
+        first_gameday = date(FIRST_SEASON, 4, 1)
+        for season_index in range(self.options["seasons"]):
+            season = Season.objects.create(name=str(FIRST_SEASON + season_index))
+            LeagueSeasonConfig.objects.create(
+                league=self.league, season=season, ruleset=ruleset
+            )
+            self.seasons.append(season)
+            for gameday_index in range(self.options["gamedays"]):
+                is_live = gameday_index == self.options["gamedays"] - 1
+                self._seed_gameday(
+                    season,
+                    first_gameday.replace(year=FIRST_SEASON + season_index)
+                    + timedelta(weeks=2 * gameday_index),
+                    is_live,
+                )
+
+    def _seed_rosters(self) -> None:
+        persons = Person.objects.bulk_create(
+            Person(
+                first_name=f"Vorname{index}",
+                last_name=f"Nachname{index}",
+                sex=self.rng.choice([Person.FEMALE, Person.MALE]),
+                year_of_birth=1980 + index % 25,
+            )
+            for index in range(len(self.teams) * self.options["roster"])
+        )
+        players = Player.objects.bulk_create(
+            Player(person=person, pass_number=str(10000 + index))
+            for index, person in enumerate(persons)
+        )
+        self.playerlists = Playerlist.objects.bulk_create(
+            Playerlist(
+                team=self.teams[index // self.options["roster"]],
+                player=player,
+                jersey_number=index % self.options["roster"] + 1,
+                joined_on=date(FIRST_SEASON - 1, 1, 1),
+            )
+            for index, player in enumerate(players)
+        )
+
+    def _seed_gameday(self, season: Season, gameday_date: date, is_live: bool) -> None:
+        gameday = Gameday.objects.create(
+            name=f"Spieltag {gameday_date}",
+            season=season,
+            league=self.league,
+            date=gameday_date,
+            start=time_of_day(10, 0),
+            author=self.user,
+            status=Gameday.STATUS_IN_PROGRESS if is_live else Gameday.STATUS_COMPLETED,
+        )
+        self.gamedays.append(gameday)
+        if is_live:
+            self.live_gamedays.append(gameday)
+
+        pairings = list(combinations(self.teams, 2))
+        games = Gameinfo.objects.bulk_create(
+            Gameinfo(
+                gameday=gameday,
+                scheduled=time_of_day(10 + index // 2, 0),
+                field=index % 2 + 1,
+                officials=self.rng.choice(
+                    [team for team in self.teams if team not in (home, away)]
+                ),
+                status=(
+                    self.rng.choice(LIVE_STATUSES)
+                    if is_live
+                    else Gameinfo.STATUS_COMPLETED
+                ),
+                stage="Vorrunde",
+                standing="Gruppe 1",
+            )
+            for index, (home, away) in enumerate(pairings)
+        )
+        self.games.extend(games)
+
+        gameresults = []
+        teamlogs = []
+        for game, (home, away) in zip(games, pairings):
+            self.home_teams[game.pk] = home
+            scores = {(home.pk, 1): 0, (home.pk, 2): 0, (away.pk, 1): 0, (away.pk, 2): 0}
+            for sequence in range(1, self.options["events"] + 1):
+                team = self.rng.choice([home, away])
+                half = 1 if sequence <= self.options["events"] // 2 else 2
+                event, points = self.rng.choice(SCORING_EVENTS)
+                scores[(team.pk, half)] += points
+                teamlogs.append(
+                    TeamLog(
+                        gameinfo=game,
+                        team=team,
+                        sequence=sequence,
+                        player=self.rng.randint(1, self.options["roster"]),
+                        event=event,
+                        value=points,
+                        half=half,
+                        author=self.user,
+                    )
+                )
+            for team, opponent, is_home in ((home, away, True), (away, home, False)):
+                gameresults.append(
+                    Gameresult(
+                        gameinfo=game,
+                        team=team,
+                        isHome=is_home,
+                        fh=scores[(team.pk, 1)],
+                        sh=scores[(team.pk, 2)],
+                        pa=scores[(opponent.pk, 1)] + scores[(opponent.pk, 2)],
+                    )
+                )
+        Gameresult.objects.bulk_create(gameresults)
+        TeamLog.objects.bulk_create(teamlogs)
+        # every player played every gameday, which the roster validation counts
+        PlayerlistGameday.objects.bulk_create(
+            PlayerlistGameday(
+                playerlist=playerlist,
+                gameday=gameday,
+                gameday_jersey=playerlist.jersey_number,
+            )
+            for playerlist in self.playerlists
+        )
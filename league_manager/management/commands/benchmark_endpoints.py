@@ -0,0 +1,259 @@
+"""Benchmark the hot endpoints against a seeded, scalable dataset.
+
+Creates a throwaway SQLite test database, seeds it with one league of
+``--seasons`` seasons of ``--gamedays`` gamedays each (every team of
+``--teams`` plays every other once per gameday, every game gets ``--events``
+scoring events and every team a roster of ``--roster`` players) and drives
+the liveticker, game log (GET and POST), gameday detail, league table, league
+statistics and passcheck roster endpoints through the Django test client.
+
+Every endpoint is requested ``--requests`` times, cycling through the seeded
+gamedays, games and seasons. The caches are cleared before every request
+unless ``--warm-cache`` is given, so the numbers cover the work behind the
+caches; a warm run starts from caches cleared before seeding. Latency percentiles, query counts and response sizes per endpoint are
+written as JSON, sorted and indented so reports of two revisions can be
+diffed. The same ``--seed`` and sizes always produce the same dataset.
+
+Usage
+-----
+::
+
+    python manage.py benchmark_endpoints --settings=league_manager.settings.test_sqlite
+    python manage.py benchmark_endpoints --settings=league_manager.settings.test_sqlite \\
+        --seasons 3 --gamedays 8 --events 60 --output benchmark-main.json
+"""
+
+import json
+import platform
+import random
+import statistics
+import time
+from itertools import cycle
+
+import django
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import (
+    CaptureQueriesContext,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.urls import reverse
+
+from gamedays.constants import (
+    API_GAMELOG,
+    LEAGUE_GAMEDAY_DETAIL,
+    LEAGUE_GAMEDAY_LEAGUE_STATISTICS,
+)
+from league_manager.cache import clear_all_caches
+from league_manager.management.benchmark_dataset import BenchmarkDataset
+from league_table.constants import LEAGUE_TABLE_OVERALL_TABLE_BY_SLUG_AND_LEAGUE
+from liveticker.api.urls import API_LIVETICKER_ALL
+from passcheck.api.urls import API_PASSCHECK_SERVICE_PLAYERS
+
+REPORT_FORMAT = 1
+
+
+def percentile(sorted_values: list[float], share: float) -> float:
+    index = min(len(sorted_values) - 1, round(share * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    help = "Benchmark the hot endpoints against a seeded SQLite dataset"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seasons", type=int, default=2)
+        parser.add_argument("--gamedays", type=int, default=4)
+        parser.add_argument("--events", type=int, default=40)
+        parser.add_argument("--teams", type=int, default=6)
+        parser.add_argument("--roster", type=int, default=20)
+        parser.add_argument("--requests", type=int, default=30)
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--warm-cache", action="store_true")
+        parser.add_argument("--output", help="write the report to this file")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError(
+                "The benchmark seeds a throwaway SQLite database, run it with "
+                "SQLite settings, e.g. --settings=league_manager.settings.test_sqlite"
+            )
+        if options["teams"] < 3:
+            raise CommandError("At least 3 teams are needed, one officiates.")
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+        # the file caches outlive a run, and the seeded ids repeat, so a warm
+        # run would otherwise be served what an earlier run cached
+        clear_all_caches()
+        try:
+            start = time.perf_counter()
+            dataset = BenchmarkDataset(random.Random(options["seed"]), options)
+            dataset.seed()
+            self.stderr.write(
+                f"Seeded {len(dataset.gamedays)} gamedays, {len(dataset.games)} games "
+                f"in {time.perf_counter() - start:.1f} s"
+            )
+            endpoints = {
+                name: self._run(requests, dataset.user, options)
+                for name, requests in self._get_endpoints(dataset).items()
+            }
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        report = json.dumps(
+            {
+                "format": REPORT_FORMAT,
+                "dataset": {
+                    key: options[key]
+                    for key in ("seasons", "gamedays", "events", "teams", "roster", "seed")
+                },
+                "requests": options["requests"],
+                "warm_cache": options["warm_cache"],
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "endpoints": endpoints,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as report_file:
+                report_file.write(report + "\n")
+        else:
+            self.stdout.write(report)
+        self.stderr.write(
+            f"{'endpoint':<18} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'queries':>8}"
+        )
+        for name, result in endpoints.items():
+            self.stderr.write(
+                f"{name:<18} {result['latency_ms']['p50']:>8.2f} "
+                f"{result['latency_ms']['p90']:>8.2f} "
+                f"{result['latency_ms']['p99']:>8.2f} {result['queries']['max']:>8}"
+            )
+
+    @staticmethod
+    def _get_endpoints(dataset: BenchmarkDataset) -> dict:
+        """Per endpoint an endless iterator of (method, url, data) requests."""
+
+        def requests(build, targets):
+            return (build(target) for target in cycle(targets))
+
+        live_games = [
+            game for game in dataset.games if game.gameday in dataset.live_gamedays
+        ]
+        return {
+            "liveticker": requests(
+                lambda gameday: (
+                    "get",
+                    f"{reverse(API_LIVETICKER_ALL)}?gameday={gameday.pk}",
+                    None,
+                ),
+                dataset.live_gamedays,
+            ),
+            "gamelog_get": requests(
+                lambda game: ("get", reverse(API_GAMELOG, kwargs={"id": game.pk}), None),
+                dataset.games,
+            ),
+            "gamelog_post": requests(
+                lambda game: (
+                    "post",
+                    reverse(API_GAMELOG, kwargs={"id": game.pk}),
+                    {
+                        "team": dataset.home_teams[game.pk].pk,
+                        "gameId": game.pk,
+                        "half": 2,
+                        "event": [
+                            {"name": "Touchdown", "player": "19"},
+                            {"name": "1-Extra-Punkt", "player": "7"},
+                        ],
+                    },
+                ),
+                live_games,
+            ),
+            "gameday_detail": requests(
+                lambda gameday: (
+                    "get",
+                    reverse(LEAGUE_GAMEDAY_DETAIL, kwargs={"pk": gameday.pk}),
+                    None,
+                ),
+                dataset.gamedays,
+            ),
+            "league_table": requests(
+                lambda season: (
+                    "get",
+                    reverse(
+                        LEAGUE_TABLE_OVERALL_TABLE_BY_SLUG_AND_LEAGUE,
+                        kwargs={"league": dataset.league.slug, "season": season.slug},
+                    ),
+                    None,
+                ),
+                dataset.seasons,
+            ),
+            "league_statistics": requests(
+                lambda season: (
+                    "get",
+                    reverse(
+                        LEAGUE_GAMEDAY_LEAGUE_STATISTICS,
+                        kwargs={"season": season.name, "league": dataset.league.name},
+                    ),
+                    None,
+                ),
+                dataset.seasons,
+            ),
+            "passcheck_roster": requests(
+                lambda gameday: (
+                    "get",
+                    reverse(
+                        API_PASSCHECK_SERVICE_PLAYERS,
+                        kwargs={"pk": dataset.teams[0].pk, "gameday": gameday.pk},
+                    ),
+                    None,
+                ),
+                dataset.gamedays,
+            ),
+        }
+
+    @staticmethod
+    def _run(requests, user: User, options) -> dict:
+        client = Client()
+        client.force_login(user)
+        latencies, queries, sizes, status_codes = [], [], [], set()
+        for _ in range(options["requests"]):
+            method, url, data = next(requests)
+            if not options["warm_cache"]:
+                clear_all_caches()
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                if method == "post":
+                    response = client.post(url, data, content_type="application/json")
+                else:
+                    response = client.get(url)
+                latencies.append((time.perf_counter() - start) * 1000)
+            queries.append(len(captured))
+            sizes.append(len(response.content))
+            status_codes.add(response.status_code)
+
+        latencies.sort()
+        return {
+            "status_codes": sorted(status_codes),
+            "latency_ms": {
+                "p50": round(percentile(latencies, 0.5), 3),
+                "p90": round(percentile(latencies, 0.9), 3),
+                "p99": round(percentile(latencies, 0.99), 3),
+                "mean": round(statistics.mean(latencies), 3),
+                "max": round(latencies[-1], 3),
+            },
+            "queries": {
+                "min": min(queries),
+                "max": max(queries),
+                "mean": round(statistics.mean(queries), 2),
+            },
+            "response_bytes": {"min": min(sizes), "max": max(sizes)},
+        }
@@ -0,0 +1,127 @@
+"""Benchmark the startup of a fresh process.
+
+Every run starts a new interpreter with the current settings and measures
+``django.setup()``, the first request (which imports the URL configs and with
+them the views and services) and a second request for comparison. The first
+request goes through the Django test client, so no server is needed, but it
+hits the configured database. It records whether pandas and numpy were
+imported after each phase, so a module importing them eagerly again shows up
+here before it shows up in the boot time of the workers.
+
+Usage
+-----
+::
+
+    python manage.py benchmark_startup
+    python manage.py benchmark_startup --runs 10 --url /liveticker/ --output startup.json
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from gamedays.constants import LEAGUE_GAMEDAY_LIST
+
+REPORT_FORMAT = 1
+HEAVY_MODULES = ["pandas", "numpy"]
+PHASES = ["setup", "first_request", "second_request"]
+
+CHILD_SCRIPT = """
+import json, sys, time
+
+def loaded():
+    return [module for module in {heavy_modules!r} if module in sys.modules]
+
+result = {{}}
+start = time.perf_counter()
+import django
+django.setup()
+result["setup"] = {{"ms": (time.perf_counter() - start) * 1000, "loaded": loaded()}}
+
+from django.test import Client
+from django.test.utils import setup_test_environment
+setup_test_environment()
+client = Client()
+for phase in ("first_request", "second_request"):
+    start = time.perf_counter()
+    response = client.get({url!r})
+    result[phase] = {{
+        "ms": (time.perf_counter() - start) * 1000,
+        "loaded": loaded(),
+        "status_code": response.status_code,
+    }}
+print(json.dumps(result))
+"""
+
+
+class Command(BaseCommand):
+    help = "Benchmark django.setup() and the first request of a fresh process"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--url", help="defaults to the gameday list")
+        parser.add_argument("--output", help="write the report to this file")
+
+    def handle(self, *args, **options):
+        url = options["url"] or reverse(LEAGUE_GAMEDAY_LIST)
+        script = CHILD_SCRIPT.format(heavy_modules=HEAVY_MODULES, url=url)
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+        runs = []
+        for _ in range(options["runs"]):
+            child = subprocess.run(
+                [sys.executable, "-c", script],
+                cwd=os.path.dirname(settings.BASE_DIR),
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+            if child.returncode != 0:
+                raise CommandError(f"Startup run failed:\n{child.stderr}")
+            # the last line, settings may print to stdout
+            runs.append(json.loads(child.stdout.strip().splitlines()[-1]))
+
+        phases = {}
+        for phase in PHASES:
+            timings = sorted(run[phase]["ms"] for run in runs)
+            phases[phase] = {
+                "ms": {
+                    "median": round(statistics.median(timings), 2),
+                    "min": round(timings[0], 2),
+                    "max": round(timings[-1], 2),
+                },
+                "loaded": sorted(set().union(*(run[phase]["loaded"] for run in runs))),
+            }
+            if "status_code" in runs[0][phase]:
+                phases[phase]["status_codes"] = sorted(
+                    {run[phase]["status_code"] for run in runs}
+                )
+
+        report = json.dumps(
+            {
+                "format": REPORT_FORMAT,
+                "runs": options["runs"],
+                "url": url,
+                "settings": settings.SETTINGS_MODULE,
+                "python": sys.version.split()[0],
+                "phases": phases,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as report_file:
+                report_file.write(report + "\n")
+        else:
+            self.stdout.write(report)
+        self.stderr.write(f"{'phase':<16} {'median ms':>10} {'min ms':>8}  loaded")
+        for phase, result in phases.items():
+            self.stderr.write(
+                f"{phase:<16} {result['ms']['median']:>10.1f} "
+                f"{result['ms']['min']:>8.1f}  {', '.join(result['loaded']) or '-'}"
+            )
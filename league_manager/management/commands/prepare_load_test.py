@@ -0,0 +1,129 @@
+"""Prepare the local database for the Locust suite in ``locust_testing``.
+
+Seeds the benchmark dataset (see ``league_manager.management.benchmark_dataset``)
+unless its league already exists, moves the latest ``--today`` gamedays of
+that league to today and resets them to published and unplayed, so every run
+finds fresh games to score. Then writes the coordination file the Locust users
+read: the gamedays, their games and teams and API tokens for the scorekeepers
+and passcheck officials.
+
+Usage
+-----
+::
+
+    python manage.py prepare_load_test
+    python manage.py prepare_load_test --today 8 --output locust_testing/gameday_assignments.json
+    locust -f locust_testing/locustfile.py --host http://localhost:8000
+"""
+
+import json
+import random
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from knox.models import AuthToken
+
+from gamedays.models import Gameday, Gameinfo, Gameresult, GameSetup, League, TeamLog
+from gamedays.service.change_counter_service import ChangeCounterService
+from league_manager.management.benchmark_dataset import (
+    BENCHMARK_LEAGUE,
+    BENCHMARK_USERNAME,
+    BenchmarkDataset,
+)
+
+DEFAULT_OUTPUT = "locust_testing/gameday_assignments.json"
+OFFICIAL_USERNAME = "loadtest-official"
+
+
+class Command(BaseCommand):
+    help = "Seed the local database and move gamedays to today for the Locust suite"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--today", type=int, default=4)
+        parser.add_argument("--seasons", type=int, default=2)
+        parser.add_argument("--gamedays", type=int, default=4)
+        parser.add_argument("--events", type=int, default=40)
+        parser.add_argument("--teams", type=int, default=6)
+        parser.add_argument("--roster", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--output", default=DEFAULT_OUTPUT)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            league = League.objects.filter(name=BENCHMARK_LEAGUE).first()
+            if league is None:
+                dataset = BenchmarkDataset(random.Random(options["seed"]), options)
+                dataset.seed()
+                league = dataset.league
+                self.stdout.write(f"Seeded {len(dataset.gamedays)} gamedays")
+            gamedays = list(
+                Gameday.objects.filter(league=league)
+                .select_related("season")
+                .order_by("-date", "-pk")[: options["today"]]
+            )
+            if not gamedays:
+                raise CommandError(f"No gamedays found for {league.name}")
+            self._reset_to_today(gamedays)
+            scorekeeper = User.objects.get(username=BENCHMARK_USERNAME)
+            official, _ = User.objects.get_or_create(username=OFFICIAL_USERNAME)
+            assignments = {
+                "league": league.slug,
+                "tokens": {
+                    "scorekeeper": AuthToken.objects.create(scorekeeper)[1],
+                    "official": AuthToken.objects.create(official)[1],
+                },
+                "gamedays": [self._describe(gameday) for gameday in gamedays],
+            }
+
+        with open(options["output"], "w", encoding="utf-8") as assignments_file:
+            json.dump(assignments, assignments_file, indent=2)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Moved {len(gamedays)} gamedays to today, wrote {options['output']}"
+            )
+        )
+
+    @staticmethod
+    def _reset_to_today(gamedays: list[Gameday]) -> None:
+        gameday_ids = [gameday.pk for gameday in gamedays]
+        games = Gameinfo.objects.filter(gameday_id__in=gameday_ids)
+        TeamLog.objects.filter(gameinfo__in=games).delete()
+        GameSetup.objects.filter(gameinfo__in=games).delete()
+        Gameresult.objects.filter(gameinfo__in=games).update(fh=None, sh=None, pa=None)
+        games.update(
+            status=Gameinfo.STATUS_PUBLISHED,
+            gameStarted=None,
+            gameHalftime=None,
+            gameFinished=None,
+            in_possession=None,
+        )
+        Gameday.objects.filter(pk__in=gameday_ids).update(
+            date=date.today(), status=Gameday.STATUS_PUBLISHED
+        )
+        # queryset updates send no post_save
+        for gameday_id in gameday_ids:
+            ChangeCounterService.bump_gameday(gameday_id)
+
+    @staticmethod
+    def _describe(gameday: Gameday) -> dict:
+        games = []
+        teams = {}
+        for game in Gameinfo.objects.filter(gameday=gameday).order_by("scheduled", "field"):
+            sides = {
+                "home" if gameresult.isHome else "away": {
+                    "id": gameresult.team_id,
+                    "name": gameresult.team.name,
+                }
+                for gameresult in game.gameresult_set.select_related("team")
+            }
+            teams.update({side["id"]: side["name"] for side in sides.values()})
+            games.append({"id": game.pk, **sides})
+        return {
+            "id": gameday.pk,
+            "name": gameday.name,
+            "season": gameday.season.slug,
+            "teams": sorted(teams),
+            "games": games,
+        }
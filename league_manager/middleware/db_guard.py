@@ -1,10 +1,11 @@
 import logging
 from django.db import connection
-from django.core.cache import cache
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.http import HttpResponse
 
+from league_manager.cache import config_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,7 +58,7 @@ class DatabaseGuardMiddleware:
             return self.get_response(request)
 
         # Check DB status
-        db_online = cache.get(self.db_status_cache_key)
+        db_online = config_cache.get(self.db_status_cache_key)
 
         if db_online is None:
             # Skip check for the error page itself during the active probe to avoid recursion if something goes wrong
@@ -66,11 +67,11 @@ class DatabaseGuardMiddleware:
                 with connection.cursor() as cursor:
                     cursor.execute("SELECT 1")
                 db_online = True
-                cache.set(self.db_status_cache_key, True, 10)  # Cache success for 10s
+                config_cache.set(self.db_status_cache_key, True, 10)  # Cache success for 10s
             except Exception as e:
                 logger.error(f"Database connection guard detected failure: {e}")
                 db_online = False
-                cache.set(self.db_status_cache_key, False, 5)  # Cache failure for 5s
+                config_cache.set(self.db_status_cache_key, False, 5)  # Cache failure for 5s
 
         # Store status on request for other middlewares
         request.db_online = db_online
@@ -1,9 +1,9 @@
 import re
 
-from django.core.cache import cache
 from django.http import HttpResponseRedirect
 from django.urls import reverse
 
+from league_manager.cache import config_cache
 from league_manager.constants import (
     LEAGUE_MANAGER_MAINTENANCE,
     MAINTENANCE_CONFIG_CACHE_KEY,
@@ -25,7 +25,7 @@ class MaintenanceModeMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
-        config = cache.get("%s" % MAINTENANCE_CONFIG_CACHE_KEY)
+        config = config_cache.get("%s" % MAINTENANCE_CONFIG_CACHE_KEY)
 
         if config is None:
             db_config = SiteConfiguration.objects.first()
@@ -37,7 +37,7 @@ class MaintenanceModeMiddleware:
             else:
                 config = {"scope": MAINTENANCE_SCOPE_OFF, "patterns": []}
 
-            cache.set(MAINTENANCE_CONFIG_CACHE_KEY, config, MAINTENANCE_CONFIG_CACHE_TTL)
+            config_cache.set(MAINTENANCE_CONFIG_CACHE_KEY, config, MAINTENANCE_CONFIG_CACHE_TTL)
 
         path = request.path_info
         if self._is_exempt(path):
@@ -0,0 +1,203 @@
+"""Per-request query instrumentation.
+
+A sampled share of the requests (``QUERY_STATS_SAMPLE_RATE``) runs with an
+``execute_wrapper`` on every database connection, which counts the statements
+and their time and remembers the slowest one with the project code that
+issued it. The samples are kept per resolved view name in a ring buffer of
+``QUERY_STATS_BUFFER_SIZE`` entries per worker process and served to staff by
+``QueryStatsView``.
+
+Requests above the query budget of their view (``QUERY_STATS_BUDGETS``,
+falling back to ``QUERY_STATS_DEFAULT_BUDGET``) are logged as warnings. Only
+sampled requests are counted, so budgets are checked for these alone.
+"""
+
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Optional
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+UNRESOLVED_VIEW = "<unresolved>"
+MAX_SQL_LENGTH = 500
+
+
+def get_call_site(frame) -> Optional[str]:
+    """The innermost frame of project code, skipping Django, the installed
+    packages, the standard library and this module."""
+    # BASE_DIR is the league_manager package, the other apps are its siblings
+    project_dir = os.path.join(os.path.dirname(settings.BASE_DIR), "")
+    # the image keeps its virtualenv inside the project directory
+    library_dirs = tuple(
+        os.path.join(prefix, "")
+        for prefix in {sys.prefix, sys.base_prefix}
+        if not project_dir.startswith(os.path.join(prefix, ""))
+    )
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(project_dir)
+            and not filename.startswith(library_dirs)
+            and "site-packages" not in filename
+            and filename != __file__
+        ):
+            return (
+                f"{os.path.relpath(filename, project_dir)}:{frame.f_lineno}"
+                f" in {frame.f_code.co_name}"
+            )
+        frame = frame.f_back
+    return None
+
+
+class QueryRecorder:
+    """``execute_wrapper`` recording the statements of one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.sql_time = 0.0
+        self.slowest_time = 0.0
+        self.slowest_sql = None
+        self.slowest_call_site = None
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.count += 1
+            self.sql_time += duration
+            if self.slowest_sql is None or duration > self.slowest_time:
+                self.slowest_time = duration
+                self.slowest_sql = sql[:MAX_SQL_LENGTH]
+                # the stack is only walked for a new slowest statement
+                self.slowest_call_site = get_call_site(sys._getframe(1))
+
+
+@dataclass(frozen=True, slots=True)
+class RequestSample:
+    queries: int
+    sql_ms: float
+    duration_ms: float
+    slowest_sql: Optional[str]
+    slowest_sql_ms: float
+    slowest_call_site: Optional[str]
+    over_budget: bool
+
+
+class QueryStatsRegistry:
+    """The latest samples of every view of this worker process."""
+
+    _samples: dict[str, deque] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, view_name: str, sample: RequestSample) -> None:
+        with cls._lock:
+            samples = cls._samples.get(view_name)
+            if samples is None:
+                samples = cls._samples[view_name] = deque(
+                    maxlen=settings.QUERY_STATS_BUFFER_SIZE
+                )
+            samples.append(sample)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._samples.clear()
+
+    @classmethod
+    def get_stats(cls) -> dict[str, dict]:
+        """Aggregates per view, the views with the most queries first."""
+        with cls._lock:
+            snapshot = {
+                view_name: list(samples) for view_name, samples in cls._samples.items()
+            }
+        stats = {
+            view_name: cls._aggregate(view_name, samples)
+            for view_name, samples in snapshot.items()
+        }
+        return dict(
+            sorted(stats.items(), key=lambda item: item[1]["queries"]["avg"], reverse=True)
+        )
+
+    @staticmethod
+    def _aggregate(view_name: str, samples: list[RequestSample]) -> dict:
+        def summarize(values):
+            return {
+                "avg": round(sum(values) / len(values), 2),
+                "max": round(max(values), 2),
+            }
+
+        slowest = max(samples, key=lambda sample: sample.slowest_sql_ms)
+        return {
+            "samples": len(samples),
+            "queries": summarize([sample.queries for sample in samples]),
+            "sql_ms": summarize([sample.sql_ms for sample in samples]),
+            "duration_ms": summarize([sample.duration_ms for sample in samples]),
+            "budget": get_query_budget(view_name),
+            "over_budget": sum(sample.over_budget for sample in samples),
+            "slowest": {
+                "sql": slowest.slowest_sql,
+                "ms": round(slowest.slowest_sql_ms, 2),
+                "call_site": slowest.slowest_call_site,
+            },
+        }
+
+
+def get_query_budget(view_name: str) -> Optional[int]:
+    return settings.QUERY_STATS_BUDGETS.get(
+        view_name, settings.QUERY_STATS_DEFAULT_BUDGET
+    )
+
+
+class QueryStatsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        sample_rate = settings.QUERY_STATS_SAMPLE_RATE
+        if sample_rate <= 0 or random.random() >= sample_rate:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(recorder))
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        match = getattr(request, "resolver_match", None)
+        view_name = match.view_name if match else UNRESOLVED_VIEW
+        budget = get_query_budget(view_name)
+        over_budget = budget is not None and recorder.count > budget
+        if over_budget:
+            logger.warning(
+                f"{view_name} issued {recorder.count} queries (budget {budget}) "
+                f"for {request.method} {request.path}, slowest "
+                f"{recorder.slowest_time * 1000:.1f} ms at {recorder.slowest_call_site}"
+            )
+        QueryStatsRegistry.record(
+            view_name,
+            RequestSample(
+                queries=recorder.count,
+                sql_ms=recorder.sql_time * 1000,
+                duration_ms=duration * 1000,
+                slowest_sql=recorder.slowest_sql,
+                slowest_sql_ms=recorder.slowest_time * 1000,
+                slowest_call_site=recorder.slowest_call_site,
+                over_budget=over_budget,
+            ),
+        )
+        return response
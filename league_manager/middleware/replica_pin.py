@@ -0,0 +1,29 @@
+import time
+
+from django.conf import settings
+
+from league_manager.db_router import PRIMARY_PIN_COOKIE, has_written, track_writes
+
+
+class ReplicaPinMiddleware:
+    """Pins a client that wrote to the database to the primary for
+    ``REPLICA_PIN_SECONDS`` with a cookie holding the end of the pin, so its
+    next reads see the write even while the replica lags behind."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with track_writes():
+            response = self.get_response(request)
+            wrote = has_written()
+        pin_seconds = settings.REPLICA_PIN_SECONDS
+        if wrote and settings.DATABASE_REPLICA_ALIAS is not None and pin_seconds > 0:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                str(int(time.time()) + pin_seconds),
+                max_age=pin_seconds,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 from django.contrib import messages
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
@@ -47,8 +48,10 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "league_manager.middleware.query_stats.QueryStatsMiddleware",
     "league_manager.middleware.maintenance.MaintenanceModeMiddleware",
     "league_manager.middleware.db_guard.DatabaseGuardMiddleware",
+    "league_manager.middleware.replica_pin.ReplicaPinMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -57,11 +60,39 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Query instrumentation (see league_manager/middleware/query_stats.py): share
+# of the requests whose queries are recorded, samples kept per view and the
+# number of queries per request above which a view is logged
+QUERY_STATS_SAMPLE_RATE = float(os.environ.get("QUERY_STATS_SAMPLE_RATE", 0.01))
+QUERY_STATS_BUFFER_SIZE = int(os.environ.get("QUERY_STATS_BUFFER_SIZE", 200))
+QUERY_STATS_DEFAULT_BUDGET = 50
+QUERY_STATS_BUDGETS = {
+    "api-liveticker-gameday-bundle": 20,
+    "api-gameday-games-results": 30,
+}
+
+# Cache namespaces (see league_manager/cache.py), shared by all processes that
+# see CACHE_DIR: alias -> (default timeout, max entries). The default is the
+# temporary directory of the machine or container; the image sets CACHE_DIR to
+# a volume that the compose files share between the backend containers.
+CACHE_DIR = os.environ.get(
+    "CACHE_DIR", os.path.join(tempfile.gettempdir(), "leaguesphere-cache")
+)
+CACHE_NAMESPACES = {
+    "default": (60 * 5, 1000),
+    "live": (60 * 60, 10000),
+    "pages": (60 * 5, 2000),
+    "config": (60, 100),
+}
 CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "league-manager-cache",
+    alias: {
+        "BACKEND": "league_manager.cache.CountingFileBasedCache",
+        "LOCATION": os.path.join(CACHE_DIR, alias),
+        "KEY_PREFIX": alias,
+        "TIMEOUT": timeout,
+        "OPTIONS": {"MAX_ENTRIES": max_entries},
     }
+    for alias, (timeout, max_entries) in CACHE_NAMESPACES.items()
 }
 
 PAGES_LINKS = {
@@ -189,8 +220,33 @@ DATABASES = {
     },
 }
 
+# Anonymous read-only views read from the replica, see league_manager/db_router.py
+DATABASE_ROUTERS = ["league_manager.db_router.ReplicaRouter"]
+DATABASE_REPLICA_ALIAS = None
+# seconds after a write during which the writing client reads the primary
+REPLICA_PIN_SECONDS = int(os.environ.get("REPLICA_PIN_SECONDS", 5))
+if os.environ.get("MYSQL_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": os.environ["MYSQL_REPLICA_HOST"],
+        "PORT": os.environ.get("MYSQL_REPLICA_PORT", DATABASES["default"]["PORT"]),
+    }
+    DATABASE_REPLICA_ALIAS = "replica"
+
 MOODLE_URL = os.environ.get("MOODLE_URL")
 MOODLE_WSTOKEN = os.environ.get("MOODLE_WSTOKEN")
+MOODLE_HTTP_TIMEOUT = int(os.environ.get("MOODLE_HTTP_TIMEOUT", 30))
+MOODLE_HTTP_RETRIES = int(os.environ.get("MOODLE_HTTP_RETRIES", 3))
+MOODLE_HTTP_BACKOFF_FACTOR = float(os.environ.get("MOODLE_HTTP_BACKOFF_FACTOR", 0.5))
+MOODLE_HTTP_POOL_SIZE = int(os.environ.get("MOODLE_HTTP_POOL_SIZE", 40))
+MOODLE_PARTICIPANT_WORKERS = int(os.environ.get("MOODLE_PARTICIPANT_WORKERS", 4))
+# submitted sync jobs are picked up by the `manage.py run_moodle_sync_jobs`
+# worker; set to "true" to run them in a thread of the web process instead
+# (development setups without a worker)
+MOODLE_SYNC_JOB_IN_PROCESS = (
+    os.environ.get("MOODLE_SYNC_JOB_IN_PROCESS", "false").lower() == "true"
+)
+MOODLE_SYNC_JOB_STALE_AFTER = int(os.environ.get("MOODLE_SYNC_JOB_STALE_AFTER", 900))
 EQUIPMENT_APPROVAL_ENDPOINT = os.environ.get("EQUIPMENT_APPROVAL_ENDPOINT")
 EQUIPMENT_APPROVAL_TOKEN = os.environ.get("EQUIPMENT_APPROVAL_TOKEN")
 
@@ -53,6 +53,8 @@ else:
             }
         }
     }
+# the demo has no replica
+DATABASE_REPLICA_ALIAS = None
 
 # Security settings for demo
 # Relax for local development, strict for production
@@ -12,6 +12,21 @@ DEBUG_DATE = datetime.date.today()
 # DEBUG_DATE = datetime.date(2026, 3, 21)
 
 DEBUG_TOOLBAR = "pytest" not in sys.modules
+
+if "pytest" in sys.modules:
+    # test processes keep their caches in memory; all namespaces share one
+    # store so clearing the cache between tests clears every namespace
+    CACHES = {
+        alias: {
+            **config,
+            "BACKEND": "league_manager.cache.CountingLocMemCache",
+            "LOCATION": "league-manager-cache",
+            "OPTIONS": {"MAX_ENTRIES": 100000},
+        }
+        for alias, config in CACHES.items()
+    }
+    # tests enable the query instrumentation where they need it
+    QUERY_STATS_SAMPLE_RATE = 0
 # DEBUG_TOOLBAR = True
 # DEBUG_TOOLBAR = False
 # PROFILING = True
@@ -61,8 +76,8 @@ def show_toolbar(request):
     Returns False if the database is offline to prevent the toolbar
     from attempting to query the database and causing a crash.
     """
-    from django.core.cache import cache
-    if cache.get('db_connection_status') is False:
+    from django.core.cache import caches
+    if caches['config'].get('db_connection_status') is False:
         return False
     return True
 
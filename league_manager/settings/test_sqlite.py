@@ -6,8 +6,17 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
-    }
+    },
+    # a second database to test the replica routing against, the router
+    # tests enable it with DATABASE_REPLICA_ALIAS. Its tables are created from
+    # the models: the data migrations query the default database.
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {"MIGRATE": False},
+    },
 }
+DATABASE_REPLICA_ALIAS = None
 
 # Speed up tests
 PASSWORD_HASHERS = [
@@ -3,10 +3,10 @@ from unittest.mock import MagicMock, patch
 from django.contrib.admin.sites import AdminSite
 from django.contrib.messages import get_messages
 from django.contrib.messages.middleware import MessageMiddleware
-from django.core.cache import cache
 from django.test import RequestFactory, TestCase, override_settings
 
 from league_manager.admin import SiteConfigurationAdmin, SiteConfigurationForm
+from league_manager.cache import config_cache
 from league_manager.constants import MAINTENANCE_CONFIG_CACHE_KEY
 from league_manager.models import SiteConfiguration
 
@@ -76,7 +76,7 @@ class TestSiteConfigurationAdmin(TestCase):
     def setUp(self):
         self.site = AdminSite()
         self.admin = SiteConfigurationAdmin(SiteConfiguration, self.site)
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
     def test_has_add_permission_reflects_count(self):
         """has_add_permission returns True only when no SiteConfiguration exists."""
@@ -121,9 +121,9 @@ class TestSiteConfigurationAdmin(TestCase):
             self.assertEqual(response.url, "..")
 
     def test_cycle_scope_clears_cache(self):
-        cache.set(MAINTENANCE_CONFIG_CACHE_KEY, {"scope": "test"})
+        config_cache.set(MAINTENANCE_CONFIG_CACHE_KEY, {"scope": "test"})
         config, _ = SiteConfiguration.objects.get_or_create(id=1)
         request = _mk_admin_request()
 
         self.admin.cycle_scope(request)
-        self.assertIsNone(cache.get(MAINTENANCE_CONFIG_CACHE_KEY))
+        self.assertIsNone(config_cache.get(MAINTENANCE_CONFIG_CACHE_KEY))
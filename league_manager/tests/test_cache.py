@@ -0,0 +1,29 @@
+from unittest.mock import patch
+
+from django.core.cache.backends.filebased import FileBasedCache
+
+from league_manager.cache import CountingFileBasedCache, VersionStamp, live_cache
+
+
+class TestCountingFileBasedCache:
+    def test_directory_is_only_listed_every_cull_interval_writes(self, tmp_path):
+        cache = CountingFileBasedCache(str(tmp_path), {"KEY_PREFIX": "live"})
+
+        with patch.object(FileBasedCache, "_cull") as cull:
+            for value in range(cache.cull_interval * 2):
+                cache.set("change_counter:global", value)
+
+        assert cull.call_count == 2
+        assert cache.get("change_counter:global") == cache.cull_interval * 2 - 1
+
+
+class TestVersionStamp:
+    def test_stamp_is_initialized_once_and_changed_by_bump(self):
+        stamp = VersionStamp("test_version")
+        live_cache.delete(stamp.key)
+
+        version = stamp.get()
+        assert stamp.get() == version
+
+        stamp.bump()
+        assert stamp.get() != version
@@ -1,8 +1,8 @@
 import pytest
 from django.conf import settings
 from django.urls import reverse
-from django.core.cache import cache
 
+from league_manager.cache import config_cache
 from league_manager.constants import (
     MAINTENANCE_CONFIG_CACHE_KEY,
     MAINTENANCE_SCOPE_OFF,
@@ -39,19 +39,19 @@ def _reset_maintenance_scope_safe():
 @pytest.fixture(autouse=True)
 def clear_db_status_cache():
     """Clear the DB status cache before and after each test to ensure isolation."""
-    cache.delete("db_connection_status")
-    cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+    config_cache.delete("db_connection_status")
+    config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
     _reset_maintenance_scope_safe()
     yield
-    cache.delete("db_connection_status")
-    cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+    config_cache.delete("db_connection_status")
+    config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
     _reset_maintenance_scope_safe()
 
 
 @pytest.mark.django_db
 def test_db_guard_redirects_on_failure(client):
     """Test that the middleware redirects to database-error when DB is down."""
-    cache.set("db_connection_status", False, 5)
+    config_cache.set("db_connection_status", False, 5)
 
     response = client.get("/home/")
     assert response.status_code == 302
@@ -61,7 +61,7 @@ def test_db_guard_redirects_on_failure(client):
 @pytest.mark.django_db
 def test_db_guard_redirects_from_home_while_db_down(client):
     """Home page redirect while flagged offline."""
-    cache.set("db_connection_status", False, 5)
+    config_cache.set("db_connection_status", False, 5)
 
     response = client.get("/")
     assert response.status_code == 302
@@ -71,7 +71,7 @@ def test_db_guard_redirects_from_home_while_db_down(client):
 @pytest.mark.django_db
 def test_db_guard_skips_health_check(client):
     """Test that the middleware doesn't redirect health check even if DB is down."""
-    cache.set("db_connection_status", False, 5)
+    config_cache.set("db_connection_status", False, 5)
 
     response = client.get("/health/")
     # Should NOT be a redirect
@@ -84,7 +84,7 @@ def test_db_guard_skips_health_check(client):
 @pytest.mark.django_db
 def test_db_guard_shows_error_page_while_db_down(client):
     """While DB is down, the error page itself returns 503 (no redirect loop)."""
-    cache.set("db_connection_status", False, 5)
+    config_cache.set("db_connection_status", False, 5)
 
     response = client.get(reverse("database-error"))
     assert response.status_code == 503
@@ -95,7 +95,7 @@ def test_db_guard_shows_error_page_while_db_down(client):
 def test_db_guard_redirects_back_home_when_db_online(client):
     """When the DB is back online, requesting the error page sends the user back to the app."""
     # DB is up in the test environment; ensure a fresh probe.
-    cache.delete("db_connection_status")
+    config_cache.delete("db_connection_status")
 
     response = client.get(reverse("database-error"))
     assert response.status_code == 302
@@ -105,7 +105,7 @@ def test_db_guard_redirects_back_home_when_db_online(client):
 @pytest.mark.django_db
 def test_error_page_auto_refreshes_to_poll_for_recovery(client):
     """The offline page must auto-poll so it can return to the app once the DB recovers."""
-    cache.set("db_connection_status", False, 5)
+    config_cache.set("db_connection_status", False, 5)
 
     response = client.get(reverse("database-error"))
     assert response.status_code == 503
@@ -0,0 +1,151 @@
+import time
+
+import pytest
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from gamedays.models import ChangeCounter, Gameday
+from gamedays.service.change_counter_service import ChangeCounterService
+from gamedays.tests.setup_factories.db_setup import DBSetup
+from league_manager.cache import clear_all_caches, live_cache
+from league_manager.db_router import (
+    PRIMARY_PIN_COOKIE,
+    ReplicaRouter,
+    is_primary_pinned,
+    use_replica,
+)
+from league_manager.middleware.replica_pin import ReplicaPinMiddleware
+from liveticker.api.urls import API_LIVETICKER_GAMEDAY_BUNDLE
+
+REPLICA = "replica"
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    clear_all_caches()
+    yield
+    clear_all_caches()
+
+
+class TestReplicaRouter:
+    @pytest.fixture(autouse=True)
+    def replica_settings(self, settings):
+        settings.DATABASE_REPLICA_ALIAS = REPLICA
+        settings.REPLICA_PIN_SECONDS = 5
+        return settings
+
+    def test_reads_go_to_the_primary_outside_use_replica(self):
+        assert ReplicaRouter().db_for_read(Gameday) == "default"
+
+    def test_reads_go_to_the_replica_within_use_replica(self):
+        with use_replica():
+            assert ReplicaRouter().db_for_read(Gameday) == REPLICA
+
+    def test_change_counters_are_read_from_the_replica_too(self):
+        with use_replica():
+            assert ReplicaRouter().db_for_read(ChangeCounter) == REPLICA
+
+    def test_without_replica_nothing_is_routed(self, replica_settings):
+        replica_settings.DATABASE_REPLICA_ALIAS = None
+
+        with use_replica():
+            assert ReplicaRouter().db_for_read(Gameday) == "default"
+
+    def test_writes_go_to_the_primary(self):
+        with use_replica():
+            assert ReplicaRouter().db_for_write(Gameday) == "default"
+
+    def test_pin_cookie_holds_until_it_expires(self):
+        request = RequestFactory().get("/")
+        assert not is_primary_pinned(request)
+
+        request.COOKIES[PRIMARY_PIN_COOKIE] = str(int(time.time()) + 5)
+        assert is_primary_pinned(request)
+
+        request.COOKIES[PRIMARY_PIN_COOKIE] = str(int(time.time()) - 1)
+        assert not is_primary_pinned(request)
+
+        request.COOKIES[PRIMARY_PIN_COOKIE] = "garbage"
+        assert not is_primary_pinned(request)
+
+
+class TestReplicaPinMiddleware:
+    @pytest.fixture(autouse=True)
+    def replica_settings(self, settings):
+        settings.DATABASE_REPLICA_ALIAS = REPLICA
+        settings.REPLICA_PIN_SECONDS = 5
+        return settings
+
+    @staticmethod
+    def _respond(write: bool) -> HttpResponse:
+        def view(request):
+            if write:
+                ReplicaRouter().db_for_write(Gameday)
+            return HttpResponse()
+
+        return ReplicaPinMiddleware(view)(RequestFactory().post("/"))
+
+    def test_writing_client_is_pinned(self):
+        response = self._respond(write=True)
+
+        cookie = response.cookies[PRIMARY_PIN_COOKIE]
+        assert cookie["max-age"] == 5
+        assert int(cookie.value) > time.time()
+
+    def test_other_clients_are_not_pinned(self):
+        self._respond(write=True)
+
+        assert PRIMARY_PIN_COOKIE not in self._respond(write=False).cookies
+
+    def test_pinning_can_be_disabled(self, replica_settings):
+        replica_settings.REPLICA_PIN_SECONDS = 0
+
+        assert PRIMARY_PIN_COOKIE not in self._respond(write=True).cookies
+
+
+@pytest.mark.skipif(
+    REPLICA not in settings.DATABASES,
+    reason="needs a second database, see league_manager.settings.test_sqlite",
+)
+@override_settings(DATABASE_REPLICA_ALIAS=REPLICA)
+class TestReplicaReadMixin(TestCase):
+    databases = {"default", REPLICA}
+
+    def setUp(self):
+        # created on the primary only, so the replica lags behind
+        self.gameday = DBSetup().g62_status_empty()
+        self.url = reverse(
+            API_LIVETICKER_GAMEDAY_BUNDLE, kwargs={"gameday": self.gameday.pk}
+        )
+
+    def test_anonymous_reads_go_to_the_replica(self):
+        assert self.client.get(self.url).status_code == 404
+
+    def test_authenticated_reads_go_to_the_primary(self):
+        self.client.force_login(User.objects.create_user(username="scorekeeper"))
+
+        assert self.client.get(self.url).status_code == 200
+
+    def test_pinned_client_reads_the_primary(self):
+        self.client.cookies[PRIMARY_PIN_COOKIE] = str(int(time.time()) + 5)
+
+        assert self.client.get(self.url).status_code == 200
+
+    def test_writes_of_others_keep_spectators_on_the_replica(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Gameday.objects.update(name="Umbenannt")
+
+        assert self.client.get(self.url).status_code == 404
+
+    def test_counters_read_from_the_replica_are_not_cached(self):
+        key = ChangeCounterService.get_key(self.gameday.pk)
+
+        with use_replica():
+            assert ChangeCounterService.get(key) == [0]
+        assert live_cache.get(f"change_counter:{key}") is None
+        assert ChangeCounterService.get(key) == [
+            ChangeCounter.objects.get(key=key).value
+        ]
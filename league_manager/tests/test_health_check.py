@@ -1,6 +1,6 @@
 import pytest
-from django.core.cache import cache
 
+from league_manager.cache import config_cache
 from league_manager.constants import (
     MAINTENANCE_CONFIG_CACHE_KEY,
     MAINTENANCE_SCOPE_OFF,
@@ -13,10 +13,10 @@ from league_manager.models import SiteConfiguration
 @pytest.fixture(autouse=True)
 def clear_cache():
     """Clear caches before each test."""
-    cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+    config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
     SiteConfiguration.objects.all().delete()
     yield
-    cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+    config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
     SiteConfiguration.objects.all().delete()
 
 
@@ -35,7 +35,7 @@ def test_health_check_reports_maintenance_mode_off_by_default(client):
     config, _ = SiteConfiguration.objects.get_or_create(id=1)
     config.maintenance_scope = MAINTENANCE_SCOPE_OFF
     config.save()
-    cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+    config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
     response = client.get("/health/")
 
@@ -48,7 +48,7 @@ def test_health_check_reports_maintenance_mode_on(client):
     config, _ = SiteConfiguration.objects.get_or_create(id=1)
     config.maintenance_scope = MAINTENANCE_SCOPE_FULL
     config.save()
-    cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+    config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
     response = client.get("/health/")
 
@@ -58,14 +58,14 @@ def test_health_check_reports_maintenance_mode_on(client):
     # writes_only also counts as maintenance mode being active
     config.maintenance_scope = MAINTENANCE_SCOPE_WRITES_ONLY
     config.save()
-    cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+    config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
     response = client.get("/health/")
     assert response.json()["maintenance_mode"] is True
 
     config.maintenance_scope = MAINTENANCE_SCOPE_OFF
     config.save()
-    cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+    config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
 
 @pytest.mark.django_db
@@ -74,7 +74,7 @@ def test_health_check_reports_maintenance_mode_off_when_scope_off(client):
     config, _ = SiteConfiguration.objects.get_or_create(id=1)
     config.maintenance_scope = MAINTENANCE_SCOPE_OFF
     config.save()
-    cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+    config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
     response = client.get("/health/")
     assert response.json()["maintenance_mode"] is False
@@ -83,14 +83,28 @@ def test_health_check_reports_maintenance_mode_off_when_scope_off(client):
 @pytest.mark.django_db
 def test_health_check_from_middleware_cache(client):
     """When middleware cache is populated, health check uses scope key."""
-    cache.set(MAINTENANCE_CONFIG_CACHE_KEY, {"scope": "full", "patterns": []})
+    config_cache.set(MAINTENANCE_CONFIG_CACHE_KEY, {"scope": "full", "patterns": []})
 
     response = client.get("/health/")
     assert response.json()["maintenance_mode"] is True
 
-    cache.set(MAINTENANCE_CONFIG_CACHE_KEY, {"scope": "off", "patterns": []})
+    config_cache.set(MAINTENANCE_CONFIG_CACHE_KEY, {"scope": "off", "patterns": []})
 
     response = client.get("/health/")
     assert response.json()["maintenance_mode"] is False
 
-    cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+    config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+
+
+@pytest.mark.django_db
+def test_health_check_reports_cache_hits_and_misses(client):
+    config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+    before = client.get("/health/").json()["caches"]["config"]
+
+    after = client.get("/health/").json()["caches"]["config"]
+
+    # the second request finds the maintenance config cached
+    assert after["hits"] > before["hits"]
+    assert set(client.get("/health/").json()["caches"]) == {
+        "default", "live", "pages", "config",
+    }
@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+
+from gamedays.models import League
+from league_manager.cache import pages_cache
+from league_manager.utils.utils import MenuRegistry, get_menu_items
+from league_table.menu import League_tableMenu
+
+
+@pytest.fixture(autouse=True)
+def clear_menu_cache():
+    MenuRegistry.invalidate()
+    yield
+    MenuRegistry.invalidate()
+
+
+def _make_request(is_authenticated=True, is_staff=False, is_superuser=False):
+    request = RequestFactory().get("/")
+    if is_authenticated:
+        request.user = MagicMock(
+            is_authenticated=True, is_staff=is_staff, is_superuser=is_superuser
+        )
+    else:
+        request.user = AnonymousUser()
+    return request
+
+
+def test_registry_is_loaded_at_startup():
+    menu_classes = {type(menu).__name__ for menu in MenuRegistry._menus}
+    assert {"GamedaysMenuAdmin", "League_tableMenu", "PasscheckMenu"} <= menu_classes
+
+
+@pytest.mark.parametrize(
+    "request_kwargs, expected",
+    [
+        ({"is_authenticated": False}, "anonymous"),
+        ({}, "user"),
+        ({"is_staff": True}, "staff"),
+        ({"is_superuser": True}, "superuser"),
+        ({"is_staff": True, "is_superuser": True}, "staff-superuser"),
+    ],
+)
+def test_permission_class(request_kwargs, expected):
+    request = _make_request(**request_kwargs)
+    assert MenuRegistry.get_permission_class(request.user) == expected
+
+
+@pytest.mark.django_db
+def test_cached_menu_needs_no_import_and_one_cache_read():
+    get_menu_items(_make_request(is_staff=True))
+
+    with (
+        patch("league_manager.utils.utils.import_module") as import_module,
+        patch.object(pages_cache, "get", wraps=pages_cache.get) as cache_get,
+        patch.object(League_tableMenu, "get_menu_items") as league_menu,
+    ):
+        menus = get_menu_items(_make_request(is_staff=True))
+
+    import_module.assert_not_called()
+    league_menu.assert_not_called()
+    assert cache_get.call_count == 1
+    assert "Orga" in menus
+
+
+@pytest.mark.django_db
+def test_menus_are_cached_per_permission_class():
+    staff_menus = get_menu_items(_make_request(is_staff=True))
+    anonymous_menus = get_menu_items(_make_request(is_authenticated=False))
+
+    assert staff_menus["Orga"]["items"]
+    assert anonymous_menus["Orga"]["items"] == []
+    assert get_menu_items(_make_request(is_authenticated=False)) == anonymous_menus
+
+
+@pytest.mark.django_db
+def test_failing_menu_is_not_cached():
+    with patch.object(League_tableMenu, "get_menu_items", side_effect=Exception):
+        menus = get_menu_items(_make_request())
+
+    assert "Ligatabelle" not in menus
+    assert pages_cache.get("menu:user") is None
+
+
+@pytest.mark.django_db
+def test_league_change_invalidates_cached_menus():
+    get_menu_items(_make_request())
+    assert pages_cache.get("menu:user") is not None
+
+    League.objects.create(name="Neue Liga")
+
+    assert pages_cache.get("menu:user") is None
@@ -0,0 +1,107 @@
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from gamedays.constants import LEAGUE_GAMEDAY_LIST
+from league_manager.constants import QUERY_STATS
+from league_manager.middleware.query_stats import (
+    QueryRecorder,
+    QueryStatsRegistry,
+    get_call_site,
+)
+
+
+class TestQueryRecorder(TestCase):
+    def test_records_count_time_and_slowest_call_site(self):
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            User.objects.count()
+            User.objects.exists()
+
+        assert recorder.count == 2
+        assert recorder.sql_time >= recorder.slowest_time > 0
+        assert "auth_user" in recorder.slowest_sql
+        assert recorder.slowest_call_site.startswith(
+            "league_manager/tests/test_query_stats.py:"
+        )
+
+    def test_call_site_skips_a_virtualenv_inside_the_project(self):
+        project_dir = os.path.dirname(settings.BASE_DIR)
+        venv_dir = os.path.join(project_dir, ".venv")
+
+        def frame(filename, back=None):
+            return SimpleNamespace(
+                f_code=SimpleNamespace(co_filename=filename, co_name="func"),
+                f_lineno=7,
+                f_back=back,
+            )
+
+        view = frame(os.path.join(project_dir, "gamedays", "views.py"))
+        library = frame(os.path.join(venv_dir, "lib", "python3", "json.py"), view)
+        with patch.object(sys, "prefix", venv_dir):
+            assert get_call_site(library) == "gamedays/views.py:7 in func"
+
+
+@override_settings(QUERY_STATS_SAMPLE_RATE=1, QUERY_STATS_BUFFER_SIZE=3)
+class TestQueryStatsMiddleware(TestCase):
+    def setUp(self):
+        QueryStatsRegistry.clear()
+        self.url = reverse(LEAGUE_GAMEDAY_LIST)
+
+    def tearDown(self):
+        QueryStatsRegistry.clear()
+
+    def test_samples_are_aggregated_per_view_name(self):
+        self.client.get(self.url)
+        self.client.get(self.url)
+
+        stats = QueryStatsRegistry.get_stats()[LEAGUE_GAMEDAY_LIST]
+        assert stats["samples"] == 2
+        assert stats["queries"]["max"] >= 1
+        assert stats["slowest"]["sql"]
+
+    def test_ring_buffer_is_bounded(self):
+        for _ in range(5):
+            self.client.get(self.url)
+
+        assert QueryStatsRegistry.get_stats()[LEAGUE_GAMEDAY_LIST]["samples"] == 3
+
+    @override_settings(QUERY_STATS_SAMPLE_RATE=0)
+    def test_unsampled_requests_are_not_recorded(self):
+        self.client.get(self.url)
+
+        assert QueryStatsRegistry.get_stats() == {}
+
+    @override_settings(QUERY_STATS_BUDGETS={LEAGUE_GAMEDAY_LIST: 0})
+    def test_exceeded_budget_is_logged(self):
+        with self.assertLogs(
+            "league_manager.middleware.query_stats", level="WARNING"
+        ) as logs:
+            self.client.get(self.url)
+
+        assert f"{LEAGUE_GAMEDAY_LIST} issued" in logs.output[0]
+        stats = QueryStatsRegistry.get_stats()[LEAGUE_GAMEDAY_LIST]
+        assert stats["budget"] == 0
+        assert stats["over_budget"] == 1
+
+    def test_stats_endpoint_is_staff_only(self):
+        self.client.get(self.url)
+        user = User.objects.create_user(username="user", password="secret")
+        self.client.force_login(user)
+
+        assert self.client.get(reverse(QUERY_STATS)).status_code == 403
+
+        user.is_staff = True
+        user.save()
+        response = self.client.get(reverse(QUERY_STATS))
+
+        assert response.status_code == 200
+        assert response.json()["sample_rate"] == 1
+        assert LEAGUE_GAMEDAY_LIST in response.json()["views"]
@@ -8,6 +8,7 @@ from django_webtest import WebTest
 
 from gamedays.constants import LEAGUE_GAMEDAY_LIST
 from gamedays.models import Team
+from league_manager.cache import config_cache, live_cache
 from league_manager.constants import (
     CLEAR_CACHE,
     LEAGUE_MANAGER_MAINTENANCE,
@@ -25,11 +26,11 @@ from passcheck.urls import PASSCHECK_LIST_FOR_ALL_TEAMS
 
 class TestMaintenanceScope(WebTest):
     def setUp(self):
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
         self.config, _ = SiteConfiguration.objects.get_or_create(id=1)
 
     def tearDown(self):
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
     def _assert_redirect_to_maintenance(self, url, method="get"):
         client_method = getattr(self.client, method)
@@ -55,7 +56,7 @@ class TestMaintenanceScope(WebTest):
     def test_off_scope_allows_all_requests(self):
         self.config.maintenance_scope = MAINTENANCE_SCOPE_OFF
         self.config.save()
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
         response = self.client.get("/gamedays/gameday/new/")
         expected_maint = reverse(LEAGUE_MANAGER_MAINTENANCE)
@@ -67,7 +68,7 @@ class TestMaintenanceScope(WebTest):
     def test_full_scope_redirects_all_urls(self):
         self.config.maintenance_scope = MAINTENANCE_SCOPE_FULL
         self.config.save()
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
         self._assert_redirect_to_maintenance("/gamedays/gameday/new/")
         self._assert_redirect_to_maintenance("/liveticker/")
@@ -76,7 +77,7 @@ class TestMaintenanceScope(WebTest):
     def test_full_scope_exempts_admin_and_maintenance(self):
         self.config.maintenance_scope = MAINTENANCE_SCOPE_FULL
         self.config.save()
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
         expected_maint = reverse(LEAGUE_MANAGER_MAINTENANCE)
 
@@ -90,7 +91,7 @@ class TestMaintenanceScope(WebTest):
     def test_writes_only_scope_blocks_write_methods(self):
         self.config.maintenance_scope = MAINTENANCE_SCOPE_WRITES_ONLY
         self.config.save()
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
         post_response = self.client.post("/gamedays/gameday/new/")
         self.assertEqual(post_response.status_code, 302)
@@ -100,7 +101,7 @@ class TestMaintenanceScope(WebTest):
     def test_writes_only_scope_allows_get_requests(self):
         self.config.maintenance_scope = MAINTENANCE_SCOPE_WRITES_ONLY
         self.config.save()
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
         response = self.client.get("/gamedays/gameday/new/")
         expected_maint = reverse(LEAGUE_MANAGER_MAINTENANCE)
@@ -112,7 +113,7 @@ class TestMaintenanceScope(WebTest):
     def test_writes_only_scope_allows_admin_writes(self):
         self.config.maintenance_scope = MAINTENANCE_SCOPE_WRITES_ONLY
         self.config.save()
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
         response = self.client.post("/admin/login/")
         expected_maint = reverse(LEAGUE_MANAGER_MAINTENANCE)
@@ -126,7 +127,7 @@ class TestMaintenanceScope(WebTest):
             r"^/passcheck/player/\d+/(update|delete|transfer)/$",
         ]
         self.config.save()
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
         response = self.client.get("/gamedays/gameday/new/")
         self.assertEqual(response.status_code, 302)
@@ -137,7 +138,7 @@ class TestMaintenanceScope(WebTest):
         self.config.maintenance_scope = MAINTENANCE_SCOPE_CUSTOM
         self.config.maintenance_pages = ["/gamedays/gameday/new/"]
         self.config.save()
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
         response = self.client.get("/liveticker/")
         expected_maint = reverse(LEAGUE_MANAGER_MAINTENANCE)
@@ -148,7 +149,7 @@ class TestMaintenanceScope(WebTest):
         self.config.maintenance_scope = MAINTENANCE_SCOPE_CUSTOM
         self.config.maintenance_pages = [r"^/gamedays/gameday/\d+/update$"]
         self.config.save()
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
         response = self.client.get("/gamedays/gameday/42/update")
         self.assertEqual(response.status_code, 302)
@@ -163,7 +164,7 @@ class TestMaintenanceScope(WebTest):
         self.config.maintenance_pages = maintenance_pages
         self.config.save()
 
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
         expected_url = reverse(LEAGUE_MANAGER_MAINTENANCE)
 
@@ -181,19 +182,19 @@ class TestMaintenanceScope(WebTest):
 
 class TestMaintenanceConfigCacheTTL(TestCase):
     def setUp(self):
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
         self.config, _ = SiteConfiguration.objects.get_or_create(id=1)
 
     def tearDown(self):
-        cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
+        config_cache.delete(MAINTENANCE_CONFIG_CACHE_KEY)
 
     def test_maintenance_config_cache_expires_within_a_minute(self):
-        """A gunicorn deployment runs multiple worker processes, each with its
-        own private LocMemCache. A stale entry only self-heals once it
-        expires, so the TTL bounds how long an admin's maintenance_scope
-        change can take to reach every worker. It must be short, not the
+        """A deployment runs workers on several hosts, each host with its own
+        config cache. A stale entry only self-heals once it expires, so the
+        TTL bounds how long an admin's maintenance_scope change can take to
+        reach every worker. It must be short, not the
         69-day default that made propagation effectively unbounded."""
-        with patch("league_manager.middleware.maintenance.cache.set") as mock_set:
+        with patch("league_manager.middleware.maintenance.config_cache.set") as mock_set:
             self.client.get("/health/")
 
         maintenance_calls = [
@@ -246,6 +247,7 @@ class TestClearCacheView(TestCase):
     def test_clear_cache_clears_cache_and_redirects_to_referer(self):
         # Set up cache with some data
         cache.set("test_key", "test_value", timeout=60)
+        live_cache.set("test_key", "test_value", timeout=60)
         assert cache.get("test_key") == "test_value"
 
         # Use test client to send request with HTTP_REFERER
@@ -254,8 +256,9 @@ class TestClearCacheView(TestCase):
             self.url, HTTP_REFERER="http://testserver/some-page/"
         )
 
-        # Cache should be cleared
+        # Cache should be cleared, in every namespace
         assert cache.get("test_key") is None
+        assert live_cache.get("test_key") is None
 
         # Should redirect to referer
         assert response.status_code == 302
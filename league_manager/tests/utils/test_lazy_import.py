@@ -0,0 +1,29 @@
+import json
+
+from gamedays.service import model_wrapper
+from league_manager.utils.lazy_import import LazyModule
+
+
+class TestLazyModule:
+    def test_module_is_imported_on_first_attribute_access(self):
+        lazy_json = LazyModule("json")
+        assert "not loaded" in repr(lazy_json)
+
+        assert lazy_json.dumps is json.dumps
+        assert "(loaded)" in repr(lazy_json)
+
+    def test_attributes_are_cached_on_the_instance(self):
+        lazy_json = LazyModule("json")
+        lazy_json.loads
+
+        assert vars(lazy_json)["loads"] is json.loads
+
+    def test_dunder_lookups_do_not_import(self):
+        lazy_json = LazyModule("json")
+
+        assert not hasattr(lazy_json, "__wrapped__")
+        assert "not loaded" in repr(lazy_json)
+
+    def test_services_use_lazy_pandas(self):
+        assert isinstance(model_wrapper.pd, LazyModule)
+        assert model_wrapper.pd.DataFrame().empty
@@ -19,17 +19,18 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.contrib.auth import views as auth_view
 from django.contrib.sitemaps.views import sitemap
-from django.core.cache import cache
 from django.http import JsonResponse
 from django.urls import path, include
 from django.views import View
 from django.views.generic import TemplateView, RedirectView
 
 from gamedays.constants import LEAGUE_GAMEDAY_LIST
+from league_manager.cache import config_cache, get_cache_stats
 from league_manager.constants import (
     LEAGUE_MANAGER_MAINTENANCE,
     CLEAR_CACHE,
     MAINTENANCE_CONFIG_CACHE_KEY,
+    QUERY_STATS,
 )
 from league_manager.models import SiteConfiguration
 
@@ -46,7 +47,7 @@ class HealthCheckView(View):
     """
 
     def get(self, request):
-        config = cache.get(MAINTENANCE_CONFIG_CACHE_KEY)
+        config = config_cache.get(MAINTENANCE_CONFIG_CACHE_KEY)
         if config is None:
             db_config = SiteConfiguration.objects.first()
             if db_config and hasattr(db_config, "maintenance_scope"):
@@ -56,10 +57,17 @@ class HealthCheckView(View):
         else:
             scope = config.get("scope", "off")
         maintenance_active = scope not in ("off", None)
-        return JsonResponse({"status": "healthy", "maintenance_mode": maintenance_active})
+        return JsonResponse(
+            {
+                "status": "healthy",
+                "maintenance_mode": maintenance_active,
+                # per worker process
+                "caches": get_cache_stats(),
+            }
+        )
 
 
-from league_manager.views import ClearCacheView, robots_txt_view, database_error_view, DemoInfoView
+from league_manager.views import ClearCacheView, QueryStatsView, robots_txt_view, database_error_view, DemoInfoView
 from journey.progress_view import GameProgressPageView
 from league_manager.sitemaps import (
     StaticViewSitemap,
@@ -92,6 +100,7 @@ urlpatterns = [
         name=LEAGUE_MANAGER_MAINTENANCE,
     ),
     path("clear-cache/", ClearCacheView.as_view(), name=CLEAR_CACHE),
+    path("query-stats/", QueryStatsView.as_view(), name=QUERY_STATS),
     path("admin/", admin.site.urls),
     path("database-error/", database_error_view, name="database-error"),
     # ToDo: fix gameday urls
@@ -0,0 +1,40 @@
+"""Deferred imports of heavy modules.
+
+pandas and numpy take longer to import than the rest of the project together.
+The modules using them are reachable from the URL configs and signal handlers,
+so importing them eagerly made every worker, management command and test
+process pay for the numeric stack before a single DataFrame was built.
+"""
+
+import importlib
+from types import ModuleType
+
+
+class LazyModule:
+    """Stand-in for a module, importing it on the first attribute access.
+
+    ``pd = LazyModule("pandas")`` is used like ``import pandas as pd``.
+    Attributes are copied onto the instance once looked up, so later accesses
+    skip ``__getattr__``. Annotations naming the module need
+    ``from __future__ import annotations`` to stay lazy.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        value = getattr(self._load(), attr)
+        setattr(self, attr, value)
+        return value
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
@@ -1,35 +1,104 @@
 import inspect
 from importlib import import_module
+from typing import Optional
+
 from django.apps import apps
 
+from league_manager.base_menu import BaseMenu
+from league_manager.cache import pages_cache
 
-def get_menu_items(request):
-    menus = {}
+MENU_CACHE_KEY = "menu:{permissions}"
+MENU_PERMISSION_CLASSES = [
+    "anonymous",
+    "user",
+    "staff",
+    "superuser",
+    "staff-superuser",
+]
 
-    for app_config in apps.get_app_configs():
-        try:
-            menu_module = import_module(f"{app_config.name}.menu")
 
+class MenuRegistry:
+    """
+    The menu classes of all installed apps, found once by
+    ``LeagueManagerConfig.ready()``: every class in ``<app>.menu`` whose name
+    starts with ``<App>Menu``.
+
+    Menus may only depend on whether the user is authenticated, staff or
+    superuser, the rendered menus are cached per such permission class in the
+    pages namespace. Menus built from data (e.g. the league list) call
+    ``invalidate`` when that data changes.
+    """
+
+    _menus: Optional[list[BaseMenu]] = None
+
+    @classmethod
+    def load(cls) -> None:
+        menus = []
+        for app_config in apps.get_app_configs():
+            try:
+                menu_module = import_module(f"{app_config.name}.menu")
+            except ImportError:
+                # Skip apps without a menu.py
+                continue
             for name, obj in inspect.getmembers(menu_module, inspect.isclass):
                 if name.startswith(app_config.name.capitalize() + "Menu"):
-                    menu_instance = obj()
-
-                    menu_name = menu_instance.get_name()
-                    try:
-                        menu_items = menu_instance.get_menu_items(request)
-                    except Exception:
-                        # Skip this menu if it fails to retrieve items (e.g. DB connection error)
-                        continue
-
-                    if menu_name in menus:
-                        menus[menu_name]["items"].extend(menu_items)
-                    else:
-                        menus[menu_name] = {
-                            "name": menu_name,
-                            "items": menu_items,
-                        }
-        except (ImportError, AttributeError):
-            # Skip apps without a menu.py or with no matching menu classes
+                    menus.append(obj())
+        cls._menus = menus
+
+    @classmethod
+    def get_menus(cls) -> list[BaseMenu]:
+        if cls._menus is None:
+            cls.load()
+        return cls._menus
+
+    @staticmethod
+    def get_permission_class(user) -> str:
+        if user is None or not user.is_authenticated:
+            return "anonymous"
+        flags = [
+            flag
+            for flag, is_set in (("staff", user.is_staff), ("superuser", user.is_superuser))
+            if is_set
+        ]
+        return "-".join(flags) or "user"
+
+    @classmethod
+    def invalidate(cls) -> None:
+        pages_cache.delete_many(
+            [
+                MENU_CACHE_KEY.format(permissions=permissions)
+                for permissions in MENU_PERMISSION_CLASSES
+            ]
+        )
+
+
+def get_menu_items(request):
+    cache_key = MENU_CACHE_KEY.format(
+        permissions=MenuRegistry.get_permission_class(getattr(request, "user", None))
+    )
+    menus = pages_cache.get(cache_key)
+    if menus is not None:
+        return menus
+
+    menus = {}
+    is_complete = True
+    for menu_instance in MenuRegistry.get_menus():
+        menu_name = menu_instance.get_name()
+        try:
+            menu_items = menu_instance.get_menu_items(request)
+        except Exception:
+            # Skip this menu if it fails to retrieve items (e.g. DB connection error)
+            is_complete = False
             continue
 
+        if menu_name in menus:
+            menus[menu_name]["items"].extend(menu_items)
+        else:
+            menus[menu_name] = {
+                "name": menu_name,
+                "items": menu_items,
+            }
+
+    if is_complete:
+        pages_cache.set(cache_key, menus)
     return menus
@@ -1,5 +1,7 @@
 from gamedays.models import Team
 
+MOODLE_REPORT_USERNAME = "offd"
+
 
 class UserRequestPermission:
     def __init__(self, is_staff=False, is_user=False):
@@ -11,6 +13,10 @@ class UserRequestPermission:
 
 
 class PermissionHelper:
+    @staticmethod
+    def is_moodle_report_user(user) -> bool:
+        return user.is_staff or user.username == MOODLE_REPORT_USERNAME
+
     @staticmethod
     def has_staff_or_user_permission(request, team_id=None):
         if request.user.is_staff:
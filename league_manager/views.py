@@ -1,5 +1,5 @@
 from django.shortcuts import render
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.generic import TemplateView
 from django.conf import settings
 
@@ -47,16 +47,17 @@ def robots_txt_view(request):
 
 
 from django.contrib.auth.mixins import UserPassesTestMixin
-from django.core.cache import cache
 from django.shortcuts import redirect
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.views import View
 from gamedays.service.team_repository_service import TeamRepositoryService
+from league_manager.cache import clear_all_caches
+from league_manager.middleware.query_stats import QueryStatsRegistry
 
 
 class ClearCacheView(UserPassesTestMixin, View):
     def get(self, request):
-        cache.clear()
+        clear_all_caches()
         referer = request.META.get("HTTP_REFERER", "/")
         if url_has_allowed_host_and_scheme(referer, allowed_hosts={request.get_host()}):
             return redirect(referer)
@@ -66,6 +67,23 @@ class ClearCacheView(UserPassesTestMixin, View):
         return self.request.user.is_staff
 
 
+class QueryStatsView(UserPassesTestMixin, View):
+    """Queries and latency per view as recorded by ``QueryStatsMiddleware``
+    in this worker process."""
+
+    def get(self, request):
+        return JsonResponse(
+            {
+                "sample_rate": settings.QUERY_STATS_SAMPLE_RATE,
+                "buffer_size": settings.QUERY_STATS_BUFFER_SIZE,
+                "views": QueryStatsRegistry.get_stats(),
+            }
+        )
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+
 class AllTeamListView(View):
     template_name = "team/all_teams_list.html"
 
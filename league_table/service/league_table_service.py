@@ -1,14 +1,18 @@
+from __future__ import annotations
+
 from typing import Any
 
-import pandas as pd
 from django.db.models import QuerySet, F
 
 from gamedays.models import Gameresult, SeasonLeagueTeam
+from league_manager.utils.lazy_import import LazyModule
 from league_table.models import LeagueSeasonConfig
 from league_table.service.datatypes import LeagueConfig
 from league_table.service.leaguetable_repository import LeagueTableRepository
 from league_table.service.ranking.engine import LeagueRankingEngine, TieBreakerEngine
 
+pd = LazyModule("pandas")
+
 LEAGUE_TABLE_GAME_COLUMNS = [
     "gameinfo",
     "team_id",
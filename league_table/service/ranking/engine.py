@@ -1,6 +1,6 @@
 # gamedays/services/ranking/engine.py
 
-import pandas as pd
+from __future__ import annotations
 
 from gamedays.service.gameday_settings import (
     FINISHED,
@@ -29,9 +29,12 @@ from gamedays.service.gameday_settings import (
     LEAGUE__NAME,
     FINALRUNDE,
 )
+from league_manager.utils.lazy_import import LazyModule
 from league_table.service.datatypes import LeagueConfig, LeagueConfigRuleset
 from league_table.service.ranking.tiebreakers import TieBreaker, TIEBREAK_REGISTRY
 
+pd = LazyModule("pandas")
+
 
 class TeamStatsEngine:
     def __init__(self, ruleset: LeagueConfigRuleset):
@@ -1,6 +1,6 @@
-from typing import Callable
+from __future__ import annotations
 
-import pandas as pd
+from typing import Callable
 
 from gamedays.service.gameday_settings import (
     TEAM_DESCRIPTION,
@@ -13,6 +13,9 @@ from gamedays.service.gameday_settings import (
     TEAM_ID,
     GAMEINFO,
 )
+from league_manager.utils.lazy_import import LazyModule
+
+pd = LazyModule("pandas")
 
 TIEBREAK_REGISTRY = {}
 
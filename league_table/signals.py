@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from gamedays.models import League
+from league_manager.utils.utils import MenuRegistry
+from league_table.models import LeagueSeasonConfig
+
+
+@receiver([post_save, post_delete], sender=League)
+@receiver([post_save, post_delete], sender=LeagueSeasonConfig)
+def invalidate_league_menu(sender, **kwargs):
+    MenuRegistry.invalidate()
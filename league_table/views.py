@@ -2,11 +2,12 @@ from django.shortcuts import render
 from django.views import View
 
 from gamedays.service.builders import TableContextBuilder
+from league_manager.db_router import ReplicaReadMixin
 from league_table.constants import LEAGUE_TABLE_OVERALL_TABLE_BY_SLUG_AND_LEAGUE
 from league_table.service.league_table_service import LeagueTableService
 
 
-class LeagueTableView(View):
+class LeagueTableView(ReplicaReadMixin, View):
     template_name = "leaguetable/overview_table.html"
 
     def get(self, request, *args, **kwargs):
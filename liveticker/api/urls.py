@@ -1,9 +1,15 @@
 from django.urls import path
 
-from liveticker.api.views import LivetickerAPIView
+from liveticker.api.views import GamedayBundleAPIView, LivetickerAPIView
 
 API_LIVETICKER_ALL = "api-liveticker"
+API_LIVETICKER_GAMEDAY_BUNDLE = "api-liveticker-gameday-bundle"
 
 urlpatterns = [
     path("", LivetickerAPIView.as_view(), name=API_LIVETICKER_ALL),
+    path(
+        "gameday/<int:gameday>/bundle/",
+        GamedayBundleAPIView.as_view(),
+        name=API_LIVETICKER_GAMEDAY_BUNDLE,
+    ),
 ]
@@ -1,13 +1,20 @@
+from django.http import HttpResponse
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from gamedays.models import Gameday
+from league_manager.constants import CACHE_PAGES
+from league_manager.db_router import ReplicaReadMixin
+from liveticker.service.gameday_bundle_service import GamedayBundleService
 from liveticker.service.liveticker_service import LivetickerService
 
 
-class LivetickerAPIView(APIView):
-    @method_decorator(cache_page(60))
+class LivetickerAPIView(ReplicaReadMixin, APIView):
+    @method_decorator(cache_page(60, cache=CACHE_PAGES))
     def get(self, request):
         league = request.query_params.get("league")
         league = [] if league is None or league == "" else league.split(",")
@@ -33,3 +40,21 @@ class LivetickerAPIView(APIView):
             except ValueError:
                 continue
         return all_numbers_as_int
+
+
+class GamedayBundleAPIView(ReplicaReadMixin, APIView):
+    # the bundle is cached as rendered JSON, so it bypasses the renderers
+    @method_decorator(
+        condition(
+            etag_func=lambda request, gameday=None: GamedayBundleService.get_etag(
+                gameday
+            )
+        )
+    )
+    def get(self, request, **kwargs):
+        gameday_id = kwargs.get("gameday")
+        try:
+            bundle = GamedayBundleService.get_bundle(gameday_id)
+        except Gameday.DoesNotExist:
+            raise NotFound(detail=f"Gameday {gameday_id} not found")
+        return HttpResponse(bundle, content_type="application/json")
@@ -0,0 +1,88 @@
+import hashlib
+import json
+from datetime import datetime
+
+from rest_framework.renderers import JSONRenderer
+
+from gamedays.models import Gameday, Gameinfo
+from gamedays.serializers.game_results import GameInfoSerializer
+from gamedays.service.change_counter_service import ChangeCounterService
+from gamedays.service.gameday_service import (
+    FINAL_TABLE_COLUMNS,
+    QUALIFY_TABLE_COLUMNS,
+    GamedayService,
+    table_to_json,
+)
+from league_manager.cache import live_cache
+from liveticker.service.liveticker_service import LivetickerService
+
+GAMEDAY_BUNDLE_FORMAT = 1
+GAMEDAY_BUNDLE_CACHE_KEY = "gameday_bundle:{gameday_id}:{version}"
+GAMEDAY_BUNDLE_CACHE_TTL = 60 * 60 * 24
+
+
+class GamedayBundleService:
+    """
+    Everything a spectator polls for one gameday in a single response: the
+    games with their scores, the qualify and final tables and the latest
+    ticks of the current games.
+
+    The bundle is rendered once per version of the gameday and kept in the
+    cache as JSON bytes. The version follows the gameday's change counters,
+    which every write to its games, results and ticks bumps, and the date,
+    as the tick times are rendered against the current day.
+    """
+
+    @staticmethod
+    def get_version(gameday_id) -> str:
+        global_version, gameday_version = ChangeCounterService.get(
+            ChangeCounterService.get_key(),
+            ChangeCounterService.get_key(gameday_id),
+        )
+        return (
+            f"{GAMEDAY_BUNDLE_FORMAT}.{global_version}.{gameday_version}"
+            f".{datetime.today().date()}"
+        )
+
+    @classmethod
+    def get_etag(cls, gameday_id) -> str:
+        etag_data = f"{gameday_id}:{cls.get_version(gameday_id)}"
+        return f'"{hashlib.md5(etag_data.encode()).hexdigest()}"'
+
+    @classmethod
+    def get_bundle(cls, gameday_id: int) -> bytes:
+        version = cls.get_version(gameday_id)
+        cache_key = GAMEDAY_BUNDLE_CACHE_KEY.format(
+            gameday_id=gameday_id, version=version
+        )
+        bundle = live_cache.get(cache_key)
+        if bundle is None:
+            bundle = JSONRenderer().render(cls._build_bundle(gameday_id, version))
+            live_cache.set(cache_key, bundle, GAMEDAY_BUNDLE_CACHE_TTL)
+        return bundle
+
+    @staticmethod
+    def _build_bundle(gameday_id: int, version: str) -> dict:
+        gameday: Gameday = Gameday.objects.select_related("league").get(pk=gameday_id)
+        games = Gameinfo.objects.filter(gameday=gameday).prefetch_related(
+            "gameresult_set__team"
+        )
+        gameday_service = GamedayService.create(gameday_id)
+        return {
+            "version": version,
+            "gameday": {
+                "id": gameday.pk,
+                "name": gameday.name,
+                "date": gameday.date.isoformat(),
+                "status": gameday.status,
+                "league": gameday.league.name,
+            },
+            "games": GameInfoSerializer(games, many=True).data,
+            "qualify_table": json.loads(
+                table_to_json(gameday_service.get_qualify_table(), QUALIFY_TABLE_COLUMNS)
+            ),
+            "final_table": json.loads(
+                table_to_json(gameday_service.get_final_table(), FINAL_TABLE_COLUMNS)
+            ),
+            "ticker": LivetickerService([], [], [gameday_id]).get_liveticker_as_json(),
+        }
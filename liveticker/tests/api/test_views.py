@@ -5,9 +5,9 @@ from django.core.cache import cache
 from django.urls import reverse
 from django_webtest import WebTest
 
-from gamedays.models import Gameinfo, Gameday
+from gamedays.models import Gameinfo, Gameday, Gameresult
 from gamedays.tests.setup_factories.db_setup import DBSetup
-from liveticker.api.urls import API_LIVETICKER_ALL
+from liveticker.api.urls import API_LIVETICKER_ALL, API_LIVETICKER_GAMEDAY_BUNDLE
 
 
 class TestLivetickerAPIView(WebTest):
@@ -46,3 +46,51 @@ class TestLivetickerAPIView(WebTest):
         assert response.json[0] == expected_result
         expected_result["gameId"] = first_game_gameday_two.pk
         assert response.json[2] == expected_result
+
+
+class TestGamedayBundleAPIView(WebTest):
+    def setUp(self):
+        cache.clear()
+        self.gameday = DBSetup().g62_status_empty()
+        self.url = reverse(
+            API_LIVETICKER_GAMEDAY_BUNDLE, kwargs={"gameday": self.gameday.pk}
+        )
+
+    def test_bundle_contains_games_tables_and_ticker(self):
+        response = self.app.get(self.url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json["gameday"]["id"] == self.gameday.pk
+        assert len(response.json["games"]) == Gameinfo.objects.filter(
+            gameday=self.gameday
+        ).count()
+        assert response.json["qualify_table"]["columns"] == [
+            "Gruppe", "Team", "Punkte", "PF", "PA", "+/-",
+        ]
+        assert response.json["final_table"] == []
+        assert isinstance(response.json["ticker"], list)
+
+    def test_cached_bundle_and_unchanged_etag_need_no_query(self):
+        etag = self.app.get(self.url).headers["ETag"]
+        with self.assertNumQueries(0):
+            assert self.app.get(self.url).headers["ETag"] == etag
+            response = self.app.get(self.url, headers={"If-None-Match": etag})
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_score_change_changes_bundle(self):
+        etag = self.app.get(self.url).headers["ETag"]
+        gameresult = Gameresult.objects.filter(gameinfo__gameday=self.gameday).first()
+        gameresult.fh = 21
+        gameresult.save()
+
+        response = self.app.get(self.url, headers={"If-None-Match": etag})
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["ETag"] != etag
+        game = next(
+            game for game in response.json["games"] if game["id"] == gameresult.gameinfo_id
+        )
+        assert 21 in [result["fh"] for result in game["results"]]
+
+    def test_unknown_gameday(self):
+        url = reverse(API_LIVETICKER_GAMEDAY_BUNDLE, kwargs={"gameday": 0})
+        response = self.app.get(url, expect_errors=True)
+        assert response.status_code == HTTPStatus.NOT_FOUND
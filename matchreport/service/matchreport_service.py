@@ -1,12 +1,13 @@
-import pandas as pd
-
 from gamedays.models import Gameinfo
 from gamedays.service.gameday_service import EMPTY_DATA
+from league_manager.utils.lazy_import import LazyModule
 from matchreport.service.model_wrapper import (
     MachtreportModelWrapper,
     PLAYER_PASSCHECK_COLUMN_MAPPING,
 )
 
+pd = LazyModule("pandas")
+
 
 class EmptyPasscheckDetailsTable:
     def to_html(self, *args, **kwargs):
@@ -1,6 +1,7 @@
+from __future__ import annotations
+
 from datetime import timedelta
 
-import pandas as pd
 from django.db.models import OuterRef, Subquery
 
 from gamedays.models import (
@@ -11,9 +12,12 @@ from gamedays.models import (
     GameOfficial,
     TeamLog,
 )
+from league_manager.utils.lazy_import import LazyModule
 from officials.models import OfficialLicenseHistory
 from passcheck.models import PasscheckVerification, PlayerlistGameday
 
+pd = LazyModule("pandas")
+
 PLAYER_PASSCHECK_COLUMN_MAPPING = {
     "gameday_jersey": "Trikotnr.",
     "playerlist__team__description": "Spieler Team",
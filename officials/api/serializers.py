@@ -18,6 +18,8 @@ from officials.models import (
     OfficialLicenseHistory,
     EmptyOfficialLicenseHistory,
     OfficialExternalGames,
+    MoodleSyncJob,
+    OfficialSeasonGameCount,
 )
 from officials.service.boff_license_calculation import LicenseStrategy
 from officials.service.moodle.moodle_service import MoodleService
@@ -43,6 +45,12 @@ class OfficialExternalGamesSerializer(ModelSerializer):
         return Obfuscator.obfuscate(*obj.reporter_name.split(" ")[:2])
 
 
+class MoodleSyncJobSerializer(ModelSerializer):
+    class Meta:
+        model = MoodleSyncJob
+        exclude = ("active_slot", "created_by")
+
+
 class OfficialTeamListScorecardSerializer(Serializer):
     ALL_FIELD_VALUES = ["last_name", "first_name", "id", "team__description"]
     team = CharField(source="team__description")
@@ -133,6 +141,7 @@ class OfficialSerializer(ModelSerializer):
 
 
 class OfficialGameCountSerializer(OfficialSerializer):
+    SEASON_GAME_COUNTS = "season_game_counts"
     position_count = SerializerMethodField()
 
     def __init__(self, season, is_staff=False, *args, **kwargs):
@@ -141,64 +150,44 @@ class OfficialGameCountSerializer(OfficialSerializer):
         self.season = season
 
     def get_position_count(self, obj: Official):
-        external_games_by_official: QuerySet[OfficialExternalGames] = (
-            obj.officialexternalgames_set.filter(date__year=self.season)
-        )
-        referee_ext = sum(
-            entry.calculated_number_games
-            for entry in external_games_by_official.filter(position="Referee")
-        )
-        down_judge_ext = sum(
-            entry.calculated_number_games
-            for entry in external_games_by_official.filter(position="Down Judge")
-        )
-        field_judge_ext = sum(
-            entry.calculated_number_games
-            for entry in external_games_by_official.filter(position="Field Judge")
-        )
-        side_judge_ext = sum(
-            entry.calculated_number_games
-            for entry in external_games_by_official.filter(position="Side Judge")
-        )
-        mix = sum(
-            entry.calculated_number_games
-            for entry in external_games_by_official.filter(position="Mix")
-        )
-        game_officials: QuerySet = obj.gameofficial_set.filter(
-            gameinfo__gameday__date__year=self.season
-        )
-        overall_ext = (
-            referee_ext + down_judge_ext + field_judge_ext + side_judge_ext + mix
-        )
-        overall = game_officials.exclude(position="Scorecard Judge").count()
-        referee = game_officials.filter(position="Referee").count()
-        down_judge = game_officials.filter(position="Down Judge").count()
-        field_judge = game_officials.filter(position="Field Judge").count()
-        side_judge = game_officials.filter(position="Side Judge").count()
+        game_count = self._get_season_game_count(obj)
+        if game_count is None:
+            game_count = OfficialSeasonGameCount(official=obj, season=self.season)
+        external = {
+            "referee": game_count.external_referee or 0,
+            "down_judge": game_count.external_down_judge or 0,
+            "field_judge": game_count.external_field_judge or 0,
+            "side_judge": game_count.external_side_judge or 0,
+        }
+        overall_ext = sum(external.values()) + game_count.external_mix
+        scorecard = {
+            "referee": game_count.internal_referee,
+            "down_judge": game_count.internal_down_judge,
+            "field_judge": game_count.internal_field_judge,
+            "side_judge": game_count.internal_side_judge,
+        }
+        overall = game_count.internal_overall
         return {
-            "scorecard": {
-                "referee": referee,
-                "down_judge": down_judge,
-                "field_judge": field_judge,
-                "side_judge": side_judge,
-                "overall": overall,
-            },
-            "external": {
-                "referee": 0 if referee_ext is None else referee_ext,
-                "down_judge": 0 if down_judge_ext is None else down_judge_ext,
-                "field_judge": 0 if field_judge_ext is None else field_judge_ext,
-                "side_judge": 0 if side_judge_ext is None else side_judge_ext,
-                "overall": overall_ext,
-            },
+            "scorecard": {**scorecard, "overall": overall},
+            "external": {**external, "overall": overall_ext},
             "sum": {
                 "overall": overall_ext + overall,
-                "referee": referee + referee_ext,
-                "down_judge": down_judge + down_judge_ext,
-                "field_judge": field_judge + field_judge_ext,
-                "side_judge": side_judge + side_judge_ext,
+                **{
+                    position: scorecard[position] + external[position]
+                    for position in scorecard
+                },
             },
         }
 
+    def _get_season_game_count(self, obj: Official) -> OfficialSeasonGameCount | None:
+        # officials of OfficialService come with the season's counts prefetched
+        if hasattr(obj, self.SEASON_GAME_COUNTS):
+            season_game_counts = getattr(obj, self.SEASON_GAME_COUNTS)
+            return season_game_counts[0] if season_game_counts else None
+        return OfficialSeasonGameCount.objects.filter(
+            official=obj, season=self.season
+        ).first()
+
 
 class OfficialGamelistSerializer(OfficialSerializer):
     is_valid = BooleanField(default=True)
@@ -1,9 +1,14 @@
 from django.urls import path
 
-from officials.api.views import OfficialsTeamListAPIView, OfficialsSearchName
+from officials.api.views import (
+    OfficialsTeamListAPIView,
+    OfficialsSearchName,
+    MoodleSyncJobAPIView,
+)
 
 API_OFFICIALS_FOR_TEAM = "api-officials-for-team"
 API_OFFICIALS_SEARCH_BY_NAME = "api-officials-search-by-name"
+API_OFFICIALS_MOODLE_SYNC_JOB = "api-officials-moodle-sync-job"
 
 urlpatterns = [
     path(
@@ -16,4 +21,9 @@ urlpatterns = [
         OfficialsSearchName.as_view(),
         name=API_OFFICIALS_SEARCH_BY_NAME,
     ),
+    path(
+        "moodle-sync/<int:pk>",
+        MoodleSyncJobAPIView.as_view(),
+        name=API_OFFICIALS_MOODLE_SYNC_JOB,
+    ),
 ]
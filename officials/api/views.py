@@ -6,8 +6,21 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from officials.api.serializers import OfficialTeamListScorecardSerializer
-from officials.models import Official
+from league_manager.utils.view_utils import PermissionHelper
+from officials.api.serializers import (
+    OfficialTeamListScorecardSerializer,
+    MoodleSyncJobSerializer,
+)
+from officials.models import Official, MoodleSyncJob
+
+
+class IsMoodleReportUser(permissions.BasePermission):
+    def has_permission(self, request, view):
+        return bool(
+            request.user
+            and request.user.is_authenticated
+            and PermissionHelper.is_moodle_report_user(request.user)
+        )
 
 
 class OfficialsTeamListAPIView(APIView):
@@ -57,3 +70,15 @@ class OfficialsSearchName(APIView):
             )
         serializer = OfficialTeamListScorecardSerializer(instance=officials, many=True)
         return Response(serializer.data, status=HTTPStatus.OK)
+
+
+class MoodleSyncJobAPIView(APIView):
+    permission_classes = (IsMoodleReportUser,)
+
+    # noinspection PyMethodMayBeStatic
+    def get(self, request, **kwargs):
+        try:
+            job = MoodleSyncJob.objects.get(pk=kwargs.get("pk"))
+        except MoodleSyncJob.DoesNotExist:
+            raise NotFound(f"Moodle-Abgleich #{kwargs.get('pk')} nicht gefunden")
+        return Response(MoodleSyncJobSerializer(instance=job).data, status=HTTPStatus.OK)
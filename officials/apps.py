@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class OfficialsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "officials"
+
+    def ready(self):
+        # noinspection PyUnresolvedReferences
+        import officials.service.signals
@@ -0,0 +1,25 @@
+"""Rebuild the per-season game counts of all officials.
+
+The counts are maintained on write by signals. Run this after changes that
+bypass them, e.g. ``QuerySet.update()`` or ``bulk_create`` of game officials.
+
+Usage
+-----
+::
+
+    python manage.py rebuild_official_game_counts
+"""
+
+from django.core.management.base import BaseCommand
+
+from officials.service.official_game_count_service import OfficialGameCountService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-season game counts of all officials."
+
+    def handle(self, *args, **options):
+        number_officials = OfficialGameCountService().rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt game counts for {number_officials} officials.")
+        )
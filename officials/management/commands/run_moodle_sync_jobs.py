@@ -0,0 +1,48 @@
+"""Worker for queued Moodle license sync jobs.
+
+Runs next to the web workers unless ``MOODLE_SYNC_JOB_IN_PROCESS`` is
+enabled, in which case the web process runs submitted jobs in a background
+thread itself.
+
+Usage
+-----
+Keep polling for jobs::
+
+    python manage.py run_moodle_sync_jobs
+
+Run the queued jobs once and exit (e.g. from cron)::
+
+    python manage.py run_moodle_sync_jobs --once
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from officials.service.moodle.moodle_sync_job_runner import MoodleSyncJobRunner
+
+
+class Command(BaseCommand):
+    help = "Run queued Moodle license sync jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run all queued jobs and exit instead of polling.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait between polls (default: 5).",
+        )
+
+    def handle(self, *args, **options):
+        runner = MoodleSyncJobRunner()
+        while True:
+            while runner.run_next():
+                self.stdout.write("Moodle sync job finished.")
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,39 @@
+# Generated by Django 6.0.8 on 2026-10-19 06:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('officials', '0015_moodleremembertoken'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MoodleCourseSyncWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('course_id', models.PositiveIntegerField(unique=True)),
+                ('last_synced_at', models.DateTimeField()),
+                ('last_attempt_time', models.DateTimeField(default=None, null=True)),
+                ('processed_count', models.PositiveIntegerField(default=0)),
+                ('skipped_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='MoodleUserSyncWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('course_id', models.PositiveIntegerField()),
+                ('user_id', models.PositiveIntegerField()),
+                ('last_attempt_time', models.DateTimeField(default=None, null=True)),
+                ('last_grade', models.FloatField(default=None, null=True)),
+                ('license_id', models.PositiveSmallIntegerField(default=None, null=True)),
+                ('synced_at', models.DateTimeField()),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('course_id', 'user_id'), name='unique_moodle_course_and_user')],
+            },
+        ),
+    ]
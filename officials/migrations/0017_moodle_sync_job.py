@@ -0,0 +1,38 @@
+# Generated by Django 6.0.8 on 2026-10-19 06:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('officials', '0016_moodle_sync_watermarks'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MoodleSyncJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('finished', 'Finished'), ('failed', 'Failed')], default='queued', max_length=20)),
+                ('active_slot', models.PositiveSmallIntegerField(default=1, null=True, unique=True)),
+                ('course_ids', models.CharField(blank=True, default=None, max_length=255, null=True)),
+                ('ignore_year', models.BooleanField(default=False)),
+                ('full_resync', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(default=None, null=True)),
+                ('heartbeat_at', models.DateTimeField(default=None, null=True)),
+                ('finished_at', models.DateTimeField(default=None, null=True)),
+                ('courses_total', models.PositiveIntegerField(default=0)),
+                ('courses_done', models.PositiveIntegerField(default=0)),
+                ('progress', models.JSONField(default=list)),
+                ('result', models.JSONField(default=None, null=True)),
+                ('execution_time', models.CharField(blank=True, default='', max_length=20)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_by', models.ForeignKey(blank=True, default=None, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
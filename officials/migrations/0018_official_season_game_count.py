@@ -0,0 +1,122 @@
+# Generated by Django 6.0.8 on 2026-10-19 06:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Case, Count, F, FloatField, Q, Sum, Value, When
+from django.db.models.functions import ExtractYear
+
+# frozen copies of officials.service.official_game_count_service and
+# OfficialExternalGames.calculated_games_expression at the time of this
+# migration; it must only use the historical models
+SCORECARD_JUDGE = "Scorecard Judge"
+INTERNAL_POSITIONS = {
+    "internal_referee": "Referee",
+    "internal_down_judge": "Down Judge",
+    "internal_field_judge": "Field Judge",
+    "internal_side_judge": "Side Judge",
+}
+EXTERNAL_POSITIONS = {
+    "external_referee": "Referee",
+    "external_down_judge": "Down Judge",
+    "external_field_judge": "Field Judge",
+    "external_side_judge": "Side Judge",
+    "external_mix": "Mix",
+}
+CALCULATED_NUMBER_GAMES = Case(
+    When(has_clockcontrol=True, halftime_duration__gte=15, then=F("number_games")),
+    When(
+        has_clockcontrol=True, halftime_duration__lt=15, then=F("number_games") * 0.5
+    ),
+    When(has_clockcontrol=False, halftime_duration__gte=23, then=F("number_games")),
+    When(
+        has_clockcontrol=False, halftime_duration__lt=23, then=F("number_games") * 0.5
+    ),
+    default=Value(0),
+    output_field=FloatField(),
+)
+
+
+def populate_season_game_counts(apps, schema_editor):
+    GameOfficial = apps.get_model("gamedays", "GameOfficial")
+    OfficialExternalGames = apps.get_model("officials", "OfficialExternalGames")
+    OfficialSeasonGameCount = apps.get_model("officials", "OfficialSeasonGameCount")
+    rows = {}
+
+    def get_row(official_id, season):
+        if (official_id, season) not in rows:
+            rows[(official_id, season)] = OfficialSeasonGameCount(
+                official_id=official_id, season=season
+            )
+        return rows[(official_id, season)]
+
+    internal_counts = (
+        GameOfficial.objects.filter(official__isnull=False)
+        .order_by()
+        .values("official_id", season=ExtractYear("gameinfo__gameday__date"))
+        .annotate(
+            internal_overall=Count("pk", filter=~Q(position=SCORECARD_JUDGE)),
+            **{
+                field: Count("pk", filter=Q(position=position))
+                for field, position in INTERNAL_POSITIONS.items()
+            },
+        )
+    )
+    for entry in internal_counts:
+        row = get_row(entry.pop("official_id"), entry.pop("season"))
+        for field, value in entry.items():
+            setattr(row, field, value)
+
+    external_counts = (
+        OfficialExternalGames.objects.order_by()
+        .values("official_id", season=ExtractYear("date"))
+        .annotate(
+            external_total=Sum(CALCULATED_NUMBER_GAMES),
+            **{
+                field: Sum(CALCULATED_NUMBER_GAMES, filter=Q(position=position))
+                for field, position in EXTERNAL_POSITIONS.items()
+            },
+        )
+    )
+    for entry in external_counts:
+        row = get_row(entry.pop("official_id"), entry.pop("season"))
+        for field, value in entry.items():
+            setattr(row, field, value or 0)
+
+    OfficialSeasonGameCount.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedays', '0042_publish_legacy_draft_gamedays'),
+        ('officials', '0017_moodle_sync_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfficialSeasonGameCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.PositiveSmallIntegerField()),
+                ('internal_referee', models.PositiveIntegerField(default=0)),
+                ('internal_down_judge', models.PositiveIntegerField(default=0)),
+                ('internal_field_judge', models.PositiveIntegerField(default=0)),
+                ('internal_side_judge', models.PositiveIntegerField(default=0)),
+                ('internal_overall', models.PositiveIntegerField(default=0)),
+                ('external_referee', models.FloatField(default=0)),
+                ('external_down_judge', models.FloatField(default=0)),
+                ('external_field_judge', models.FloatField(default=0)),
+                ('external_side_judge', models.FloatField(default=0)),
+                ('external_mix', models.FloatField(default=0)),
+                ('external_total', models.FloatField(default=0)),
+                ('official', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='officials.official')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['season'], name='officials_o_season_9f29cb_idx')],
+                'constraints': [models.UniqueConstraint(fields=('official', 'season'), name='unique_official_and_season')],
+            },
+        ),
+        migrations.RunPython(
+            populate_season_game_counts, migrations.RunPython.noop
+        ),
+    ]
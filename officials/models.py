@@ -1,6 +1,7 @@
 import datetime
 from datetime import date
 
+from django.contrib.auth.models import User
 from django.db import models
 from django.utils import timezone
 from django.db.models import (
@@ -58,6 +59,87 @@ class MoodleRememberToken(models.Model):
         )
 
 
+class MoodleCourseSyncWatermark(models.Model):
+    course_id = models.PositiveIntegerField(unique=True)
+    last_synced_at = models.DateTimeField()
+    last_attempt_time = models.DateTimeField(null=True, default=None)
+    processed_count = models.PositiveIntegerField(default=0)
+    skipped_count = models.PositiveIntegerField(default=0)
+
+    objects: QuerySet = models.Manager()
+
+    def __str__(self):
+        return f"Moodle course {self.course_id} synced at {self.last_synced_at}"
+
+
+class MoodleUserSyncWatermark(models.Model):
+    course_id = models.PositiveIntegerField()
+    user_id = models.PositiveIntegerField()
+    last_attempt_time = models.DateTimeField(null=True, default=None)
+    last_grade = models.FloatField(null=True, default=None)
+    license_id = models.PositiveSmallIntegerField(null=True, default=None)
+    synced_at = models.DateTimeField()
+
+    objects: QuerySet = models.Manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["course_id", "user_id"], name="unique_moodle_course_and_user"
+            ),
+        ]
+
+    def __str__(self):
+        return f"Moodle course {self.course_id} / user {self.user_id} -> {self.last_grade} ({self.license_id})"
+
+
+class MoodleSyncJob(models.Model):
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_FINISHED = "finished"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = (
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_FINISHED, "Finished"),
+        (STATUS_FAILED, "Failed"),
+    )
+    ACTIVE_SLOT = 1
+
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED
+    )
+    # set while the job is queued or running - the unique constraint lets the
+    # database refuse a second concurrent sync
+    active_slot = models.PositiveSmallIntegerField(
+        null=True, default=ACTIVE_SLOT, unique=True
+    )
+    course_ids = models.CharField(max_length=255, null=True, blank=True, default=None)
+    ignore_year = models.BooleanField(default=False)
+    full_resync = models.BooleanField(default=False)
+    created_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True, default=None
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, default=None)
+    heartbeat_at = models.DateTimeField(null=True, default=None)
+    finished_at = models.DateTimeField(null=True, default=None)
+    courses_total = models.PositiveIntegerField(default=0)
+    courses_done = models.PositiveIntegerField(default=0)
+    progress = models.JSONField(default=list)
+    result = models.JSONField(null=True, default=None)
+    execution_time = models.CharField(max_length=20, blank=True, default="")
+    error = models.TextField(blank=True, default="")
+
+    objects: QuerySet = models.Manager()
+
+    def is_active(self) -> bool:
+        return self.status in (self.STATUS_QUEUED, self.STATUS_RUNNING)
+
+    def __str__(self):
+        return f"Moodle sync #{self.pk} ({self.status}) {self.courses_done}/{self.courses_total}"
+
+
 class OfficialGamedaySignup(models.Model):
     gameday = models.ForeignKey(Gameday, on_delete=models.CASCADE)
     official = models.ForeignKey(Official, on_delete=models.CASCADE)
@@ -198,3 +280,43 @@ class OfficialExternalGames(models.Model):
 
     def __str__(self):
         return f"{self.official.last_name}__{self.date}: {self.number_games}"
+
+
+class OfficialSeasonGameCount(models.Model):
+    """Games of an official per season (calendar year of the game date).
+
+    Internal games count ``GameOfficial`` entries without the scorecard judge,
+    external games are weighted like ``OfficialExternalGames.calculated_number_games``.
+    Kept up to date by ``officials.service.signals``; writes that bypass the
+    signals (bulk updates, raw SQL) need ``manage.py rebuild_official_game_counts``.
+    """
+
+    official = models.ForeignKey(Official, on_delete=models.CASCADE)
+    season = models.PositiveSmallIntegerField()
+    internal_referee = models.PositiveIntegerField(default=0)
+    internal_down_judge = models.PositiveIntegerField(default=0)
+    internal_field_judge = models.PositiveIntegerField(default=0)
+    internal_side_judge = models.PositiveIntegerField(default=0)
+    internal_overall = models.PositiveIntegerField(default=0)
+    external_referee = models.FloatField(default=0)
+    external_down_judge = models.FloatField(default=0)
+    external_field_judge = models.FloatField(default=0)
+    external_side_judge = models.FloatField(default=0)
+    external_mix = models.FloatField(default=0)
+    # all external games regardless of their position
+    external_total = models.FloatField(default=0)
+
+    objects: QuerySet = models.Manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["official", "season"], name="unique_official_and_season"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["season"]),
+        ]
+
+    def __str__(self):
+        return f"{self.official_id} - {self.season}: {self.internal_overall} / {self.external_total}"
@@ -0,0 +1,182 @@
+import hashlib
+from datetime import date
+
+from django.db.models import Q, OuterRef, Subquery
+from django.db.models.functions import ExtractYear
+
+from gamedays.models import GameOfficial, Gameresult
+from league_manager.cache import VersionStamp, pages_cache
+from officials.api.serializers import GameOfficialAllInfoSerializer
+
+GAME_OFFICIAL_LIST_VERSION_KEY = "game_official_list_version"
+GAME_OFFICIAL_YEARS_VERSION_KEY = "game_official_years_version"
+GAME_OFFICIAL_LIST_YEARS_CACHE_KEY = "game_official_list_years:{team_id}:{version}"
+GAME_OFFICIAL_LIST_PAGE_CACHE_KEY = (
+    "game_official_list_page:{year}:{team_id}:{after}:{before}:{version}"
+)
+GAME_OFFICIAL_LIST_YEARS_CACHE_TTL = 60 * 60 * 24
+GAME_OFFICIAL_LIST_PAGE_CACHE_TTL = 60 * 5
+
+
+class GameOfficialListVersion:
+    """Cache-held version stamps of the game official list, bumped by
+    ``officials.service.signals``: the list one on every write that changes a
+    listed field, the years one only when game officials are added, removed
+    or moved to another year or team."""
+
+    @staticmethod
+    def get() -> int:
+        return VersionStamp(GAME_OFFICIAL_LIST_VERSION_KEY).get()
+
+    @staticmethod
+    def get_years() -> int:
+        return VersionStamp(GAME_OFFICIAL_YEARS_VERSION_KEY).get()
+
+    @staticmethod
+    def bump(years: bool = False):
+        VersionStamp(GAME_OFFICIAL_LIST_VERSION_KEY).bump()
+        if years:
+            VersionStamp(GAME_OFFICIAL_YEARS_VERSION_KEY).bump()
+
+
+class GameOfficialListCursor:
+    """Keyset position in the list, encoded as ``<gameday date>_<game official id>``."""
+
+    SEPARATOR = "_"
+
+    @staticmethod
+    def encode(entry: dict) -> str:
+        gameday_date = entry[GameOfficialAllInfoSerializer.GAMEDAY_DATE_C]
+        return f"{gameday_date.isoformat()}{GameOfficialListCursor.SEPARATOR}{entry[GameOfficialAllInfoSerializer.ID_C]}"
+
+    @staticmethod
+    def decode(cursor: str | None) -> tuple[date, int] | None:
+        if not cursor:
+            return None
+        try:
+            gameday_date, game_official_id = cursor.split(GameOfficialListCursor.SEPARATOR)
+            return date.fromisoformat(gameday_date), int(game_official_id)
+        except ValueError:
+            return None
+
+
+class GameOfficialListService:
+    PAGE_SIZE = 1000
+    DATE = "gameinfo__gameday__date"
+
+    def __init__(self, year: int, team_id: int | None = None):
+        self.year = year
+        self.team_id = team_id
+
+    @staticmethod
+    def get_etag(request, **kwargs) -> str:
+        etag_data = (
+            f"{request.path}?{request.GET.urlencode()}:{request.user.username}:"
+            f"{request.user.is_staff}:{GameOfficialListVersion.get()}:"
+            f"{GameOfficialListVersion.get_years()}"
+        )
+        return f'"{hashlib.md5(etag_data.encode()).hexdigest()}"'
+
+    def get_years(self) -> list[int]:
+        cache_key = GAME_OFFICIAL_LIST_YEARS_CACHE_KEY.format(
+            team_id=self.team_id, version=GameOfficialListVersion.get_years()
+        )
+        years = pages_cache.get(cache_key)
+        if years is None:
+            years = sorted(
+                self._filter_team(GameOfficial.objects.all())
+                .annotate(year=ExtractYear(self.DATE))
+                .order_by()
+                .values_list("year", flat=True)
+                .distinct(),
+                reverse=True,
+            )
+            pages_cache.set(cache_key, years, GAME_OFFICIAL_LIST_YEARS_CACHE_TTL)
+        return years
+
+    def get_page(self, after: str = None, before: str = None) -> dict:
+        """Returns one page of entries ordered by gameday date and id together
+        with the cursors of the neighbouring pages (``None`` if there is none)."""
+        after_key = GameOfficialListCursor.decode(after)
+        before_key = None if after_key else GameOfficialListCursor.decode(before)
+        cache_key = GAME_OFFICIAL_LIST_PAGE_CACHE_KEY.format(
+            year=self.year,
+            team_id=self.team_id,
+            after=after_key and GameOfficialListCursor.SEPARATOR.join(map(str, after_key)),
+            before=before_key
+            and GameOfficialListCursor.SEPARATOR.join(map(str, before_key)),
+            version=GameOfficialListVersion.get(),
+        )
+        page = pages_cache.get(cache_key)
+        if page is None:
+            page = self._build_page(after_key, before_key)
+            pages_cache.set(cache_key, page, GAME_OFFICIAL_LIST_PAGE_CACHE_TTL)
+        return page
+
+    def _build_page(self, after_key, before_key) -> dict:
+        game_officials = self._filter_team(
+            GameOfficial.objects.filter(
+                **{
+                    f"{self.DATE}__gte": date(self.year, 1, 1),
+                    f"{self.DATE}__lt": date(self.year + 1, 1, 1),
+                }
+            ).exclude(position="Scorecard Judge")
+        )
+        if before_key:
+            gameday_date, game_official_id = before_key
+            game_officials = game_officials.filter(
+                Q(**{f"{self.DATE}__lt": gameday_date})
+                | Q(**{self.DATE: gameday_date, "pk__lt": game_official_id})
+            ).order_by(f"-{self.DATE}", "-pk")
+        else:
+            if after_key:
+                gameday_date, game_official_id = after_key
+                game_officials = game_officials.filter(
+                    Q(**{f"{self.DATE}__gt": gameday_date})
+                    | Q(**{self.DATE: gameday_date, "pk__gt": game_official_id})
+                )
+            game_officials = game_officials.order_by(self.DATE, "pk")
+        entries = list(
+            game_officials.annotate(
+                home=self._get_team_subquery(is_home=True),
+                away=self._get_team_subquery(is_home=False),
+            ).values(*GameOfficialAllInfoSerializer.ALL_VALUE_FIELDS)[
+                : self.PAGE_SIZE + 1
+            ]
+        )
+        has_more = len(entries) > self.PAGE_SIZE
+        entries = entries[: self.PAGE_SIZE]
+        if before_key:
+            entries.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, after_key is not None
+        return {
+            "entries": entries,
+            "next": (
+                GameOfficialListCursor.encode(entries[-1])
+                if has_next and entries
+                else None
+            ),
+            "previous": (
+                GameOfficialListCursor.encode(entries[0])
+                if has_previous and entries
+                else None
+            ),
+        }
+
+    def _filter_team(self, game_officials):
+        if not self.team_id:
+            return game_officials
+        return game_officials.filter(
+            Q(gameinfo__officials__pk=self.team_id, official=None)
+            | Q(official__team__pk=self.team_id)
+        )
+
+    # noinspection PyMethodMayBeStatic
+    def _get_team_subquery(self, is_home: bool):
+        return Subquery(
+            Gameresult.objects.filter(
+                gameinfo=OuterRef("gameinfo"), isHome=is_home
+            ).values("team__description")[:1]
+        )
@@ -1,9 +1,12 @@
 import json
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
 from typing import List
 
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from officials.service.boff_license_calculation import LicenseStrategy
 
@@ -163,12 +166,19 @@ class ApiExamResult:
         attempts = exam_result_json.get("attempts")
         if attempts is None or len(attempts) == 0:
             self.result = None
+            self.attempt_time = None
         else:
             self.result = float(exam_result_json.get("attempts")[0]["sumgrades"])
+            self.attempt_time = exam_result_json.get("attempts")[0].get("timefinish")
 
     def get_result(self):
         return self.result
 
+    def get_attempt_time(self) -> datetime | None:
+        if not self.attempt_time:
+            return None
+        return datetime.fromtimestamp(self.attempt_time, tz=timezone.utc)
+
     def __str__(self):
         return f"Result={self.result}"
 
@@ -247,24 +257,59 @@ class MoodleAuth:
 
 
 class MoodleApi:
+    # read-only web service functions whose responses can be reused for the
+    # lifetime of one MoodleApi instance (i.e. one sync run)
+    CACHEABLE_FUNCTIONS = (
+        "core_course_get_courses_by_field",
+        "core_enrol_get_enrolled_users",
+        "mod_quiz_get_quizzes_by_courses",
+        "mod_quiz_get_user_attempts",
+    )
+
     def __init__(self):
         self.moodle_url = (
             f"{settings.MOODLE_URL}/moodle/webservice/rest/server.php"
             f"?wstoken={settings.MOODLE_WSTOKEN}&moodlewsrestformat=json"
         )
+        self.session = self._create_session()
+        self._request_cache = {}
+        self._request_cache_lock = threading.Lock()
 
     def __str__(self):
         return f"{settings.MOODLE_URL}"
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        retry = Retry(
+            total=settings.MOODLE_HTTP_RETRIES,
+            backoff_factor=settings.MOODLE_HTTP_BACKOFF_FACTOR,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=settings.MOODLE_HTTP_POOL_SIZE,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def clear_request_cache(self):
+        with self._request_cache_lock:
+            self._request_cache.clear()
+
     def confirm_user_auth(self, username, password):
         return MoodleAuth(
-            requests.get(
+            self.session.get(
                 f"{settings.MOODLE_URL}/moodle/login/token.php",
-                {
+                params={
                     "username": username,
                     "password": password,
                     "service": "moodle_mobile_app",
                 },
+                timeout=settings.MOODLE_HTTP_TIMEOUT,
             ).json()
         )
 
@@ -328,4 +373,24 @@ class MoodleApi:
         )
 
     def _send_request(self, additional_params) -> dict:
-        return requests.get(f"{self.moodle_url}{additional_params}").json()
+        is_cacheable = self._is_cacheable(additional_params)
+        if is_cacheable:
+            with self._request_cache_lock:
+                if additional_params in self._request_cache:
+                    return self._request_cache[additional_params]
+        response = self.session.get(
+            f"{self.moodle_url}{additional_params}",
+            timeout=settings.MOODLE_HTTP_TIMEOUT,
+        ).json()
+        # moodle reports errors as a regular json body -> never reuse those
+        is_error = isinstance(response, dict) and "exception" in response
+        if is_cacheable and not is_error:
+            with self._request_cache_lock:
+                self._request_cache[additional_params] = response
+        return response
+
+    def _is_cacheable(self, additional_params) -> bool:
+        return any(
+            f"wsfunction={function}&" in f"{additional_params}&"
+            for function in self.CACHEABLE_FUNCTIONS
+        )
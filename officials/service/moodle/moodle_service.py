@@ -7,11 +7,16 @@ from typing import Any
 
 from django.conf import settings
 from django.db import connections
-from django.db.models import QuerySet
 from django.urls import reverse
+from django.utils import timezone
 
 from gamedays.models import Association, Team
-from officials.models import OfficialLicenseHistory, Official
+from officials.models import (
+    OfficialLicenseHistory,
+    Official,
+    MoodleUserSyncWatermark,
+    MoodleCourseSyncWatermark,
+)
 from officials.service.boff_license_calculation import (
     LicenseCalculator,
 )
@@ -25,7 +30,9 @@ from officials.service.moodle.moodle_api import (
     FieldNotFoundException,
     EmptyApiExams,
     ApiExam,
+    ApiExamResult,
 )
+from officials.service.moodle.moodle_sync_lookup import MoodleSyncLookup
 
 
 def measure_execution_time(func):
@@ -42,18 +49,34 @@ def measure_execution_time(func):
     return wrapper
 
 
+class MoodleSyncProgress:
+    """Receives progress updates while ``MoodleService.update_licenses`` runs."""
+
+    def start(self, courses_total: int):
+        pass
+
+    def course_finished(self, course_result: dict):
+        pass
+
+    def heartbeat(self):
+        """Called from the course threads while a course is processed, once
+        per participant and per Moodle request."""
+        pass
+
+
 class MoodleService:
     MOODLE_PROFILE = "/moodle/user/profile.php"
     MOODLE_COURSE = "/moodle/course/edit.php"
 
-    def __init__(self):
+    def __init__(self, full_resync: bool = False):
         self.moodle_api = MoodleApi()
-        self.license_history: QuerySet[OfficialLicenseHistory] = (
-            OfficialLicenseHistory.objects.none()
-        )
+        self.full_resync = full_resync
+        self._lookup: MoodleSyncLookup | None = None
+        self._lookup_lock = threading.Lock()
         self.license_calculator = LicenseCalculator()
         self.exams = EmptyApiExams()
         self._thread_local = threading.local()
+        self._progress = MoodleSyncProgress()
 
     def set_exams(self, exams):
         self._thread_local.exams = exams
@@ -61,6 +84,12 @@ class MoodleService:
     def get_exams(self):
         return getattr(self._thread_local, "exams", EmptyApiExams())
 
+    def get_lookup(self) -> MoodleSyncLookup:
+        with self._lookup_lock:
+            if self._lookup is None:
+                self._lookup = MoodleSyncLookup.load()
+            return self._lookup
+
     def get_all_users_for_course(self, course_id) -> list[Any]:
         participants: ApiParticipants = self.moodle_api.get_participants_for_course(
             course_id
@@ -74,11 +103,24 @@ class MoodleService:
         return self.moodle_api.get_courses(course_id).get_all()[0]
 
     @measure_execution_time
-    def update_licenses(self, course_ids: str = None, ignore_year=False):
+    def update_licenses(
+        self,
+        course_ids: str = None,
+        ignore_year=False,
+        full_resync=None,
+        progress: MoodleSyncProgress = None,
+    ):
+        progress = progress or MoodleSyncProgress()
+        self._progress = progress
+        if full_resync is not None:
+            self.full_resync = full_resync
+        self.moodle_api.clear_request_cache()
+        self._lookup = None
         courses: ApiCourses = self.moodle_api.get_courses(course_ids, ignore_year)
         missing_team_names = set()
         result_list = []
         missed_officials_list = []
+        progress.start(len(courses.get_all()))
         with ThreadPoolExecutor(max_workers=10) as executor:
             # Submit each course update task to the thread pool
             futures = {
@@ -93,13 +135,21 @@ class MoodleService:
                 missing_team_names.update(team_name_set)
                 missed_officials_list += missed_official
                 result_list += [course_result]
+                progress.course_finished(course_result)
         connections.close_all()
 
         missed_officials_messages = [item["message"] for item in missed_officials_list]
         missed_officials_ids = [item["id"] for item in missed_officials_list]
 
         return {
+            "full_resync": self.full_resync,
             "items_result_list": len(result_list),
+            "items_processed": sum(
+                course_result["officials_count"] for course_result in result_list
+            ),
+            "items_skipped": sum(
+                course_result["skipped_count"] for course_result in result_list
+            ),
             "items_missed_officials": len(missed_officials_list),
             "result_list": result_list,
             "missed_officials": missed_officials_messages,
@@ -109,12 +159,15 @@ class MoodleService:
 
     def get_participants_from_course(self, course: ApiCourse):
         result = self.get_participants_from_course_with_time_measure(course)
-        team_name_set, missed_official, officials, skip_reason = result[0]
+        team_name_set, missed_official, officials, skipped_count, skip_reason = (
+            result[0]
+        )
         formatted_time = result[1]
         course_result = {
             "course": self._get_ahref_for_course(course.get_id(), course.get_name()),
             "execution_time": formatted_time,
             "officials_count": len(officials),
+            "skipped_count": skipped_count,
             "officials": officials,
         }
         if skip_reason:
@@ -129,39 +182,214 @@ class MoodleService:
                 set(),
                 [],
                 [],
+                0,
                 f"Kurs als nicht relevant markiert -> Kurs-Enddatum: {course.end_date} / Kurs-Lizenzstufe: {LicenseCalculator.get_license_name(course.get_license_id())}",
             )
-        self.license_history = OfficialLicenseHistory.objects.filter(
-            created_at__year=course.get_year()
-        )
         exams = self.moodle_api.get_exams_for_course(course.get_id())
         if exams.is_empty():
-            return set(), [], [], "Kurs hat kein Quiz (oder keine Ergenisse im Quiz) mit Namen 'Lizenzprüfung' oder 'Exam'."
+            return set(), [], [], 0, "Kurs hat kein Quiz (oder keine Ergenisse im Quiz) mit Namen 'Lizenzprüfung' oder 'Exam'."
         self.set_exams(exams)
-        missing_teams_list, missed_officials_list, result_list = (
+        missing_teams_list, missed_officials_list, result_list, skipped_count = (
             self.get_participants_from_relevant_course(course)
         )
-        return missing_teams_list, missed_officials_list, result_list, None
+        return (
+            missing_teams_list,
+            missed_officials_list,
+            result_list,
+            skipped_count,
+            None,
+        )
 
     def get_participants_from_relevant_course(self, course):
         participants: ApiParticipants = self.moodle_api.get_participants_for_course(
             course.get_id()
         )
-        result_list = []
         missed_officials_list = []
         missing_teams_list = set()
+        participants_with_team = []
         for current_participant in participants.get_all():
-            team_name, missed_official, official = self.get_info_of_user_with_result(
+            self._progress.heartbeat()
+            team_name, missed_official, team = self.find_team_of_participant(
                 course, current_participant
             )
             if team_name is not None:
                 missing_teams_list.add(team_name)
             missed_officials_list += missed_official
-            result_list += official
+            if team is not None:
+                participants_with_team += [current_participant]
+
+        exams = self.get_exams()
+        exam_results = self._run_concurrently(
+            lambda participant: self.get_exam_result(participant, exams),
+            participants_with_team,
+        )
+        watermarks = self._get_user_watermarks(course)
+        changed_participants = []
+        for current_participant, exam_result in zip(
+            participants_with_team, exam_results
+        ):
+            if self._is_unchanged(
+                watermarks.get(current_participant.get_id()), exam_result
+            ):
+                continue
+            changed_participants += [(current_participant, exam_result)]
+        skipped_count = len(participants_with_team) - len(changed_participants)
+
+        resolved_participants = []
+        lookup = self.get_lookup()
+        with lookup.lock:
+            for current_participant, exam_result in changed_participants:
+                self._progress.heartbeat()
+                team_name, missed_official, official = self.resolve_official(
+                    course, current_participant
+                )
+                if team_name is not None:
+                    missing_teams_list.add(team_name)
+                missed_officials_list += missed_official
+                if official is not None:
+                    resolved_participants += [
+                        (current_participant, exam_result, official)
+                    ]
+            lookup.save_officials(
+                [official for _, _, official in resolved_participants]
+            )
+            license_histories = [
+                self.create_new_or_update_license_history(
+                    official, course, exam_result[0]
+                )
+                for _, exam_result, official in resolved_participants
+            ]
+            lookup.save_license_histories(
+                course.get_year(),
+                [history for history in license_histories if history is not None],
+            )
+
+        result_list = []
+        users_to_update = []
+        watermarks_to_save = []
+        for (current_participant, exam_result, official), license_history in zip(
+            resolved_participants, license_histories
+        ):
+            _, api_exam_result = exam_result
+            watermark = watermarks.get(current_participant.get_id())
+            license_id = None if license_history is None else license_history.license_id
+            if license_history is not None and (
+                self.full_resync
+                or watermark is None
+                or watermark.license_id != license_id
+            ):
+                users_to_update += [
+                    ApiUpdateUser(official.external_id, official.pk, license_id)
+                ]
+            watermarks_to_save += [
+                self._create_user_watermark(
+                    course, current_participant, api_exam_result, license_id
+                )
+            ]
+            result_list += [
+                f"{'XXX / ' if license_history is None else str(license_history.result) + '% / '}{self._get_ahref_for_moodle_profile(official.external_id, str(official))} / Lizenz: {self._get_ahref_for_profile(official.pk)}"
+            ]
+        self._run_concurrently(self.moodle_api.update_user, users_to_update)
+        self._save_watermarks(
+            course, watermarks_to_save, len(result_list), skipped_count
+        )
+
+        return missing_teams_list, missed_officials_list, result_list, skipped_count
+
+    def _get_user_watermarks(self, course: ApiCourse) -> dict:
+        if self.full_resync:
+            return {}
+        return {
+            watermark.user_id: watermark
+            for watermark in MoodleUserSyncWatermark.objects.filter(
+                course_id=course.get_id()
+            )
+        }
 
-        return missing_teams_list, missed_officials_list, result_list
+    # noinspection PyMethodMayBeStatic
+    def _is_unchanged(self, watermark: MoodleUserSyncWatermark | None, exam_result):
+        if watermark is None:
+            return False
+        _, api_exam_result = exam_result
+        if api_exam_result is None:
+            return watermark.last_grade is None
+        return (
+            watermark.last_grade == api_exam_result.get_result()
+            and watermark.last_attempt_time == api_exam_result.get_attempt_time()
+        )
 
-    def get_info_of_user_with_result(self, course: ApiCourse, user_info: ApiUserInfo):
+    # noinspection PyMethodMayBeStatic
+    def _create_user_watermark(
+        self,
+        course: ApiCourse,
+        participant: ApiUserInfo,
+        api_exam_result: ApiExamResult | None,
+        license_id,
+    ) -> MoodleUserSyncWatermark:
+        return MoodleUserSyncWatermark(
+            course_id=course.get_id(),
+            user_id=participant.get_id(),
+            last_grade=None if api_exam_result is None else api_exam_result.get_result(),
+            last_attempt_time=(
+                None if api_exam_result is None else api_exam_result.get_attempt_time()
+            ),
+            license_id=license_id,
+            synced_at=timezone.now(),
+        )
+
+    # noinspection PyMethodMayBeStatic
+    def _save_watermarks(
+        self,
+        course: ApiCourse,
+        watermarks: list[MoodleUserSyncWatermark],
+        processed_count,
+        skipped_count,
+    ):
+        MoodleUserSyncWatermark.objects.bulk_create(
+            watermarks,
+            update_conflicts=True,
+            unique_fields=["course_id", "user_id"],
+            update_fields=["last_grade", "last_attempt_time", "license_id", "synced_at"],
+        )
+        attempt_times = [
+            watermark.last_attempt_time
+            for watermark in watermarks
+            if watermark.last_attempt_time is not None
+        ]
+        course_watermark, _ = MoodleCourseSyncWatermark.objects.get_or_create(
+            course_id=course.get_id(), defaults={"last_synced_at": timezone.now()}
+        )
+        course_watermark.last_synced_at = timezone.now()
+        if attempt_times:
+            course_watermark.last_attempt_time = max(
+                attempt_times + [course_watermark.last_attempt_time or attempt_times[0]]
+            )
+        course_watermark.processed_count = processed_count
+        course_watermark.skipped_count = skipped_count
+        course_watermark.save()
+
+    # noinspection PyMethodMayBeStatic
+    def _run_concurrently(self, func, items: list) -> list:
+        """Runs the network bound ``func`` for each item with bounded parallelism
+        and returns the results in the order of the items. The progress gets a
+        heartbeat from the calling thread per finished item."""
+        results = []
+        if len(items) <= 1:
+            for item in items:
+                results += [func(item)]
+                self._progress.heartbeat()
+            return results
+        with ThreadPoolExecutor(
+            max_workers=settings.MOODLE_PARTICIPANT_WORKERS
+        ) as executor:
+            for result in executor.map(func, items):
+                results += [result]
+                self._progress.heartbeat()
+        return results
+
+    def find_team_of_participant(
+        self, course: ApiCourse, user_info: ApiUserInfo
+    ) -> tuple[str | None, list, Team | None]:
         try:
             team_description = user_info.get_team()
         except FieldNotFoundException as exception:
@@ -172,8 +400,8 @@ class MoodleService:
                     f"-> {exception}",
                 }
             ]
-            return None, missed_officials, []
-        team: Team = self._get_first(Team.objects.filter(description=team_description))
+            return None, missed_officials, None
+        team = self.get_lookup().get_team(team_description)
         if team is None:
             missed_officials = [
                 {
@@ -182,57 +410,51 @@ class MoodleService:
                     f"-> fehlendes Team: {team_description}",
                 }
             ]
-            return team_description, missed_officials, []
-        else:
-            try:
-                official = self.create_new_or_update_existing_official(user_info)
-            except Association.DoesNotExist:
-                missed_officials = [
-                    {
-                        "id": user_info.id,
-                        "message": f"{self._get_ahref_for_moodle_profile(course.get_id())}: {self._get_ahref_for_moodle_profile(user_info.id)} - {user_info.get_last_name()} "
-                        f"-> Association nicht gefunden: {user_info.get_association()}",
-                    }
-                ]
-                return team_description, missed_officials, []
+            return team_description, missed_officials, None
+        return None, [], team
 
-        license_history = self.create_new_or_update_license_history(
-            official, course, user_info
-        )
-        return (
-            None,
-            [],
-            [
-                f"{'XXX / ' if license_history is None else str(license_history.result) + '% / '}{self._get_ahref_for_moodle_profile(official.external_id, str(official))} / Lizenz: {self._get_ahref_for_profile(official.pk)}"
-            ],
-        )
+    def resolve_official(
+        self, course: ApiCourse, user_info: ApiUserInfo
+    ) -> tuple[str | None, list, Official | None]:
+        try:
+            official = self.create_new_or_update_existing_official(user_info)
+        except Association.DoesNotExist:
+            missed_officials = [
+                {
+                    "id": user_info.id,
+                    "message": f"{self._get_ahref_for_moodle_profile(course.get_id())}: {self._get_ahref_for_moodle_profile(user_info.id)} - {user_info.get_last_name()} "
+                    f"-> Association nicht gefunden: {user_info.get_association()}",
+                }
+            ]
+            return user_info.get_team(), missed_officials, None
+        return None, [], official
 
-    def create_new_or_update_license_history(
-        self, official, course: ApiCourse, participant: ApiUserInfo
-    ) -> OfficialLicenseHistory | None:
-        result = None
-        exams = self.get_exams()
+    def get_exam_result(
+        self, participant: ApiUserInfo, exams
+    ) -> tuple[int | None, ApiExamResult | None]:
         exam: ApiExam
         for exam in exams.get_all():
             exam_result = self.moodle_api.get_user_result_for_exam(
                 participant.get_id(), exam.get_id()
             )
             if exam_result.get_result():
-                result = int(
-                    math.ceil(exam_result.get_result() / exam.get_grade() * 100)
+                return (
+                    int(math.ceil(exam_result.get_result() / exam.get_grade() * 100)),
+                    exam_result,
                 )
-                break
+        return None, None
+
+    def create_new_or_update_license_history(
+        self, official, course: ApiCourse, result: int | None
+    ) -> OfficialLicenseHistory | None:
         if result is None:
             return None
         calculated_license_id = self.license_calculator.calculate(
             course.get_license_id(), result
         )
-        license_history_to_update: OfficialLicenseHistory = self._get_first(
-            self.license_history.filter(
-                official=official,
-                created_at__year=course.get_year(),
-                license_id=calculated_license_id,
-            )
+        lookup = self.get_lookup()
+        license_history_to_update = lookup.get_license_history(
+            official.pk, course.get_year(), calculated_license_id
         )
         if license_history_to_update is not None:
             if license_history_to_update.result < result:
@@ -241,30 +463,29 @@ class MoodleService:
             license_history_to_update = self.create_new_license_history(
                 course, official, result
             )
-        license_history_to_update.save()
-        api_user = ApiUpdateUser(
-            official.external_id, official.pk, license_history_to_update.license_id
-        )
-        self.moodle_api.update_user(api_user)
+            lookup.add_license_history(course.get_year(), license_history_to_update)
         return license_history_to_update
 
     def create_new_or_update_existing_official(self, user_info) -> Official:
-        official = self._get_first(
-            Official.objects.filter(external_id=user_info.get_id())
-        )
+        """Applies the moodle user info to the matching official of the lookup.
+
+        Changes are only kept in memory; callers persist them in bulk with
+        ``MoodleSyncLookup.save_officials`` while holding the lookup lock.
+        """
+        lookup = self.get_lookup()
+        association = None
+        if user_info.whistle_for_association():
+            association = lookup.get_association(user_info.get_association())
+        official = lookup.get_official(user_info.get_id())
         if official is None:
             official = Official()
             official.external_id = user_info.get_id()
+            lookup.add_official(official)
         official.first_name = user_info.get_first_name()
         official.last_name = user_info.get_last_name()
-        official.team = self._get_first(
-            Team.objects.filter(description=user_info.get_team())
-        )
-        if user_info.whistle_for_association():
-            official.association = Association.objects.get(
-                name=user_info.get_association()
-            )
-        official.save()
+        official.team = lookup.get_team(user_info.get_team())
+        if association is not None:
+            official.association = association
         return official
 
     def create_new_license_history(
@@ -278,10 +499,6 @@ class MoodleService:
             result=result,
         )
 
-    # noinspection PyMethodMayBeStatic
-    def _get_first(self, query_set: QuerySet):
-        return query_set.first()
-
     def get_user_info_by(self, external_id) -> ApiUserInfo:
         return self.moodle_api.get_user_info_by_id(external_id)
 
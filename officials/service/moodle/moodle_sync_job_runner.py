@@ -0,0 +1,172 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from officials.models import MoodleSyncJob
+from officials.service.moodle.moodle_service import MoodleService, MoodleSyncProgress
+
+logger = logging.getLogger(__name__)
+
+
+class MoodleSyncJobAlreadyRunning(Exception):
+    def __init__(self, job: MoodleSyncJob | None):
+        self.job = job
+        super().__init__(
+            "Es läuft bereits ein Moodle-Abgleich."
+            if job is None
+            else f"Es läuft bereits ein Moodle-Abgleich (#{job.pk}, {job.status})."
+        )
+
+
+class MoodleSyncJobProgress(MoodleSyncProgress):
+    """Stores the progress of a job. Heartbeats are written at most every
+    ``HEARTBEAT_INTERVAL`` seconds, a single course can take longer than
+    ``MOODLE_SYNC_JOB_STALE_AFTER`` on its own."""
+
+    HEARTBEAT_INTERVAL = 10
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self.entries = []
+        self._heartbeat_lock = threading.Lock()
+        self._last_heartbeat = time.monotonic()
+
+    def start(self, courses_total: int):
+        self._last_heartbeat = time.monotonic()
+        MoodleSyncJob.objects.filter(pk=self.job_id).update(
+            courses_total=courses_total, heartbeat_at=timezone.now()
+        )
+
+    def course_finished(self, course_result: dict):
+        self.entries += [
+            {
+                "course": course_result["course"],
+                "execution_time": course_result["execution_time"],
+                "officials_count": course_result["officials_count"],
+                "skipped_count": course_result["skipped_count"],
+            }
+        ]
+        self._last_heartbeat = time.monotonic()
+        MoodleSyncJob.objects.filter(pk=self.job_id).update(
+            courses_done=len(self.entries),
+            progress=self.entries,
+            heartbeat_at=timezone.now(),
+        )
+
+    def heartbeat(self):
+        with self._heartbeat_lock:
+            now = time.monotonic()
+            if now - self._last_heartbeat < self.HEARTBEAT_INTERVAL:
+                return
+            self._last_heartbeat = now
+        MoodleSyncJob.objects.filter(
+            pk=self.job_id, status=MoodleSyncJob.STATUS_RUNNING
+        ).update(heartbeat_at=timezone.now())
+
+
+class MoodleSyncJobRunner:
+    """Runs the Moodle license sync as a job stored in the database.
+
+    Submitted jobs are picked up by the ``run_moodle_sync_jobs`` management
+    command, or by a thread of the web process if
+    ``MOODLE_SYNC_JOB_IN_PROCESS`` is enabled. Only one job can be queued or running at a
+    time; jobs without a heartbeat for ``MOODLE_SYNC_JOB_STALE_AFTER`` seconds
+    are marked as failed so a crashed worker does not block the next sync.
+    """
+
+    def submit(
+        self, course_ids=None, ignore_year=False, full_resync=False, user=None
+    ) -> MoodleSyncJob:
+        self.fail_stale_jobs()
+        try:
+            with transaction.atomic():
+                job = MoodleSyncJob.objects.create(
+                    course_ids=course_ids,
+                    ignore_year=ignore_year,
+                    full_resync=full_resync,
+                    created_by=user,
+                )
+        except IntegrityError:
+            raise MoodleSyncJobAlreadyRunning(self.get_active_job())
+        if settings.MOODLE_SYNC_JOB_IN_PROCESS:
+            transaction.on_commit(lambda: self._start_thread(job.pk))
+        return job
+
+    # noinspection PyMethodMayBeStatic
+    def get_active_job(self) -> MoodleSyncJob | None:
+        return MoodleSyncJob.objects.filter(
+            active_slot=MoodleSyncJob.ACTIVE_SLOT
+        ).first()
+
+    # noinspection PyMethodMayBeStatic
+    def fail_stale_jobs(self) -> int:
+        stale_before = timezone.now() - timedelta(
+            seconds=settings.MOODLE_SYNC_JOB_STALE_AFTER
+        )
+        return MoodleSyncJob.objects.filter(
+            Q(status=MoodleSyncJob.STATUS_QUEUED, created_at__lt=stale_before)
+            | Q(status=MoodleSyncJob.STATUS_RUNNING, heartbeat_at__lt=stale_before)
+        ).update(
+            status=MoodleSyncJob.STATUS_FAILED,
+            active_slot=None,
+            finished_at=timezone.now(),
+            error="Der Abgleich hat sich nicht mehr zurückgemeldet.",
+        )
+
+    def run_next(self) -> bool:
+        self.fail_stale_jobs()
+        job_id = (
+            MoodleSyncJob.objects.filter(status=MoodleSyncJob.STATUS_QUEUED)
+            .order_by("created_at")
+            .values_list("pk", flat=True)
+            .first()
+        )
+        if job_id is None:
+            return False
+        return self.run_job(job_id)
+
+    # noinspection PyMethodMayBeStatic
+    def run_job(self, job_id) -> bool:
+        now = timezone.now()
+        claimed = MoodleSyncJob.objects.filter(
+            pk=job_id, status=MoodleSyncJob.STATUS_QUEUED
+        ).update(status=MoodleSyncJob.STATUS_RUNNING, started_at=now, heartbeat_at=now)
+        if not claimed:
+            return False
+        job = MoodleSyncJob.objects.get(pk=job_id)
+        finished = {"status": MoodleSyncJob.STATUS_FINISHED}
+        try:
+            result, execution_time = MoodleService(
+                full_resync=job.full_resync
+            ).update_licenses(
+                job.course_ids,
+                job.ignore_year,
+                progress=MoodleSyncJobProgress(job_id),
+            )
+            finished.update(result=result, execution_time=execution_time)
+        except Exception as exception:
+            logger.exception("Moodle sync job %s failed", job_id)
+            finished.update(status=MoodleSyncJob.STATUS_FAILED, error=str(exception))
+        # a job failed as stale meanwhile keeps its status
+        if not MoodleSyncJob.objects.filter(
+            pk=job_id, status=MoodleSyncJob.STATUS_RUNNING
+        ).update(active_slot=None, finished_at=timezone.now(), **finished):
+            logger.warning("Moodle sync job %s was no longer running", job_id)
+        return True
+
+    def _start_thread(self, job_id):
+        def run():
+            try:
+                self.run_job(job_id)
+            finally:
+                connections.close_all()
+
+        threading.Thread(
+            target=run, name=f"moodle-sync-job-{job_id}", daemon=True
+        ).start()
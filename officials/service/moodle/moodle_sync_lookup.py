@@ -0,0 +1,154 @@
+import threading
+
+from gamedays.models import Association, Team
+from gamedays.service.change_counter_service import post_bulk_write
+from officials.models import Official, OfficialLicenseHistory
+
+OFFICIAL_SYNC_FIELDS = ["first_name", "last_name", "team", "association"]
+
+
+class MoodleSyncLookup:
+    """In-memory lookup maps for one license sync run.
+
+    Teams, associations and officials are loaded once per run, the license
+    history lazily once per course year. Course threads share one instance, so
+    every read-modify-write has to happen while holding ``lock``.
+    """
+
+    def __init__(self, teams=(), associations=(), officials=()):
+        self.lock = threading.RLock()
+        self._teams_by_description = {}
+        for team in teams:
+            self._teams_by_description.setdefault(team.description, team)
+        self._associations_by_name = {}
+        for association in associations:
+            self._associations_by_name.setdefault(association.name, association)
+        self._officials_by_external_id = {
+            str(official.external_id): official for official in officials
+        }
+        self._saved_official_values = {
+            external_id: self._get_official_values(official)
+            for external_id, official in self._officials_by_external_id.items()
+        }
+        self._license_history_by_year = {}
+
+    @classmethod
+    def load(cls) -> "MoodleSyncLookup":
+        return cls(
+            teams=Team.objects.order_by("pk"),
+            associations=Association.objects.order_by("pk"),
+            officials=Official.objects.filter(external_id__isnull=False)
+            .select_related("team", "association")
+            .order_by("pk"),
+        )
+
+    def get_team(self, description) -> Team | None:
+        return self._teams_by_description.get(description)
+
+    def get_association(self, name) -> Association:
+        try:
+            return self._associations_by_name[name]
+        except KeyError:
+            raise Association.DoesNotExist(f"Association '{name}' not found")
+
+    def get_official(self, external_id) -> Official | None:
+        return self._officials_by_external_id.get(str(external_id))
+
+    def get_license_history(
+        self, official_id, year, license_id
+    ) -> OfficialLicenseHistory | None:
+        return self._get_license_history_of_year(year).get((official_id, license_id))
+
+    def add_official(self, official: Official):
+        self._officials_by_external_id[str(official.external_id)] = official
+
+    def add_license_history(self, year, history: OfficialLicenseHistory):
+        self._get_license_history_of_year(year)[
+            (history.official_id, history.license_id)
+        ] = history
+
+    @staticmethod
+    def _get_official_values(official: Official) -> dict:
+        return {
+            field: getattr(official, Official._meta.get_field(field).attname)
+            for field in OFFICIAL_SYNC_FIELDS
+        }
+
+    def save_officials(self, officials: list[Official]):
+        """Updates the changed officials and creates the new ones. As bulk
+        writes send no post_save, ``post_bulk_write`` is sent with the fields
+        that changed."""
+        officials = list({id(official): official for official in officials}.values())
+        changed_officials = []
+        changed_fields = set()
+        for official in officials:
+            if official.pk is None:
+                continue
+            values = self._get_official_values(official)
+            saved_values = self._saved_official_values.get(
+                str(official.external_id), {}
+            )
+            fields = {
+                field
+                for field in OFFICIAL_SYNC_FIELDS
+                if values[field] != saved_values.get(field)
+            }
+            if fields:
+                changed_officials += [official]
+                changed_fields |= fields
+        Official.objects.bulk_update(changed_officials, OFFICIAL_SYNC_FIELDS)
+        if changed_fields:
+            post_bulk_write.send(
+                sender=Official,
+                gameday_id=None,
+                created=False,
+                update_fields=frozenset(changed_fields),
+            )
+        created = Official.objects.bulk_create(
+            [official for official in officials if official.pk is None]
+        )
+        if any(official.pk is None for official in created):
+            # not every backend returns the primary keys of bulk inserted rows
+            pks = dict(
+                Official.objects.filter(
+                    external_id__in=[official.external_id for official in created]
+                ).values_list("external_id", "pk")
+            )
+            for official in created:
+                official.pk = pks[official.external_id]
+        for official in officials:
+            self._saved_official_values[str(official.external_id)] = (
+                self._get_official_values(official)
+            )
+
+    def save_license_histories(self, year, histories: list[OfficialLicenseHistory]):
+        histories = list({id(history): history for history in histories}.values())
+        OfficialLicenseHistory.objects.bulk_update(
+            [history for history in histories if history.pk is not None], ["result"]
+        )
+        created = OfficialLicenseHistory.objects.bulk_create(
+            [history for history in histories if history.pk is None]
+        )
+        if any(history.pk is None for history in created):
+            pks = {
+                (official_id, license_id): pk
+                for pk, official_id, license_id in OfficialLicenseHistory.objects.filter(
+                    official_id__in={history.official_id for history in created},
+                    created_at__year=year,
+                )
+                .order_by("pk")
+                .values_list("pk", "official_id", "license_id")
+            }
+            for history in created:
+                history.pk = pks[(history.official_id, history.license_id)]
+
+    def _get_license_history_of_year(self, year) -> dict:
+        histories_of_year = self._license_history_by_year.get(year)
+        if histories_of_year is None:
+            histories_of_year = {}
+            for history in OfficialLicenseHistory.objects.in_year(year).order_by("pk"):
+                histories_of_year.setdefault(
+                    (history.official_id, history.license_id), history
+                )
+            self._license_history_by_year[year] = histories_of_year
+        return histories_of_year
@@ -0,0 +1,101 @@
+from django.db import transaction
+from django.db.models import Count, Q, Sum, QuerySet
+from django.db.models.functions import ExtractYear
+
+from gamedays.models import GameOfficial
+from officials.models import Official, OfficialExternalGames, OfficialSeasonGameCount
+
+SCORECARD_JUDGE = "Scorecard Judge"
+INTERNAL_POSITIONS = {
+    "internal_referee": "Referee",
+    "internal_down_judge": "Down Judge",
+    "internal_field_judge": "Field Judge",
+    "internal_side_judge": "Side Judge",
+}
+EXTERNAL_POSITIONS = {
+    "external_referee": "Referee",
+    "external_down_judge": "Down Judge",
+    "external_field_judge": "Field Judge",
+    "external_side_judge": "Side Judge",
+    "external_mix": "Mix",
+}
+
+
+def build_season_game_counts(
+    game_officials: QuerySet, external_games: QuerySet, game_count_model
+) -> list:
+    """Aggregates the given game official and external game entries into one
+    unsaved ``game_count_model`` instance per official and season."""
+    rows = {}
+
+    def get_row(official_id, season):
+        if (official_id, season) not in rows:
+            rows[(official_id, season)] = game_count_model(
+                official_id=official_id, season=season
+            )
+        return rows[(official_id, season)]
+
+    internal_counts = (
+        game_officials.filter(official__isnull=False)
+        .order_by()
+        .values("official_id", season=ExtractYear("gameinfo__gameday__date"))
+        .annotate(
+            internal_overall=Count("pk", filter=~Q(position=SCORECARD_JUDGE)),
+            **{
+                field: Count("pk", filter=Q(position=position))
+                for field, position in INTERNAL_POSITIONS.items()
+            },
+        )
+    )
+    for entry in internal_counts:
+        row = get_row(entry.pop("official_id"), entry.pop("season"))
+        for field, value in entry.items():
+            setattr(row, field, value)
+
+    calculated_number_games = OfficialExternalGames.calculated_games_expression()
+    external_counts = (
+        external_games.order_by()
+        .values("official_id", season=ExtractYear("date"))
+        .annotate(
+            external_total=Sum(calculated_number_games),
+            **{
+                field: Sum(calculated_number_games, filter=Q(position=position))
+                for field, position in EXTERNAL_POSITIONS.items()
+            },
+        )
+    )
+    for entry in external_counts:
+        row = get_row(entry.pop("official_id"), entry.pop("season"))
+        for field, value in entry.items():
+            setattr(row, field, value or 0)
+    return list(rows.values())
+
+
+class OfficialGameCountService:
+    REBUILD_CHUNK_SIZE = 500
+
+    # noinspection PyMethodMayBeStatic
+    def refresh(self, official_ids):
+        official_ids = {
+            official_id for official_id in official_ids if official_id is not None
+        }
+        if not official_ids:
+            return
+        rows = build_season_game_counts(
+            GameOfficial.objects.filter(official_id__in=official_ids),
+            OfficialExternalGames.objects.filter(official_id__in=official_ids),
+            OfficialSeasonGameCount,
+        )
+        with transaction.atomic():
+            OfficialSeasonGameCount.objects.filter(
+                official_id__in=official_ids
+            ).delete()
+            OfficialSeasonGameCount.objects.bulk_create(rows)
+
+    def rebuild(self) -> int:
+        official_ids = list(
+            Official.objects.order_by("pk").values_list("pk", flat=True)
+        )
+        for start in range(0, len(official_ids), self.REBUILD_CHUNK_SIZE):
+            self.refresh(official_ids[start : start + self.REBUILD_CHUNK_SIZE])
+        return len(official_ids)
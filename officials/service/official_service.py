@@ -1,10 +1,8 @@
-from django.db.models import Sum, Prefetch, Q
-from django.db.models.functions import Coalesce
+from django.db.models import Sum, Prefetch
 
-from gamedays.models import GameOfficial
 from gamedays.service.team_repository_service import TeamRepositoryService
 from officials.api.serializers import OfficialGameCountSerializer
-from officials.models import Official, OfficialExternalGames
+from officials.models import Official, OfficialSeasonGameCount
 from officials.service.game_official_entries import (
     InternalGameOfficialEntry,
     ExternalGameOfficialEntry,
@@ -22,20 +20,15 @@ class OfficialService:
     def get_all_officials_with_team_infos(self, team_id, season, is_staff):
         team_repository_service = TeamRepositoryService(team_id)
 
-        game_official_prefetch = Prefetch(
-            'gameofficial_set',
-            queryset=GameOfficial.objects.filter(
-                gameinfo__gameday__date__year=season
-            ).select_related('gameinfo__gameday')
-        )
-        external_games_prefetch = Prefetch(
-            'officialexternalgames_set',
-            queryset=OfficialExternalGames.objects.filter(date__year=season)
+        season_game_count_prefetch = Prefetch(
+            'officialseasongamecount_set',
+            queryset=OfficialSeasonGameCount.objects.filter(season=season),
+            to_attr=OfficialGameCountSerializer.SEASON_GAME_COUNTS,
         )
 
         all_team_officials = (
             Official.objects.select_related('team')
-            .prefetch_related(game_official_prefetch, external_games_prefetch, 'officiallicensehistory_set')
+            .prefetch_related(season_game_count_prefetch, 'officiallicensehistory_set')
             .filter(
                 officiallicensehistory__created_at__gte=f"{season - 1}-10-01",
                 officiallicensehistory__created_at__lte=f"{season}-12-31",
@@ -96,11 +89,12 @@ class OfficialService:
         moodle_service = MoodleService()
         course = moodle_service.get_course_by_id(course_id)
         external_ids: [] = moodle_service.get_all_users_for_course(course_id)
-        officials = list(
-            self.official_repository_service.get_officials_game_count_for_license(
+        officials = [
+            self._get_license_check_values(official)
+            for official in self.official_repository_service.get_officials_game_count_for_license(
                 course.get_date(), external_ids
-            ).values(*OfficialLicenseCheckSerializer.ALL_FIELD_VALUES)
-        )
+            )
+        ]
         for official in officials:
             external_ids.remove(int(official["external_id"]))
         for current_external_id in external_ids:
@@ -114,6 +108,18 @@ class OfficialService:
             course,
         )
 
+    # noinspection PyMethodMayBeStatic
+    def _get_license_check_values(self, official: Official) -> dict:
+        values = {
+            field: getattr(official, field)
+            for field in OfficialLicenseCheckSerializer.ALL_FIELD_VALUES
+            if field != OfficialLicenseCheckSerializer.TEAM_DESCRIPTION
+        }
+        values[OfficialLicenseCheckSerializer.TEAM_DESCRIPTION] = (
+            official.team.description
+        )
+        return values
+
     def _get_official_not_in_database(self, external_id):
         return {
             "external_id": f"{external_id}",
@@ -1,20 +1,15 @@
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import date, datetime, timedelta
 
-from django.db.models import (
-    Sum,
-    Count,
-    Q,
-    OuterRef,
-    Subquery,
-    Value,
-    FloatField,
-    CharField,
-    F,
-)
-from django.db.models.functions import Coalesce
+from django.db.models import Sum, Count, Q, FloatField, F
 
-from officials.models import Official, OfficialLicenseHistory, OfficialExternalGames
-from officials.service.funcs import GroupConcat
+from gamedays.models import GameOfficial
+from officials.models import (
+    Official,
+    OfficialLicenseHistory,
+    OfficialExternalGames,
+    OfficialSeasonGameCount,
+)
 
 
 class OfficialsRepositoryService:
@@ -24,161 +19,138 @@ class OfficialsRepositoryService:
         latest_date: datetime,
         external_ids: list[str],
         license_ids: list[int] = (1, 3),
-    ):
-        officials = (
+    ) -> list[Official]:
+        """Returns the officials with the given external ids, annotated with
+        ``license_years``, ``license_name``, ``license_id``, ``total_games`` and
+        ``total_season_games``.
+
+        Completed seasons are read from ``OfficialSeasonGameCount``, only the
+        games of the last 365 days before ``latest_date`` are counted from the
+        game entries - each with one grouped query for all officials.
+        """
+        latest_date = self._to_date(latest_date)
+        officials = list(
             Official.objects.filter(external_id__in=external_ids)
-            # TODO: move into QuerySet
-            .annotate(
-                license_years=Coalesce(
-                    Subquery(
-                        OfficialLicenseHistory.objects.filter(
-                            official=OuterRef("pk"), license_id__in=license_ids
-                        )
-                        .annotate(year=F("created_at__year"))
-                        .values("official")
-                        .annotate(
-                            years=GroupConcat(F("year"), ordering="created_at ASC")
-                        )
-                        .values("years"),
-                        output_field=CharField(),
-                    ),
-                    Value("-", output_field=CharField()),
-                ),
-                license_name=Coalesce(
-                    Subquery(self._license_name_subquery(latest_date.year)), Value("-")
-                ),
-                license_id=Subquery(self._license_id_subquery(latest_date.year)),
-                total_games=Subquery(self._internal_games_subquery(latest_date))
-                + Subquery(self._external_games_subquery(latest_date)),
-                total_season_games=Subquery(
-                    self._current_season_external_subquery(latest_date)
-                )
-                + Subquery(self._current_season_internal_subquery(latest_date)),
-            ).order_by("last_name")
+            .select_related("team")
+            .order_by("last_name")
         )
-
-        return officials
-
-    @classmethod
-    def _generic_games_subquery_with_calculation(cls, query_filter: Q):
-        """
-        Subquery that calculates and sums `calculated_number_games` for official external games.
-        """
-        calculated_number_games = OfficialExternalGames.calculated_games_expression(
-            "officialexternalgames__"
+        official_ids = [official.pk for official in officials]
+        license_years, license_of_year = self._get_license_infos(
+            official_ids, set(license_ids), latest_date.year - 1
         )
-
-        return (
-            Official.objects.filter(pk=OuterRef("pk"))
-            .annotate(
-                games=Coalesce(
-                    Sum(
-                        calculated_number_games,
-                        filter=query_filter,
-                        output_field=FloatField(),
-                    ),
-                    Value(0),
-                    output_field=FloatField(),
-                )
+        history_games = self._history_games(official_ids, latest_date.year)
+        internal_games = self._recent_internal_games(official_ids, latest_date)
+        external_games = self._recent_external_games(official_ids, latest_date)
+        for official in officials:
+            official.license_years = license_years.get(official.pk, "-")
+            official.license_id, official.license_name = license_of_year.get(
+                official.pk, (None, "-")
             )
-            .values("games")[:1]
-        )
-
-    @staticmethod
-    def _license_subquery(year: int, field: str):
-        """
-        Helper method to create subqueries for license name or ID in a specific year.
-
-        :param year: The target year for the query filter.
-        :param field: The specific field to retrieve (e.g., 'license__name' or 'license__pk').
-        :return: Subquery to retrieve the desired field for the license in the specified year.
-        """
-        return OfficialLicenseHistory.objects.filter(
-            official=OuterRef("pk"), created_at__year=year
-        ).values(field)[:1]
+            internal = internal_games.get(official.pk, {})
+            external = external_games.get(official.pk, {})
+            official.total_games = (
+                history_games.get(official.pk, 0)
+                + internal.get("current_year", 0)
+                + (external.get("current_year") or 0)
+            )
+            official.total_season_games = internal.get("season", 0) + (
+                external.get("season") or 0
+            )
+        return officials
 
     @staticmethod
-    def _license_name_subquery(year: int):
-        return OfficialsRepositoryService._license_subquery(
-            year=year - 1, field="license__name"
-        )
+    def _to_date(value) -> date:
+        if isinstance(value, datetime):
+            return value.date()
+        return value
 
     @staticmethod
-    def _license_id_subquery(year: int):
-        return OfficialsRepositoryService._license_subquery(
-            year=year - 1, field="license__pk"
-        )
+    def _get_license_infos(official_ids, license_ids, license_year):
+        """Returns the comma separated license years and the license of
+        ``license_year`` per official."""
+        years = defaultdict(list)
+        license_of_year = {}
+        for official_id, created_at, license_id, license_name in (
+            OfficialLicenseHistory.objects.filter(official_id__in=official_ids)
+            .order_by("pk")
+            .values_list("official_id", "created_at", "license_id", "license__name")
+        ):
+            if license_id in license_ids:
+                years[official_id] += [created_at]
+            if created_at.year == license_year:
+                license_of_year.setdefault(official_id, (license_id, license_name))
+        license_years = {
+            official_id: ",".join(
+                str(created_at.year) for created_at in sorted(created_ats)
+            )
+            for official_id, created_ats in years.items()
+        }
+        return license_years, license_of_year
 
     @staticmethod
-    def _generic_games_subquery(
-        field: str, aggregation, query_filter: Q, exclude_scorecard_judge: bool = False
-    ):
-        """
-        Helper method to generate subqueries for various game counts.
-
-        :param field: The field to aggregate on.
-        :param aggregation: Aggregation function (Sum, Count, etc.)
-        :param query_filter: The query filter to filter down the aggregation.
-        :param exclude_scorecard_judge: Boolean indicating if Scorecard Judge positions should be excluded.
-        :return: Subquery for the aggregated games count.
-        """
-        if exclude_scorecard_judge:
-            query_filter &= ~Q(gameofficial__position="Scorecard Judge")
-
-        return (
-            Official.objects.filter(pk=OuterRef("pk"))
-            .annotate(games=Coalesce(aggregation(field, filter=query_filter), Value(0)))
-            .values("games")[:1]
+    def _history_games(official_ids, before_season) -> dict:
+        return dict(
+            OfficialSeasonGameCount.objects.filter(
+                official_id__in=official_ids, season__lt=before_season
+            )
+            .values("official_id")
+            .annotate(
+                games=Sum(
+                    F("internal_overall") + F("external_total"),
+                    output_field=FloatField(),
+                )
+            )
+            .values_list("official_id", "games")
         )
 
     @classmethod
-    def _external_games_subquery(cls, date: datetime):
-        return cls._generic_games_subquery_with_calculation(
-            query_filter=Q(officialexternalgames__date__lte=date)
-        )
+    def _recent_internal_games(cls, official_ids, latest_date: date) -> dict:
+        year_start = date(latest_date.year, 1, 1)
+        season_start = cls.sub_one_year_from(latest_date)
+        return {
+            entry.pop("official_id"): entry
+            for entry in GameOfficial.objects.filter(
+                official_id__in=official_ids,
+                gameinfo__gameday__date__gte=min(year_start, season_start),
+                gameinfo__gameday__date__lte=latest_date,
+            )
+            .exclude(position="Scorecard Judge")
+            .order_by()
+            .values("official_id")
+            .annotate(
+                current_year=Count(
+                    "pk", filter=Q(gameinfo__gameday__date__gte=year_start)
+                ),
+                season=Count("pk", filter=Q(gameinfo__gameday__date__gte=season_start)),
+            )
+        }
 
     @classmethod
-    def _current_season_external_subquery(cls, date: datetime):
-        return cls._generic_games_subquery_with_calculation(
-            query_filter=(
-                Q(officialexternalgames__date__lte=date)
-                & Q(
-                    officialexternalgames__date__gte=OfficialsRepositoryService.sub_one_year_from(
-                        date
-                    )
-                )
+    def _recent_external_games(cls, official_ids, latest_date: date) -> dict:
+        year_start = date(latest_date.year, 1, 1)
+        season_start = cls.sub_one_year_from(latest_date)
+        calculated_number_games = OfficialExternalGames.calculated_games_expression()
+        return {
+            entry.pop("official_id"): entry
+            for entry in OfficialExternalGames.objects.filter(
+                official_id__in=official_ids,
+                date__gte=min(year_start, season_start),
+                date__lte=latest_date,
             )
-        )
+            .order_by()
+            .values("official_id")
+            .annotate(
+                current_year=Sum(
+                    calculated_number_games, filter=Q(date__gte=year_start)
+                ),
+                season=Sum(calculated_number_games, filter=Q(date__gte=season_start)),
+            )
+        }
 
     @classmethod
     def sub_one_year_from(cls, date: datetime):
         return date - timedelta(days=365)
 
-    @classmethod
-    def _internal_games_subquery(cls, date: datetime):
-        return cls._generic_games_subquery(
-            field="gameofficial",
-            query_filter=Q(gameofficial__gameinfo__gameday__date__lte=date),
-            aggregation=Count,
-            exclude_scorecard_judge=True,
-        )
-
-    @classmethod
-    def _current_season_internal_subquery(cls, date: datetime):
-        return cls._generic_games_subquery(
-            field="gameofficial",
-            query_filter=(
-                Q(gameofficial__gameinfo__gameday__date__lte=date)
-                & Q(
-                    gameofficial__gameinfo__gameday__date__gte=OfficialsRepositoryService.sub_one_year_from(
-                        date
-                    )
-                )
-            ),
-            aggregation=Count,
-            exclude_scorecard_judge=True,
-        )
-
     # noinspection PyMethodMayBeStatic
     def get_all_years_with_team_official_licenses(self, team):
         return (
@@ -0,0 +1,172 @@
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from gamedays.models import GameOfficial, Gameday, Gameinfo, Gameresult, Team
+from gamedays.service.change_counter_service import post_bulk_write
+from officials.models import OfficialExternalGames, Official
+from officials.service.game_official_list_service import GameOfficialListVersion
+from officials.service.official_game_count_service import OfficialGameCountService
+
+PREVIOUS_STATE = "_game_count_previous_state"
+# fields shown in the game official list (GameOfficialAllInfoSerializer)
+GAME_OFFICIAL_LIST_FIELDS = {
+    Gameinfo: {"gameday", "standing", "officials"},
+    Official: {"first_name", "last_name", "team"},
+    Team: {"name", "description"},
+}
+# fields that decide in which years a team's game officials are listed
+GAME_OFFICIAL_YEARS_FIELDS = {
+    Gameinfo: {"gameday", "officials"},
+    Official: {"team"},
+    Team: set(),
+}
+
+
+def _changed_fields(fields: set, update_fields) -> set:
+    if update_fields is None:
+        return fields
+    return fields & {field.removesuffix("_id") for field in update_fields}
+
+
+@receiver(pre_save, sender=GameOfficial)
+def remember_previous_game_official(sender, instance: GameOfficial, raw=False, **kwargs):
+    if raw or instance.pk is None:
+        return
+    setattr(
+        instance,
+        PREVIOUS_STATE,
+        GameOfficial.objects.filter(pk=instance.pk)
+        .values_list("official_id", "gameinfo_id", "position")
+        .first(),
+    )
+
+
+@receiver(post_save, sender=GameOfficial)
+def update_game_counts_for_game_official(
+    sender, instance: GameOfficial, raw=False, **kwargs
+):
+    if raw:
+        return
+    previous_state = getattr(instance, PREVIOUS_STATE, None)
+    if previous_state == (instance.official_id, instance.gameinfo_id, instance.position):
+        # the scorecard saves all positions again on every submit
+        return
+    previous_official_id = None if previous_state is None else previous_state[0]
+    OfficialGameCountService().refresh({instance.official_id, previous_official_id})
+
+
+@receiver(pre_save, sender=OfficialExternalGames)
+def remember_previous_external_games_official(
+    sender, instance: OfficialExternalGames, raw=False, **kwargs
+):
+    if raw or instance.pk is None:
+        return
+    setattr(
+        instance,
+        PREVIOUS_STATE,
+        OfficialExternalGames.objects.filter(pk=instance.pk)
+        .values_list("official_id", flat=True)
+        .first(),
+    )
+
+
+@receiver(post_save, sender=OfficialExternalGames)
+def update_game_counts_for_external_games(
+    sender, instance: OfficialExternalGames, raw=False, **kwargs
+):
+    if raw:
+        return
+    OfficialGameCountService().refresh(
+        {instance.official_id, getattr(instance, PREVIOUS_STATE, None)}
+    )
+
+
+@receiver(post_delete, sender=GameOfficial)
+@receiver(post_delete, sender=OfficialExternalGames)
+def update_game_counts_after_delete(sender, instance, **kwargs):
+    # deferred: when the official itself is deleted, the cascade must not
+    # recreate game counts for it
+    official_id = instance.official_id
+    transaction.on_commit(lambda: OfficialGameCountService().refresh({official_id}))
+
+
+@receiver(pre_save, sender=Gameday)
+def remember_previous_gameday_date(sender, instance: Gameday, raw=False, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    previous_date = None
+    if not raw and instance.pk is not None and (
+        update_fields is None or "date" in update_fields
+    ):
+        previous_date = (
+            Gameday.objects.filter(pk=instance.pk).values_list("date", flat=True).first()
+        )
+    setattr(instance, PREVIOUS_STATE, previous_date)
+
+
+@receiver(post_save, sender=Gameday)
+def update_game_counts_for_gameday_date(
+    sender, instance: Gameday, raw=False, **kwargs
+):
+    previous_date = getattr(instance, PREVIOUS_STATE, None)
+    if raw or previous_date is None or str(previous_date) == str(instance.date):
+        return
+    OfficialGameCountService().refresh(
+        GameOfficial.objects.filter(
+            gameinfo__gameday=instance, official__isnull=False
+        ).values_list("official_id", flat=True)
+    )
+
+
+@receiver(post_save, sender=GameOfficial)
+@receiver(post_delete, sender=GameOfficial)
+def invalidate_game_official_list_for_game_official(sender, **kwargs):
+    GameOfficialListVersion.bump(years=True)
+
+
+@receiver(post_save, sender=Gameday)
+def invalidate_game_official_list_for_gameday(
+    sender, instance: Gameday, created=False, update_fields=None, **kwargs
+):
+    if created or not _changed_fields({"date", "name"}, update_fields):
+        return
+    previous_date = getattr(instance, PREVIOUS_STATE, None)
+    GameOfficialListVersion.bump(
+        years=previous_date is not None and str(previous_date) != str(instance.date)
+    )
+
+
+@receiver(post_save, sender=Gameinfo)
+@receiver(post_bulk_write, sender=Gameinfo)
+@receiver(post_save, sender=Official)
+@receiver(post_bulk_write, sender=Official)
+@receiver(post_save, sender=Team)
+def invalidate_game_official_list(
+    sender, created=False, update_fields=None, **kwargs
+):
+    # new games, officials and teams have no game officials yet; live status
+    # and time updates of games save with update_fields and change nothing
+    # listed
+    if created:
+        return
+    if _changed_fields(GAME_OFFICIAL_LIST_FIELDS[sender], update_fields):
+        GameOfficialListVersion.bump(
+            years=bool(_changed_fields(GAME_OFFICIAL_YEARS_FIELDS[sender], update_fields))
+        )
+
+
+@receiver(post_delete, sender=Gameday)
+@receiver(post_delete, sender=Gameinfo)
+@receiver(post_delete, sender=Official)
+def invalidate_game_official_list_after_delete(sender, **kwargs):
+    GameOfficialListVersion.bump(years=True)
+
+
+@receiver(post_save, sender=Gameresult)
+@receiver(post_delete, sender=Gameresult)
+@receiver(post_bulk_write, sender=Gameresult)
+def invalidate_game_official_list_for_gameresult(sender, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    # score updates during a game do not change the listed home and away teams
+    if update_fields is None or "team" in update_fields:
+        GameOfficialListVersion.bump()
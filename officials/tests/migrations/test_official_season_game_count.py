@@ -0,0 +1,24 @@
+import importlib
+
+from django.apps import apps
+from django.test import TestCase
+
+from officials.models import OfficialSeasonGameCount
+from officials.tests.service.test_official_game_count_service import get_game_counts
+from officials.tests.setup_factories.db_setup_officials import DbSetupOfficials
+
+_migration = importlib.import_module(
+    "officials.migrations.0018_official_season_game_count"
+)
+
+
+class TestPopulateSeasonGameCounts(TestCase):
+    def test_populates_the_counts_maintained_on_write(self):
+        DbSetupOfficials().create_officials_full_setup()
+        DbSetupOfficials().create_external_officials_entries()
+        maintained = get_game_counts()
+        OfficialSeasonGameCount.objects.all().delete()
+
+        _migration.populate_season_game_counts(apps, schema_editor=None)
+
+        assert get_game_counts() == maintained
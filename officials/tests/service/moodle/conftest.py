@@ -0,0 +1,14 @@
+import pytest
+
+from officials.tests.service.moodle.moodle_stub_server import MoodleStubServer
+
+
+@pytest.fixture
+def moodle_stub_server(settings):
+    """Start a local stand-in Moodle server and point the Moodle settings to it."""
+    server = MoodleStubServer().start()
+    settings.MOODLE_URL = server.url
+    settings.MOODLE_WSTOKEN = "stub-token"
+    settings.MOODLE_HTTP_BACKOFF_FACTOR = 0
+    yield server
+    server.stop()
@@ -0,0 +1,161 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+class MoodleStubServer:
+    """Local stand-in for the Moodle web service REST endpoint.
+
+    Serves canned json for the web service functions used by ``MoodleApi`` with
+    a configurable artificial latency, and counts requests and TCP connections
+    so pooling, caching and parallelism can be checked and benchmarked offline.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.courses = []
+        self.participants = {}
+        self.quizzes = {}
+        self.attempts = {}
+        self.users = {}
+        self.failures_before_success = 0
+        self.requests = []
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._create_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def add_course(self, course_id, category_id=4, end_date=None, name=None):
+        self.courses.append(
+            {
+                "id": course_id,
+                "categoryid": category_id,
+                "enddate": end_date if end_date is not None else time.time(),
+                "fullname": name or f"Course {course_id}",
+            }
+        )
+
+    def add_participant(
+        self, course_id, user_id, team_description, sumgrades=None, timefinish=None
+    ):
+        self.participants.setdefault(course_id, []).append(
+            {
+                "id": user_id,
+                "firstname": f"First {user_id}",
+                "lastname": f"Last {user_id}",
+                "customfields": [
+                    {"shortname": "teamname", "value": team_description},
+                    {"shortname": "teamid", "value": "-1"},
+                    {"shortname": "Landesverband", "value": "Nein."},
+                ],
+                "roles": [{"roleid": 5}],
+            }
+        )
+        for quiz in self.quizzes.get(course_id, []):
+            self.set_attempt(quiz["id"], user_id, sumgrades, timefinish)
+
+    def set_attempt(self, quiz_id, user_id, sumgrades, timefinish=None):
+        attempts = []
+        if sumgrades is not None:
+            attempts = [
+                {"sumgrades": sumgrades, "timefinish": timefinish or int(time.time())}
+            ]
+        self.attempts[(quiz_id, user_id)] = {"attempts": attempts}
+
+    def add_exam(self, course_id, quiz_id, grade=100):
+        self.quizzes.setdefault(course_id, []).append(
+            {
+                "id": quiz_id,
+                "course": course_id,
+                "grade": grade,
+                "name": "Lizenzprüfung",
+            }
+        )
+
+    def count_requests(self, wsfunction) -> int:
+        with self._lock:
+            return sum(1 for request in self.requests if request == wsfunction)
+
+    def _handle(self, params: dict):
+        wsfunction = params.get("wsfunction", [""])[0]
+        with self._lock:
+            self.requests.append(wsfunction)
+            if self.failures_before_success > 0:
+                self.failures_before_success -= 1
+                return 503, {"exception": "service unavailable"}
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return self._respond(wsfunction, params)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _respond(self, wsfunction, params: dict):
+        if self.latency:
+            time.sleep(self.latency)
+        if wsfunction == "core_course_get_courses_by_field":
+            ids = params.get("value", [""])[0]
+            courses = self.courses
+            if ids:
+                wanted = {int(course_id) for course_id in ids.split(",")}
+                courses = [course for course in courses if course["id"] in wanted]
+            return 200, {"courses": courses, "warnings": []}
+        if wsfunction == "core_enrol_get_enrolled_users":
+            return 200, self.participants.get(int(params["courseid"][0]), [])
+        if wsfunction == "mod_quiz_get_quizzes_by_courses":
+            course_id = int(params["courseids[0]"][0])
+            return 200, {"quizzes": self.quizzes.get(course_id, []), "warnings": []}
+        if wsfunction == "mod_quiz_get_user_attempts":
+            key = (int(params["quizid"][0]), int(params["userid"][0]))
+            return 200, self.attempts.get(key, {"attempts": []})
+        if wsfunction == "core_user_update_users":
+            return 200, None
+        if wsfunction == "core_user_get_users_by_field":
+            user_id = int(params["values[0]"][0])
+            return 200, [self.users.get(user_id, {"id": user_id})]
+        return 200, {"exception": "invalid_parameter_exception"}
+
+    def _create_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_GET(self):
+                status, body = stub._handle(parse_qs(urlparse(self.path).query))
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,77 @@
+import pytest
+
+from gamedays.tests.setup_factories.factories import TeamFactory
+from officials.models import OfficialLicenseHistory
+from officials.service.moodle.moodle_api import MoodleApi
+from officials.service.moodle.moodle_service import MoodleService
+from officials.tests.setup_factories.factories_officials import OfficialLicenseFactory
+
+
+class TestMoodleApiPooling:
+    def test_requests_reuse_pooled_connection(self, moodle_stub_server):
+        moodle_stub_server.add_course(1)
+        moodle_api = MoodleApi()
+        for _ in range(5):
+            moodle_api.get_participants_for_course(1)
+            moodle_api.get_exams_for_course(1)
+        assert moodle_stub_server.connections == 1
+
+    def test_identical_read_calls_are_served_from_cache(self, moodle_stub_server):
+        moodle_stub_server.add_course(1)
+        moodle_api = MoodleApi()
+        moodle_api.get_participants_for_course(1)
+        moodle_api.get_participants_for_course(1)
+        moodle_api.get_participants_for_course(2)
+        assert moodle_stub_server.count_requests("core_enrol_get_enrolled_users") == 2
+        moodle_api.clear_request_cache()
+        moodle_api.get_participants_for_course(1)
+        assert moodle_stub_server.count_requests("core_enrol_get_enrolled_users") == 3
+
+    def test_updates_are_never_cached(self, moodle_stub_server):
+        moodle_api = MoodleApi()
+        moodle_api._send_request("&wsfunction=core_user_update_users&users[0][id]=1")
+        moodle_api._send_request("&wsfunction=core_user_update_users&users[0][id]=1")
+        assert moodle_stub_server.count_requests("core_user_update_users") == 2
+
+    def test_failing_requests_are_retried(self, moodle_stub_server):
+        moodle_stub_server.add_course(1)
+        moodle_stub_server.failures_before_success = 2
+        moodle_api = MoodleApi()
+        courses = moodle_api.get_courses("1")
+        assert len(courses.get_all()) == 1
+        assert moodle_stub_server.count_requests("core_course_get_courses_by_field") == 3
+
+
+@pytest.mark.django_db
+class TestMoodleServiceWithStubServer:
+    NUMBER_OF_PARTICIPANTS = 12
+
+    def _setup_course(self, server, latency):
+        team = TeamFactory(description="Stub Team")
+        OfficialLicenseFactory(id=1, name="F1")
+        server.add_course(1, category_id=4)
+        server.add_exam(1, quiz_id=75)
+        for user_id in range(1, self.NUMBER_OF_PARTICIPANTS + 1):
+            server.add_participant(1, user_id, team.description, sumgrades=80)
+        server.latency = latency
+
+    def test_course_participants_are_processed_concurrently(
+        self, moodle_stub_server, settings
+    ):
+        latency = 0.1
+        self._setup_course(moodle_stub_server, latency)
+        settings.MOODLE_PARTICIPANT_WORKERS = 4
+        moodle_service = MoodleService()
+        course = moodle_service.get_course_by_id(1)
+        result = moodle_service.get_participants_from_course(course)
+        assert result[2]["officials_count"] == self.NUMBER_OF_PARTICIPANTS
+        assert OfficialLicenseHistory.objects.count() == self.NUMBER_OF_PARTICIPANTS
+        assert (
+            moodle_stub_server.count_requests("core_user_update_users")
+            == self.NUMBER_OF_PARTICIPANTS
+        )
+        # the stub's peak of requests in flight at once, the wall clock time
+        # is too noisy on a loaded machine
+        assert moodle_stub_server.max_in_flight > 1
+        assert moodle_stub_server.max_in_flight <= settings.MOODLE_PARTICIPANT_WORKERS
+        assert moodle_stub_server.connections <= settings.MOODLE_PARTICIPANT_WORKERS + 1
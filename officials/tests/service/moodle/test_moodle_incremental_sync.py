@@ -0,0 +1,84 @@
+import pytest
+
+from gamedays.tests.setup_factories.factories import TeamFactory
+from officials.models import (
+    OfficialLicenseHistory,
+    MoodleUserSyncWatermark,
+    MoodleCourseSyncWatermark,
+)
+from officials.service.moodle.moodle_service import MoodleService
+from officials.tests.setup_factories.factories_officials import OfficialLicenseFactory
+
+
+@pytest.mark.django_db(transaction=True)
+class TestMoodleIncrementalSync:
+    COURSE_ID = 1
+    QUIZ_ID = 75
+
+    def _setup_course(self, server):
+        team = TeamFactory(description="Stub Team")
+        OfficialLicenseFactory(id=1, name="F1")
+        OfficialLicenseFactory(id=3, name="F2")
+        server.add_course(self.COURSE_ID, category_id=4)
+        server.add_exam(self.COURSE_ID, quiz_id=self.QUIZ_ID)
+        server.add_participant(self.COURSE_ID, 1, team.description, 80, 1000)
+        server.add_participant(self.COURSE_ID, 2, team.description, 60, 1000)
+        server.add_participant(self.COURSE_ID, 3, team.description)
+
+    def _sync(self, full_resync=False):
+        return MoodleService().update_licenses(
+            str(self.COURSE_ID), full_resync=full_resync
+        )[0]
+
+    def test_first_run_processes_all_participants(self, moodle_stub_server):
+        self._setup_course(moodle_stub_server)
+        result = self._sync()
+        assert result["items_processed"] == 3
+        assert result["items_skipped"] == 0
+        assert MoodleUserSyncWatermark.objects.count() == 3
+        assert MoodleCourseSyncWatermark.objects.get(
+            course_id=self.COURSE_ID
+        ).processed_count == 3
+        assert moodle_stub_server.count_requests("core_user_update_users") == 2
+
+    def test_unchanged_participants_are_skipped(self, moodle_stub_server):
+        self._setup_course(moodle_stub_server)
+        self._sync()
+        result = self._sync()
+        assert result["items_processed"] == 0
+        assert result["items_skipped"] == 3
+        assert moodle_stub_server.count_requests("core_user_update_users") == 2
+
+    def test_changed_attempt_is_processed_again(self, moodle_stub_server):
+        self._setup_course(moodle_stub_server)
+        self._sync()
+        moodle_stub_server.set_attempt(self.QUIZ_ID, 2, 75, 2000)
+        result = self._sync()
+        assert result["items_processed"] == 1
+        assert result["items_skipped"] == 2
+        watermark = MoodleUserSyncWatermark.objects.get(
+            course_id=self.COURSE_ID, user_id=2
+        )
+        assert watermark.last_grade == 75
+        assert watermark.license_id == 1
+        assert moodle_stub_server.count_requests("core_user_update_users") == 3
+
+    def test_better_result_with_same_license_does_not_update_moodle(
+        self, moodle_stub_server
+    ):
+        self._setup_course(moodle_stub_server)
+        self._sync()
+        moodle_stub_server.set_attempt(self.QUIZ_ID, 1, 90, 2000)
+        result = self._sync()
+        assert result["items_processed"] == 1
+        assert OfficialLicenseHistory.objects.filter(result=90).count() == 1
+        assert moodle_stub_server.count_requests("core_user_update_users") == 2
+
+    def test_full_resync_processes_everything(self, moodle_stub_server):
+        self._setup_course(moodle_stub_server)
+        self._sync()
+        result = self._sync(full_resync=True)
+        assert result["full_resync"] is True
+        assert result["items_processed"] == 3
+        assert result["items_skipped"] == 0
+        assert moodle_stub_server.count_requests("core_user_update_users") == 4
@@ -0,0 +1,143 @@
+import time
+from datetime import timedelta
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from gamedays.tests.setup_factories.db_setup import DBSetup
+from gamedays.tests.setup_factories.factories import TeamFactory
+from officials.api.urls import API_OFFICIALS_MOODLE_SYNC_JOB
+from officials.models import MoodleSyncJob
+from officials.service.moodle.moodle_service import MoodleService
+from officials.service.moodle.moodle_sync_job_runner import (
+    MoodleSyncJobAlreadyRunning,
+    MoodleSyncJobProgress,
+    MoodleSyncJobRunner,
+)
+from officials.tests.setup_factories.factories_officials import OfficialLicenseFactory
+from officials.urls import OFFICIALS_MOODLE_REPORT, OFFICIALS_MOODLE_REPORT_JOB
+
+
+@override_settings(MOODLE_SYNC_JOB_IN_PROCESS=False)
+class TestMoodleSyncJobRunner(TestCase):
+    def test_second_job_is_refused_while_first_is_active(self):
+        runner = MoodleSyncJobRunner()
+        job = runner.submit("1")
+        with self.assertRaises(MoodleSyncJobAlreadyRunning) as context:
+            runner.submit("2")
+        assert context.exception.job == job
+        assert MoodleSyncJob.objects.count() == 1
+
+    def test_stale_job_does_not_block_next_submit(self):
+        runner = MoodleSyncJobRunner()
+        stale_job = runner.submit()
+        MoodleSyncJob.objects.filter(pk=stale_job.pk).update(
+            status=MoodleSyncJob.STATUS_RUNNING,
+            heartbeat_at=timezone.now() - timedelta(hours=1),
+        )
+        job = runner.submit()
+        stale_job.refresh_from_db()
+        assert stale_job.status == MoodleSyncJob.STATUS_FAILED
+        assert stale_job.active_slot is None
+        assert job.status == MoodleSyncJob.STATUS_QUEUED
+
+    @patch.object(MoodleService, "update_licenses")
+    def test_failing_sync_marks_job_failed(self, update_licenses_mock):
+        update_licenses_mock.side_effect = RuntimeError("moodle down")
+        runner = MoodleSyncJobRunner()
+        job = runner.submit()
+        assert runner.run_next()
+        job.refresh_from_db()
+        assert job.status == MoodleSyncJob.STATUS_FAILED
+        assert job.error == "moodle down"
+        assert not runner.run_next()
+        runner.submit()
+
+    @patch.object(MoodleService, "update_licenses")
+    def test_job_failed_as_stale_is_not_marked_finished(self, update_licenses_mock):
+        runner = MoodleSyncJobRunner()
+        job = runner.submit()
+
+        def fail_as_stale(*args, **kwargs):
+            MoodleSyncJob.objects.filter(pk=job.pk).update(
+                heartbeat_at=timezone.now() - timedelta(hours=1)
+            )
+            runner.fail_stale_jobs()
+            return {"items_processed": 0}, "0:00:01"
+
+        update_licenses_mock.side_effect = fail_as_stale
+        assert runner.run_next()
+        job.refresh_from_db()
+        assert job.status == MoodleSyncJob.STATUS_FAILED
+        assert job.result is None
+
+    def test_heartbeat_is_written_at_most_every_interval(self):
+        job = MoodleSyncJobRunner().submit()
+        long_ago = timezone.now() - timedelta(hours=1)
+        MoodleSyncJob.objects.filter(pk=job.pk).update(
+            status=MoodleSyncJob.STATUS_RUNNING, heartbeat_at=long_ago
+        )
+        progress = MoodleSyncJobProgress(job.pk)
+
+        progress.heartbeat()
+        job.refresh_from_db()
+        assert job.heartbeat_at == long_ago
+
+        with patch(
+            "officials.service.moodle.moodle_sync_job_runner.time.monotonic",
+            return_value=time.monotonic() + MoodleSyncJobProgress.HEARTBEAT_INTERVAL,
+        ):
+            progress.heartbeat()
+        job.refresh_from_db()
+        assert job.heartbeat_at > long_ago
+
+    def test_report_view_submits_job_and_redirects(self):
+        self.client.force_login(DBSetup().create_new_user("staff", is_staff=True))
+        response = self.client.get(reverse(OFFICIALS_MOODLE_REPORT) + "?ids=7")
+        job = MoodleSyncJob.objects.get()
+        assert job.course_ids == "7"
+        assert response.status_code == HTTPStatus.FOUND
+        assert response.url == reverse(OFFICIALS_MOODLE_REPORT_JOB, kwargs={"pk": job.pk})
+        assert self.client.get(response.url).status_code == HTTPStatus.OK
+        response = self.client.get(reverse(OFFICIALS_MOODLE_REPORT) + "?ids=8")
+        assert response.url == reverse(OFFICIALS_MOODLE_REPORT_JOB, kwargs={"pk": job.pk})
+        assert MoodleSyncJob.objects.count() == 1
+
+    def test_status_endpoint_needs_report_permission(self):
+        job = MoodleSyncJobRunner().submit()
+        url = reverse(API_OFFICIALS_MOODLE_SYNC_JOB, kwargs={"pk": job.pk})
+        self.client.force_login(DBSetup().create_new_user("user"))
+        assert self.client.get(url).status_code == HTTPStatus.FORBIDDEN
+        self.client.force_login(DBSetup().create_new_user("offd"))
+        response = self.client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["status"] == MoodleSyncJob.STATUS_QUEUED
+
+
+@pytest.mark.django_db(transaction=True)
+class TestMoodleSyncJobExecution:
+    def test_job_reports_progress_per_course(self, moodle_stub_server, settings):
+        settings.MOODLE_SYNC_JOB_IN_PROCESS = False
+        team = TeamFactory(description="Stub Team")
+        OfficialLicenseFactory(id=1, name="F1")
+        for course_id in (1, 2):
+            moodle_stub_server.add_course(course_id, category_id=4)
+            moodle_stub_server.add_exam(course_id, quiz_id=70 + course_id)
+            moodle_stub_server.add_participant(course_id, course_id, team.description, 80)
+        runner = MoodleSyncJobRunner()
+        job = runner.submit("1,2")
+        with patch.object(MoodleSyncJobProgress, "heartbeat") as heartbeat_mock:
+            assert runner.run_next()
+        # per participant and per exam result request at least
+        assert heartbeat_mock.call_count >= 4
+        job.refresh_from_db()
+        assert job.status == MoodleSyncJob.STATUS_FINISHED
+        assert job.active_slot is None
+        assert job.courses_total == job.courses_done == 2
+        assert [entry["officials_count"] for entry in job.progress] == [1, 1]
+        assert job.result["items_processed"] == 2
+        assert job.execution_time
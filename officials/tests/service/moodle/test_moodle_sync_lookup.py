@@ -0,0 +1,71 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from gamedays.tests.setup_factories.factories import TeamFactory
+from officials.models import Official, OfficialLicenseHistory
+from officials.service.game_official_list_service import GameOfficialListVersion
+from officials.service.moodle.moodle_service import MoodleService
+from officials.tests.setup_factories.factories_officials import OfficialLicenseFactory
+
+
+@pytest.mark.django_db(transaction=True)
+class TestMoodleSyncLookup:
+    QUIZ_ID = 75
+
+    @pytest.fixture(autouse=True)
+    def _licenses(self):
+        OfficialLicenseFactory(id=1, name="F1")
+        OfficialLicenseFactory(id=3, name="F2")
+
+    def _add_course(self, server, course_id, user_ids, category_id=4):
+        team = TeamFactory(description=f"Team {course_id}")
+        server.add_course(course_id, category_id=category_id)
+        server.add_exam(course_id, quiz_id=self.QUIZ_ID + course_id)
+        for user_id in user_ids:
+            server.add_participant(course_id, user_id, team.description, 80)
+
+    def _count_sync_queries(self, course_id) -> int:
+        service = MoodleService()
+        course = service.get_course_by_id(course_id)
+        with CaptureQueriesContext(connection) as queries:
+            service.get_participants_from_course(course)
+        return len(queries)
+
+    def test_queries_do_not_grow_with_participants(self, moodle_stub_server):
+        self._add_course(moodle_stub_server, 1, range(1, 3))
+        self._add_course(moodle_stub_server, 2, range(10, 18))
+        assert self._count_sync_queries(1) == self._count_sync_queries(2)
+        assert Official.objects.count() == 10
+        assert OfficialLicenseHistory.objects.count() == 10
+
+    def test_existing_official_and_license_are_updated(self, moodle_stub_server):
+        self._add_course(moodle_stub_server, 1, [7])
+        MoodleService().update_licenses("1")
+        moodle_stub_server.set_attempt(self.QUIZ_ID + 1, 7, 95)
+        MoodleService(full_resync=True).update_licenses("1")
+        official = Official.objects.get(external_id=7)
+        assert official.last_name == "Last 7"
+        assert OfficialLicenseHistory.objects.get(official=official).result == 95
+
+    def test_courses_of_same_year_share_official(self, moodle_stub_server):
+        self._add_course(moodle_stub_server, 1, [1, 2])
+        self._add_course(moodle_stub_server, 2, [1, 2], category_id=3)
+        result = MoodleService().update_licenses("1,2")[0]
+        assert result["items_processed"] == 4
+        assert Official.objects.count() == 2
+        assert set(
+            OfficialLicenseHistory.objects.values_list("official__external_id", "license_id")
+        ) == {("1", 1), ("2", 1), ("1", 3), ("2", 3)}
+
+    def test_changed_official_invalidates_game_official_list(self, moodle_stub_server):
+        self._add_course(moodle_stub_server, 1, [7])
+        MoodleService().update_licenses("1")
+        version = GameOfficialListVersion.get()
+        MoodleService(full_resync=True).update_licenses("1")
+        assert GameOfficialListVersion.get() == version
+
+        Official.objects.filter(external_id=7).update(last_name="Renamed")
+        MoodleService(full_resync=True).update_licenses("1")
+        assert Official.objects.get(external_id=7).last_name == "Last 7"
+        assert GameOfficialListVersion.get() != version
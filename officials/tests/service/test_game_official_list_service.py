@@ -0,0 +1,116 @@
+from datetime import datetime
+from http import HTTPStatus
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from gamedays.models import GameOfficial, Gameinfo, Gameresult
+from gamedays.service.change_counter_service import ChangeCounterService
+from gamedays.service.wrapper.gameinfo_wrapper import GameinfoWrapper
+from officials.models import Official
+from officials.service.game_official_list_service import (
+    GameOfficialListService,
+    GameOfficialListVersion,
+)
+from officials.tests.setup_factories.db_setup_officials import DbSetupOfficials
+from officials.urls import OFFICIALS_GAME_OFFICIALS_APPEARANCE_FOR_TEAM_AND_YEAR
+
+
+class TestGameOfficialListService(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.team = DbSetupOfficials().create_officials_full_setup()
+        self.year = datetime.today().year
+        self.expected_ids = list(
+            GameOfficial.objects.filter(gameinfo__gameday__date__year=self.year)
+            .exclude(position="Scorecard Judge")
+            .order_by("gameinfo__gameday__date", "pk")
+            .values_list("pk", flat=True)
+        )
+
+    @patch.object(GameOfficialListService, "PAGE_SIZE", 3)
+    def test_keyset_pages_cover_all_entries_in_both_directions(self):
+        service = GameOfficialListService(self.year)
+        pages = [service.get_page()]
+        while pages[-1]["next"]:
+            pages.append(service.get_page(after=pages[-1]["next"]))
+        assert pages[0]["previous"] is None
+        assert [
+            entry["id"] for page in pages for entry in page["entries"]
+        ] == self.expected_ids
+        previous_page = service.get_page(before=pages[-1]["previous"])
+        assert previous_page["entries"] == pages[-2]["entries"]
+
+    def test_years_are_cached_until_game_officials_change(self):
+        service = GameOfficialListService(self.year, self.team.pk)
+        assert service.get_years() == [self.year, 2020]
+        service.get_page()
+        with self.assertNumQueries(0):
+            service.get_years()
+            service.get_page()
+        GameOfficial.objects.filter(gameinfo__gameday__date__year=2020).delete()
+        assert service.get_years() == [self.year]
+
+    def test_view_serves_fresh_list_after_change(self):
+        url = reverse(
+            OFFICIALS_GAME_OFFICIALS_APPEARANCE_FOR_TEAM_AND_YEAR,
+            kwargs={"pk": self.team.pk, "season": self.year},
+        )
+        response = self.client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        etag = response["ETag"]
+        assert (
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code
+            == HTTPStatus.NOT_MODIFIED
+        )
+        official = Official.objects.first()
+        official.last_name = "Neuname"
+        official.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+        assert response["ETag"] != etag
+
+    def test_live_game_updates_keep_the_cached_list(self):
+        version = GameOfficialListVersion.get()
+        years_version = GameOfficialListVersion.get_years()
+        gameinfo = GameOfficial.objects.first().gameinfo
+
+        GameinfoWrapper(gameinfo).set_gamestarted_to_now()
+        GameinfoWrapper(gameinfo).set_game_finished_to_now()
+
+        assert GameOfficialListVersion.get() == version
+        assert GameOfficialListVersion.get_years() == years_version
+
+    def test_renamed_gameday_keeps_the_cached_years(self):
+        years_version = GameOfficialListVersion.get_years()
+        version = GameOfficialListVersion.get()
+        gameday = GameOfficial.objects.first().gameinfo.gameday
+
+        gameday.name = "Umbenannt"
+        gameday.save()
+
+        assert GameOfficialListVersion.get() != version
+        assert GameOfficialListVersion.get_years() == years_version
+
+        gameday.date = gameday.date.replace(year=2019)
+        gameday.save(update_fields=["date"])
+
+        assert GameOfficialListVersion.get_years() != years_version
+
+    def test_bulk_writes_invalidate_the_list_like_saves(self):
+        version = GameOfficialListVersion.get()
+        gameinfo = GameOfficial.objects.first().gameinfo
+
+        ChangeCounterService.bump_after_bulk_write(
+            gameinfo.gameday_id, updated={Gameresult: ["fh", "sh"], Gameinfo: ["status"]}
+        )
+        assert GameOfficialListVersion.get() == version
+
+        gameinfo.officials = self.team
+        Gameinfo.objects.bulk_update([gameinfo], ["officials"])
+        ChangeCounterService.bump_after_bulk_write(
+            gameinfo.gameday_id, updated={Gameinfo: ["officials"]}
+        )
+        assert GameOfficialListVersion.get() != version
@@ -0,0 +1,91 @@
+from datetime import datetime
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from gamedays.models import GameOfficial, Gameinfo
+from officials.models import Official, OfficialSeasonGameCount, OfficialExternalGames
+from officials.service.official_game_count_service import OfficialGameCountService
+from officials.service.officials_repository_service import OfficialsRepositoryService
+from officials.tests.setup_factories.db_setup_officials import DbSetupOfficials
+from officials.tests.setup_factories.factories_officials import OfficialFactory
+
+
+def get_game_counts():
+    return {
+        (count.official_id, count.season): (count.internal_overall, count.external_total)
+        for count in OfficialSeasonGameCount.objects.all()
+    }
+
+
+class TestOfficialGameCountService(TestCase):
+    def setUp(self):
+        DbSetupOfficials().create_officials_full_setup()
+        DbSetupOfficials().create_external_officials_entries()
+        self.year = datetime.today().year
+        self.first = Official.objects.first()
+        self.last = Official.objects.last()
+
+    def test_game_counts_are_maintained_on_write(self):
+        counts = OfficialSeasonGameCount.objects.get(official=self.last, season=self.year)
+        assert counts.internal_overall == 8
+        assert counts.internal_referee == 2
+        assert counts.internal_side_judge == 2
+        assert counts.external_referee == 7.0
+        assert counts.external_total == 7.0
+        assert OfficialSeasonGameCount.objects.get(
+            official=self.first, season=2020
+        ).internal_overall == 4
+
+    def test_reassigned_game_official_moves_game_count(self):
+        game_official = GameOfficial.objects.filter(
+            official=self.first, position="Referee"
+        ).first()
+        season = game_official.gameinfo.gameday.date.year
+        before = OfficialSeasonGameCount.objects.get(official=self.first, season=season)
+        game_official.official = self.last
+        game_official.save()
+        after = OfficialSeasonGameCount.objects.get(official=self.first, season=season)
+        assert after.internal_overall == before.internal_overall - 1
+        assert after.internal_referee == before.internal_referee - 1
+
+    def test_deleted_entries_are_removed_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            OfficialExternalGames.objects.filter(official=self.last).delete()
+        counts = OfficialSeasonGameCount.objects.get(official=self.last, season=self.year)
+        assert counts.external_total == 0
+        assert counts.internal_overall == 8
+
+    def test_changed_gameday_date_moves_games_to_other_season(self):
+        gameday = Gameinfo.objects.filter(gameofficial__official=self.first).first().gameday
+        gameday.date = "2019-05-05"
+        gameday.save()
+        assert OfficialSeasonGameCount.objects.get(
+            official=self.first, season=2019
+        ).internal_overall == 4
+
+    def test_rebuild_matches_maintained_counts(self):
+        maintained = get_game_counts()
+        OfficialSeasonGameCount.objects.all().delete()
+        assert OfficialGameCountService().rebuild() == 2
+        assert get_game_counts() == maintained
+
+
+class TestOfficialsRepositoryServiceQueries(TestCase):
+    def test_license_check_queries_do_not_grow_with_officials(self):
+        DbSetupOfficials().create_officials_full_setup()
+        DbSetupOfficials().create_external_officials_entries()
+        repository = OfficialsRepositoryService()
+        with CaptureQueriesContext(connection) as two_officials:
+            repository.get_officials_game_count_for_license(
+                datetime.today(), ["5", "7"]
+            )
+        for external_id in range(100, 120):
+            OfficialFactory(team=Official.objects.first().team, external_id=external_id)
+        with CaptureQueriesContext(connection) as many_officials:
+            officials = repository.get_officials_game_count_for_license(
+                datetime.today(), ["5", "7"] + [str(i) for i in range(100, 120)]
+            )
+        assert len(officials) == 22
+        assert len(many_officials) == len(two_officials)
@@ -6,6 +6,7 @@ from officials.views import (
     GameOfficialListView,
     AddInternalGameOfficialUpdateView,
     MoodleReportView,
+    MoodleReportJobView,
     OfficialProfileLicenseView,
     OfficialAssociationListView,
     OfficialProfileGamelistView,
@@ -31,6 +32,7 @@ OFFICIALS_GAME_OFFICIALS_APPEARANCE_FOR_TEAM_AND_YEAR = (
 OFFICIALS_GAMEOFFICIAL_INTERNAL_CREATE = "view-officials-gameofficial-internal-create"
 OFFICIALS_LICENSE_CHECK = "view-officials-license-check"
 OFFICIALS_MOODLE_REPORT = "view-officials-moodle-report"
+OFFICIALS_MOODLE_REPORT_JOB = "view-officials-moodle-report-job"
 OFFICIALS_PROFILE_LICENSE = "view-officials-profile-license"
 OFFICIALS_PROFILE_GAMELIST = "view-officials-profile-gamelist"
 OFFICIALS_ASSOCIATION_LIST = "view-officials-association-list"
@@ -78,6 +80,11 @@ urlpatterns = [
         name=OFFICIALS_LICENSE_CHECK,
     ),
     path("moodle-report/", MoodleReportView.as_view(), name=OFFICIALS_MOODLE_REPORT),
+    path(
+        "moodle-report/<int:pk>/",
+        MoodleReportJobView.as_view(),
+        name=OFFICIALS_MOODLE_REPORT_JOB,
+    ),
     path(
         "profile/<int:pk>/license/",
         OfficialProfileLicenseView.as_view(),
@@ -1,21 +1,19 @@
-import json
 from datetime import datetime, timedelta
 
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import UserPassesTestMixin, LoginRequiredMixin
-from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
-from django.db.models import Subquery, OuterRef, Q
+from django.db.models import Q
 from django.http import Http404, HttpResponse
-from django.shortcuts import render, redirect
+from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.utils.safestring import mark_safe
 from django.views import View
-from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
 
 from gamedays.constants import LEAGUE_GAMEDAY_DETAIL
-from gamedays.models import Team, Gameinfo, GameOfficial, Gameresult
+from gamedays.models import Team, Gameinfo
 from league_manager.utils.view_utils import PermissionHelper
 from officials.api.serializers import (
     GameOfficialAllInfoSerializer,
@@ -23,10 +21,15 @@ from officials.api.serializers import (
     OfficialGamelistSerializer,
 )
 from officials.forms import AddInternalGameOfficialEntryForm, MoodleLoginForm
-from officials.models import Official, OfficialLicenseHistory
+from officials.models import Official, OfficialLicenseHistory, MoodleSyncJob
 from officials.service.boff_license_calculation import LicenseStrategy
 from officials.service.moodle.moodle_api import MoodleApiException
 from officials.service.moodle.moodle_service import MoodleService
+from officials.service.moodle.moodle_sync_job_runner import (
+    MoodleSyncJobRunner,
+    MoodleSyncJobAlreadyRunning,
+)
+from officials.service.game_official_list_service import GameOfficialListService
 from officials.service.official_service import OfficialService
 from officials.service.signup_service import (
     OfficialSignupService,
@@ -94,7 +97,7 @@ class OfficialsTeamListView(View):
 class GameOfficialListView(View):
     template_name = "officials/game_officials_list.html"
 
-    @method_decorator(cache_page(60 * 60 * 24))
+    @method_decorator(condition(etag_func=GameOfficialListService.get_etag))
     def get(self, request, **kwargs):
         year_str = kwargs.get("season", datetime.today().year)
         year = int(year_str) if year_str else None
@@ -103,45 +106,10 @@ class GameOfficialListView(View):
             team_id = int(team_id) if team_id else None
         except ValueError:
             team_id = None
-        game_officials = GameOfficial.objects.filter(
-            gameinfo__gameday__date__year=year
-        ).exclude(position="Scorecard Judge")
-        if team_id:
-            team = Team.objects.get(pk=team_id).description
-            game_officials = game_officials.filter(
-                Q(gameinfo__officials__pk=team_id, official=None)
-                | Q(official__team__pk=team_id)
-            )
-            years = (
-                GameOfficial.objects.filter(
-                    Q(gameinfo__officials__pk=team_id, official=None)
-                    | Q(official__team__pk=team_id)
-                )
-                .values_list("gameinfo__gameday__date__year", flat=True)
-                .distinct()
-            )
-        else:
-            years = (
-                GameOfficial.objects.all()
-                .values_list("gameinfo__gameday__date__year", flat=True)
-                .distinct()
-            )
-            team = None
-        game_officials = game_officials.order_by("gameinfo__gameday__date")
-        is_staff = request.user.is_staff
-        team_name = request.user.username
-
-        paginator = Paginator(game_officials, 1000)
-        page = request.GET.get("page")
-        try:
-            game_officials_page = paginator.page(page)
-        except PageNotAnInteger:
-            game_officials_page = paginator.page(1)
-        except EmptyPage:
-            game_officials_page = paginator.page(paginator.num_pages)
-        game_officials_object_list = game_officials_page.object_list.annotate(
-            home=self._get_subquery(is_home=True),
-            away=self._get_subquery(is_home=False),
+        team = Team.objects.get(pk=team_id).description if team_id else None
+        game_official_list_service = GameOfficialListService(year, team_id)
+        page = game_official_list_service.get_page(
+            after=request.GET.get("after"), before=request.GET.get("before")
         )
         from officials.urls import OFFICIALS_GAME_OFFICIALS_APPEARANCE_FOR_TEAM_AND_YEAR
 
@@ -149,29 +117,20 @@ class GameOfficialListView(View):
             "season": year,
             "team": team,
             "team_id": team_id,
-            "years": sorted(years, reverse=True),
+            "years": game_official_list_service.get_years(),
             "url_pattern": OFFICIALS_GAME_OFFICIALS_APPEARANCE_FOR_TEAM_AND_YEAR,
             "pk": team_id,
             "object_list": GameOfficialAllInfoSerializer(
-                instance=game_officials_object_list.values(
-                    *GameOfficialAllInfoSerializer.ALL_VALUE_FIELDS
-                ),
-                display_names_for_team=team_name,
-                is_staff=is_staff,
+                instance=page["entries"],
+                display_names_for_team=request.user.username,
+                is_staff=request.user.is_staff,
                 many=True,
             ).data,
-            "page_obj": game_officials_page,
+            "next_cursor": page["next"],
+            "previous_cursor": page["previous"],
         }
         return render(request, self.template_name, context)
 
-    # noinspection PyMethodMayBeStatic
-    def _get_subquery(self, is_home: bool):
-        return Subquery(
-            Gameresult.objects.filter(
-                gameinfo=OuterRef("gameinfo"), isHome=is_home
-            ).values("team__description")[:1]
-        )
-
 
 class AddInternalGameOfficialUpdateView(LoginRequiredMixin, UserPassesTestMixin, View):
     form_class = AddInternalGameOfficialEntryForm
@@ -244,23 +203,46 @@ class LicenseCheckForOfficials(LoginRequiredMixin, UserPassesTestMixin, View):
         return render(request, self.template_name, context)
 
     def test_func(self):
-        return self.request.user.is_staff or self.request.user.username == "offd"
+        return PermissionHelper.is_moodle_report_user(self.request.user)
 
 
 class MoodleReportView(LoginRequiredMixin, UserPassesTestMixin, View):
-    template_name = "officials/moodle_report.html"
-
+    # noinspection PyMethodMayBeStatic
     def get(self, request, *args, **kwargs):
+        from officials.urls import OFFICIALS_MOODLE_REPORT_JOB
+
         course_ids = request.GET.get("ids")
         ignore_year_raw = request.GET.get("ignoreYear", "false").lower()
         ignore_year = ignore_year_raw == "true"
-        moodle_service = MoodleService()
-        result = moodle_service.update_licenses(course_ids, ignore_year)
-        context = {"time": result[1], "result": json.dumps(result[0], indent=4)}
+        full_resync = request.GET.get("fullResync", "false").lower() == "true"
+        try:
+            job = MoodleSyncJobRunner().submit(
+                course_ids, ignore_year, full_resync, user=request.user
+            )
+        except MoodleSyncJobAlreadyRunning as exception:
+            messages.warning(request, f"{exception}")
+            job = exception.job or MoodleSyncJob.objects.latest("pk")
+        return redirect(reverse(OFFICIALS_MOODLE_REPORT_JOB, kwargs={"pk": job.pk}))
+
+    def test_func(self):
+        return PermissionHelper.is_moodle_report_user(self.request.user)
+
+
+class MoodleReportJobView(LoginRequiredMixin, UserPassesTestMixin, View):
+    template_name = "officials/moodle_report.html"
+
+    def get(self, request, *args, **kwargs):
+        from officials.api.urls import API_OFFICIALS_MOODLE_SYNC_JOB
+
+        job = get_object_or_404(MoodleSyncJob, pk=kwargs.get("pk"))
+        context = {
+            "job": job,
+            "status_url": reverse(API_OFFICIALS_MOODLE_SYNC_JOB, kwargs={"pk": job.pk}),
+        }
         return render(request, self.template_name, context)
 
     def test_func(self):
-        return self.request.user.is_staff or self.request.user.username == "offd"
+        return PermissionHelper.is_moodle_report_user(self.request.user)
 
 
 class OfficialProfileLicenseView(View):
@@ -5,6 +5,7 @@ from passcheck.api.views import (
     PasscheckGamesAPIView,
     PasscheckGamesStatusAPIView,
     PasscheckApprovalUrlAPIView,
+    PasscheckGamedayBundleAPIView,
 )
 
 API_PASSCHECK_GAMES_STATUS = "api-passcheck-games-status"
@@ -12,6 +13,7 @@ API_PASSCHECK_LIST = "api-passcheck-list"
 API_PASSCHECK_SERVICE = "api-passcheck-service"
 API_PASSCHECK_SERVICE_PLAYERS = "api-passcheck-service-players"
 API_PASSCHECK_EQUIPMENT_APPROVAL_URL = "api-passcheck-equipment-approval-url"
+API_PASSCHECK_GAMEDAY_BUNDLE = "api-passcheck-gameday-bundle"
 
 # Mapping which URL connects to which view
 urlpatterns = [
@@ -36,4 +38,9 @@ urlpatterns = [
         PasscheckRosterAPIView.as_view(),
         name=API_PASSCHECK_SERVICE_PLAYERS,
     ),
+    path(
+        "bundle/gameday/<int:gameday>",
+        PasscheckGamedayBundleAPIView.as_view(),
+        name=API_PASSCHECK_GAMEDAY_BUNDLE,
+    ),
 ]
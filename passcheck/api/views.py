@@ -1,10 +1,13 @@
 from http import HTTPStatus
 
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import permissions
 from rest_framework.exceptions import PermissionDenied, NotFound, ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from gamedays.models import Gameday
 from league_manager.utils.decorators import get_user_request_permission
 from league_manager.utils.view_utils import UserRequestPermission
 from passcheck.service.passcheck_service import (
@@ -12,6 +15,7 @@ from passcheck.service.passcheck_service import (
     PasscheckServicePlayers,
     PasscheckException,
 )
+from passcheck.service.passcheck_bundle_service import PasscheckBundleService
 from passcheck.service.request_api_service import RequestApiService
 
 
@@ -97,3 +101,37 @@ class PasscheckRosterAPIView(APIView):
             team_id, gameday_id, request.user, data
         )
         return Response(status=HTTPStatus.OK)
+
+
+def _get_gameday_bundle_etag(request, gameday=None):
+    # no ETag for a denied request, so it is never answered with a 304
+    bundle_service = PasscheckBundleService(
+        UserRequestPermission(is_staff=request.user.is_staff)
+    )
+    try:
+        bundle_service.get_allowed_gameday(gameday)
+    except (Gameday.DoesNotExist, PasscheckException):
+        return None
+    return PasscheckBundleService.get_etag(gameday)
+
+
+class PasscheckGamedayBundleAPIView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @method_decorator(condition(etag_func=_get_gameday_bundle_etag))
+    def get(self, request, **kwargs):
+        gameday_id = kwargs.get("gameday")
+        bundle_service = PasscheckBundleService(
+            UserRequestPermission(is_staff=request.user.is_staff)
+        )
+        try:
+            return Response(
+                bundle_service.get_bundle(gameday_id),
+                status=HTTPStatus.OK,
+            )
+        except Gameday.DoesNotExist:
+            raise NotFound(detail=f"Gameday {gameday_id} not found")
+        except PasscheckException:
+            raise PermissionDenied(detail=f"Permission denied for Gameday: {gameday_id}")
+        except LookupError as exception:
+            raise NotFound(detail=f"Not found for Gameday: {gameday_id} -> {exception}")
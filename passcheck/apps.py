@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class PasscheckConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "passcheck"
+
+    def ready(self):
+        # noinspection PyUnresolvedReferences
+        import passcheck.service.signals
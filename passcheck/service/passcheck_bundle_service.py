@@ -0,0 +1,113 @@
+import hashlib
+from datetime import datetime
+
+from gamedays.models import Gameday, Gameresult
+from league_manager.cache import VersionStamp, live_cache
+from league_manager.utils.view_utils import UserRequestPermission
+from passcheck.models import PasscheckVerification
+from passcheck.service.passcheck_service import PasscheckService
+
+PASSCHECK_BUNDLE_FORMAT = 1
+PASSCHECK_BUNDLE_GLOBAL_VERSION_KEY = "passcheck_bundle_version"
+PASSCHECK_BUNDLE_GAMEDAY_VERSION_KEY = "passcheck_bundle_version:{gameday_id}"
+PASSCHECK_BUNDLE_CACHE_KEY = "passcheck_bundle:{gameday_id}:{version}"
+PASSCHECK_BUNDLE_CACHE_TTL = 60 * 60 * 24
+
+
+class PasscheckBundleVersion:
+    """Cache-held version stamps for the offline passcheck bundle.
+
+    Writes that only touch one gameday (verifications, gameday jerseys, game
+    results) bump that gameday's stamp; roster and rule changes affect every
+    gameday and bump the global one.
+    """
+
+    @staticmethod
+    def get(gameday_id) -> str:
+        global_version = PasscheckBundleVersion._stamp(None).get()
+        gameday_version = PasscheckBundleVersion._stamp(gameday_id).get()
+        return f"{PASSCHECK_BUNDLE_FORMAT}.{global_version}.{gameday_version}"
+
+    @staticmethod
+    def bump(gameday_id=None):
+        PasscheckBundleVersion._stamp(gameday_id).bump()
+
+    @staticmethod
+    def _stamp(gameday_id) -> VersionStamp:
+        if gameday_id is None:
+            return VersionStamp(PASSCHECK_BUNDLE_GLOBAL_VERSION_KEY)
+        return VersionStamp(
+            PASSCHECK_BUNDLE_GAMEDAY_VERSION_KEY.format(gameday_id=gameday_id)
+        )
+
+
+class PasscheckBundleService:
+    def __init__(self, user_permission=UserRequestPermission()):
+        # the bundle is meant for the officials doing the passcheck, so the
+        # roster is always rendered unobfuscated like in the roster endpoint
+        self.user_permission = UserRequestPermission(
+            is_staff=user_permission.is_staff, is_user=True
+        )
+
+    @staticmethod
+    def get_etag(gameday_id) -> str:
+        # with the date, as whether the bundle may be served depends on it
+        etag_data = (
+            f"{gameday_id}:{PasscheckBundleVersion.get(gameday_id)}"
+            f":{datetime.today().date()}"
+        )
+        return f'"{hashlib.md5(etag_data.encode()).hexdigest()}"'
+
+    def get_allowed_gameday(self, gameday_id: int) -> Gameday:
+        """Raises Gameday.DoesNotExist or PasscheckException unless the user
+        may get the bundle of the gameday."""
+        gameday: Gameday = Gameday.objects.select_related("league").get(pk=gameday_id)
+        PasscheckService(self.user_permission).check_gameday_is_allowed(gameday)
+        return gameday
+
+    def get_bundle(self, gameday_id: int) -> dict:
+        gameday = self.get_allowed_gameday(gameday_id)
+        passcheck = PasscheckService(self.user_permission)
+        version = PasscheckBundleVersion.get(gameday_id)
+        cache_key = PASSCHECK_BUNDLE_CACHE_KEY.format(
+            gameday_id=gameday_id, version=version
+        )
+        bundle = live_cache.get(cache_key)
+        if bundle is None:
+            bundle = self._build_bundle(passcheck, gameday, version)
+            live_cache.set(cache_key, bundle, PASSCHECK_BUNDLE_CACHE_TTL)
+        return bundle
+
+    # noinspection PyMethodMayBeStatic
+    def _build_bundle(self, passcheck: PasscheckService, gameday: Gameday, version):
+        team_ids = (
+            Gameresult.objects.filter(gameinfo__gameday=gameday, team__isnull=False)
+            .values_list("team_id", flat=True)
+            .distinct()
+            .order_by("team_id")
+        )
+        verified_team_ids = set(
+            PasscheckVerification.objects.filter(gameday=gameday).values_list(
+                "team_id", flat=True
+            )
+        )
+        teams = []
+        for team_id in team_ids:
+            roster = passcheck.build_roster_with_validation(team_id, gameday)
+            teams.append(
+                {
+                    "team_id": team_id,
+                    "isChecked": team_id in verified_team_ids,
+                    **roster,
+                }
+            )
+        return {
+            "version": version,
+            "gameday": {
+                "id": gameday.pk,
+                "name": gameday.name,
+                "date": gameday.date.isoformat(),
+                "league": gameday.league.name,
+            },
+            "teams": teams,
+        }
@@ -175,14 +175,21 @@ class PasscheckService:
 
     def get_roster_with_validation(self, team_id: int, gameday_id: int):
         gameday: Gameday = Gameday.objects.get(pk=gameday_id)
+        self.check_gameday_is_allowed(gameday)
+        return self.build_roster_with_validation(team_id, gameday)
+
+    def check_gameday_is_allowed(self, gameday: Gameday):
         if not self.user_permission.is_staff:
             today = datetime.date.today()
             if settings.DEBUG:
                 today = settings.DEBUG_DATE
             if today != gameday.date:
                 raise PasscheckException(
-                    f"Passcheck nicht erlaubt für Spieltag: {gameday_id}. Nur heutige Spieltage sind erlaubt."
+                    f"Passcheck nicht erlaubt für Spieltag: {gameday.pk}. Nur heutige Spieltage sind erlaubt."
                 )
+
+    def build_roster_with_validation(self, team_id: int, gameday: Gameday):
+        gameday_id = gameday.pk
         roster = (
             self._get_roster(team_id, gameday_id, {})
             .filter(Q(joined_on__lte=gameday.date))
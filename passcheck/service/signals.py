@@ -0,0 +1,91 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from gamedays.models import Gameday, Gameresult, Gameinfo, Person, Team
+from gamedays.service.change_counter_service import post_bulk_write
+from passcheck.models import (
+    Player,
+    Playerlist,
+    PlayerlistGameday,
+    PasscheckVerification,
+    TeamRelationship,
+    EligibilityRule,
+)
+from passcheck.service.passcheck_bundle_service import PasscheckBundleVersion
+
+# fields of a gameday and of a team that end up in the bundle; the gameday
+# date also selects the roster by joined_on and left_on
+GAMEDAY_BUNDLE_FIELDS = {"date", "name", "league"}
+TEAM_BUNDLE_FIELDS = {"name", "description"}
+
+
+def _changes(fields: set, update_fields) -> bool:
+    return update_fields is None or bool(
+        fields & {field.removesuffix("_id") for field in update_fields}
+    )
+
+
+@receiver(post_save, sender=PasscheckVerification)
+@receiver(post_delete, sender=PasscheckVerification)
+def invalidate_gameday_bundle(sender, instance, **kwargs):
+    PasscheckBundleVersion.bump(instance.gameday_id)
+
+
+@receiver(post_save, sender=Gameday)
+def invalidate_gameday_bundle_for_gameday(
+    sender, instance: Gameday, created=False, update_fields=None, **kwargs
+):
+    if not created and _changes(GAMEDAY_BUNDLE_FIELDS, update_fields):
+        PasscheckBundleVersion.bump(instance.pk)
+
+
+@receiver(post_save, sender=Gameresult)
+@receiver(post_delete, sender=Gameresult)
+def invalidate_gameday_bundle_for_gameresult(sender, instance: Gameresult, **kwargs):
+    # only the participating teams matter for the bundle, not the scores
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and "team" not in update_fields:
+        return
+    gameday_id = (
+        Gameinfo.objects.filter(pk=instance.gameinfo_id)
+        .values_list("gameday_id", flat=True)
+        .first()
+    )
+    # a cascading gameday delete removes the gameinfo first -> bump everything
+    PasscheckBundleVersion.bump(gameday_id)
+
+
+@receiver(post_bulk_write, sender=Gameresult)
+def invalidate_gameday_bundle_after_bulk_write(
+    sender, gameday_id, update_fields=None, **kwargs
+):
+    if update_fields is None or "team" in update_fields:
+        PasscheckBundleVersion.bump(gameday_id)
+
+
+@receiver(post_save, sender=Team)
+def invalidate_all_bundles_for_team(
+    sender, created=False, update_fields=None, **kwargs
+):
+    if not created and _changes(TEAM_BUNDLE_FIELDS, update_fields):
+        PasscheckBundleVersion.bump()
+
+
+# a player selected on one gameday counts towards the eligibility of the
+# additional teams on the other gamedays of that year, in any league
+@receiver(post_save, sender=PlayerlistGameday)
+@receiver(post_delete, sender=PlayerlistGameday)
+@receiver(post_save, sender=Person)
+@receiver(post_delete, sender=Person)
+@receiver(post_save, sender=Player)
+@receiver(post_delete, sender=Player)
+@receiver(post_save, sender=Playerlist)
+@receiver(post_delete, sender=Playerlist)
+@receiver(post_save, sender=TeamRelationship)
+@receiver(post_delete, sender=TeamRelationship)
+@receiver(m2m_changed, sender=TeamRelationship.additional_teams.through)
+@receiver(post_save, sender=EligibilityRule)
+@receiver(post_delete, sender=EligibilityRule)
+@receiver(m2m_changed, sender=EligibilityRule.eligible_in.through)
+def invalidate_all_bundles(sender, **kwargs):
+    PasscheckBundleVersion.bump()
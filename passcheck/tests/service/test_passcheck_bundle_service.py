@@ -0,0 +1,187 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from gamedays.models import Gameresult
+from gamedays.service.change_counter_service import ChangeCounterService
+from gamedays.tests.setup_factories.db_setup import DBSetup
+from league_manager.utils.view_utils import UserRequestPermission
+from passcheck.api.urls import API_PASSCHECK_GAMEDAY_BUNDLE
+from passcheck.models import PasscheckVerification, Playerlist, PlayerlistGameday
+from passcheck.service.passcheck_bundle_service import (
+    PasscheckBundleService,
+    PasscheckBundleVersion,
+)
+from passcheck.service.passcheck_service import PasscheckException
+from passcheck.tests.setup_factories.db_setup_passcheck import DbSetupPasscheck
+from passcheck.tests.setup_factories.factories_passcheck import (
+    EligibilityRuleFactory,
+)
+
+
+def create_gameday_with_roster():
+    gameday = DBSetup().create_main_round_gameday(status="Geplant", number_teams=3)
+    EligibilityRuleFactory(
+        league=gameday.league,
+        eligible_in=[gameday.league],
+        max_gamedays=3,
+        minimum_player_strength=0,
+        maximum_player_strength=-1,
+    )
+    home = Gameresult.objects.filter(gameinfo__gameday=gameday, isHome=True).first()
+    DbSetupPasscheck.create_playerlist_for_team(team=home.team, gamedays=[gameday])
+    return gameday, home.team
+
+
+class TestPasscheckBundleService(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_bundle_contains_all_participating_teams(self):
+        gameday, team = create_gameday_with_roster()
+        bundle = PasscheckBundleService().get_bundle(gameday.pk)
+        assert bundle["gameday"]["id"] == gameday.pk
+        assert len(bundle["teams"]) == 3
+        team_entry = next(t for t in bundle["teams"] if t["team_id"] == team.pk)
+        assert team_entry["team"]["name"] == team.description
+        assert {player["first_name"] for player in team_entry["team"]["roster"]} == {
+            "Fia",
+            "Yonathan",
+            "Oscar",
+        }
+        assert team_entry["isChecked"] is False
+
+    def test_bundle_is_served_from_cache(self):
+        gameday, _ = create_gameday_with_roster()
+        PasscheckBundleService().get_bundle(gameday.pk)
+        with self.assertNumQueries(1):
+            PasscheckBundleService().get_bundle(gameday.pk)
+
+    def test_verification_invalidates_bundle(self):
+        gameday, team = create_gameday_with_roster()
+        etag_before = PasscheckBundleService.get_etag(gameday.pk)
+        PasscheckBundleService().get_bundle(gameday.pk)
+        PasscheckVerification.objects.create(
+            team=team,
+            gameday=gameday,
+            user=User.objects.first(),
+            official_name="Checker",
+        )
+        assert PasscheckBundleService.get_etag(gameday.pk) != etag_before
+        bundle = PasscheckBundleService().get_bundle(gameday.pk)
+        team_entry = next(t for t in bundle["teams"] if t["team_id"] == team.pk)
+        assert team_entry["isChecked"] is True
+        assert team_entry["official_name"] == "Checker"
+
+    def test_other_gameday_keeps_its_version(self):
+        gameday, _ = create_gameday_with_roster()
+        version_before = PasscheckBundleVersion.get(gameday.pk)
+        PasscheckBundleVersion.bump(gameday.pk + 1)
+        assert PasscheckBundleVersion.get(gameday.pk) == version_before
+
+    def test_only_todays_gameday_is_allowed_for_non_staff(self):
+        gameday, _ = create_gameday_with_roster()
+        gameday.date = gameday.date - timedelta(days=1)
+        gameday.save()
+        with self.assertRaises(PasscheckException):
+            PasscheckBundleService().get_bundle(gameday.pk)
+        bundle = PasscheckBundleService(
+            UserRequestPermission(is_staff=True)
+        ).get_bundle(gameday.pk)
+        assert len(bundle["teams"]) == 3
+
+
+class TestPasscheckGamedayBundleAPIView(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_bundle_needs_authentication(self):
+        response = self.client.get(
+            reverse(API_PASSCHECK_GAMEDAY_BUNDLE, kwargs={"gameday": 1})
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_bundle_is_revalidated_with_etag(self):
+        gameday, _ = create_gameday_with_roster()
+        self.client.force_authenticate(DBSetup().create_new_user("official"))
+        url = reverse(API_PASSCHECK_GAMEDAY_BUNDLE, kwargs={"gameday": gameday.pk})
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["teams"]) == 3
+        revalidated = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_revalidation_is_denied_for_a_gameday_of_another_day(self):
+        gameday, _ = create_gameday_with_roster()
+        gameday.date = gameday.date - timedelta(days=1)
+        gameday.save()
+        self.client.force_authenticate(DBSetup().create_new_user("official"))
+        response = self.client.get(
+            reverse(API_PASSCHECK_GAMEDAY_BUNDLE, kwargs={"gameday": gameday.pk}),
+            HTTP_IF_NONE_MATCH=PasscheckBundleService.get_etag(gameday.pk),
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_etag_changes_with_the_date(self):
+        gameday, _ = create_gameday_with_roster()
+        etag = PasscheckBundleService.get_etag(gameday.pk)
+        with patch("passcheck.service.passcheck_bundle_service.datetime") as datetime_mock:
+            datetime_mock.today.return_value = datetime.today() + timedelta(days=1)
+            assert PasscheckBundleService.get_etag(gameday.pk) != etag
+
+    def test_unknown_gameday_returns_not_found(self):
+        self.client.force_authenticate(DBSetup().create_new_user("official"))
+        response = self.client.get(
+            reverse(API_PASSCHECK_GAMEDAY_BUNDLE, kwargs={"gameday": 4711})
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_player_and_team_edits_invalidate_bundle(self):
+        gameday, team = create_gameday_with_roster()
+        version_before = PasscheckBundleVersion.get(gameday.pk)
+        person = Playerlist.objects.filter(team=team).first().player.person
+        person.first_name = "Umbenannt"
+        person.save()
+        assert PasscheckBundleVersion.get(gameday.pk) != version_before
+
+        version_before = PasscheckBundleVersion.get(gameday.pk)
+        team.description = "Umbenannt"
+        team.save(update_fields=["description"])
+        assert PasscheckBundleVersion.get(gameday.pk) != version_before
+
+    def test_gameday_date_change_invalidates_bundle(self):
+        gameday, _ = create_gameday_with_roster()
+        version_before = PasscheckBundleVersion.get(gameday.pk)
+        gameday.status = "Veröffentlicht"
+        gameday.save(update_fields=["status"])
+        assert PasscheckBundleVersion.get(gameday.pk) == version_before
+
+        gameday.date += timedelta(days=1)
+        gameday.save(update_fields=["date"])
+        assert PasscheckBundleVersion.get(gameday.pk) != version_before
+
+    def test_selection_on_one_gameday_invalidates_the_others(self):
+        gameday, team = create_gameday_with_roster()
+        other_gameday = DBSetup().create_empty_gameday()
+        version_before = PasscheckBundleVersion.get(other_gameday.pk)
+        PlayerlistGameday.objects.filter(gameday=gameday).first().delete()
+        assert PasscheckBundleVersion.get(other_gameday.pk) != version_before
+
+    def test_bulk_team_assignment_invalidates_bundle(self):
+        gameday, team = create_gameday_with_roster()
+        version_before = PasscheckBundleVersion.get(gameday.pk)
+        ChangeCounterService.bump_after_bulk_write(
+            gameday.pk, updated={Gameresult: ["fh", "sh"]}
+        )
+        assert PasscheckBundleVersion.get(gameday.pk) == version_before
+
+        ChangeCounterService.bump_after_bulk_write(
+            gameday.pk, updated={Gameresult: ["team"]}
+        )
+        assert PasscheckBundleVersion.get(gameday.pk) != version_before
@@ -3,12 +3,14 @@ import io
 import json
 from datetime import datetime
 
-import pandas as pd
 from django import forms
 from django.contrib import messages
 from django.shortcuts import render, redirect
 
 import gamedays.models
+from league_manager.utils.lazy_import import LazyModule
+
+pd = LazyModule("pandas")
 
 # Create your views here.
 